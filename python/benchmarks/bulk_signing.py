@@ -0,0 +1,99 @@
+"""
+Bulk signing benchmark: signing on the calling thread vs. a SigningPool of worker processes.
+
+Signs a batch of EIP-191 messages and a batch of EIP-712 attestations one by one, as
+``sign_message``/``sign_typed_data`` loops do, and with ``sign_messages``/``sign_typed_data_many``
+on a :class:`~radius_wallets.web3.SigningPool` for each worker count up to ``--processes``.
+Workers are started before timing. Reports signatures per second and the speedup over the
+sequential loop, which should grow nearly linearly with the number of cores.
+
+Usage:
+    python benchmarks/bulk_signing.py --messages 5000 --processes 8
+"""
+import argparse
+import os
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+from eth_account import Account
+from web3 import Web3
+
+from radius_wallets.web3 import SigningPool, Web3EVMWalletClient, Web3Options
+
+
+def attestation(nonce: int) -> Dict[str, Any]:
+    return {
+        "types": {
+            "EIP712Domain": [
+                {"name": "name", "type": "string"},
+                {"name": "version", "type": "string"},
+                {"name": "chainId", "type": "uint256"},
+            ],
+            "Attestation": [
+                {"name": "subject", "type": "address"},
+                {"name": "schema", "type": "bytes32"},
+                {"name": "data", "type": "bytes"},
+                {"name": "nonce", "type": "uint256"},
+            ],
+        },
+        "primaryType": "Attestation",
+        "domain": {"name": "Attestations", "version": "1", "chainId": 1223953},
+        "message": {
+            "subject": f"0x{nonce + 1:040x}",
+            "schema": "0x" + "5c" * 32,
+            "data": "0x" + f"{nonce:064x}",
+            "nonce": nonce,
+        },
+    }
+
+
+def rate(operation: Callable[[], Any], count: int) -> float:
+    start = time.perf_counter()
+    operation()
+    return count / (time.perf_counter() - start)
+
+
+def worker_counts(processes: int) -> List[int]:
+    counts = [1]
+    while counts[-1] * 2 <= processes:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != processes:
+        counts.append(processes)
+    return counts[1:]
+
+
+def run(messages: int, processes: int, chunk_size: int) -> List[Tuple[str, str, float]]:
+    account = Account.create()
+    texts = [f"attestation {index}" for index in range(messages)]
+    payloads = [attestation(nonce) for nonce in range(messages)]
+    wallet = Web3EVMWalletClient(Web3(), Web3Options(account=account))
+
+    rows = [
+        ("messages", "sequential", rate(lambda: [wallet.sign_message(text) for text in texts], messages)),
+        ("typed data", "sequential", rate(lambda: [wallet.sign_typed_data(payload) for payload in payloads], messages)),
+    ]
+    for count in worker_counts(processes):
+        with SigningPool(account, processes=count, chunk_size=chunk_size) as pool:
+            pool.start()
+            label = f"{count} processes"
+            rows.append(("messages", label, rate(lambda: pool.sign_messages(texts), messages)))
+            rows.append(("typed data", label, rate(lambda: pool.sign_typed_data_many(payloads), messages)))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=2000, help="Payloads signed per batch")
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1, help="Largest worker count to run")
+    parser.add_argument("--chunk-size", type=int, default=256, help="Maximum payloads per worker task")
+    args = parser.parse_args()
+
+    rows = run(args.messages, args.processes, args.chunk_size)
+    sequential = {payload: value for payload, label, value in rows if label == "sequential"}
+    print(f"{'payload':<12}{'signer':<16}{'signatures/s':>14}{'speedup':>10}")
+    for payload, label, value in rows:
+        print(f"{payload:<12}{label:<16}{value:>14.0f}{value / sequential[payload]:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Transaction confirmation latency benchmark: receipt polling vs. a newHeads subscription.
+
+Runs LocalChain with auto-mining disabled and a background miner producing a block every
+``--block-time`` milliseconds, then sends ETH transfers through two wallets: one waiting for
+receipts by polling (web3's default), one resolving them from blocks announced over a
+WebSocket ``eth_subscribe`` subscription.
+
+Usage:
+    python benchmarks/confirmation_latency.py --iterations 50 --block-time 100
+"""
+import argparse
+import threading
+
+from radius_wallets.web3 import HeadSubscription, Web3Options
+from radius_wallets.web3.testing import LatencyRecorder, LocalChain
+
+
+def run(iterations: int, block_time: float) -> LatencyRecorder:
+    chain = LocalChain(num_accounts=2)
+    chain.tester.disable_auto_mine_transactions()
+    recipient = chain.accounts[1].address
+
+    stop = threading.Event()
+
+    def mine():
+        while not stop.wait(block_time):
+            chain.mine()
+
+    miner = threading.Thread(target=mine, daemon=True)
+    miner.start()
+
+    recorder = LatencyRecorder()
+    try:
+        with chain.head_server() as server, HeadSubscription(server.url) as heads:
+            wallets = {
+                "polling": chain.wallet(0),
+                "new_heads": chain.wallet(0, Web3Options(head_subscription=heads)),
+            }
+            for _ in range(iterations):
+                for name, wallet in wallets.items():
+                    with recorder.measure(name):
+                        wallet.send_transaction({"to": recipient, "value": 1})
+    finally:
+        stop.set()
+        miner.join()
+    return recorder
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=50, help="Transfers sent per wallet")
+    parser.add_argument("--block-time", type=float, default=100.0, help="Milliseconds between mined blocks")
+    args = parser.parse_args()
+
+    recorder = run(args.iterations, args.block_time / 1000)
+    print(recorder.format_report())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Import-time benchmark for the Radius packages.
+
+Imports each package in a fresh interpreter with ``python -X importtime``, reports the
+cumulative import time and checks two kinds of regressions:
+
+* heavy dependencies (web3, aiohttp, LangChain, ...) being imported eagerly again, and
+* cumulative import time exceeding the recorded baseline by more than ``--tolerance``
+  (plus ``--slack-ms`` to absorb timer noise on sub-millisecond imports).
+
+Usage:
+    python benchmarks/import_time.py                    # compare against the baseline
+    python benchmarks/import_time.py --update-baseline  # record new baseline timings
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Set, Tuple
+
+BASELINE_PATH = Path(__file__).with_name("import_time_baseline.json")
+
+# Package -> dependencies that must not be loaded by a bare ``import <package>``
+TARGETS: Dict[str, List[str]] = {
+    "radius": ["pydantic"],
+    "radius_wallets.web3": ["web3", "eth_account"],
+    "radius_plugins.erc20": ["pydantic"],
+    "radius_plugins.jsonrpc": ["aiohttp"],
+    "radius_plugins.uniswap": ["aiohttp", "web3"],
+    "radius_adapters.langchain": ["langchain_core", "langchain"],
+    "radius_adapters.mcp": ["mcp", "mcp_types", "starlette"],
+}
+
+
+def measure(module: str) -> Tuple[int, Set[str]]:
+    """Imports ``module`` in a fresh interpreter, returning its cumulative import time (us) and loaded modules."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr}")
+
+    cumulative = 0
+    loaded: Set[str] = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, name = line[len("import time:"):].split("|")
+        name = name.strip()
+        loaded.add(name)
+        if name == module:
+            cumulative = int(cumulative_us)
+    return cumulative, loaded
+
+
+def run(repeat: int) -> Dict[str, Tuple[int, Set[str]]]:
+    results: Dict[str, Tuple[int, Set[str]]] = {}
+    for module in TARGETS:
+        samples = [measure(module) for _ in range(repeat)]
+        results[module] = (min(sample[0] for sample in samples), samples[0][1])
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters per package (the minimum is kept)")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="Allowed slowdown over the baseline (0.5 = 50%%)")
+    parser.add_argument("--slack-ms", type=float, default=5.0, help="Absolute slack added to the allowed import time")
+    parser.add_argument("--update-baseline", action="store_true", help="Write the measured timings as the new baseline")
+    args = parser.parse_args()
+
+    results = run(args.repeat)
+    baseline: Dict[str, int] = json.loads(BASELINE_PATH.read_text()) if BASELINE_PATH.exists() else {}
+
+    failures: List[str] = []
+    print(f"{'package':<28}{'import ms':>12}{'baseline ms':>14}")
+    for module, (cumulative, loaded) in results.items():
+        expected = baseline.get(module)
+        print(f"{module:<28}{cumulative / 1000:>12.1f}{(expected / 1000 if expected else float('nan')):>14.1f}")
+
+        eager = sorted(dependency for dependency in TARGETS[module] if dependency in loaded)
+        if eager:
+            failures.append(f"{module} eagerly imports {', '.join(eager)}")
+        allowed = expected * (1 + args.tolerance) + args.slack_ms * 1000 if expected else None
+        if allowed and not args.update_baseline and cumulative > allowed:
+            failures.append(f"{module} import time {cumulative / 1000:.1f}ms exceeds baseline {expected / 1000:.1f}ms")
+
+    if args.update_baseline:
+        BASELINE_PATH.write_text(json.dumps({module: value[0] for module, value in results.items()}, indent=2) + "\n")
+        print(f"\nBaseline written to {BASELINE_PATH}")
+
+    if failures:
+        print("\nRegressions:")
+        for failure in failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
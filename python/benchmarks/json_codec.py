@@ -0,0 +1,123 @@
+"""
+JSON codec benchmark: web3/aiohttp-style decoding vs. the toolkit's codec.
+
+Encodes and decodes payloads shaped like the toolkit's traffic (a Uniswap quote, an
+``eth_getLogs`` response and a batch of ``eth_getBalance`` responses) the way the HTTP layers
+used to, decoding the body to a string and parsing it with the standard library, and with
+each available :class:`~radius.JSONCodec` working on bytes.
+
+Usage:
+    python benchmarks/json_codec.py --iterations 2000 --logs 500
+"""
+import argparse
+import json
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+from radius.utils.json_codec import JSONCodec, OrjsonCodec
+
+
+def uniswap_quote() -> Dict[str, Any]:
+    pool = {
+        "type": "v3-pool",
+        "address": "0x" + "c3" * 20,
+        "tokenIn": {"chainId": 1223953, "decimals": "18", "address": "0x" + "11" * 20, "symbol": "WETH"},
+        "tokenOut": {"chainId": 1223953, "decimals": "6", "address": "0x" + "22" * 20, "symbol": "USDC"},
+        "fee": "500",
+        "liquidity": "1234567890123456789",
+        "sqrtRatioX96": "1461446703485210103287273052203988822378723970341",
+        "tickCurrent": "-197314",
+        "amountIn": "1000000000000000000",
+        "amountOut": "3412345678",
+    }
+    return {
+        "requestId": "7f6b7e0c-4c56-4b43-9c59-7d3a1c2e9f10",
+        "routing": "CLASSIC",
+        "quote": {
+            "chainId": 1223953,
+            "input": {"amount": "1000000000000000000", "token": pool["tokenIn"]["address"]},
+            "output": {"amount": "3412345678", "token": pool["tokenOut"]["address"]},
+            "swapper": "0x" + "33" * 20,
+            "route": [[dict(pool) for _ in range(3)] for _ in range(4)],
+            "slippage": 0.5,
+            "gasFee": "1234567890000",
+            "gasFeeUSD": "0.0123",
+            "gasUseEstimate": "184000",
+            "priceImpact": 0.02,
+        },
+        "permitData": None,
+    }
+
+
+def get_logs_response(count: int) -> Dict[str, Any]:
+    log = {
+        "address": "0x" + "44" * 20,
+        "topics": ["0x" + "dd" * 32, "0x" + "00" * 12 + "55" * 20, "0x" + "00" * 12 + "66" * 20],
+        "data": "0x" + "00" * 31 + "01",
+        "blockNumber": "0x12d687",
+        "transactionHash": "0x" + "77" * 32,
+        "transactionIndex": "0x3",
+        "blockHash": "0x" + "88" * 32,
+        "logIndex": "0x1f",
+        "removed": False,
+    }
+    return {"jsonrpc": "2.0", "id": 1, "result": [dict(log) for _ in range(count)]}
+
+
+def balance_batch(count: int) -> List[Dict[str, Any]]:
+    return [{"jsonrpc": "2.0", "id": index, "result": hex(10**18 + index)} for index in range(count)]
+
+
+def measure(operation: Callable[[], Any], iterations: int) -> float:
+    """Returns the mean time of one call, in microseconds."""
+    operation()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        operation()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def run(iterations: int, logs: int) -> List[Tuple[str, int, str, float, float]]:
+    codecs: List[JSONCodec] = [JSONCodec()]
+    try:
+        codecs.append(OrjsonCodec())
+    except ImportError:
+        pass
+
+    payloads = {
+        "uniswap_quote": uniswap_quote(),
+        f"eth_getLogs[{logs}]": get_logs_response(logs),
+        "eth_getBalance[50]": balance_batch(50),
+    }
+    rows = []
+    for payload_name, payload in payloads.items():
+        body = json.dumps(payload).encode()
+        baseline = (
+            measure(lambda: json.dumps(payload).encode(), iterations),
+            measure(lambda: json.loads(body.decode()), iterations),
+        )
+        rows.append((payload_name, len(body), "json (str)", *baseline))
+        for codec in codecs:
+            rows.append((
+                payload_name,
+                len(body),
+                codec.name,
+                measure(lambda: codec.dumps(payload), iterations),
+                measure(lambda: codec.loads(body), iterations),
+            ))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=2000, help="Encodes and decodes per payload and codec")
+    parser.add_argument("--logs", type=int, default=500, help="Logs in the eth_getLogs response")
+    args = parser.parse_args()
+
+    print(f"{'payload':<22}{'bytes':>10}  {'codec':<12}{'encode µs':>12}{'decode µs':>12}")
+    for payload_name, size, codec_name, encode, decode in run(args.iterations, args.logs):
+        print(f"{payload_name:<22}{size:>10}  {codec_name:<12}{encode:>12.1f}{decode:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+"""
+Multi-agent load test: concurrent agent sessions against LocalChain and a mock Uniswap API.
+
+Simulates agents arriving at a configurable rate. Each builds its own wallet client and toolset
+with ``get_tools`` (send_ETH, ERC20 and Uniswap plugins), as a new agent session would, then
+makes a scripted mix of tool calls with optional think time between them; no LLM is involved.
+Wallet writes are signed locally with accounts shared round-robin between agents, and Uniswap
+calls go to an in-process HTTP stand-in for the trading API.
+
+Reports per-tool latency percentiles, overall throughput, JSON-RPC and API request counts, and
+a timeline of active agents, throughput and resident memory. LocalChain executes requests one
+at a time, so absolute numbers reflect py-evm; compare runs with each other.
+
+Usage:
+    python benchmarks/load_test.py --agents 50 --calls 20
+    python benchmarks/load_test.py --agents 200 --arrival-rate 20 --think-time 0.05 --rpc-cache
+    python benchmarks/load_test.py --mix get_balance=1,uniswap_get_quote=1 --api-latency 30
+"""
+import argparse
+import contextlib
+import io
+import json
+import random
+import resource
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+
+from radius import get_tools
+from radius_plugins.erc20 import ERC20PluginOptions, erc20
+from radius_plugins.uniswap import UniswapPluginOptions, uniswap
+from radius_wallets.evm import send_eth
+from radius_wallets.web3 import NonceManager, RPCCache, Web3Options
+from radius_wallets.web3.testing import LatencyRecorder, LocalChain
+
+DEFAULT_MIX = "get_balance=3,get_token_balance=3,uniswap_get_quote=2,send_ETH=1,transfer=1"
+
+
+class MockUniswapAPI:
+    """In-process stand-in for the Uniswap trading API, answering quotes and approval checks."""
+
+    def __init__(self, token_in: str, token_out: str, latency: float = 0.0):
+        self.requests = 0
+        api = self
+        quote = {
+            "requestId": "load-test",
+            "routing": "CLASSIC",
+            "quote": {
+                "input": {"amount": "1000000000000000000", "token": token_in},
+                "output": {"amount": "998000000000000000", "token": token_out},
+                "route": [[{"type": "v3-pool", "fee": "500", "tokenIn": token_in, "tokenOut": token_out}]],
+                "gasFee": "1000000000000",
+                "gasUseEstimate": "184000",
+            },
+            "permitData": None,
+        }
+        responses = {"/quote": json.dumps(quote).encode(), "/check_approval": b'{"approval": null}'}
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                api.requests += 1
+                if latency:
+                    time.sleep(latency)
+                body = responses.get(self.path)
+                self.send_response(200 if body is not None else 404)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body or b"")))
+                self.end_headers()
+                self.wfile.write(body or b"")
+
+            def log_message(self, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._httpd.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self._httpd.server_address[1]}"
+        threading.Thread(target=self._httpd.serve_forever, daemon=True).start()
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+
+
+def rss_bytes() -> int:
+    """Current resident set size; the peak where /proc is unavailable."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * resource.getpagesize()
+    except OSError:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Kilobytes on Linux, bytes on macOS
+        return peak if peak > 1 << 30 else peak * 1024
+
+
+def parse_mix(mix: str) -> List[Tuple[str, float]]:
+    weights = []
+    for item in mix.split(","):
+        name, _, weight = item.partition("=")
+        weights.append((name.strip(), float(weight or 1)))
+    return weights
+
+
+class LoadTest:
+    """Runs simulated agents and collects latencies, counters and a resource timeline."""
+
+    def __init__(self, args: argparse.Namespace):
+        self.args = args
+        self.chain = LocalChain(num_accounts=args.accounts + 1)
+        for account in self.chain.accounts[1:]:
+            self.chain.mint(account.address, 10**6 * 10**18)
+        self.api = MockUniswapAPI(self.chain.token_address, self.chain.multicall_address, args.api_latency / 1000)
+        self.plugins = [
+            send_eth(),
+            erc20(ERC20PluginOptions(tokens=[self.chain.token])),
+            uniswap(UniswapPluginOptions(api_key="load-test", base_url=self.api.url)),
+        ]
+        self.nonces = NonceManager(self.chain.web3)
+        self.rpc_cache = RPCCache() if args.rpc_cache else None
+        self.mix = parse_mix(args.mix)
+        self.recorder = LatencyRecorder()
+        self.errors: Dict[str, int] = {}
+        self.timeline: List[Tuple[float, int, int, int]] = []
+        self._lock = threading.Lock()
+        self._active = 0
+        self._peak_active = 0
+        self._completed = 0
+
+    def arguments(self, name: str, agent: int) -> Dict[str, object]:
+        recipient = self.chain.accounts[(agent + 1) % len(self.chain.accounts)].address
+        token = self.chain.token_address
+        return {
+            "get_balance": {"address": recipient},
+            "get_token_balance": {"wallet": recipient, "tokenAddress": token},
+            "send_ETH": {"to": recipient, "amount": "0.0001"},
+            "transfer": {"tokenAddress": token, "to": recipient, "amount": "1"},
+            "uniswap_get_quote": {
+                "tokenIn": token, "tokenOut": self.chain.multicall_address, "amount": "1000000", "protocols": ["V3"],
+            },
+            "uniswap_check_approval": {"token": token, "amount": "1000000", "walletAddress": recipient},
+        }[name]
+
+    def run_agent(self, agent: int, seed: int) -> None:
+        rng = random.Random(seed)
+        account = self.chain.accounts[1 + agent % self.args.accounts]
+        with self._lock:
+            self._active += 1
+            self._peak_active = max(self._peak_active, self._active)
+        try:
+            wallet = self.chain.wallet(
+                1 + agent % self.args.accounts,
+                Web3Options(account=account, nonce_manager=self.nonces, rpc_cache=self.rpc_cache),
+            )
+            tools = {tool.name: tool for tool in get_tools(wallet, self.plugins)}
+            names = [name for name, _ in self.mix]
+            weights = [weight for _, weight in self.mix]
+            for _ in range(self.args.calls):
+                if self.args.think_time:
+                    time.sleep(rng.expovariate(1 / self.args.think_time))
+                name = rng.choices(names, weights)[0]
+                started = time.perf_counter()
+                try:
+                    tools[name].execute(self.arguments(name, agent))
+                except Exception:
+                    with self._lock:
+                        self.errors[name] = self.errors.get(name, 0) + 1
+                self.recorder.record(name, time.perf_counter() - started)
+                with self._lock:
+                    self._completed += 1
+        finally:
+            with self._lock:
+                self._active -= 1
+
+    def sample(self, started: float, stop: threading.Event) -> None:
+        while True:
+            with self._lock:
+                self.timeline.append((time.perf_counter() - started, self._active, self._completed, rss_bytes()))
+            if stop.wait(self.args.sample_interval):
+                with self._lock:
+                    self.timeline.append((time.perf_counter() - started, self._active, self._completed, rss_bytes()))
+                return
+
+    def run(self) -> float:
+        rng = random.Random(self.args.seed)
+        requests_before = self.chain.request_count
+        stop = threading.Event()
+        started = time.perf_counter()
+        self.recorder.reset()
+        sampler = threading.Thread(target=self.sample, args=(started, stop), daemon=True)
+        sampler.start()
+        agents = []
+        # The Uniswap plugin prints its request parameters
+        with contextlib.redirect_stdout(io.StringIO()):
+            for agent in range(self.args.agents):
+                if self.args.arrival_rate > 0 and agent:
+                    time.sleep(rng.expovariate(self.args.arrival_rate))
+                thread = threading.Thread(target=self.run_agent, args=(agent, rng.random()), daemon=True)
+                thread.start()
+                agents.append(thread)
+            for thread in agents:
+                thread.join()
+        elapsed = time.perf_counter() - started
+        stop.set()
+        sampler.join()
+        self.rpc_requests = self.chain.request_count - requests_before
+        return elapsed
+
+    def print_report(self, elapsed: float) -> None:
+        print(f"{'t (s)':>8}{'agents':>8}{'calls':>8}{'calls/s':>10}{'RSS MiB':>10}")
+        previous: Optional[Tuple[float, int, int, int]] = None
+        for point in self.timeline:
+            at, active, completed, rss = point
+            rate = (completed - previous[2]) / max(at - previous[0], 1e-9) if previous else 0.0
+            print(f"{at:>8.1f}{active:>8}{completed:>8}{rate:>10.1f}{rss / 2**20:>10.1f}")
+            previous = point
+
+        print()
+        print(self.recorder.format_report())
+        if self.errors:
+            print("\nErrors: " + ", ".join(f"{name}={count}" for name, count in sorted(self.errors.items())))
+
+        total = self._completed
+        first_rss, last_rss = self.timeline[0][3], self.timeline[-1][3]
+        print(f"\n{self.args.agents} agents (peak {self._peak_active} concurrent), {total} tool calls "
+              f"in {elapsed:.2f}s ({total / elapsed:.1f} calls/s)")
+        print(f"JSON-RPC requests: {self.rpc_requests} ({self.rpc_requests / max(total, 1):.1f} per tool call); "
+              f"Uniswap API requests: {self.api.requests}")
+        print(f"RSS: {first_rss / 2**20:.1f} MiB -> {last_rss / 2**20:.1f} MiB "
+              f"({(last_rss - first_rss) / max(self.args.agents, 1) / 1024:.1f} KiB per agent)")
+        if self.rpc_cache is not None:
+            stats = self.rpc_cache.stats()
+            print(f"RPC cache: {stats['hits']} hits, {stats['misses']} misses ({stats['hit_rate']:.0%} hit rate)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--agents", type=int, default=20, help="Simulated agent sessions")
+    parser.add_argument("--calls", type=int, default=20, help="Tool calls per agent")
+    parser.add_argument(
+        "--arrival-rate", type=float, default=0.0, help="Agents arriving per second; 0 starts all at once"
+    )
+    parser.add_argument("--think-time", type=float, default=0.0, help="Mean seconds an agent waits between calls")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="Weighted tool mix, as name=weight pairs")
+    parser.add_argument("--accounts", type=int, default=10, help="Funded accounts shared round-robin by the agents")
+    parser.add_argument(
+        "--api-latency", type=float, default=0.0, help="Milliseconds the mock Uniswap API takes to answer"
+    )
+    parser.add_argument("--rpc-cache", action="store_true", help="Share an RPCCache between the agents' wallets")
+    parser.add_argument("--sample-interval", type=float, default=1.0, help="Seconds between timeline samples")
+    parser.add_argument("--seed", type=int, default=1, help="Seed of the arrival times and tool mix")
+    args = parser.parse_args()
+
+    load_test = LoadTest(args)
+    elapsed = load_test.run()
+    load_test.print_report(elapsed)
+    load_test.api.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+End-to-end throughput and latency benchmark against the in-process LocalChain.
+
+Runs the core wallet tools, the SendETHPlugin and the ERC20 plugin against py-evm and prints
+per-tool latency percentiles plus overall throughput.
+
+Usage:
+    python benchmarks/local_chain.py --iterations 200
+    python benchmarks/local_chain.py --iterations 200 --rpc-cache   # with the block-aware RPC cache
+"""
+import argparse
+import time
+
+from radius import get_tools
+from radius_plugins.erc20 import ERC20PluginOptions, erc20
+from radius_wallets.evm import send_eth
+from radius_wallets.web3 import RPCCache, Web3Options
+from radius_wallets.web3.testing import LatencyRecorder, LocalChain
+
+
+def run(iterations: int, rpc_cache: bool = False) -> LatencyRecorder:
+    chain = LocalChain()
+    cache = RPCCache() if rpc_cache else None
+    wallet = chain.wallet(0, Web3Options(rpc_cache=cache))
+    recipient = chain.accounts[1].address
+    tools = {
+        tool.name: tool
+        for tool in get_tools(wallet, [send_eth(), erc20(ERC20PluginOptions(tokens=[chain.token]))])
+    }
+
+    calls = [
+        ("get_balance", {"address": recipient}),
+        ("get_token_balance", {"wallet": recipient, "tokenAddress": chain.token_address}),
+        ("send_ETH", {"to": recipient, "amount": "0.001"}),
+        ("transfer", {"tokenAddress": chain.token_address, "to": recipient, "amount": "1"}),
+    ]
+
+    recorder = LatencyRecorder()
+    requests_before = chain.request_count
+    for _ in range(iterations):
+        for name, parameters in calls:
+            with recorder.measure(name):
+                tools[name].execute(parameters)
+
+    total_calls = iterations * len(calls)
+    print(f"JSON-RPC requests per tool call: {(chain.request_count - requests_before) / total_calls:.1f}")
+    if cache is not None:
+        stats = cache.stats()
+        print(f"RPC cache: {stats['hits']} hits, {stats['misses']} misses ({stats['hit_rate']:.0%} hit rate)")
+    return recorder
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=100, help="Rounds of the tool call mix to run")
+    parser.add_argument("--rpc-cache", action="store_true", help="Serve wallet reads through an RPCCache")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    recorder = run(args.iterations, args.rpc_cache)
+    elapsed = time.perf_counter() - started
+
+    print(recorder.format_report())
+    total = sum(summary["count"] for summary in recorder.report().values())
+    print(f"\n{total} tool calls in {elapsed:.2f}s ({total / elapsed:.1f} calls/s)")
+
+
+if __name__ == "__main__":
+    main()
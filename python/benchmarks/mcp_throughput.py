@@ -0,0 +1,113 @@
+"""
+Throughput benchmark of the MCP tool server against a local client.
+
+Opens a number of client sessions against the LocalChain tools and makes concurrent tool calls
+in each. In ``warm`` mode every session talks to one long-lived OnChainToolServer; in ``cold``
+mode a new wallet client, tool list and server are built for each session, as happens when an
+MCP client spawns a fresh server process per conversation.
+
+Usage:
+    python benchmarks/mcp_throughput.py --sessions 20 --calls 20
+    python benchmarks/mcp_throughput.py --sessions 20 --calls 20 --transport http
+"""
+import argparse
+import asyncio
+import socket
+import threading
+import time
+
+import uvicorn
+from mcp import Client
+from radius_adapters.mcp import OnChainToolServer
+from radius_plugins.erc20 import ERC20PluginOptions, erc20
+from radius_wallets.evm import send_eth
+from radius_wallets.web3 import Web3Options
+from radius_wallets.web3.testing import LatencyRecorder, LocalChain
+
+
+def build_server(chain: LocalChain) -> OnChainToolServer:
+    wallet = chain.wallet(0, Web3Options())
+    return OnChainToolServer(wallet, [send_eth(), erc20(ERC20PluginOptions(tokens=[chain.token]))])
+
+
+class HTTPServer:
+    """Runs an OnChainToolServer over Streamable HTTP on a background thread."""
+
+    def __init__(self, server: OnChainToolServer):
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            self.port = probe.getsockname()[1]
+        config = uvicorn.Config(server.http_app(), host="127.0.0.1", port=self.port, log_level="warning")
+        self._uvicorn = uvicorn.Server(config)
+        self._thread = threading.Thread(target=self._uvicorn.run, daemon=True)
+        self._thread.start()
+        while not self._uvicorn.started:
+            time.sleep(0.01)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}/mcp"
+
+    def stop(self) -> None:
+        self._uvicorn.should_exit = True
+        self._thread.join()
+
+
+async def run_session(target, chain: LocalChain, calls: int, recorder: LatencyRecorder) -> None:
+    recipient = chain.accounts[1].address
+    mix = [
+        ("get_balance", {"address": recipient}),
+        ("get_token_balance", {"wallet": recipient, "tokenAddress": chain.token_address}),
+    ]
+
+    async def call(name, arguments):
+        started = time.perf_counter()
+        result = await client.call_tool(name, arguments)
+        recorder.record(name, time.perf_counter() - started)
+        assert not result.is_error, result.content[0].text
+
+    async with Client(target) as client:
+        await client.list_tools()
+        await asyncio.gather(*(call(*mix[i % len(mix)]) for i in range(calls)))
+
+
+async def run(mode: str, transport: str, sessions: int, calls: int) -> LatencyRecorder:
+    chain = LocalChain()
+    recorder = LatencyRecorder()
+    shared = build_server(chain) if mode == "warm" else None
+    shared_http = HTTPServer(shared) if shared is not None and transport == "http" else None
+    for _ in range(sessions):
+        server = shared or build_server(chain)
+        http = shared_http or (HTTPServer(server) if transport == "http" else None)
+        await run_session(http.url if http else server.server, chain, calls, recorder)
+        if shared is None:
+            if http is not None:
+                http.stop()
+            server.close()
+    if shared_http is not None:
+        shared_http.stop()
+    if shared is not None:
+        stats = shared.stats()
+        print(f"Scheduler: {stats['scheduler']['max_queued']} calls queued at most, {stats['tool_errors']} errors")
+    return recorder
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=10, help="Client sessions to open one after another")
+    parser.add_argument("--calls", type=int, default=20, help="Concurrent tool calls per session")
+    parser.add_argument("--transport", choices=["memory", "http"], default="memory", help="How the client connects")
+    args = parser.parse_args()
+
+    for mode in ("cold", "warm"):
+        started = time.perf_counter()
+        recorder = asyncio.run(run(mode, args.transport, args.sessions, args.calls))
+        elapsed = time.perf_counter() - started
+        total = args.sessions * args.calls
+        print(f"\n== {mode} server ({args.transport}) ==")
+        print(recorder.format_report())
+        print(f"{total} tool calls in {elapsed:.2f}s ({total / elapsed:.1f} calls/s)\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+EIP-712 signing benchmark: eth_account's encode_typed_data vs. the cached TypedDataEncoder.
+
+Encodes and signs Uniswap Permit2 ``PermitSingle`` and ``PermitBatch`` payloads that differ
+only in amount and nonce, as an agent approving swaps does, encoding each from scratch with
+``eth_account.messages.encode_typed_data`` (what ``sign_typed_data`` used to do) and with a
+:class:`~radius_wallets.web3.TypedDataEncoder` that reuses domain separators and type hashes.
+Reports encodings and signatures per second. Signing rates depend on the ECDSA backend of
+eth_keys: with the pure-Python backend the signature itself dominates, so install
+``coincurve`` to see the encoding savings end to end.
+
+Usage:
+    python benchmarks/typed_data.py --iterations 2000 --batch 5
+"""
+import argparse
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+from eth_account import Account
+from eth_account.messages import encode_typed_data
+
+from radius_wallets.web3 import TypedDataEncoder
+
+PERMIT2 = "0x000000000022D473030F116dDEE9F6B43aC78BA3"
+DOMAIN_TYPE = [
+    {"name": "name", "type": "string"},
+    {"name": "chainId", "type": "uint256"},
+    {"name": "verifyingContract", "type": "address"},
+]
+DETAILS_TYPE = [
+    {"name": "token", "type": "address"},
+    {"name": "amount", "type": "uint160"},
+    {"name": "expiration", "type": "uint48"},
+    {"name": "nonce", "type": "uint48"},
+]
+
+
+def details(index: int, nonce: int) -> Dict[str, Any]:
+    return {"token": f"0x{index + 1:040x}", "amount": str(10**18 + nonce), "expiration": 1_900_000_000, "nonce": nonce}
+
+
+def permit_single(nonce: int) -> Dict[str, Any]:
+    return {
+        "types": {
+            "EIP712Domain": DOMAIN_TYPE,
+            "PermitSingle": [
+                {"name": "details", "type": "PermitDetails"},
+                {"name": "spender", "type": "address"},
+                {"name": "sigDeadline", "type": "uint256"},
+            ],
+            "PermitDetails": DETAILS_TYPE,
+        },
+        "primaryType": "PermitSingle",
+        "domain": {"name": "Permit2", "chainId": 1223953, "verifyingContract": PERMIT2},
+        "message": {"details": details(0, nonce), "spender": "0x" + "22" * 20, "sigDeadline": "1900000000"},
+    }
+
+
+def permit_batch(nonce: int, tokens: int) -> Dict[str, Any]:
+    return {
+        "types": {
+            "EIP712Domain": DOMAIN_TYPE,
+            "PermitBatch": [
+                {"name": "details", "type": "PermitDetails[]"},
+                {"name": "spender", "type": "address"},
+                {"name": "sigDeadline", "type": "uint256"},
+            ],
+            "PermitDetails": DETAILS_TYPE,
+        },
+        "primaryType": "PermitBatch",
+        "domain": {"name": "Permit2", "chainId": 1223953, "verifyingContract": PERMIT2},
+        "message": {
+            "details": [details(index, nonce) for index in range(tokens)],
+            "spender": "0x" + "22" * 20,
+            "sigDeadline": "1900000000",
+        },
+    }
+
+
+def rate(operation: Callable[[Dict[str, Any]], Any], payloads: List[Dict[str, Any]]) -> float:
+    """Returns the operations per second over the payloads."""
+    operation(payloads[0])
+    start = time.perf_counter()
+    for payload in payloads:
+        operation(payload)
+    return len(payloads) / (time.perf_counter() - start)
+
+
+def run(iterations: int, batch: int) -> List[Tuple[str, str, float, float]]:
+    account = Account.create()
+    payload_sets = {
+        "PermitSingle": [permit_single(nonce) for nonce in range(iterations)],
+        f"PermitBatch[{batch}]": [permit_batch(nonce, batch) for nonce in range(iterations)],
+    }
+    encoders: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+        "encode_typed_data": lambda payload: encode_typed_data(full_message=payload),
+        "TypedDataEncoder": TypedDataEncoder().encode,
+    }
+    rows = []
+    for payload_name, payloads in payload_sets.items():
+        for encoder_name, encode in encoders.items():
+            rows.append((
+                payload_name,
+                encoder_name,
+                rate(encode, payloads),
+                rate(lambda payload: account.sign_message(encode(payload)), payloads),
+            ))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=2000, help="Payloads encoded and signed per encoder")
+    parser.add_argument("--batch", type=int, default=5, help="Tokens in the PermitBatch payload")
+    args = parser.parse_args()
+
+    print(f"{'payload':<18}{'encoder':<20}{'encodes/s':>12}{'signatures/s':>14}")
+    for payload_name, encoder_name, encodes, signatures in run(args.iterations, args.batch):
+        print(f"{payload_name:<18}{encoder_name:<20}{encodes:>12.0f}{signatures:>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,7 @@ from radius_plugins.erc20 import ERC20PluginOptions, erc20
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 from web3 import Web3
-from web3.middleware.signing import construct_sign_and_send_raw_middleware
+from web3.middleware import SignAndSendRawMiddlewareBuilder
 from eth_account.signers.local import LocalAccount
 from eth_account import Account
 
@@ -46,8 +46,8 @@ if chain_id != 1223953:  # Radius chain ID
 account: LocalAccount = Account.from_key(private_key)
 w3.eth.default_account = account.address  # Set the default account
 w3.eth.default_local_account = account
-w3.middleware_onion.add(
-    construct_sign_and_send_raw_middleware(account)
+w3.middleware_onion.inject(
+    SignAndSendRawMiddlewareBuilder.build(account), layer=0
 )  # Add middleware
 
 # Initialize LLM
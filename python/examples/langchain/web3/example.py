@@ -4,8 +4,7 @@ from dotenv import load_dotenv
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 from web3 import Web3
-from web3.middleware.signing import construct_sign_and_send_raw_middleware
-from web3.middleware import geth_poa_middleware
+from web3.middleware import ExtraDataToPOAMiddleware, SignAndSendRawMiddlewareBuilder
 from eth_account.signers.local import LocalAccount
 from eth_account import Account
 
@@ -39,12 +38,12 @@ private_key = os.getenv("WALLET_PRIVATE_KEY")
 assert private_key is not None, "You must set WALLET_PRIVATE_KEY environment variable"
 assert private_key.startswith("0x"), "Private key must start with 0x hex prefix"
 
-w3.middleware_onion.inject(geth_poa_middleware, layer=0)
+w3.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
 
 account: LocalAccount = Account.from_key(private_key)
 w3.eth.default_account = account.address  # Set the default account
 w3.eth.default_local_account = account
-w3.middleware_onion.add(construct_sign_and_send_raw_middleware(account))
+w3.middleware_onion.inject(SignAndSendRawMiddlewareBuilder.build(account), layer=0)
 
 # Initialize LLM
 llm = ChatOpenAI(model="gpt-4o-mini")
@@ -1,7 +1,29 @@
-from .adapter import get_on_chain_tools
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .adapter import get_on_chain_tools
 
 __version__ = "1.0.0"
 
+# Resolved on first access (PEP 562) so LangChain is only imported when tools are built.
+_LAZY_ATTRIBUTES = {
+    "get_on_chain_tools": ".adapter",
+}
+
 __all__ = [
     "get_on_chain_tools",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
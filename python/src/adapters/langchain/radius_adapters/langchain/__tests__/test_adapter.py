@@ -1,3 +1,6 @@
+import os
+import subprocess
+import sys
 from unittest.mock import Mock, patch
 from typing import Dict, Any
 from pydantic import BaseModel
@@ -146,8 +149,9 @@ class TestLangChainAdapter:
             assert len(tools) == 1
             langchain_tool = tools[0]
             
-            # Verify the parameter schema matches
-            assert langchain_tool.args_schema == TestParameters
+            # Verify the cached JSON schema of the parameters is passed through
+            assert langchain_tool.args_schema is mock_tool.json_schema
+            assert langchain_tool.args_schema == TestParameters.model_json_schema()
 
     def test_multiple_plugins_and_tools(self):
         """Test with multiple plugins and tools."""
@@ -192,4 +196,20 @@ class TestLangChainAdapter:
             
             # Verify name and description match exactly
             assert langchain_tool.name == test_name
-            assert langchain_tool.description == test_description
\ No newline at end of file
+            assert langchain_tool.description == test_description
+
+    def test_import_defers_langchain(self):
+        """Test that importing the adapter package does not import LangChain until tools are built."""
+        code = (
+            "import sys, radius_adapters.langchain\n"
+            "assert 'langchain_core' not in sys.modules\n"
+            "radius_adapters.langchain.get_on_chain_tools\n"
+            "assert 'langchain_core' in sys.modules\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        )
+        assert result.returncode == 0, result.stderr
@@ -22,12 +22,13 @@ def get_on_chain_tools(wallet: WalletClientBase, plugins: List[Any]) -> List[Bas
 
     langchain_tools = []
     for t in tools:
-        # Create a LangChain Tool for each Radius tool
+        # Create a LangChain Tool for each Radius tool. The cached JSON schema is passed instead of the
+        # Pydantic model so LangChain does not regenerate it; the tool validates its own parameters.
         tool = StructuredTool(
             name=t.name,
             description=t.description,
             func=lambda t=t, **args: _execute_tool(t, **args),
-            args_schema=t.parameters,
+            args_schema=t.json_schema,
         )
         langchain_tools.append(tool)
 
@@ -0,0 +1 @@
+# Initialize test package
\ No newline at end of file
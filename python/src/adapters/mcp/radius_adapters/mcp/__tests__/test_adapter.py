@@ -0,0 +1,188 @@
+"""
+Tests for the MCP adapter and the long-lived MCP tool server.
+"""
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+from mcp import Client
+from pydantic import BaseModel
+
+from radius.classes.plugin_base import PluginBase
+from radius.classes.tool_base import create_tool, get_json_schema
+from radius.classes.wallet_client_base import WalletClientBase
+from radius_adapters.mcp.adapter import OnChainToolServer, get_on_chain_tools
+
+
+class EchoParameters(BaseModel):
+    message: str
+    delay: float = 0.0
+
+
+class MockWallet(WalletClientBase):
+    """Mock wallet without core tools."""
+
+    def get_chain(self):
+        return {"type": "evm", "id": 1}
+
+    def get_core_tools(self):
+        return []
+
+    def get_address(self):
+        return "0x1234567890123456789012345678901234567890"
+
+    def sign_message(self, message):
+        return {"signature": "0x1234"}
+
+    def balance_of(self, address):
+        return {"decimals": 18, "symbol": "ETH", "name": "Ethereum", "value": "1", "in_base_units": "1"}
+
+
+class MockPlugin(PluginBase):
+    """Plugin with a read tool, a write tool and a failing tool, counting how often tools are built."""
+
+    def __init__(self):
+        super().__init__("mock", [])
+        self.builds = 0
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+
+    def supports_chain(self, chain):
+        return True
+
+    def get_tools(self, wallet_client):
+        self.builds += 1
+        return [
+            create_tool({"name": "echo", "description": "Echoes", "parameters": EchoParameters, "side_effect": "read"},
+                        self._echo),
+            create_tool({"name": "send", "description": "Sends", "parameters": EchoParameters, "side_effect": "write",
+                         "wallet_client": wallet_client}, self._echo),
+            create_tool({"name": "fail", "description": "Fails", "parameters": EchoParameters, "side_effect": "read"},
+                        self._fail),
+        ]
+
+    def _echo(self, parameters):
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(parameters["delay"])
+        with self.lock:
+            self.running -= 1
+        return {"echo": parameters["message"]}
+
+    def _fail(self, parameters):
+        raise RuntimeError("node unavailable")
+
+
+def test_get_on_chain_tools():
+    """Test the tool listing and handler mirroring the TypeScript adapter."""
+    tools = get_on_chain_tools(MockWallet(), [MockPlugin()])
+
+    listing = {tool["name"]: tool for tool in tools.list_of_tools()}
+    assert set(listing) == {"echo", "send", "fail"}
+    assert listing["echo"]["inputSchema"]["required"] == ["message"]
+    assert listing["echo"]["inputSchema"] is get_json_schema(EchoParameters)
+    assert tools.tool_handler("echo", {"message": "hi"}) == {"content": [{"type": "text", "text": '{"echo": "hi"}'}]}
+    with pytest.raises(ValueError, match="Tool missing not found"):
+        tools.tool_handler("missing", {})
+
+
+@pytest.mark.asyncio
+async def test_server_lists_and_calls_tools():
+    """Test listing tools with side effect annotations and calling them through an MCP client."""
+    server = OnChainToolServer(MockWallet(), [MockPlugin()])
+
+    async with Client(server.server) as client:
+        tools = {tool.name: tool for tool in (await client.list_tools()).tools}
+        result = await client.call_tool("echo", {"message": "hi"})
+        missing = await client.call_tool("missing", {})
+        failed = await client.call_tool("fail", {"message": "hi"})
+        invalid = await client.call_tool("echo", {})
+
+    assert tools["echo"].annotations.read_only_hint is True
+    assert tools["send"].annotations.destructive_hint is True
+    assert tools["send"].input_schema["properties"]["message"]["type"] == "string"
+    assert not result.is_error
+    assert json.loads(result.content[0].text) == {"echo": "hi"}
+    assert missing.is_error and missing.content[0].text == "Tool missing not found"
+    assert failed.is_error and failed.content[0].text == "node unavailable"
+    assert invalid.is_error
+    stats = server.stats()
+    assert stats["list_requests"] == 1
+    assert stats["tool_calls"] == 4
+    assert stats["tool_errors"] == 3
+    server.close()
+
+
+@pytest.mark.asyncio
+async def test_sessions_share_warm_tools_and_run_calls_concurrently():
+    """Test that sessions reuse the tools built at startup and that their read calls overlap."""
+    plugin = MockPlugin()
+    server = OnChainToolServer(MockWallet(), [plugin], max_concurrency=8)
+
+    async def session(index):
+        async with Client(server.server) as client:
+            return await asyncio.gather(
+                *(client.call_tool("echo", {"message": f"{index}-{i}", "delay": 0.2}) for i in range(2))
+            )
+
+    started = time.monotonic()
+    results = await asyncio.gather(*(session(index) for index in range(3)))
+
+    assert time.monotonic() - started < 1.0
+    assert plugin.builds == 1
+    assert plugin.max_running >= 4
+    assert json.loads(results[2][1].content[0].text) == {"echo": "2-1"}
+    assert server.stats()["scheduler"]["reads"] == 6
+    server.close()
+
+
+@pytest.mark.asyncio
+async def test_writes_from_one_wallet_are_serialized_across_sessions():
+    """Test that write calls from concurrent sessions never overlap."""
+    plugin = MockPlugin()
+    server = OnChainToolServer(MockWallet(), [plugin])
+
+    async def session(index):
+        async with Client(server.server) as client:
+            return await client.call_tool("send", {"message": str(index), "delay": 0.05})
+
+    results = await asyncio.gather(*(session(index) for index in range(3)))
+
+    assert not any(result.is_error for result in results)
+    assert plugin.max_running == 1
+    assert server.stats()["scheduler"]["writes"] == 3
+    server.close()
+
+
+def test_http_app_routes_the_endpoint():
+    """Test that the Streamable HTTP app is served at the configured path."""
+    server = OnChainToolServer(MockWallet(), [MockPlugin()])
+
+    app = server.http_app(path="/radius")
+
+    assert [route.path for route in app.routes] == ["/radius"]
+    server.close()
+
+
+def test_import_defers_mcp():
+    """Test that importing the adapter package does not import the MCP SDK until it is used."""
+    code = (
+        "import sys, radius_adapters.mcp\n"
+        "assert 'mcp' not in sys.modules\n"
+        "radius_adapters.mcp.OnChainToolServer\n"
+        "assert 'mcp' in sys.modules\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    assert result.returncode == 0, result.stderr
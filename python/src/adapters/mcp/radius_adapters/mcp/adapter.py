@@ -0,0 +1,221 @@
+import json
+from typing import Any, Dict, List, Optional, TypedDict
+
+import anyio
+import mcp_types as types
+from mcp.server.lowlevel import Server
+from radius import ToolBase, ToolScheduler, ToolSchedulerStats, WalletClientBase, get_tools
+
+
+class OnChainTools:
+    """
+    Radius tools exposed in the shape of MCP ``tools/list`` and ``tools/call`` responses.
+
+    Args:
+        tools: The tools to expose
+    """
+
+    def __init__(self, tools: List[ToolBase]):
+        self.tools = {tool.name: tool for tool in tools}
+
+    def list_of_tools(self) -> List[Dict[str, Any]]:
+        """Returns the name, description and JSON input schema of every tool."""
+        return [
+            {
+                "name": tool.name,
+                "description": tool.description,
+                "inputSchema": tool.json_schema,
+            }
+            for tool in self.tools.values()
+        ]
+
+    def tool_handler(self, name: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Runs a tool and wraps its result as MCP text content.
+
+        Args:
+            name: The name of the tool
+            parameters: The tool's arguments
+
+        Returns:
+            The result serialized as JSON in a text content block
+
+        Raises:
+            ValueError: If no tool has that name
+        """
+        tool = self.tools.get(name)
+        if tool is None:
+            raise ValueError(f"Tool {name} not found")
+        result = tool.execute(parameters)
+        return {"content": [{"type": "text", "text": _to_json(result)}]}
+
+
+def get_on_chain_tools(wallet: WalletClientBase, plugins: List[Any]) -> OnChainTools:
+    """Create MCP tool listings and a tool handler from Radius tools.
+
+    Args:
+        wallet: A wallet client instance
+        plugins: List of plugin instances
+
+    Returns:
+        The tools, listable and callable in MCP format
+    """
+    return OnChainTools(get_tools(wallet=wallet, plugins=plugins))
+
+
+class OnChainToolServerStats(TypedDict):
+    """
+    Counters of an MCP tool server
+
+    Attributes:
+        list_requests: tools/list requests answered
+        tool_calls: tools/call requests received
+        tool_errors: Tool calls answered with an error result
+        scheduler: Counters of the scheduler running the tool calls
+    """
+
+    list_requests: int
+    tool_calls: int
+    tool_errors: int
+    scheduler: ToolSchedulerStats
+
+
+class OnChainToolServer:
+    """
+    Serves Radius tools over MCP from one long-lived process.
+
+    The wallet, the plugins and the tool list are built once and shared by every client
+    session, so wallet connections, RPC and metadata caches, and nonce state stay warm instead
+    of being rebuilt for each session the way a process spawned per client would.
+
+    Tool calls run on a :class:`~radius.ToolScheduler` off the event loop: concurrent calls,
+    from one session or many, proceed in parallel, except writes from the same wallet, which
+    run one at a time in arrival order so they never race for a nonce.
+
+    Example:
+        ```python
+        server = OnChainToolServer(Web3EVMWalletClient(w3), [erc20(...), send_eth()])
+        server.run_stdio()                     # for a client launching the process
+        server.run_http(port=8000)             # or shared by clients at http://127.0.0.1:8000/mcp
+        ```
+
+    Args:
+        wallet: The wallet client providing the core tools
+        plugins: Plugins whose tools should be served
+        name: Server name reported to clients
+        max_concurrency: Maximum number of tool calls running at the same time
+        scheduler: Scheduler to run tool calls on; by default one is created with ``max_concurrency``
+    """
+
+    def __init__(
+        self,
+        wallet: WalletClientBase,
+        plugins: Optional[List[Any]] = None,
+        name: str = "radius",
+        max_concurrency: int = 8,
+        scheduler: Optional[ToolScheduler] = None,
+    ):
+        self.tools = get_on_chain_tools(wallet, plugins or [])
+        self.scheduler = scheduler or ToolScheduler(max_concurrency=max_concurrency)
+        self._tool_list = types.ListToolsResult(tools=[_to_mcp_tool(tool) for tool in self.tools.tools.values()])
+        self._counters = {"list_requests": 0, "tool_calls": 0, "tool_errors": 0}
+        self.server = Server(name, on_list_tools=self._list_tools, on_call_tool=self._call_tool)
+
+    def stats(self) -> OnChainToolServerStats:
+        """Returns request and scheduler counters, accumulated across every session."""
+        return {
+            "list_requests": self._counters["list_requests"],
+            "tool_calls": self._counters["tool_calls"],
+            "tool_errors": self._counters["tool_errors"],
+            "scheduler": self.scheduler.stats(),
+        }
+
+    async def serve(self, read_stream: Any, write_stream: Any) -> None:
+        """
+        Serves one client session over a pair of MCP message streams.
+
+        Args:
+            read_stream: Stream of messages from the client
+            write_stream: Stream of messages to the client
+        """
+        await self.server.run(read_stream, write_stream, self.server.create_initialization_options())
+
+    async def serve_stdio(self) -> None:
+        """Serves one client over the process's stdin and stdout."""
+        from mcp.server.stdio import stdio_server
+
+        async with stdio_server() as (read_stream, write_stream):
+            await self.serve(read_stream, write_stream)
+
+    def run_stdio(self) -> None:
+        """Blocks serving one client over stdin and stdout."""
+        anyio.run(self.serve_stdio)
+
+    def http_app(self, path: str = "/mcp", host: str = "127.0.0.1") -> Any:
+        """
+        Creates the ASGI app serving any number of clients over Streamable HTTP.
+
+        Responses are streamed to clients as server-sent events.
+
+        Args:
+            path: The endpoint path
+            host: The host the app is served on, used to protect local servers from DNS rebinding
+
+        Returns:
+            A Starlette application
+        """
+        return self.server.streamable_http_app(streamable_http_path=path, host=host)
+
+    def run_http(self, host: str = "127.0.0.1", port: int = 8000, path: str = "/mcp") -> None:
+        """
+        Blocks serving clients over Streamable HTTP.
+
+        Args:
+            host: The interface to listen on
+            port: The port to listen on
+            path: The endpoint path
+        """
+        import uvicorn
+
+        uvicorn.run(self.http_app(path, host), host=host, port=port, log_level="warning")
+
+    def close(self) -> None:
+        """Stops the scheduler after the tool calls in progress complete."""
+        self.scheduler.shutdown()
+
+    async def _list_tools(self, ctx: Any, params: Optional[types.PaginatedRequestParams]) -> types.ListToolsResult:
+        self._counters["list_requests"] += 1
+        return self._tool_list
+
+    async def _call_tool(self, ctx: Any, params: types.CallToolRequestParams) -> types.CallToolResult:
+        self._counters["tool_calls"] += 1
+        tool = self.tools.tools.get(params.name)
+        if tool is None:
+            return self._error(f"Tool {params.name} not found")
+        try:
+            result = await self.scheduler.arun([{"tool": tool, "parameters": params.arguments or {}}])
+        except Exception as error:
+            return self._error(str(error))
+        return types.CallToolResult(content=[types.TextContent(type="text", text=_to_json(result[0]))])
+
+    def _error(self, message: str) -> types.CallToolResult:
+        """Tool errors are returned as results so the model can see them and recover."""
+        self._counters["tool_errors"] += 1
+        return types.CallToolResult(content=[types.TextContent(type="text", text=message)], is_error=True)
+
+
+def _to_mcp_tool(tool: ToolBase) -> types.Tool:
+    side_effect = getattr(tool, "side_effect", "write")
+    return types.Tool(
+        name=tool.name,
+        description=tool.description,
+        input_schema=tool.json_schema,
+        annotations=types.ToolAnnotations(
+            read_only_hint=side_effect == "read",
+            destructive_hint=side_effect == "write",
+        ),
+    )
+
+
+def _to_json(result: Any) -> str:
+    return json.dumps(result, default=str)
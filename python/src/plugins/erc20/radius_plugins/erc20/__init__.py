@@ -1,28 +1,48 @@
-from dataclasses import dataclass
-from typing import List
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-from radius.classes.plugin_base import PluginBase
-from radius.types.chain import Chain
-from .service import Erc20Service
-from .token import Token, get_tokens_for_network
+if TYPE_CHECKING:
+    from .token import Token, get_tokens_for_network
+    from .plugin import ERC20Plugin, ERC20PluginOptions, erc20
+    from .token_metadata import TokenMetadata, TokenMetadataCache
+    from .transfer_index import TransferIndex, TransferRecord
 
 __version__ = "1.0.0"
 
-__all__ = ["Token", "get_tokens_for_network", "ERC20Plugin", "ERC20PluginOptions", "erc20"]
-
-
-@dataclass
-class ERC20PluginOptions:
-    tokens: List[Token]
-
-
-class ERC20Plugin(PluginBase):
-    def __init__(self, options: ERC20PluginOptions):
-        super().__init__("erc20", [Erc20Service(options.tokens)])
-
-    def supports_chain(self, chain: Chain) -> bool:
-        return chain["type"] == "evm"
-
-
-def erc20(options: ERC20PluginOptions) -> ERC20Plugin:
-    return ERC20Plugin(options)
+# Resolved on first access (PEP 562) to keep the package cheap to import.
+_LAZY_ATTRIBUTES = {
+    "Token": ".token",
+    "get_tokens_for_network": ".token",
+    "ERC20Plugin": ".plugin",
+    "ERC20PluginOptions": ".plugin",
+    "erc20": ".plugin",
+    "TokenMetadata": ".token_metadata",
+    "TokenMetadataCache": ".token_metadata",
+    "TransferIndex": ".transfer_index",
+    "TransferRecord": ".transfer_index",
+}
+
+__all__ = [
+    "Token",
+    "get_tokens_for_network",
+    "ERC20Plugin",
+    "ERC20PluginOptions",
+    "erc20",
+    "TokenMetadata",
+    "TokenMetadataCache",
+    "TransferIndex",
+    "TransferRecord",
+]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
@@ -54,4 +54,55 @@ ERC20_ABI = [
         "outputs": [{"type": "bool"}],
         "stateMutability": "nonpayable",
     },
+    {
+        "type": "function",
+        "name": "decimals",
+        "inputs": [],
+        "outputs": [{"type": "uint8"}],
+        "stateMutability": "view",
+    },
+    {
+        "type": "function",
+        "name": "symbol",
+        "inputs": [],
+        "outputs": [{"type": "string"}],
+        "stateMutability": "view",
+    },
+    {
+        "type": "function",
+        "name": "name",
+        "inputs": [],
+        "outputs": [{"type": "string"}],
+        "stateMutability": "view",
+    },
+]
+
+# The aggregate3 entry point of Multicall3 (deployed at the same address on most EVM chains)
+MULTICALL3_ABI = [
+    {
+        "type": "function",
+        "name": "aggregate3",
+        "inputs": [
+            {
+                "name": "calls",
+                "type": "tuple[]",
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"},
+                ],
+            }
+        ],
+        "outputs": [
+            {
+                "name": "returnData",
+                "type": "tuple[]",
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"},
+                ],
+            }
+        ],
+        "stateMutability": "payable",
+    },
 ]
@@ -0,0 +1,70 @@
+from typing import List, Sequence, Tuple
+
+from radius_wallets.evm import EVMWalletClient
+
+from .abi import MULTICALL3_ABI
+
+try:
+    from web3.exceptions import BadFunctionCallOutput, ContractLogicError
+except ImportError:  # pragma: no cover - wallets not built on web3 raise their own errors
+    _CALL_FAILURES: Tuple[type, ...] = ()
+else:
+    _CALL_FAILURES = (BadFunctionCallOutput, ContractLogicError)
+
+# Multicall3 is deployed at this address on most EVM chains
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+# Calls bundled into one aggregate3 request
+MULTICALL_BATCH_SIZE = 300
+
+
+def aggregate3(
+    wallet_client: EVMWalletClient, multicall_address: str, calls: Sequence[Tuple[str, bytes]]
+) -> List[Tuple[bool, bytes]]:
+    """
+    Executes read-only calls through Multicall3's ``aggregate3``, one ``eth_call`` per batch.
+
+    Every call may fail on its own (``allowFailure``), so one reverting target does not fail
+    the others.
+
+    Args:
+        wallet_client: The wallet client used for the read
+        multicall_address: Address of the Multicall3 deployment
+        calls: (target address, calldata) pairs
+
+    Returns:
+        A (success, return data) pair per call, in order
+    """
+    results: List[Tuple[bool, bytes]] = []
+    for start in range(0, len(calls), MULTICALL_BATCH_SIZE):
+        batch = calls[start:start + MULTICALL_BATCH_SIZE]
+        response = wallet_client.read({
+            "address": multicall_address,
+            "abi": MULTICALL3_ABI,
+            "functionName": "aggregate3",
+            "args": [[(target, True, call_data) for target, call_data in batch]],
+        })["value"]
+        results.extend((bool(success), bytes(data)) for success, data in response)
+    return results
+
+
+def is_call_failure(error: BaseException) -> bool:
+    """
+    Whether a read failed because the call reverted or returned no data.
+
+    Such a failure is an answer from the contract, unlike connection errors, timeouts, rate
+    limits or open circuit breakers, which say nothing about it and may pass when retried.
+    """
+    return isinstance(error, _CALL_FAILURES)
+
+
+def encode_address(address: str) -> bytes:
+    """ABI-encodes an address argument."""
+    return bytes.fromhex(address[2:].rjust(64, "0"))
+
+
+def decode_uint(success: bool, data: bytes) -> int:
+    """Decodes a ``uint256`` return value, raising ValueError for a failed or empty call."""
+    if not success or len(data) < 32:
+        raise ValueError("Call failed or returned no data")
+    return int.from_bytes(data[:32], "big")
@@ -1,3 +1,5 @@
+from typing import List, Literal, Optional
+
 from pydantic import BaseModel, Field
 
 
@@ -5,6 +7,43 @@ class GetTokenInfoBySymbolParameters(BaseModel):
     symbol: str = Field(description="The symbol of the token to get the info of")
 
 
+class GetTokenInfoByAddressParameters(BaseModel):
+    tokenAddresses: List[str] = Field(
+        description="The contract addresses of the tokens to get the info of"
+    )
+
+
+class GetPortfolioParameters(BaseModel):
+    wallet: Optional[str] = Field(
+        default=None,
+        description="The address to get the portfolio of; defaults to the connected wallet",
+    )
+
+
+class GetTransferHistoryParameters(BaseModel):
+    wallet: Optional[str] = Field(
+        default=None,
+        description="The address whose transfers to list; defaults to the connected wallet",
+    )
+    tokenAddress: Optional[str] = Field(
+        default=None,
+        description="Only list transfers of this token; defaults to every indexed token",
+    )
+    direction: Literal["in", "out", "any"] = Field(
+        default="any",
+        description="'in' for received transfers, 'out' for sent transfers, 'any' for both",
+    )
+    fromTimestamp: Optional[int] = Field(
+        default=None,
+        description="Earliest block time to include, in seconds since the epoch",
+    )
+    toTimestamp: Optional[int] = Field(
+        default=None,
+        description="Latest block time to include, in seconds since the epoch",
+    )
+    limit: int = Field(default=50, description="The maximum number of transfers to return, newest first")
+
+
 class GetTokenBalanceParameters(BaseModel):
     wallet: str = Field(description="The address to get the balance of")
     tokenAddress: str = Field(
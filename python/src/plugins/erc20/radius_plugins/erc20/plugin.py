@@ -0,0 +1,43 @@
+from dataclasses import dataclass
+from typing import List, Optional
+
+from radius.classes.plugin_base import PluginBase
+from radius.types.chain import Chain
+from .service import Erc20Service, TransferHistoryService
+from .token import Token
+from .token_metadata import TokenMetadataCache
+from .transfer_index import TransferIndex
+
+
+@dataclass
+class ERC20PluginOptions:
+    tokens: List[Token]
+    # SQLite file persisting discovered token metadata across restarts (in memory when omitted)
+    metadata_cache_path: Optional[str] = None
+    # Multicall3 deployment used to read the metadata or balances of many tokens in one call; defaults to the
+    # canonical address on chains that have it
+    multicall_address: Optional[str] = None
+    # SQLite file of the local Transfer log index; enables the transfer history tool (":memory:" for no persistence)
+    transfer_index_path: Optional[str] = None
+    # First block to backfill Transfer logs from
+    transfer_index_start_block: int = 0
+    # Seconds between background syncs of the transfer index, or None to sync only through TransferHistoryService.sync
+    transfer_index_sync_interval: Optional[float] = 12.0
+
+
+class ERC20Plugin(PluginBase):
+    def __init__(self, options: ERC20PluginOptions):
+        metadata_cache = TokenMetadataCache(options.metadata_cache_path or ":memory:")
+        service = Erc20Service(options.tokens, metadata_cache, options.multicall_address)
+        tool_providers: List[object] = [service]
+        if options.transfer_index_path is not None:
+            index = TransferIndex(options.transfer_index_path, start_block=options.transfer_index_start_block)
+            tool_providers.append(TransferHistoryService(service, index, options.transfer_index_sync_interval))
+        super().__init__("erc20", tool_providers)
+
+    def supports_chain(self, chain: Chain) -> bool:
+        return chain["type"] == "evm"
+
+
+def erc20(options: ERC20PluginOptions) -> ERC20Plugin:
+    return ERC20Plugin(options)
@@ -1,6 +1,13 @@
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, TypeVar
+
 from radius.decorators.tool import Tool
+from radius.utils.resilience import ResiliencePolicy
 from .parameters import (
     GetTokenInfoBySymbolParameters,
+    GetTokenInfoByAddressParameters,
+    GetPortfolioParameters,
+    GetTransferHistoryParameters,
     GetTokenBalanceParameters,
     TransferParameters,
     GetTokenTotalSupplyParameters,
@@ -11,18 +18,79 @@ from .parameters import (
     ConvertFromBaseUnitParameters,
 )
 from .token import Token
+from .token_metadata import TokenMetadata, TokenMetadataCache, fetch_token_metadata, unique_addresses
 from .abi import ERC20_ABI
+from .multicall import MULTICALL3_ADDRESS, aggregate3, decode_uint, encode_address, is_call_failure
+from .transfer_index import TransferIndex
 from radius_wallets.evm import EVMWalletClient
+from radius_wallets.evm.send_eth import get_chain_token
+
+_BALANCE_OF_SELECTOR = bytes.fromhex("70a08231")
+_GET_ETH_BALANCE_SELECTOR = bytes.fromhex("4d2301cc")
+
+T = TypeVar("T")
 
 
 class Erc20Service:
-    def __init__(self, tokens: list[Token] = []):
+    def __init__(
+        self,
+        tokens: list[Token] = [],
+        metadata_cache: Optional[TokenMetadataCache] = None,
+        multicall_address: Optional[str] = None,
+    ):
         self.tokens = tokens
+        # Metadata of tokens outside the configured list, discovered on demand
+        self.metadata_cache = metadata_cache or TokenMetadataCache()
+        # Without an address, the canonical Multicall3 deployment is tried on each chain
+        self.multicall_address = multicall_address
+        self._chains_without_multicall: Set[int] = set()
+
+    def resolve_tokens(self, wallet_client: EVMWalletClient, addresses: List[str]) -> Dict[str, TokenMetadata]:
+        """
+        Resolves the metadata of tokens by contract address.
+
+        Configured tokens and cached entries are answered without RPC; the rest are read from
+        the chain in one batch (a single call when the chain has Multicall3) and cached.
+
+        Args:
+            wallet_client: The wallet client used for reads
+            addresses: The token contract addresses
+
+        Returns:
+            The metadata of every address that is an ERC-20 token, keyed by the requested address
+        """
+        chain_id = wallet_client.get_chain()["id"]
+        addresses = unique_addresses(addresses)
+        resolved: Dict[str, TokenMetadata] = {}
+        for token in self.tokens:
+            chain_info = token["chains"].get(chain_id)
+            contract_address = chain_info.get("contractAddress", "") if chain_info else ""
+            for address in addresses:
+                if address.lower() == contract_address.lower():
+                    resolved[address] = {
+                        "contractAddress": contract_address,
+                        "decimals": token["decimals"],
+                        "symbol": token["symbol"],
+                        "name": token["name"],
+                    }
+
+        resolved.update(self.metadata_cache.get_many(chain_id, [a for a in addresses if a not in resolved]))
+        missing = [address for address in addresses if address not in resolved]
+        if missing:
+            fetched = self._with_multicall(
+                wallet_client,
+                chain_id,
+                lambda multicall_address: fetch_token_metadata(wallet_client, missing, multicall_address),
+            )
+            self.metadata_cache.put_many(chain_id, fetched.values())
+            resolved.update(fetched)
+        return resolved
 
     @Tool(
         {
             "description": "Get the ERC20 token info by its symbol, including the contract address, decimals, and name",
             "parameters_schema": GetTokenInfoBySymbolParameters,
+            "tags": ["read", "erc20"],
         }
     )
     def get_token_info_by_symbol(
@@ -37,10 +105,15 @@ class Erc20Service:
             None,
         )
 
+        chain = wallet_client.get_chain()
+
         if not token:
+            # Fall back to tokens discovered by address on this chain
+            discovered = self.metadata_cache.find_by_symbol(chain["id"], parameters["symbol"])
+            if discovered:
+                return dict(discovered)
             raise Exception(f"Token with symbol {parameters['symbol']} not found")
 
-        chain = wallet_client.get_chain()
         chain_info = token["chains"].get(chain["id"])
 
         if not chain_info or not chain_info.get("contractAddress"):
@@ -57,8 +130,136 @@ class Erc20Service:
 
     @Tool(
         {
-            "description": "Get the balance of an ERC20 token in base units. Convert to decimal units before returning.",
+            "description": "Get the info of ERC20 tokens by their contract addresses, "
+            "including the decimals, symbol, and name",
+            "parameters_schema": GetTokenInfoByAddressParameters,
+            "tags": ["read", "erc20"],
+        }
+    )
+    def get_token_info_by_address(
+        self, wallet_client: EVMWalletClient, parameters: dict
+    ):
+        try:
+            addresses = [wallet_client.resolve_address(address) for address in parameters["tokenAddresses"]]
+            resolved = self.resolve_tokens(wallet_client, addresses)
+        except Exception as error:
+            raise Exception(f"Failed to fetch token info: {error}")
+
+        missing = [address for address in addresses if address not in resolved]
+        if missing:
+            raise Exception(f"Not ERC20 tokens: {', '.join(missing)}")
+        return [resolved[address] for address in unique_addresses(addresses)]
+
+    def portfolio_tokens(self, chain_id: int) -> List[TokenMetadata]:
+        """The configured tokens on a chain, followed by tokens discovered by address."""
+        tokens: Dict[str, TokenMetadata] = {}
+        for token in self.tokens:
+            chain_info = token["chains"].get(chain_id)
+            if chain_info and chain_info.get("contractAddress", "").startswith("0x"):
+                tokens[chain_info["contractAddress"].lower()] = {
+                    "contractAddress": chain_info["contractAddress"],
+                    "decimals": token["decimals"],
+                    "symbol": token["symbol"],
+                    "name": token["name"],
+                }
+        for token in self.metadata_cache.tokens(chain_id):
+            tokens.setdefault(token["contractAddress"].lower(), token)
+        return list(tokens.values())
+
+    @Tool(
+        {
+            "description": "Get the native and ERC20 token balances of a wallet in one call, "
+            "converted to decimal units",
+            "parameters_schema": GetPortfolioParameters,
+            "tags": ["read", "erc20"],
+        }
+    )
+    def get_portfolio(self, wallet_client: EVMWalletClient, parameters: dict):
+        try:
+            owner = wallet_client.resolve_address(parameters.get("wallet") or wallet_client.get_address())
+            chain_id = wallet_client.get_chain()["id"]
+            tokens = self.portfolio_tokens(chain_id)
+
+            native_balance, token_balances = self._with_multicall(
+                wallet_client,
+                chain_id,
+                lambda multicall_address: self._read_balances(wallet_client, owner, tokens, multicall_address),
+            )
+        except Exception as error:
+            raise Exception(f"Failed to fetch portfolio: {error}")
+
+        try:
+            native = get_chain_token(chain_id)
+        except Exception:
+            native = {"symbol": "ETH", "name": "Ether", "decimals": 18}
+        return {
+            "wallet": owner,
+            "native": _holding(native["symbol"], native["name"], int(native["decimals"]), native_balance),
+            "tokens": [
+                {**_holding(token["symbol"], token["name"], token["decimals"], balance),
+                 "contractAddress": token["contractAddress"]}
+                for token, balance in zip(tokens, token_balances)
+                if balance is not None
+            ],
+        }
+
+    def _with_multicall(self, wallet_client: EVMWalletClient, chain_id: int, read: Callable[[Optional[str]], T]) -> T:
+        """
+        Runs ``read`` with the Multicall3 address to use on a chain, or None to read individually.
+
+        A configured address is always used. Otherwise the canonical deployment is tried, and a
+        chain where it has no code, reverts or returns no data is read individually from then on.
+        Other errors, such as timeouts or rate limits, are raised and the chain keeps Multicall3.
+        """
+        if self.multicall_address is not None:
+            return read(self.multicall_address)
+        if chain_id not in self._chains_without_multicall:
+            try:
+                return read(MULTICALL3_ADDRESS)
+            except Exception as error:
+                if not _lacks_multicall(wallet_client, error):
+                    raise
+                self._chains_without_multicall.add(chain_id)
+        return read(None)
+
+    def _read_balances(
+        self, wallet_client: EVMWalletClient, owner: str, tokens: List[TokenMetadata], multicall_address: Optional[str]
+    ) -> Tuple[int, List[Optional[int]]]:
+        """Reads the native balance and token balances of an owner; None for tokens that cannot be read."""
+        if multicall_address is None:
+            native_balance = int(wallet_client.balance_of(owner)["in_base_units"])
+            token_balances = [self._read_balance(wallet_client, token["contractAddress"], owner) for token in tokens]
+            return native_balance, token_balances
+
+        # Native and token balances in a single eth_call
+        calls = [(multicall_address, _GET_ETH_BALANCE_SELECTOR + encode_address(owner))]
+        calls += [(token["contractAddress"], _BALANCE_OF_SELECTOR + encode_address(owner)) for token in tokens]
+        results = aggregate3(wallet_client, multicall_address, calls)
+        token_balances = []
+        for result in results[1:]:
+            try:
+                token_balances.append(decode_uint(*result))
+            except ValueError:
+                token_balances.append(None)
+        return decode_uint(*results[0]), token_balances
+
+    def _read_balance(self, wallet_client: EVMWalletClient, token_address: str, owner: str) -> Optional[int]:
+        try:
+            return int(wallet_client.read({
+                "address": token_address,
+                "abi": ERC20_ABI,
+                "functionName": "balanceOf",
+                "args": [owner],
+            })["value"])
+        except Exception:
+            return None
+
+    @Tool(
+        {
+            "description": "Get the balance of an ERC20 token in base units. "
+            "Convert to decimal units before returning.",
             "parameters_schema": GetTokenBalanceParameters,
+            "tags": ["read", "erc20"],
         }
     )
     def get_token_balance(self, wallet_client: EVMWalletClient, parameters: dict):
@@ -84,6 +285,7 @@ class Erc20Service:
         {
             "description": "Transfer an amount of an ERC20 token to an address",
             "parameters_schema": TransferParameters,
+            "tags": ["write", "erc20"],
         }
     )
     def transfer(self, wallet_client: EVMWalletClient, parameters: dict):
@@ -95,7 +297,7 @@ class Erc20Service:
                     "to": parameters["tokenAddress"],
                     "abi": ERC20_ABI,
                     "functionName": "transfer",
-                    "args": [to_address, parameters["amount"]],
+                    "args": [to_address, int(parameters["amount"])],
                 }
             )
             return hash_result["hash"]
@@ -106,6 +308,7 @@ class Erc20Service:
         {
             "description": "Get the total supply of an ERC20 token",
             "parameters_schema": GetTokenTotalSupplyParameters,
+            "tags": ["read", "erc20"],
         }
     )
     def get_token_total_supply(
@@ -128,6 +331,7 @@ class Erc20Service:
         {
             "description": "Get the allowance of an ERC20 token",
             "parameters_schema": GetTokenAllowanceParameters,
+            "tags": ["read", "erc20"],
         }
     )
     def get_token_allowance(self, wallet_client: EVMWalletClient, parameters: dict):
@@ -151,6 +355,7 @@ class Erc20Service:
         {
             "description": "Approve an amount of an ERC20 token to an address",
             "parameters_schema": ApproveParameters,
+            "tags": ["write", "erc20"],
         }
     )
     def approve(self, wallet_client: EVMWalletClient, parameters: dict):
@@ -162,7 +367,7 @@ class Erc20Service:
                     "to": parameters["tokenAddress"],
                     "abi": ERC20_ABI,
                     "functionName": "approve",
-                    "args": [spender, parameters["amount"]],
+                    "args": [spender, int(parameters["amount"])],
                 }
             )
             return hash_result["hash"]
@@ -173,6 +378,7 @@ class Erc20Service:
         {
             "description": "Transfer an amount of an ERC20 token from an address to another address",
             "parameters_schema": TransferFromParameters,
+            "tags": ["write", "erc20"],
         }
     )
     def transfer_from(self, wallet_client: EVMWalletClient, parameters: dict):
@@ -185,7 +391,7 @@ class Erc20Service:
                     "to": parameters["tokenAddress"],
                     "abi": ERC20_ABI,
                     "functionName": "transferFrom",
-                    "args": [from_address, to_address, parameters["amount"]],
+                    "args": [from_address, to_address, int(parameters["amount"])],
                 }
             )
             return hash_result["hash"]
@@ -196,6 +402,7 @@ class Erc20Service:
         {
             "description": "Convert an amount of an ERC20 token to its base unit",
             "parameters_schema": ConvertToBaseUnitParameters,
+            "tags": ["read", "erc20"],
         }
     )
     def convert_to_base_unit(self, parameters: dict):
@@ -208,6 +415,7 @@ class Erc20Service:
         {
             "description": "Convert an amount of an ERC20 token from its base unit to its decimal unit",
             "parameters_schema": ConvertFromBaseUnitParameters,
+            "tags": ["read", "erc20"],
         }
     )
     def convert_from_base_unit(self, parameters: dict):
@@ -215,3 +423,124 @@ class Erc20Service:
         decimals = parameters["decimals"]
         decimal_unit = amount / 10**decimals
         return float(decimal_unit)
+
+
+class TransferHistoryService:
+    """
+    Tools answering transfer history questions from a local :class:`TransferIndex`.
+
+    The index covers every configured token on the chain and every token discovered by address.
+    Queries never wait for the chain: the first one starts a background sync of the index every
+    ``sync_interval`` seconds, and each answer reports the block the index has reached. With
+    ``sync_interval=None`` the index is only brought up to date by :meth:`sync`.
+
+    Args:
+        erc20_service: The service whose configured and discovered tokens are indexed
+        index: The transfer index
+        sync_interval: Seconds between background syncs, or None to sync only on demand
+    """
+
+    def __init__(self, erc20_service: Erc20Service, index: TransferIndex, sync_interval: Optional[float] = 12.0):
+        self.erc20_service = erc20_service
+        self.index = index
+        self.sync_interval = sync_interval
+
+    def sync(self, wallet_client: EVMWalletClient) -> int:
+        """
+        Brings the index up to the chain head for every token of the wallet's chain.
+
+        Returns:
+            The number of transfers indexed
+        """
+        return self.index.sync(wallet_client, self._token_addresses(wallet_client.get_chain()["id"]))
+
+    @Tool(
+        {
+            "description": "List the ERC20 token transfers sent or received by a wallet, newest first, "
+            "optionally filtered by token and time range, from a local index that reports the last block "
+            "it has indexed",
+            "parameters_schema": GetTransferHistoryParameters,
+            "tags": ["read", "erc20"],
+        }
+    )
+    def get_transfer_history(self, wallet_client: EVMWalletClient, parameters: dict):
+        try:
+            owner = wallet_client.resolve_address(parameters.get("wallet") or wallet_client.get_address())
+            chain_id = wallet_client.get_chain()["id"]
+            tokens = {
+                token["contractAddress"].lower(): token for token in self.erc20_service.portfolio_tokens(chain_id)
+            }
+            token_address = parameters.get("tokenAddress")
+            if token_address and token_address.lower() not in tokens:
+                # Discovered tokens are cached, so the background sync picks them up from now on
+                for token in self.erc20_service.resolve_tokens(wallet_client, [token_address]).values():
+                    tokens[token["contractAddress"].lower()] = token
+
+            if self.sync_interval is not None:
+                self.index.start(wallet_client, lambda: self._token_addresses(chain_id), self.sync_interval)
+            transfers = self.index.transfers(
+                chain_id,
+                wallet=owner,
+                token=token_address,
+                direction=parameters.get("direction") or "any",
+                from_timestamp=parameters.get("fromTimestamp"),
+                to_timestamp=parameters.get("toTimestamp"),
+                limit=parameters.get("limit") or 50,
+            )
+            queried = [token_address] if token_address else list(tokens)
+            indexed_block = self.index.indexed_block(chain_id, queried)
+            head_block = self.index.target_block(chain_id)
+        except Exception as error:
+            raise Exception(f"Failed to fetch transfer history: {error}")
+
+        history = []
+        for transfer in transfers:
+            token = tokens.get(transfer["tokenAddress"])
+            entry: Dict[str, Any] = {**transfer, "valueInBaseUnits": transfer["value"]}
+            if token is not None:
+                entry["symbol"] = token["symbol"]
+                entry["value"] = _to_decimal_string(int(transfer["value"]), token["decimals"])
+            history.append(entry)
+        return {
+            "transfers": history,
+            # Transfers after indexedToBlock are not listed yet; headBlock is the head the last sync ran to
+            "indexedToBlock": indexed_block,
+            "headBlock": head_block,
+            "upToDate": head_block is not None and indexed_block >= head_block,
+        }
+
+    def _token_addresses(self, chain_id: int) -> List[str]:
+        return [token["contractAddress"] for token in self.erc20_service.portfolio_tokens(chain_id)]
+
+
+def _lacks_multicall(wallet_client: EVMWalletClient, error: Exception) -> bool:
+    """Whether a failed read through the canonical Multicall3 address shows that the chain does not have it."""
+    if is_call_failure(error):
+        return True
+    if isinstance(error, ResiliencePolicy.transient_errors):
+        return False
+    # Errors of other wallet clients are only trusted when the address has no code
+    try:
+        return wallet_client.get_code(MULTICALL3_ADDRESS) == "0x"
+    except Exception:
+        return False
+
+
+def _holding(symbol: str, name: str, decimals: int, balance: int) -> Dict[str, Any]:
+    """A balance in both base and decimal units."""
+    return {
+        "symbol": symbol,
+        "name": name,
+        "decimals": decimals,
+        "balance": _to_decimal_string(balance, decimals),
+        "inBaseUnits": str(balance),
+    }
+
+
+def _to_decimal_string(amount: int, decimals: int) -> str:
+    """Converts base units to an exact decimal string, e.g. 1500000 with 6 decimals to "1.5"."""
+    value = Decimal(amount).scaleb(-decimals)
+    text = format(value, "f")
+    if "." in text:
+        text = text.rstrip("0").rstrip(".")
+    return text or "0"
@@ -0,0 +1,228 @@
+import os
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, TypedDict
+
+from radius_wallets.evm import EVMWalletClient
+
+from .abi import ERC20_ABI
+from .multicall import aggregate3, is_call_failure
+
+# Selectors of the ERC-20 metadata functions, which take no arguments
+_DECIMALS_SELECTOR = bytes.fromhex("313ce567")
+_SYMBOL_SELECTOR = bytes.fromhex("95d89b41")
+_NAME_SELECTOR = bytes.fromhex("06fdde03")
+
+
+class TokenMetadata(TypedDict):
+    contractAddress: str
+    decimals: int
+    symbol: str
+    name: str
+
+
+class TokenMetadataCache:
+    """
+    Persistent cache of ERC-20 token metadata keyed by (chain ID, contract address).
+
+    Entries are kept in memory and written to a SQLite database, so a warm restart pointing
+    at the same file resolves known tokens without any RPC. Token metadata never changes once
+    a contract is deployed, so entries do not expire.
+
+    Args:
+        path: SQLite database file, created along with its directory if missing; the default
+            ``":memory:"`` keeps entries for the process lifetime only
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        if path != ":memory:":
+            path = os.path.expanduser(path)
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS token_metadata ("
+            "chain_id INTEGER NOT NULL, address TEXT NOT NULL, contract_address TEXT NOT NULL, "
+            "decimals INTEGER NOT NULL, symbol TEXT NOT NULL, name TEXT NOT NULL, "
+            "PRIMARY KEY (chain_id, address))"
+        )
+        self._connection.commit()
+        self._entries: Dict[Tuple[int, str], TokenMetadata] = {}
+        for chain_id, address, contract_address, decimals, symbol, name in self._connection.execute(
+            "SELECT chain_id, address, contract_address, decimals, symbol, name FROM token_metadata"
+        ):
+            self._entries[(chain_id, address)] = {
+                "contractAddress": contract_address,
+                "decimals": decimals,
+                "symbol": symbol,
+                "name": name,
+            }
+
+    def get(self, chain_id: int, address: str) -> Optional[TokenMetadata]:
+        """Returns the cached metadata of a token, if any."""
+        with self._lock:
+            return self._entries.get((chain_id, address.lower()))
+
+    def get_many(self, chain_id: int, addresses: Iterable[str]) -> Dict[str, TokenMetadata]:
+        """Returns the cached metadata of the given tokens, keyed by the requested address."""
+        with self._lock:
+            found = {}
+            for address in addresses:
+                entry = self._entries.get((chain_id, address.lower()))
+                if entry is not None:
+                    found[address] = entry
+            return found
+
+    def put_many(self, chain_id: int, tokens: Iterable[TokenMetadata]) -> None:
+        """Stores token metadata in memory and in the database."""
+        rows = [
+            (chain_id, token["contractAddress"].lower(), token["contractAddress"],
+             token["decimals"], token["symbol"], token["name"])
+            for token in tokens
+        ]
+        if not rows:
+            return
+        with self._lock:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO token_metadata "
+                "(chain_id, address, contract_address, decimals, symbol, name) VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._connection.commit()
+            for chain, address, contract_address, decimals, symbol, name in rows:
+                self._entries[(chain, address)] = {
+                    "contractAddress": contract_address,
+                    "decimals": decimals,
+                    "symbol": symbol,
+                    "name": name,
+                }
+
+    def tokens(self, chain_id: int) -> List[TokenMetadata]:
+        """Returns every cached token on a chain."""
+        with self._lock:
+            return [entry for (chain, _), entry in self._entries.items() if chain == chain_id]
+
+    def find_by_symbol(self, chain_id: int, symbol: str) -> Optional[TokenMetadata]:
+        """Returns a cached token on a chain with the given symbol (case-insensitive), if any."""
+        with self._lock:
+            for (chain, _), entry in self._entries.items():
+                if chain == chain_id and entry["symbol"].lower() == symbol.lower():
+                    return entry
+        return None
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        with self._lock:
+            self._connection.close()
+
+
+def fetch_token_metadata(
+    wallet_client: EVMWalletClient,
+    addresses: Sequence[str],
+    multicall_address: Optional[str] = None,
+) -> Dict[str, TokenMetadata]:
+    """
+    Reads ``decimals``, ``symbol`` and ``name`` of tokens from the chain.
+
+    With a Multicall3 address, the metadata of all tokens is read in a single ``eth_call`` (per
+    :data:`~.multicall.MULTICALL_BATCH_SIZE` calls); otherwise each token takes three reads.
+
+    Args:
+        wallet_client: The wallet client used for the reads
+        addresses: The token contract addresses
+        multicall_address: Address of a Multicall3 deployment
+
+    Returns:
+        The metadata of every address that implements ``decimals``, keyed by address
+
+    Raises:
+        Exception: Errors of reads that did not get an answer from the contract, such as timeouts
+    """
+    if multicall_address is None:
+        return _fetch_individually(wallet_client, addresses)
+
+    calls = [
+        (address, selector)
+        for address in addresses
+        for selector in (_DECIMALS_SELECTOR, _SYMBOL_SELECTOR, _NAME_SELECTOR)
+    ]
+    responses = aggregate3(wallet_client, multicall_address, calls)
+    result: Dict[str, TokenMetadata] = {}
+    for index, address in enumerate(addresses):
+        decimals, symbol, name = responses[index * 3:index * 3 + 3]
+        token = _decode_metadata(address, decimals, symbol, name)
+        if token is not None:
+            result[address] = token
+    return result
+
+
+def _fetch_individually(wallet_client: EVMWalletClient, addresses: Sequence[str]) -> Dict[str, TokenMetadata]:
+    result: Dict[str, TokenMetadata] = {}
+    for address in addresses:
+        try:
+            decimals = wallet_client.read({"address": address, "abi": ERC20_ABI, "functionName": "decimals"})
+        except Exception as error:
+            # Only a contract answering without decimals is not a token; other errors are raised before caching
+            if not is_call_failure(error):
+                raise
+            continue
+        result[address] = {
+            "contractAddress": address,
+            "decimals": int(decimals["value"]),
+            "symbol": _read_text(wallet_client, address, "symbol"),
+            "name": _read_text(wallet_client, address, "name"),
+        }
+    return result
+
+
+def _read_text(wallet_client: EVMWalletClient, address: str, function_name: str) -> str:
+    try:
+        return str(wallet_client.read({"address": address, "abi": ERC20_ABI, "functionName": function_name})["value"])
+    except Exception as error:
+        # symbol and name are optional in ERC-20
+        if not is_call_failure(error):
+            raise
+        return ""
+
+
+def _decode_metadata(
+    address: str, decimals: Sequence, symbol: Sequence, name: Sequence
+) -> Optional[TokenMetadata]:
+    success, data = decimals
+    if not success or len(data) < 32:
+        return None
+    return {
+        "contractAddress": address,
+        "decimals": int.from_bytes(data[:32], "big"),
+        "symbol": _decode_text(*symbol),
+        "name": _decode_text(*name),
+    }
+
+
+def _decode_text(success: bool, data: bytes) -> str:
+    """Decodes an ABI ``string`` return value, or a ``bytes32`` one as used by some older tokens."""
+    if not success:
+        return ""
+    if len(data) >= 64:
+        offset = int.from_bytes(data[:32], "big")
+        if offset + 32 <= len(data):
+            length = int.from_bytes(data[offset:offset + 32], "big")
+            if offset + 32 + length <= len(data):
+                return data[offset + 32:offset + 32 + length].decode("utf-8", errors="replace")
+    if len(data) == 32:
+        return data.rstrip(b"\0").decode("utf-8", errors="replace")
+    return ""
+
+
+def unique_addresses(addresses: Iterable[str]) -> List[str]:
+    """Deduplicates addresses case-insensitively, keeping the first spelling and the order."""
+    seen = set()
+    unique = []
+    for address in addresses:
+        if address.lower() not in seen:
+            seen.add(address.lower())
+            unique.append(address)
+    return unique
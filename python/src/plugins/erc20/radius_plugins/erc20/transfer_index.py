@@ -0,0 +1,385 @@
+import os
+import sqlite3
+import threading
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, TypedDict
+
+from radius_wallets.evm import EVMWalletClient
+from radius_wallets.evm.types import EVMLog
+
+# keccak256("Transfer(address,address,uint256)")
+TRANSFER_TOPIC = "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+
+
+class TransferRecord(TypedDict):
+    tokenAddress: str
+    sender: str
+    recipient: str
+    value: str  # base units
+    blockNumber: int
+    timestamp: int
+    transactionHash: str
+    logIndex: int
+
+
+class TransferIndexStats(TypedDict):
+    """
+    Counters of a transfer index
+
+    Attributes:
+        requests: ``eth_getLogs`` requests made while syncing
+        transfers: Transfers stored
+        range_shrinks: Times a block range was halved after the node rejected it
+        chunk_size: Current block range of one request
+        syncing: Whether the background sync is running
+        sync_errors: Background syncs that failed and will be retried
+    """
+
+    requests: int
+    transfers: int
+    range_shrinks: int
+    chunk_size: int
+    syncing: bool
+    sync_errors: int
+
+
+class TransferIndex:
+    """
+    Local index of ERC-20 ``Transfer`` events, stored in SQLite.
+
+    :meth:`sync` backfills logs from ``start_block`` and then continues from the last block it
+    processed for each token, so every log is fetched once. Block ranges adapt to the node:
+    a rejected request (too many results, range too large, timeout) is retried with half the
+    range, and ranges grow again while responses stay small. Queries are answered from the
+    indexed database without any RPC; :meth:`start` keeps the index up to date from a background
+    thread, and :meth:`indexed_block` tells how far it has got.
+
+    Args:
+        path: SQLite database file, created along with its directory if missing; the default
+            ``":memory:"`` keeps the index for the process lifetime only
+        start_block: First block to backfill for a newly indexed token
+        chunk_size: Initial block range of one ``eth_getLogs`` request
+        max_chunk_size: Upper bound on the block range of one request
+        target_logs: Logs per response above which the range shrinks, and below half of which it grows
+        confirmations: Blocks behind the head that are left unindexed, so reorganized blocks are not stored
+    """
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        start_block: int = 0,
+        chunk_size: int = 2_000,
+        max_chunk_size: int = 100_000,
+        target_logs: int = 5_000,
+        confirmations: int = 0,
+    ):
+        if path != ":memory:":
+            path = os.path.expanduser(path)
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.start_block = start_block
+        self.max_chunk_size = max_chunk_size
+        self.target_logs = target_logs
+        self.confirmations = confirmations
+        self._chunk_size = max(1, min(chunk_size, max_chunk_size))
+        self._lock = threading.Lock()
+        # One sync at a time; queries only wait for the database lock
+        self._sync_lock = threading.Lock()
+        self._counters = {"requests": 0, "range_shrinks": 0, "sync_errors": 0}
+        # Last block each chain was synced towards
+        self._target_blocks: Dict[int, int] = {}
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.executescript(
+            "CREATE TABLE IF NOT EXISTS transfers ("
+            "chain_id INTEGER NOT NULL, token TEXT NOT NULL, sender TEXT NOT NULL, recipient TEXT NOT NULL, "
+            "value TEXT NOT NULL, block_number INTEGER NOT NULL, timestamp INTEGER NOT NULL, "
+            "tx_hash TEXT NOT NULL, log_index INTEGER NOT NULL, "
+            "PRIMARY KEY (chain_id, tx_hash, log_index));"
+            "CREATE INDEX IF NOT EXISTS transfers_sender ON transfers (chain_id, sender, timestamp);"
+            "CREATE INDEX IF NOT EXISTS transfers_recipient ON transfers (chain_id, recipient, timestamp);"
+            "CREATE INDEX IF NOT EXISTS transfers_token ON transfers (chain_id, token, timestamp);"
+            "CREATE TABLE IF NOT EXISTS sync_state ("
+            "chain_id INTEGER NOT NULL, token TEXT NOT NULL, next_block INTEGER NOT NULL, "
+            "PRIMARY KEY (chain_id, token));"
+        )
+        self._connection.commit()
+
+    def stats(self) -> TransferIndexStats:
+        """Returns request and storage counters of the index."""
+        with self._lock:
+            (transfers,) = self._connection.execute("SELECT COUNT(*) FROM transfers").fetchone()
+            return {
+                "requests": self._counters["requests"],
+                "transfers": transfers,
+                "range_shrinks": self._counters["range_shrinks"],
+                "chunk_size": self._chunk_size,
+                "syncing": self.syncing,
+                "sync_errors": self._counters["sync_errors"],
+            }
+
+    @property
+    def syncing(self) -> bool:
+        """Whether the background sync is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def next_block(self, chain_id: int, token: str) -> int:
+        """Returns the first block of a token that has not been indexed yet."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT next_block FROM sync_state WHERE chain_id = ? AND token = ?", (chain_id, token.lower())
+            ).fetchone()
+        return self.start_block if row is None else row[0]
+
+    def indexed_block(self, chain_id: int, tokens: Sequence[str]) -> int:
+        """
+        Returns the last block indexed for all of the tokens.
+
+        Tokens never synced count as indexed up to the block before ``start_block``.
+        """
+        return min((self.next_block(chain_id, token) for token in tokens), default=self.start_block) - 1
+
+    def target_block(self, chain_id: int) -> Optional[int]:
+        """Returns the block the latest sync of a chain indexed up to, or None if it was never synced."""
+        with self._lock:
+            return self._target_blocks.get(chain_id)
+
+    def sync(self, wallet_client: EVMWalletClient, tokens: Sequence[str], to_block: Optional[int] = None) -> int:
+        """
+        Indexes the ``Transfer`` logs of tokens up to ``to_block``.
+
+        Tokens at the same position are fetched together in one request per block range; a
+        token added later is first caught up to the others.
+
+        Args:
+            wallet_client: The wallet client used to read logs and block timestamps
+            tokens: Token contract addresses to index
+            to_block: Last block to index; defaults to the head minus ``confirmations``
+
+        Returns:
+            The number of transfers indexed by this call
+
+        Raises:
+            Exception: The node's error, if even a single-block request fails
+        """
+        if not tokens:
+            return 0
+        with self._sync_lock:
+            chain_id = wallet_client.get_chain()["id"]
+            if to_block is None:
+                to_block = wallet_client.get_block_number() - self.confirmations
+            with self._lock:
+                self._target_blocks[chain_id] = max(to_block, self._target_blocks.get(chain_id, to_block))
+            cursors: Dict[str, int] = {}
+            for token in tokens:
+                cursors.setdefault(token.lower(), self.next_block(chain_id, token))
+
+            indexed = 0
+            timestamps: Dict[int, int] = {}
+            while True:
+                from_block = min(cursors.values())
+                if from_block > to_block:
+                    return indexed
+                group = [token for token, cursor in cursors.items() if cursor == from_block]
+                # Stop where the next group starts, so the groups merge
+                ahead = [cursor for cursor in cursors.values() if cursor > from_block]
+                end = min(to_block, from_block + self._chunk_size - 1, *(cursor - 1 for cursor in ahead))
+
+                try:
+                    with self._lock:
+                        self._counters["requests"] += 1
+                    logs = wallet_client.get_logs({
+                        "fromBlock": from_block,
+                        "toBlock": end,
+                        "address": group,
+                        "topics": [TRANSFER_TOPIC],
+                    })
+                except NotImplementedError:
+                    raise
+                except Exception:
+                    if end == from_block:
+                        raise
+                    with self._lock:
+                        self._chunk_size = max(1, (end - from_block + 1) // 2)
+                        self._counters["range_shrinks"] += 1
+                    continue
+
+                rows = [row for row in (self._decode(chain_id, log, wallet_client, timestamps) for log in logs) if row]
+                self._store(chain_id, rows, group, end + 1)
+                for token in group:
+                    cursors[token] = end + 1
+                indexed += len(rows)
+                self._adapt(len(logs), end - from_block + 1)
+
+    def start(
+        self, wallet_client: EVMWalletClient, tokens: Callable[[], Sequence[str]], interval: float = 12.0
+    ) -> "TransferIndex":
+        """
+        Starts syncing the index from a background thread.
+
+        The thread syncs right away and then every ``interval`` seconds, reading the tokens to
+        index from ``tokens`` each time so tokens discovered in the meantime are picked up. A
+        failed sync is counted in :meth:`stats` and retried at the next interval. Does nothing
+        if the background sync is already running.
+
+        Args:
+            wallet_client: The wallet client used to read logs and block timestamps
+            tokens: Returns the token contract addresses to index
+            interval: Seconds between syncs
+
+        Returns:
+            The index itself, for chaining
+        """
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stopping.clear()
+                self._thread = threading.Thread(
+                    target=self._run, args=(wallet_client, tokens, interval), name="radius-transfer-index", daemon=True
+                )
+                self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stops the background sync, waiting for a sync in progress to finish."""
+        self._stopping.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        self._thread = None
+
+    def transfers(
+        self,
+        chain_id: int,
+        wallet: Optional[str] = None,
+        token: Optional[str] = None,
+        direction: str = "any",
+        from_timestamp: Optional[int] = None,
+        to_timestamp: Optional[int] = None,
+        limit: int = 100,
+    ) -> List[TransferRecord]:
+        """
+        Queries indexed transfers, newest first.
+
+        Args:
+            chain_id: The chain to query
+            wallet: Only transfers from or to this address
+            token: Only transfers of this token
+            direction: "in", "out" or "any", relative to ``wallet``
+            from_timestamp: Earliest block timestamp, inclusive
+            to_timestamp: Latest block timestamp, inclusive
+            limit: Maximum number of transfers
+
+        Returns:
+            The matching transfers
+        """
+        if direction not in ("in", "out", "any"):
+            raise ValueError("direction must be 'in', 'out' or 'any'")
+        conditions = ["chain_id = ?"]
+        arguments: List[object] = [chain_id]
+        if wallet is not None:
+            if direction == "in":
+                conditions.append("recipient = ?")
+                arguments.append(wallet.lower())
+            elif direction == "out":
+                conditions.append("sender = ?")
+                arguments.append(wallet.lower())
+            else:
+                conditions.append("(sender = ? OR recipient = ?)")
+                arguments.extend([wallet.lower(), wallet.lower()])
+        if token is not None:
+            conditions.append("token = ?")
+            arguments.append(token.lower())
+        if from_timestamp is not None:
+            conditions.append("timestamp >= ?")
+            arguments.append(from_timestamp)
+        if to_timestamp is not None:
+            conditions.append("timestamp <= ?")
+            arguments.append(to_timestamp)
+        arguments.append(limit)
+
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT token, sender, recipient, value, block_number, timestamp, tx_hash, log_index "
+                f"FROM transfers WHERE {' AND '.join(conditions)} "
+                "ORDER BY block_number DESC, log_index DESC LIMIT ?",
+                arguments,
+            ).fetchall()
+        return [
+            {
+                "tokenAddress": token_address,
+                "sender": sender,
+                "recipient": recipient,
+                "value": value,
+                "blockNumber": block_number,
+                "timestamp": timestamp,
+                "transactionHash": tx_hash,
+                "logIndex": log_index,
+            }
+            for token_address, sender, recipient, value, block_number, timestamp, tx_hash, log_index in rows
+        ]
+
+    def close(self) -> None:
+        """Stops the background sync and closes the database connection."""
+        self.stop()
+        with self._lock:
+            self._connection.close()
+
+    def _run(self, wallet_client: EVMWalletClient, tokens: Callable[[], Sequence[str]], interval: float) -> None:
+        while not self._stopping.is_set():
+            try:
+                self.sync(wallet_client, tokens())
+            except Exception:
+                with self._lock:
+                    self._counters["sync_errors"] += 1
+            self._stopping.wait(interval)
+
+    def _decode(
+        self, chain_id: int, log: EVMLog, wallet_client: EVMWalletClient, timestamps: Dict[int, int]
+    ) -> Optional[Tuple]:
+        # ERC-721 shares the event signature but indexes the token ID as a fourth topic
+        if len(log["topics"]) != 3:
+            return None
+        block_number = log["blockNumber"]
+        timestamp = log.get("timestamp")
+        if timestamp is None:
+            timestamp = timestamps.get(block_number)
+            if timestamp is None:
+                timestamp = timestamps[block_number] = wallet_client.get_block_timestamp(block_number)
+        data = log["data"][2:] if log["data"].startswith("0x") else log["data"]
+        return (
+            chain_id,
+            log["address"].lower(),
+            "0x" + log["topics"][1][-40:].lower(),
+            "0x" + log["topics"][2][-40:].lower(),
+            # uint256 exceeds SQLite integers, so values are stored as text
+            str(int(data[:64] or "0", 16)),
+            block_number,
+            timestamp,
+            log["transactionHash"],
+            log["logIndex"],
+        )
+
+    def _store(self, chain_id: int, rows: List[Tuple], tokens: List[str], next_block: int) -> None:
+        """Stores transfers and advances the tokens' positions in one transaction."""
+        with self._lock:
+            with self._connection:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO transfers "
+                    "(chain_id, token, sender, recipient, value, block_number, timestamp, tx_hash, log_index) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO sync_state (chain_id, token, next_block) VALUES (?, ?, ?)",
+                    [(chain_id, token, next_block) for token in tokens],
+                )
+
+    def _adapt(self, log_count: int, span: int) -> None:
+        """Resizes the block range after a successful request."""
+        with self._lock:
+            if log_count > self.target_logs:
+                self._chunk_size = max(1, span // 2)
+            elif log_count < self.target_logs // 2 and span >= self._chunk_size:
+                self._chunk_size = min(self.max_chunk_size, self._chunk_size * 2)
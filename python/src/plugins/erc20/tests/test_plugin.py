@@ -66,4 +66,13 @@ class TestERC20Plugin:
         # Check plugin
         assert plugin is not None
         assert plugin.name == "erc20"
-        assert plugin.tool_providers[0] is not None
\ No newline at end of file
+        assert plugin.tool_providers[0] is not None
+    def test_transfer_history_is_opt_in(self):
+        """Test that the transfer history tools are only provided with a transfer index path."""
+        assert len(erc20(ERC20PluginOptions(tokens=[])).tool_providers) == 1
+
+        plugin = erc20(ERC20PluginOptions(tokens=[], transfer_index_path=":memory:", transfer_index_start_block=42))
+
+        assert len(plugin.tool_providers) == 2
+        assert plugin.tool_providers[1].index.start_block == 42
+        assert plugin.tool_providers[1].sync_interval == 12.0
@@ -0,0 +1,223 @@
+"""
+Tests for the get_portfolio tool.
+"""
+import pytest
+from web3.exceptions import BadFunctionCallOutput, ContractLogicError
+
+from radius_plugins.erc20.service import Erc20Service
+
+OWNER = "0x9999999999999999999999999999999999999999"
+USDC = "0x1111111111111111111111111111111111111111"
+DAI = "0x2222222222222222222222222222222222222222"
+BROKEN = "0x3333333333333333333333333333333333333333"
+MULTICALL = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+TOKENS = [
+    {"decimals": 6, "symbol": "USDC", "name": "USD Coin", "chains": {1: {"contractAddress": USDC}}},
+    {"decimals": 18, "symbol": "DAI", "name": "Dai", "chains": {1: {"contractAddress": DAI}}},
+    {"decimals": 18, "symbol": "BRK", "name": "Broken", "chains": {1: {"contractAddress": BROKEN}}},
+    {"decimals": 18, "symbol": "OTHER", "name": "Other chain", "chains": {5: {"contractAddress": OWNER}}},
+]
+
+
+class FakeWalletClient:
+    """Wallet client answering balance reads, individually or through Multicall3 aggregate3."""
+
+    def __init__(self, has_multicall=True):
+        self.has_multicall = has_multicall
+        self.reads = []
+        # Errors raised by the next aggregate3 reads, before answering
+        self.aggregate_errors = []
+        self.native = 2 * 10**18
+        # BROKEN reverts on balanceOf
+        self.balances = {USDC.lower(): 1_500_000, DAI.lower(): 0}
+
+    def get_address(self):
+        return OWNER
+
+    def get_chain(self):
+        return {"type": "evm", "id": 1}
+
+    def resolve_address(self, address):
+        return address
+
+    def balance_of(self, address):
+        self.reads.append("balance")
+        return {"value": "2", "decimals": 18, "symbol": "ETH", "name": "Ether", "in_base_units": str(self.native)}
+
+    def read(self, request):
+        self.reads.append(request["functionName"])
+        if request["functionName"] == "aggregate3":
+            if self.aggregate_errors:
+                raise self.aggregate_errors.pop(0)
+            if not self.has_multicall:
+                raise BadFunctionCallOutput(
+                    "Could not decode contract function call to aggregate3 with return data: b''"
+                )
+            results = []
+            for target, _, call_data in request["args"][0]:
+                selector, owner = call_data[:4].hex(), "0x" + call_data[-20:].hex()
+                assert owner == OWNER
+                if selector == "4d2301cc" and target == MULTICALL:
+                    results.append((True, self.native.to_bytes(32, "big")))
+                elif selector == "70a08231" and target.lower() in self.balances:
+                    results.append((True, self.balances[target.lower()].to_bytes(32, "big")))
+                else:
+                    results.append((False, b""))
+            return {"value": results}
+
+        if request["address"].lower() not in self.balances:
+            raise ContractLogicError("execution reverted")
+        return {"value": self.balances[request["address"].lower()]}
+
+    def get_code(self, address):
+        self.reads.append("code")
+        return "0x6080" if self.has_multicall else "0x"
+
+
+def test_portfolio_is_read_in_one_call():
+    """Test that native and token balances are read with a single aggregated call."""
+    wallet = FakeWalletClient()
+    service = Erc20Service(TOKENS, multicall_address=MULTICALL)
+
+    portfolio = service.get_portfolio(wallet, {})
+
+    assert wallet.reads == ["aggregate3"]
+    assert portfolio["wallet"] == OWNER
+    assert portfolio["native"] == {
+        "symbol": "ETH",
+        "name": "Ether",
+        "decimals": 18,
+        "balance": "2",
+        "inBaseUnits": str(2 * 10**18),
+    }
+    # Tokens of other chains and tokens whose balance cannot be read are left out
+    assert portfolio["tokens"] == [
+        {"symbol": "USDC", "name": "USD Coin", "decimals": 6, "balance": "1.5",
+         "inBaseUnits": "1500000", "contractAddress": USDC},
+        {"symbol": "DAI", "name": "Dai", "decimals": 18, "balance": "0",
+         "inBaseUnits": "0", "contractAddress": DAI},
+    ]
+
+
+def test_portfolio_uses_canonical_multicall_by_default():
+    """Test that the canonical Multicall3 deployment is used when no address is configured."""
+    wallet = FakeWalletClient()
+    service = Erc20Service(TOKENS)
+
+    portfolio = service.get_portfolio(wallet, {})
+
+    assert wallet.reads == ["aggregate3"]
+    assert [token["balance"] for token in portfolio["tokens"]] == ["1.5", "0"]
+
+
+def test_portfolio_without_multicall():
+    """Test the per-token fallback on a chain without Multicall3, which is only probed once."""
+    wallet = FakeWalletClient(has_multicall=False)
+    service = Erc20Service(TOKENS)
+
+    portfolio = service.get_portfolio(wallet, {"wallet": OWNER})
+
+    assert wallet.reads == ["aggregate3", "balance", "balanceOf", "balanceOf", "balanceOf"]
+    assert [token["balance"] for token in portfolio["tokens"]] == ["1.5", "0"]
+    assert portfolio["native"]["balance"] == "2"
+    wallet.reads.clear()
+    service.get_portfolio(wallet, {"wallet": OWNER})
+    assert wallet.reads == ["balance", "balanceOf", "balanceOf", "balanceOf"]
+
+
+def test_transient_errors_keep_multicall():
+    """Test that a timeout of the canonical Multicall3 read is raised without switching the chain to single reads."""
+    wallet = FakeWalletClient()
+    wallet.aggregate_errors.append(TimeoutError("read timed out"))
+    service = Erc20Service(TOKENS)
+
+    with pytest.raises(Exception, match="Failed to fetch portfolio: read timed out"):
+        service.get_portfolio(wallet, {})
+    assert wallet.reads == ["aggregate3"]
+
+    wallet.reads.clear()
+    assert [token["balance"] for token in service.get_portfolio(wallet, {})["tokens"]] == ["1.5", "0"]
+    assert wallet.reads == ["aggregate3"]
+
+
+def test_unknown_errors_are_checked_against_the_code():
+    """Test that an error the plugin cannot classify only disables Multicall3 where the address has no code."""
+    wallet = FakeWalletClient()
+    wallet.aggregate_errors.append(ValueError("rate limited"))
+    service = Erc20Service(TOKENS)
+
+    with pytest.raises(Exception, match="rate limited"):
+        service.get_portfolio(wallet, {})
+    assert wallet.reads == ["aggregate3", "code"]
+
+    wallet = FakeWalletClient(has_multicall=False)
+    wallet.aggregate_errors.append(ValueError("unrecognized error"))
+    service.get_portfolio(wallet, {})
+    assert wallet.reads == ["aggregate3", "code", "balance", "balanceOf", "balanceOf", "balanceOf"]
+
+
+def test_configured_multicall_errors_are_raised():
+    """Test that a failing configured Multicall3 address is reported instead of falling back."""
+    service = Erc20Service(TOKENS, multicall_address=MULTICALL)
+
+    with pytest.raises(Exception, match="Failed to fetch portfolio"):
+        service.get_portfolio(FakeWalletClient(has_multicall=False), {})
+
+
+def test_portfolio_includes_discovered_tokens():
+    """Test that tokens resolved by address are part of the portfolio."""
+    wallet = FakeWalletClient()
+    service = Erc20Service([], multicall_address=MULTICALL)
+    service.metadata_cache.put_many(1, [
+        {"contractAddress": USDC, "decimals": 6, "symbol": "USDC", "name": "USD Coin"},
+    ])
+
+    portfolio = service.get_portfolio(wallet, {})
+
+    assert [token["symbol"] for token in portfolio["tokens"]] == ["USDC"]
+
+
+def test_portfolio_on_local_chain():
+    """Test a portfolio read against the LocalChain Multicall3 deployment."""
+    pytest.importorskip("eth_tester")
+    testing = pytest.importorskip("radius_wallets.web3.testing")
+
+    chain = testing.LocalChain(token_decimals=6)
+    wallet = chain.wallet()
+    # Another account, as eth-tester charges the caller's gas within eth_call
+    owner = chain.accounts[1].address
+    chain.mint(owner, 1_250_000)
+    service = Erc20Service([], multicall_address=chain.multicall_address)
+    service.resolve_tokens(wallet, [chain.token_address])
+
+    before = chain.request_count
+    balance_read = service.get_token_balance(wallet, {"wallet": owner, "tokenAddress": chain.token_address})
+    single_read = chain.request_count - before
+
+    before = chain.request_count
+    portfolio = service.get_portfolio(wallet, {"wallet": owner})
+
+    # No more requests than reading one token balance, plus the chain ID lookup
+    assert chain.request_count - before <= single_read + 1
+    assert portfolio["native"]["inBaseUnits"] == wallet.balance_of(owner)["in_base_units"]
+    assert portfolio["tokens"][0]["inBaseUnits"] == str(balance_read)
+    assert portfolio["tokens"][0]["balance"] == str(balance_read / 10**6)
+
+
+def test_portfolio_on_local_chain_without_canonical_multicall():
+    """Test that a chain with no contract at the canonical Multicall3 address is read individually."""
+    pytest.importorskip("eth_tester")
+    testing = pytest.importorskip("radius_wallets.web3.testing")
+
+    chain = testing.LocalChain(token_decimals=6)
+    wallet = chain.wallet()
+    owner = chain.accounts[1].address
+    chain.mint(owner, 1_250_000)
+    service = Erc20Service([])
+
+    assert service.resolve_tokens(wallet, [chain.token_address])[chain.token_address]["decimals"] == 6
+    portfolio = service.get_portfolio(wallet, {"wallet": owner})
+
+    assert portfolio["tokens"][0]["inBaseUnits"] == "1250000"
+    assert portfolio["native"]["inBaseUnits"] == wallet.balance_of(owner)["in_base_units"]
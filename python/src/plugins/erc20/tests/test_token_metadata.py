@@ -0,0 +1,196 @@
+"""
+Tests for ERC20 token metadata discovery and its persistent cache.
+"""
+import pytest
+from web3.exceptions import ContractLogicError
+
+from radius_plugins.erc20.service import Erc20Service
+from radius_plugins.erc20.token_metadata import TokenMetadataCache, fetch_token_metadata
+
+TOKEN = "0x1111111111111111111111111111111111111111"
+LEGACY_TOKEN = "0x2222222222222222222222222222222222222222"
+NOT_A_TOKEN = "0x3333333333333333333333333333333333333333"
+MULTICALL = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+
+def encode_uint(value):
+    return value.to_bytes(32, "big")
+
+
+def encode_string(value):
+    data = value.encode()
+    padding = b"\0" * (-len(data) % 32)
+    return encode_uint(32) + encode_uint(len(data)) + data + padding
+
+
+class FakeWalletClient:
+    """Wallet client answering Multicall3 aggregate3 and plain metadata reads from a token table."""
+
+    def __init__(self, chain_id=1):
+        self.chain_id = chain_id
+        self.reads = []
+        # Function name -> error raised once by its next read
+        self.errors = {}
+        # address -> (decimals, symbol, name) return data; None means the call reverts
+        self.contracts = {
+            TOKEN.lower(): (encode_uint(6), encode_string("USDC"), encode_string("USD Coin")),
+            LEGACY_TOKEN.lower(): (encode_uint(18), b"MKR".ljust(32, b"\0"), b"Maker".ljust(32, b"\0")),
+        }
+
+    def get_chain(self):
+        return {"type": "evm", "id": self.chain_id}
+
+    def resolve_address(self, address):
+        return address
+
+    def read(self, request):
+        self.reads.append(request["functionName"])
+        if request["functionName"] in self.errors:
+            raise self.errors.pop(request["functionName"])
+        if request["functionName"] == "aggregate3":
+            selectors = {"313ce567": 0, "95d89b41": 1, "06fdde03": 2}
+            results = []
+            for target, _, call_data in request["args"][0]:
+                contract = self.contracts.get(target.lower())
+                if contract is None:
+                    results.append((False, b""))
+                else:
+                    results.append((True, contract[selectors[call_data.hex()]]))
+            return {"value": results}
+
+        contract = self.contracts.get(request["address"].lower())
+        if contract is None:
+            raise ContractLogicError("execution reverted")
+        index = ["decimals", "symbol", "name"].index(request["functionName"])
+        data = contract[index]
+        if index == 0:
+            return {"value": int.from_bytes(data, "big")}
+        return {"value": data[64:64 + int.from_bytes(data[32:64], "big")].decode()}
+
+
+def test_multicall_fetches_all_tokens_in_one_read():
+    """Test that metadata of several tokens is read with a single aggregated call."""
+    wallet = FakeWalletClient()
+
+    tokens = fetch_token_metadata(wallet, [TOKEN, LEGACY_TOKEN, NOT_A_TOKEN], multicall_address=MULTICALL)
+
+    assert wallet.reads == ["aggregate3"]
+    assert tokens[TOKEN] == {"contractAddress": TOKEN, "decimals": 6, "symbol": "USDC", "name": "USD Coin"}
+    # bytes32 symbols of older tokens are decoded too
+    assert tokens[LEGACY_TOKEN]["symbol"] == "MKR"
+    assert NOT_A_TOKEN not in tokens
+
+
+def test_fetch_without_multicall():
+    """Test the per-token fallback when no Multicall3 address is configured."""
+    wallet = FakeWalletClient()
+
+    tokens = fetch_token_metadata(wallet, [TOKEN, NOT_A_TOKEN])
+
+    assert tokens[TOKEN]["decimals"] == 6
+    assert tokens[TOKEN]["symbol"] == "USDC"
+    assert NOT_A_TOKEN not in tokens
+
+
+def test_failed_reads_are_raised():
+    """Test that dropped reads are raised instead of treating the token as missing or without a symbol."""
+    wallet = FakeWalletClient()
+
+    wallet.errors["symbol"] = ConnectionError("connection reset")
+    with pytest.raises(ConnectionError):
+        fetch_token_metadata(wallet, [TOKEN])
+    wallet.errors["decimals"] = TimeoutError("read timed out")
+    with pytest.raises(TimeoutError):
+        fetch_token_metadata(wallet, [TOKEN])
+
+    assert fetch_token_metadata(wallet, [TOKEN])[TOKEN]["symbol"] == "USDC"
+
+
+def test_failed_reads_are_not_cached():
+    """Test that a token whose metadata read failed is read again on the next lookup."""
+    wallet = FakeWalletClient()
+    service = Erc20Service([])
+
+    wallet.errors["aggregate3"] = ConnectionError("connection reset")
+    with pytest.raises(ConnectionError):
+        service.resolve_tokens(wallet, [TOKEN])
+    assert service.metadata_cache.get(1, TOKEN) is None
+
+    assert service.resolve_tokens(wallet, [TOKEN])[TOKEN]["name"] == "USD Coin"
+    assert wallet.reads == ["aggregate3", "aggregate3"]
+
+
+def test_repeat_lookups_use_the_cache():
+    """Test that a resolved token costs no further reads."""
+    wallet = FakeWalletClient()
+    service = Erc20Service([], multicall_address=MULTICALL)
+
+    service.resolve_tokens(wallet, [TOKEN])
+    service.resolve_tokens(wallet, [TOKEN.upper().replace("0X", "0x")])
+
+    assert wallet.reads == ["aggregate3"]
+
+
+def test_configured_tokens_need_no_reads(sample_tokens):
+    """Test that tokens from the plugin options are answered without RPC."""
+    wallet = FakeWalletClient(chain_id=1)
+    service = Erc20Service(sample_tokens, multicall_address=MULTICALL)
+
+    resolved = service.resolve_tokens(wallet, ["0x1234567890123456789012345678901234567890"])
+
+    assert resolved["0x1234567890123456789012345678901234567890"]["symbol"] == "TEST"
+    assert wallet.reads == []
+
+
+def test_cache_persists_across_restarts(tmp_path):
+    """Test that a new cache on the same file serves tokens discovered before."""
+    path = str(tmp_path / "cache" / "tokens.sqlite3")
+    service = Erc20Service([], TokenMetadataCache(path), MULTICALL)
+    service.resolve_tokens(FakeWalletClient(), [TOKEN])
+    service.metadata_cache.close()
+
+    wallet = FakeWalletClient()
+    restarted = Erc20Service([], TokenMetadataCache(path), MULTICALL)
+    assert restarted.resolve_tokens(wallet, [TOKEN])[TOKEN]["name"] == "USD Coin"
+    assert wallet.reads == []
+    # Entries are per chain
+    assert TokenMetadataCache(path).get(5, TOKEN) is None
+
+
+def test_get_token_info_by_address_tool():
+    """Test the tool resolving tokens by address, and the symbol lookup of discovered tokens."""
+    wallet = FakeWalletClient()
+    service = Erc20Service([], multicall_address=MULTICALL)
+
+    info = service.get_token_info_by_address(wallet, {"tokenAddresses": [TOKEN, LEGACY_TOKEN]})
+
+    assert [token["symbol"] for token in info] == ["USDC", "MKR"]
+    assert service.get_token_info_by_symbol(wallet, {"symbol": "usdc"})["contractAddress"] == TOKEN
+    with pytest.raises(Exception, match="Not ERC20 tokens"):
+        service.get_token_info_by_address(wallet, {"tokenAddresses": [NOT_A_TOKEN]})
+
+
+def test_discovery_on_local_chain():
+    """Test resolving the LocalChain token through its Multicall3 deployment."""
+    pytest.importorskip("eth_tester")
+    testing = pytest.importorskip("radius_wallets.web3.testing")
+
+    chain = testing.LocalChain(token_symbol="DISC", token_decimals=8)
+    wallet = chain.wallet()
+    service = Erc20Service([], multicall_address=chain.multicall_address)
+
+    before = chain.request_count
+    resolved = service.resolve_tokens(wallet, [chain.token_address, chain.accounts[1].address])
+    assert resolved == {
+        chain.token_address: {
+            "contractAddress": chain.token_address,
+            "decimals": 8,
+            "symbol": "DISC",
+            "name": chain.token_name,
+        }
+    }
+    reads = chain.request_count - before
+
+    service.resolve_tokens(wallet, [chain.token_address])
+    # Only the chain ID lookup remains
+    assert chain.request_count - before - reads <= 1
@@ -0,0 +1,247 @@
+"""
+Tests for the local ERC20 Transfer log index and the transfer history tool.
+"""
+import time
+
+import pytest
+
+from radius_plugins.erc20.service import Erc20Service, TransferHistoryService
+from radius_plugins.erc20.transfer_index import TRANSFER_TOPIC, TransferIndex
+
+TOKEN = "0x1111111111111111111111111111111111111111"
+OTHER_TOKEN = "0x2222222222222222222222222222222222222222"
+ALICE = "0xaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa"
+BOB = "0xbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbb"
+
+
+def topic(address):
+    return "0x" + address[2:].rjust(64, "0")
+
+
+class FakeWalletClient:
+    """Wallet client serving Transfer logs from a list, rejecting ranges wider than ``max_range``."""
+
+    def __init__(self, head=1_000, max_range=None):
+        self.head = head
+        self.max_range = max_range
+        self.logs = []
+        self.requests = []
+
+    def get_chain(self):
+        return {"type": "evm", "id": 1}
+
+    def get_address(self):
+        return ALICE
+
+    def resolve_address(self, address):
+        return address
+
+    def get_block_number(self):
+        return self.head
+
+    def get_block_timestamp(self, block_number):
+        return 1_700_000_000 + block_number * 2
+
+    def add_transfer(self, token, sender, recipient, value, block_number):
+        self.logs.append({
+            "address": token,
+            "topics": [TRANSFER_TOPIC, topic(sender), topic(recipient)],
+            "data": hex(value),
+            "blockNumber": block_number,
+            "transactionHash": "0x%064x" % len(self.logs),
+            "logIndex": 0,
+        })
+
+    def get_logs(self, filter):
+        self.requests.append((filter["fromBlock"], filter["toBlock"], tuple(filter["address"])))
+        if self.max_range is not None and filter["toBlock"] - filter["fromBlock"] + 1 > self.max_range:
+            raise Exception("query exceeds max block range")
+        addresses = {address.lower() for address in filter["address"]}
+        return [
+            log for log in self.logs
+            if filter["fromBlock"] <= log["blockNumber"] <= filter["toBlock"]
+            and log["address"].lower() in addresses
+            and log["topics"][0] == filter["topics"][0]
+        ]
+
+
+def test_backfill_adapts_block_range():
+    """Test that a rejected range is halved and that every log is indexed once."""
+    wallet = FakeWalletClient(head=1_000, max_range=150)
+    for block in range(0, 1_000, 10):
+        wallet.add_transfer(TOKEN, BOB, ALICE, block, block)
+    index = TransferIndex(chunk_size=1_000)
+
+    assert index.sync(wallet, [TOKEN]) == 100
+    stats = index.stats()
+    assert stats["transfers"] == 100
+    assert stats["range_shrinks"] >= 3
+    assert index.next_block(1, TOKEN) == 1_001
+    # Successful ranges never overlap
+    served = sorted((start, end) for start, end, _ in wallet.requests if end - start + 1 <= 150)
+    assert all(previous[1] < current[0] for previous, current in zip(served, served[1:]))
+
+
+def test_sync_is_incremental():
+    """Test that a later sync only fetches blocks after the last processed one."""
+    wallet = FakeWalletClient(head=100)
+    wallet.add_transfer(TOKEN, BOB, ALICE, 5, 50)
+    index = TransferIndex()
+    index.sync(wallet, [TOKEN])
+
+    wallet.head = 120
+    wallet.add_transfer(TOKEN, ALICE, BOB, 3, 110)
+    wallet.requests.clear()
+
+    assert index.sync(wallet, [TOKEN]) == 1
+    assert wallet.requests == [(101, 120, (TOKEN,))]
+    # Nothing new
+    wallet.requests.clear()
+    assert index.sync(wallet, [TOKEN]) == 0
+    assert wallet.requests == []
+
+
+def test_new_token_catches_up_then_joins():
+    """Test that a token added later is backfilled separately, then fetched with the others."""
+    wallet = FakeWalletClient(head=100)
+    index = TransferIndex(start_block=0)
+    index.sync(wallet, [TOKEN])
+
+    wallet.head = 110
+    wallet.requests.clear()
+    index.sync(wallet, [TOKEN, OTHER_TOKEN])
+
+    assert wallet.requests == [(0, 100, (OTHER_TOKEN.lower(),)), (101, 110, (TOKEN.lower(), OTHER_TOKEN.lower()))]
+
+
+def test_queries_by_wallet_token_and_time():
+    """Test filtering by wallet, direction, token and time range, newest first."""
+    wallet = FakeWalletClient(head=100)
+    wallet.add_transfer(TOKEN, BOB, ALICE, 10, 10)
+    wallet.add_transfer(TOKEN, ALICE, BOB, 4, 20)
+    wallet.add_transfer(OTHER_TOKEN, BOB, ALICE, 2**255, 30)
+    index = TransferIndex()
+    index.sync(wallet, [TOKEN, OTHER_TOKEN])
+
+    assert [t["blockNumber"] for t in index.transfers(1, wallet=ALICE)] == [30, 20, 10]
+    assert [t["blockNumber"] for t in index.transfers(1, wallet=ALICE, direction="in")] == [30, 10]
+    assert [t["blockNumber"] for t in index.transfers(1, wallet=ALICE, direction="out")] == [20]
+    assert [t["blockNumber"] for t in index.transfers(1, token=TOKEN.upper().replace("0X", "0x"))] == [20, 10]
+    in_range = index.transfers(1, wallet=ALICE, from_timestamp=1_700_000_040, to_timestamp=1_700_000_060)
+    assert [t["blockNumber"] for t in in_range] == [30, 20]
+    # Values beyond 64 bits are kept exactly
+    assert index.transfers(1, token=OTHER_TOKEN)[0]["value"] == str(2**255)
+    assert index.transfers(5, wallet=ALICE) == []
+
+
+def test_non_erc20_transfers_are_skipped():
+    """Test that ERC-721 Transfer logs, which index a fourth topic, are not stored."""
+    wallet = FakeWalletClient(head=10)
+    wallet.add_transfer(TOKEN, BOB, ALICE, 1, 5)
+    wallet.logs[0]["topics"].append(topic("0x" + "01".rjust(40, "0")))
+    wallet.logs[0]["data"] = "0x"
+    index = TransferIndex()
+
+    assert index.sync(wallet, [TOKEN]) == 0
+
+
+def test_index_persists_across_restarts(tmp_path):
+    """Test that a new index on the same file answers queries and resumes from its last block."""
+    path = str(tmp_path / "index" / "transfers.sqlite3")
+    wallet = FakeWalletClient(head=100)
+    wallet.add_transfer(TOKEN, BOB, ALICE, 7, 40)
+    index = TransferIndex(path)
+    index.sync(wallet, [TOKEN])
+    index.close()
+
+    restarted = TransferIndex(path)
+    assert restarted.transfers(1, wallet=ALICE)[0]["value"] == "7"
+    wallet.requests.clear()
+    restarted.sync(wallet, [TOKEN])
+    assert wallet.requests == []
+
+
+def test_transfer_history_tool():
+    """Test the tool answering from the index, reporting its progress and converting values to decimal units."""
+    wallet = FakeWalletClient(head=100)
+    wallet.add_transfer(TOKEN, BOB, ALICE, 1_500_000, 10)
+    tokens = [{"decimals": 6, "symbol": "USDC", "name": "USD Coin", "chains": {1: {"contractAddress": TOKEN}}}]
+    service = TransferHistoryService(Erc20Service(tokens), TransferIndex(), sync_interval=None)
+
+    before_sync = service.get_transfer_history(wallet, {"direction": "in"})
+    assert before_sync == {"transfers": [], "indexedToBlock": -1, "headBlock": None, "upToDate": False}
+    assert wallet.requests == []
+
+    assert service.sync(wallet) == 1
+    wallet.head = 120
+    result = service.get_transfer_history(wallet, {"direction": "in"})
+
+    assert result["indexedToBlock"] == 100
+    assert result["headBlock"] == 100
+    assert result["upToDate"]
+    history = result["transfers"]
+    assert len(history) == 1
+    assert history[0]["symbol"] == "USDC"
+    assert history[0]["value"] == "1.5"
+    assert history[0]["valueInBaseUnits"] == "1500000"
+    assert history[0]["sender"] == BOB
+
+
+def test_background_sync():
+    """Test that the first query starts a background sync that keeps the index current."""
+    wallet = FakeWalletClient(head=100)
+    wallet.add_transfer(TOKEN, BOB, ALICE, 1_500_000, 10)
+    tokens = [{"decimals": 6, "symbol": "USDC", "name": "USD Coin", "chains": {1: {"contractAddress": TOKEN}}}]
+    index = TransferIndex()
+    service = TransferHistoryService(Erc20Service(tokens), index, sync_interval=0.01)
+
+    service.get_transfer_history(wallet, {})
+    wallet.add_transfer(TOKEN, ALICE, BOB, 2_000_000, 150)
+    wallet.head = 200
+    deadline = time.monotonic() + 5
+    while index.indexed_block(1, [TOKEN]) < 200 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    result = service.get_transfer_history(wallet, {})
+    index.stop()
+
+    assert [transfer["value"] for transfer in result["transfers"]] == ["2", "1.5"]
+    assert result["indexedToBlock"] == 200
+    assert index.stats()["syncing"] is False
+    assert index.stats()["sync_errors"] == 0
+
+
+def test_failed_background_sync_is_retried():
+    """Test that a node error during a background sync is counted and the next sync proceeds."""
+    wallet = FakeWalletClient(head=100, max_range=0)
+    index = TransferIndex().start(wallet, lambda: [TOKEN], interval=0.01)
+
+    deadline = time.monotonic() + 5
+    while index.stats()["sync_errors"] < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    wallet.max_range = None
+    while index.indexed_block(1, [TOKEN]) < 100 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    index.stop()
+
+    assert index.stats()["sync_errors"] >= 2
+    assert index.indexed_block(1, [TOKEN]) == 100
+
+
+def test_transfer_history_on_local_chain():
+    """Test indexing transfers made on the LocalChain."""
+    pytest.importorskip("eth_tester")
+    testing = pytest.importorskip("radius_wallets.web3.testing")
+
+    chain = testing.LocalChain(token_decimals=6)
+    wallet = chain.wallet()
+    recipient = chain.accounts[2].address
+    service = Erc20Service([chain.token])
+    service.transfer(wallet, {"tokenAddress": chain.token_address, "to": recipient, "amount": "2500000"})
+    history_service = TransferHistoryService(service, TransferIndex(), sync_interval=None)
+    history_service.sync(wallet)
+
+    received = history_service.get_transfer_history(wallet, {"wallet": recipient, "direction": "in"})
+
+    assert [(t["sender"], t["value"]) for t in received["transfers"]] == [(wallet.get_address().lower(), "2.5")]
+    assert received["upToDate"]
+    assert history_service.get_transfer_history(wallet, {"wallet": recipient, "direction": "out"})["transfers"] == []
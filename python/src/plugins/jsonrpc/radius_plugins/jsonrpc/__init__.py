@@ -1,23 +1,36 @@
-from dataclasses import dataclass
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-from radius.classes.plugin_base import PluginBase
-from .service import JSONRpcService
+if TYPE_CHECKING:
+    from .plugin import JSONRpcPlugin, JSONRpcPluginOptions, jsonrpc
+    from .service import JSONRpcService
 
 __version__ = "1.0.0"
 
-
-@dataclass
-class JSONRpcPluginOptions:
-    endpoint: str
-
-
-class JSONRpcPlugin(PluginBase):
-    def __init__(self, options: JSONRpcPluginOptions):
-        super().__init__("jsonrpc", [JSONRpcService(options.endpoint)])
-
-    def supports_chain(self, chain) -> bool:
-        return True
-
-
-def jsonrpc(options: JSONRpcPluginOptions) -> JSONRpcPlugin:
-    return JSONRpcPlugin(options)
+# Resolved on first access (PEP 562) so aiohttp is only imported when the plugin is used.
+_LAZY_ATTRIBUTES = {
+    "JSONRpcPlugin": ".plugin",
+    "JSONRpcPluginOptions": ".plugin",
+    "jsonrpc": ".plugin",
+    "JSONRpcService": ".service",
+}
+
+__all__ = [
+    "JSONRpcPlugin",
+    "JSONRpcPluginOptions",
+    "jsonrpc",
+    "JSONRpcService",
+]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
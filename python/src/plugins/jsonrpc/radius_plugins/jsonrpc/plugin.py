@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from radius.classes.plugin_base import PluginBase
+from radius.utils.resilience import Resilience
+from radius.utils.single_flight import SingleFlight
+from .service import JSONRpcService
+
+
+@dataclass
+class JSONRpcPluginOptions:
+    endpoint: str
+    resilience: Optional[Resilience] = None  # Timeout, retry and circuit breaker policy (defaults apply when omitted)
+    # Coalescing group for identical concurrent reads (one per service when omitted)
+    single_flight: Optional[SingleFlight] = None
+
+
+class JSONRpcPlugin(PluginBase):
+    def __init__(self, options: JSONRpcPluginOptions):
+        super().__init__("jsonrpc", [JSONRpcService(options.endpoint, options.resilience, options.single_flight)])
+
+    def supports_chain(self, chain) -> bool:
+        return True
+
+
+def jsonrpc(options: JSONRpcPluginOptions) -> JSONRpcPlugin:
+    return JSONRpcPlugin(options)
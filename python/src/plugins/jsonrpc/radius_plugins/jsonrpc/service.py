@@ -1,22 +1,87 @@
-import aiohttp
+import json
+from typing import Optional
+
 from radius.decorators.tool import Tool
+from radius.utils.json_codec import get_json_codec
+from radius.utils.resilience import Resilience, TransientError
+from radius.utils.single_flight import SingleFlight
 from .parameters import JSONRpcBodyParameters
 
+# Reads that may be retried on a transport error and shared between identical calls in flight.
+# Other methods are sent once: besides transactions, calls such as eth_newFilter or
+# personal_unlockAccount create or change state on the node.
+IDEMPOTENT_METHODS = frozenset({
+    "eth_blockNumber",
+    "eth_call",
+    "eth_chainId",
+    "eth_estimateGas",
+    "eth_feeHistory",
+    "eth_gasPrice",
+    "eth_getBalance",
+    "eth_getBlockByHash",
+    "eth_getBlockByNumber",
+    "eth_getBlockReceipts",
+    "eth_getCode",
+    "eth_getLogs",
+    "eth_getProof",
+    "eth_getStorageAt",
+    "eth_getTransactionByHash",
+    "eth_getTransactionCount",
+    "eth_getTransactionReceipt",
+    "eth_maxPriorityFeePerGas",
+    "eth_syncing",
+    "net_version",
+    "web3_clientVersion",
+})
+
+
 class JSONRpcService:
-    def __init__(self, endpoint: str):
+    def __init__(
+        self, endpoint: str, resilience: Optional[Resilience] = None, single_flight: Optional[SingleFlight] = None
+    ):
         self.endpoint = endpoint
+        # Deadline, retries of reads and a circuit breaker for the endpoint
+        self.resilience = resilience or Resilience()
+        # Identical reads in flight at the same time share one HTTP call
+        self.single_flight = single_flight or SingleFlight()
 
     @Tool({
         "description": "Make a remote procedure call to a JSON RPC endpoint",
-        "parameters_schema": JSONRpcBodyParameters
+        "parameters_schema": JSONRpcBodyParameters,
+        "tags": ["jsonrpc"],
+        # Arbitrary methods, including eth_sendRawTransaction
+        "side_effect": "write",
     })
     async def JSONRpcFunc(self, parameters: dict):
         """Makes a POST request to the configured endpoint with the required JSON-RPC parameters."""
-        try:
+        import aiohttp  # Deferred so importing the plugin doesn't load the HTTP stack
+
+        codec = get_json_codec()
+
+        async def send():
             async with aiohttp.ClientSession() as session:
-                async with session.post(self.endpoint, json=parameters) as response:
-                    if not response.ok:
-                        raise Exception(f"HTTP error! status: {response.status}, body: {await response.text()}")
-                    return await response.json()
+                try:
+                    async with session.post(
+                        self.endpoint, data=codec.dumps(parameters), headers={"Content-Type": "application/json"}
+                    ) as response:
+                        if not response.ok:
+                            error = f"HTTP error! status: {response.status}, body: {await response.text()}"
+                            if response.status >= 500 or response.status == 429:
+                                raise TransientError(error)
+                            raise Exception(error)
+                        return codec.loads(await response.read())
+                except aiohttp.ClientError as e:
+                    raise TransientError(f"Network error: {e}") from e
+
+        try:
+            if parameters.get("method") not in IDEMPOTENT_METHODS:
+                return await self.resilience.acall(self.endpoint, send, idempotent=False)
+            # The request ID does not change the answer, so it is left out of the key
+            key = (parameters.get("method"), json.dumps(parameters.get("params"), sort_keys=True, default=str))
+            response = await self.single_flight.ado(key, lambda: self.resilience.acall(self.endpoint, send))
         except Exception as e:
             raise Exception(f"Failed to call {self.endpoint}: {e}")
+        if isinstance(response, dict) and "id" in parameters:
+            # Answer with the caller's own ID when sharing another call's response
+            response = {**response, "id": parameters["id"]}
+        return response
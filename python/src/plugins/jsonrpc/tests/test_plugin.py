@@ -1,3 +1,7 @@
+import os
+import subprocess
+import sys
+
 from radius_plugins.jsonrpc import jsonrpc, JSONRpcPlugin, JSONRpcPluginOptions
 
 
@@ -55,4 +59,14 @@ class TestJSONRpcPlugin:
         # Check plugin
         assert plugin is not None
         assert plugin.name == "jsonrpc"
-        assert plugin.tool_providers[0] is not None
\ No newline at end of file
+        assert plugin.tool_providers[0] is not None
+
+    def test_import_defers_aiohttp(self):
+        """Test that importing the plugin package does not import aiohttp."""
+        result = subprocess.run(
+            [sys.executable, "-c", "import sys, radius_plugins.jsonrpc; assert 'aiohttp' not in sys.modules"],
+            capture_output=True,
+            text=True,
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        )
+        assert result.returncode == 0, result.stderr
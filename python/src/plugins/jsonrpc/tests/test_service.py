@@ -1,6 +1,11 @@
+import asyncio
+
 import pytest
+import pytest_asyncio
 import json
 from unittest.mock import patch, AsyncMock
+from aiohttp import web
+from radius.utils.resilience import Resilience, ResiliencePolicy
 from radius_plugins.jsonrpc.service import JSONRpcService
 
 
@@ -153,4 +158,88 @@ class TestJSONRpcService:
             
             # Verify the result
             assert result["result"]["blockHash"] == "0x1234"
-            assert result["result"]["blockNumber"] == "0x10"
\ No newline at end of file
+            assert result["result"]["blockNumber"] == "0x10"
+
+@pytest_asyncio.fixture
+async def jsonrpc_server():
+    """Starts a local JSON-RPC endpoint whose first ``failures`` requests answer HTTP 503."""
+    runners = []
+
+    async def start(failures):
+        calls = []
+
+        async def handle(request):
+            body = await request.json()
+            calls.append(body["method"])
+            if len(calls) <= failures:
+                return web.Response(status=503, text="upstream unavailable")
+            return web.json_response({"jsonrpc": "2.0", "id": body["id"], "result": "0x10"})
+
+        app = web.Application()
+        app.router.add_post("/", handle)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        runners.append(runner)
+        return f"http://127.0.0.1:{runner.addresses[0][1]}/", calls
+
+    yield start
+    for runner in runners:
+        await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_transient_errors_are_retried(jsonrpc_server):
+    """Test that reads are retried after a transient server error."""
+    endpoint, calls = await jsonrpc_server(failures=1)
+    resilience = Resilience(ResiliencePolicy(base_delay=0.001))
+    service = JSONRpcService(endpoint, resilience)
+
+    result = await service.JSONRpcFunc({"method": "eth_blockNumber", "params": [], "id": 1, "jsonrpc": "2.0"})
+
+    assert result["result"] == "0x10"
+    assert calls == ["eth_blockNumber", "eth_blockNumber"]
+    assert resilience.stats()["retries"] == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("method", ["eth_sendRawTransaction", "eth_newFilter", "personal_unlockAccount", "debug_x"])
+async def test_methods_with_side_effects_are_not_retried(jsonrpc_server, method):
+    """Test that transactions, state-creating calls and unknown methods are sent only once."""
+    endpoint, calls = await jsonrpc_server(failures=1)
+    service = JSONRpcService(endpoint, Resilience(ResiliencePolicy(base_delay=0.001)))
+
+    with pytest.raises(Exception, match="503"):
+        await service.JSONRpcFunc({"method": method, "params": ["0x00"], "id": 1, "jsonrpc": "2.0"})
+    assert calls == [method]
+
+
+@pytest.mark.asyncio
+async def test_filters_are_not_coalesced(jsonrpc_server):
+    """Test that identical eth_newFilter calls in flight together each create their own filter."""
+    endpoint, calls = await jsonrpc_server(failures=0)
+    service = JSONRpcService(endpoint)
+
+    await asyncio.gather(*(
+        service.JSONRpcFunc({"method": "eth_newFilter", "params": [{}], "id": request_id, "jsonrpc": "2.0"})
+        for request_id in range(2)
+    ))
+
+    assert calls == ["eth_newFilter", "eth_newFilter"]
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_reads_are_coalesced(jsonrpc_server):
+    """Test that identical reads in flight together share one request but keep their own IDs."""
+    endpoint, calls = await jsonrpc_server(failures=0)
+    service = JSONRpcService(endpoint)
+
+    results = await asyncio.gather(*(
+        service.JSONRpcFunc({"method": "eth_blockNumber", "params": [], "id": request_id, "jsonrpc": "2.0"})
+        for request_id in range(3)
+    ))
+
+    assert calls == ["eth_blockNumber"]
+    assert [result["id"] for result in results] == [0, 1, 2]
+    assert service.single_flight.stats()["coalesced"] == 2
@@ -1,45 +1,47 @@
-from dataclasses import dataclass
-from radius.classes.plugin_base import PluginBase
-from .service import UniswapService
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-__version__ = "1.0.0"
+if TYPE_CHECKING:
+    from .plugin import UniswapPlugin, UniswapPluginOptions, uniswap
+    from .rate_limit import RateLimitConfig, RateLimiter, RateLimitStats, RateLimitTimeout, shared_rate_limiter
+    from .service import UniswapService
 
+__version__ = "1.0.0"
 
-@dataclass
-class UniswapPluginOptions:
-    """Options for the UniswapPlugin."""
-    api_key: str  # API key for external service integration
-    base_url: str  # Base URL for Uniswap API
-
-
-class UniswapPlugin(PluginBase):
-    """Uniswap plugin for token swaps on the Radius network."""
-    def __init__(self, options: UniswapPluginOptions):
-        super().__init__("uniswap", [UniswapService(options.api_key, options.base_url)])
-
-    def supports_chain(self, chain) -> bool:
-        """Check if the chain is supported by Uniswap.
-        
-        Currently supports:
-        - Radius (1223953)
-        """
-        if chain['type'] != 'evm':
-            return False
-            
-        # List of supported chain IDs from uniswap.plugin.ts
-        SUPPORTED_CHAIN_IDS = [
-            1223953,  # Radius
-        ]
-        return chain['id'] in SUPPORTED_CHAIN_IDS
-
-
-def uniswap(options: UniswapPluginOptions) -> UniswapPlugin:
-    """Create a new instance of the Uniswap plugin.
-    
-    Args:
-        options: Configuration options for the plugin
-        
-    Returns:
-        A configured UniswapPlugin instance
-    """
-    return UniswapPlugin(options)
+# Resolved on first access (PEP 562) so aiohttp and the wallet stack are only imported when used.
+_LAZY_ATTRIBUTES = {
+    "UniswapPlugin": ".plugin",
+    "UniswapPluginOptions": ".plugin",
+    "uniswap": ".plugin",
+    "UniswapService": ".service",
+    "RateLimitConfig": ".rate_limit",
+    "RateLimiter": ".rate_limit",
+    "RateLimitStats": ".rate_limit",
+    "RateLimitTimeout": ".rate_limit",
+    "shared_rate_limiter": ".rate_limit",
+}
+
+__all__ = [
+    "UniswapPlugin",
+    "UniswapPluginOptions",
+    "uniswap",
+    "UniswapService",
+    "RateLimitConfig",
+    "RateLimiter",
+    "RateLimitStats",
+    "RateLimitTimeout",
+    "shared_rate_limiter",
+]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
@@ -0,0 +1,58 @@
+from dataclasses import dataclass
+from typing import Optional
+from radius.classes.plugin_base import PluginBase
+from radius.utils.resilience import Resilience
+from radius.utils.single_flight import SingleFlight
+from .rate_limit import RateLimitConfig
+from .service import UniswapService
+
+
+@dataclass
+class UniswapPluginOptions:
+    """Options for the UniswapPlugin."""
+    api_key: str  # API key for external service integration
+    base_url: str  # Base URL for Uniswap API
+    rate_limit: Optional[RateLimitConfig] = None  # Client-side limits for the API key (defaults apply when omitted)
+    resilience: Optional[Resilience] = None  # Timeout and circuit breaker policy (defaults apply when omitted)
+    # Coalescing group for identical concurrent requests (one per service when omitted)
+    single_flight: Optional[SingleFlight] = None
+
+
+class UniswapPlugin(PluginBase):
+    """Uniswap plugin for token swaps on the Radius network."""
+    def __init__(self, options: UniswapPluginOptions):
+        service = UniswapService(
+            options.api_key,
+            options.base_url,
+            options.rate_limit,
+            resilience=options.resilience,
+            single_flight=options.single_flight,
+        )
+        super().__init__("uniswap", [service])
+
+    def supports_chain(self, chain) -> bool:
+        """Check if the chain is supported by Uniswap.
+        
+        Currently supports:
+        - Radius (1223953)
+        """
+        if chain['type'] != 'evm':
+            return False
+            
+        # List of supported chain IDs from uniswap.plugin.ts
+        SUPPORTED_CHAIN_IDS = [
+            1223953,  # Radius
+        ]
+        return chain['id'] in SUPPORTED_CHAIN_IDS
+
+
+def uniswap(options: UniswapPluginOptions) -> UniswapPlugin:
+    """Create a new instance of the Uniswap plugin.
+    
+    Args:
+        options: Configuration options for the plugin
+        
+    Returns:
+        A configured UniswapPlugin instance
+    """
+    return UniswapPlugin(options)
@@ -0,0 +1,272 @@
+import asyncio
+import random
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Optional, TypedDict, TypeVar
+
+from radius.utils.resilience import TransientError
+
+T = TypeVar("T")
+
+
+@dataclass
+class RateLimitConfig:
+    """
+    Client-side limits for requests to the Uniswap trading API.
+
+    Attributes:
+        requests_per_second: Sustained request rate allowed per API key
+        burst: Requests that may be sent back to back before the rate applies
+        max_wait: Seconds a call may spend queued and backing off before it fails
+        max_retries: Retries of a rate-limited, server-side or network error
+        base_delay: First backoff delay in seconds, doubled on every retry
+        max_delay: Upper bound on a single backoff delay in seconds
+    """
+
+    requests_per_second: float = 10.0
+    burst: int = 10
+    max_wait: float = 30.0
+    max_retries: int = 4
+    base_delay: float = 0.5
+    max_delay: float = 10.0
+
+
+class RateLimitStats(TypedDict):
+    """
+    Counters describing how a rate limiter shaped traffic
+
+    Attributes:
+        requests: Requests let through the limiter
+        throttled: Requests that had to wait for a token
+        queued: Requests currently waiting for a token
+        throttled_seconds: Total time requests spent waiting for tokens
+        backoff_seconds: Total time calls spent backing off before retries
+        retries: Requests retried after a retryable error
+        rate_limited: Responses rejected by the API for exceeding its rate limit
+        rejected: Calls that failed because their wait would exceed ``max_wait``
+    """
+
+    requests: int
+    throttled: int
+    queued: int
+    throttled_seconds: float
+    backoff_seconds: float
+    retries: int
+    rate_limited: int
+    rejected: int
+
+
+class RateLimitTimeout(Exception):
+    """Raised when a request cannot be sent within its deadline."""
+
+
+class RetryableError(TransientError):
+    """
+    Error of a request that may succeed when retried.
+
+    Args:
+        message: Error message, raised as is once retries are exhausted
+        retry_after: Delay in seconds requested by the server, if any
+        rate_limited: Whether the server rejected the request for exceeding its rate limit
+    """
+
+    def __init__(self, message: str, retry_after: Optional[float] = None, rate_limited: bool = False):
+        super().__init__(message)
+        self.retry_after = retry_after
+        self.rate_limited = rate_limited
+
+
+class RateLimiter:
+    """
+    Token-bucket limiter with deadline-aware queueing and exponential backoff.
+
+    Requests reserve send slots in arrival order (a token bucket expressed as a virtual schedule),
+    so concurrent callers queue fairly instead of racing, and a call whose slot lies beyond its
+    deadline fails immediately instead of waiting in vain. When the API answers with a rate
+    limit error, the whole bucket pauses for the ``Retry-After`` delay, slowing every caller
+    sharing the API key rather than only the one that was rejected.
+
+    The limiter is thread-safe and independent of the event loop, so one instance can be shared
+    by services running in different threads.
+
+    Args:
+        config: Rate and retry settings
+        clock: Monotonic time source, in seconds
+        sleep: Coroutine function used to wait
+    """
+
+    def __init__(
+        self,
+        config: Optional[RateLimitConfig] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+    ):
+        self.config = config or RateLimitConfig()
+        if self.config.requests_per_second <= 0 or self.config.burst < 1:
+            raise ValueError("requests_per_second must be positive and burst at least 1")
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._interval = 1.0 / self.config.requests_per_second
+        self._tolerance = (self.config.burst - 1) * self._interval
+        # Theoretical arrival time of the next request at the sustained rate
+        self._next_slot = clock()
+        self._stats: RateLimitStats = {
+            "requests": 0,
+            "throttled": 0,
+            "queued": 0,
+            "throttled_seconds": 0.0,
+            "backoff_seconds": 0.0,
+            "retries": 0,
+            "rate_limited": 0,
+            "rejected": 0,
+        }
+
+    def stats(self) -> RateLimitStats:
+        """Returns the request, throttling and retry counters of the limiter."""
+        with self._lock:
+            return dict(self._stats)  # type: ignore[return-value]
+
+    async def acquire(self, timeout: Optional[float] = None) -> float:
+        """
+        Waits for a send slot.
+
+        Args:
+            timeout: Maximum number of seconds to wait; None waits as long as needed
+
+        Returns:
+            The number of seconds waited
+
+        Raises:
+            RateLimitTimeout: If no slot is available within ``timeout``
+        """
+        with self._lock:
+            now = self._clock()
+            slot = max(now, self._next_slot - self._tolerance)
+            wait = slot - now
+            if timeout is not None and wait > timeout:
+                self._stats["rejected"] += 1
+                raise RateLimitTimeout(f"Rate limit queue wait of {wait:.2f}s exceeds the deadline")
+            self._next_slot = max(self._next_slot, slot) + self._interval
+            self._stats["requests"] += 1
+            if wait > 0:
+                self._stats["throttled"] += 1
+                self._stats["throttled_seconds"] += wait
+                self._stats["queued"] += 1
+
+        if wait > 0:
+            try:
+                await self._sleep(wait)
+            finally:
+                with self._lock:
+                    self._stats["queued"] -= 1
+        return wait
+
+    def pause(self, seconds: float) -> None:
+        """
+        Holds back every request for ``seconds``, e.g. after the API signalled its rate limit.
+
+        Args:
+            seconds: Delay before the next request may be sent
+        """
+        with self._lock:
+            resume_at = self._clock() + seconds
+            # Resume at the sustained rate rather than with a full burst
+            self._next_slot = max(self._next_slot, resume_at + self._tolerance)
+
+    def backoff_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Delay before retry number ``attempt`` (starting at 0).
+
+        A server-provided ``Retry-After`` is honoured as a lower bound; otherwise the delay is
+        exponential with full jitter so that retrying callers spread out.
+        """
+        ceiling = min(self.config.max_delay, self.config.base_delay * 2 ** attempt)
+        delay = random.uniform(0, ceiling)
+        if retry_after is not None:
+            delay = max(retry_after, delay)
+        return delay
+
+    async def call(self, operation: Callable[[], Awaitable[T]]) -> T:
+        """
+        Runs ``operation`` under the limiter, retrying :class:`RetryableError` with backoff.
+
+        Args:
+            operation: Coroutine function sending one request
+
+        Returns:
+            The result of the first successful attempt
+
+        Raises:
+            RetryableError: The last error, once retries are exhausted or the deadline would be exceeded
+            RateLimitTimeout: If the limiter cannot schedule the request before the deadline
+        """
+        deadline = self._clock() + self.config.max_wait
+        attempt = 0
+        while True:
+            await self.acquire(timeout=max(0.0, deadline - self._clock()))
+            try:
+                return await operation()
+            except RetryableError as error:
+                delay = self.backoff_delay(attempt, error.retry_after)
+                with self._lock:
+                    if error.rate_limited:
+                        self._stats["rate_limited"] += 1
+                    exhausted = attempt >= self.config.max_retries or self._clock() + delay > deadline
+                    if not exhausted:
+                        self._stats["retries"] += 1
+                        self._stats["backoff_seconds"] += delay
+                if exhausted:
+                    raise
+                if error.rate_limited:
+                    self.pause(delay)
+                    delay = 0.0  # The paused bucket delays the next acquire
+                await self._sleep(delay)
+                attempt += 1
+
+
+_limiters: Dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def shared_rate_limiter(api_key: str, config: Optional[RateLimitConfig] = None) -> RateLimiter:
+    """
+    Returns the process-wide limiter for an API key, creating it on first use.
+
+    Every service using the same key shares one bucket, so concurrent agents together stay
+    within the key's allowance. The configuration of the first call for a key is kept.
+
+    Args:
+        api_key: The Uniswap API key
+        config: Limits applied if the limiter is created by this call
+
+    Returns:
+        The shared limiter
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(api_key)
+        if limiter is None:
+            limiter = _limiters[api_key] = RateLimiter(config)
+        return limiter
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parses a ``Retry-After`` header given in seconds or as an HTTP date.
+
+    Returns:
+        The delay in seconds, or None if the header is missing or invalid
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
@@ -1,18 +1,43 @@
-import aiohttp
 import json
-from typing import Any, Dict, cast
+import logging
+from typing import Any, Dict, Optional, cast
 from eth_typing import HexStr
 from radius.decorators.tool import Tool
+from radius.utils.json_codec import get_json_codec
+from radius.utils.resilience import Resilience, ResiliencePolicy
+from radius.utils.single_flight import SingleFlight
 from .parameters import CheckApprovalParameters, GetQuoteParameters
+from .rate_limit import RateLimitConfig, RateLimiter, RetryableError, parse_retry_after, shared_rate_limiter
 from radius_wallets.evm import EVMTransaction, EVMTypedData
 from radius_wallets.evm import EVMWalletClient
 from radius_plugins.erc20.abi import ERC20_ABI
 
+logger = logging.getLogger(__name__)
+
+# Every API endpoint is a POST; these only read state, so identical concurrent requests can share a response.
+# A swap response is a transaction to sign and send, which each caller must get for itself.
+COALESCED_ENDPOINTS = frozenset({"check_approval", "quote"})
+
 
 class UniswapService:
-    def __init__(self, api_key: str, base_url: str = "https://trade-api.gateway.uniswap.org/v1"):
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://trade-api.gateway.uniswap.org/v1",
+        rate_limit: Optional[RateLimitConfig] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        resilience: Optional[Resilience] = None,
+        single_flight: Optional[SingleFlight] = None,
+    ):
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")  # Remove trailing slash if present
+        # One limiter per API key, shared by every service in the process using that key
+        self.rate_limiter = rate_limiter or shared_rate_limiter(api_key, rate_limit)
+        # Deadline and circuit breaker for the API; retries are left to the rate limiter, which
+        # honours Retry-After
+        self.resilience = resilience or Resilience(ResiliencePolicy(max_retries=0))
+        # Identical read requests in flight at the same time share one HTTP call
+        self.single_flight = single_flight or SingleFlight()
 
         # Map chain IDs to their string names
         self.chain_id_map = {
@@ -20,46 +45,70 @@ class UniswapService:
         }
 
     async def make_request(self, endpoint: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
-        """Make a request to the Uniswap API."""
+        """Make a request to the Uniswap API.
+
+        Requests are throttled by the API key's shared rate limiter; rate limit, server and
+        network errors are retried with backoff, honouring the ``Retry-After`` header. Identical
+        concurrent requests to the read-only endpoints (``COALESCED_ENDPOINTS``) are sent once and
+        share the response; other requests are always sent.
+        """
+        if endpoint not in COALESCED_ENDPOINTS:
+            return await self._send_request(endpoint, parameters)
+        key = (endpoint, json.dumps(parameters, sort_keys=True, default=str))
+        return await self.single_flight.ado(key, lambda: self._send_request(endpoint, parameters))
+
+    async def _send_request(self, endpoint: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        import aiohttp  # Deferred so importing the plugin doesn't load the HTTP stack
+
         url = f"{self.base_url}/{endpoint}"
         
         headers = {
-            "x-api-key": self.api_key
+            "x-api-key": self.api_key,
+            "Content-Type": "application/json",
         }
+        codec = get_json_codec()
         
         async with aiohttp.ClientSession() as session:
-            try:
-                async with session.post(url, json=parameters, headers=headers) as response:
-                    response_text = await response.text()
-                    try:
-                        response_json = json.loads(response_text)
-                    except json.JSONDecodeError:
-                        raise Exception(f"Invalid JSON response from {endpoint}: {response_text}")
-                    
-                    print(f"\nAPI Response for {endpoint}:")
-                    print(f"Status: {response.status}")
-                    print(f"Headers: {dict(response.headers)}")
-                    print(f"Body: {response_text}")
-                    
-                    if not response.ok:
-                        error_code = response_json.get("errorCode", "Unknown error")
-                        if error_code == "VALIDATION_ERROR":
-                            raise Exception("Invalid parameters provided to the API")
-                        elif error_code == "INSUFFICIENT_BALANCE":
-                            raise Exception("Insufficient balance for the requested operation")
-                        elif error_code == "RATE_LIMIT":
-                            raise Exception("API rate limit exceeded")
-                        else:
-                            raise Exception(f"API error: {error_code}")
-                    
-                    return response_json
-            except aiohttp.ClientError as e:
-                raise Exception(f"Network error while accessing {endpoint}: {str(e)}")
+            async def send() -> Dict[str, Any]:
+                try:
+                    async with session.post(url, data=codec.dumps(parameters), headers=headers) as response:
+                        body = await response.read()
+                        try:
+                            response_json = codec.loads(body)
+                        except ValueError:
+                            if response.status >= 500:
+                                raise RetryableError(f"API error: HTTP {response.status}")
+                            raise Exception(f"Invalid JSON response from {endpoint}: {body.decode(errors='replace')}")
+
+                        logger.debug(
+                            "Uniswap API %s responded with HTTP %s (%d bytes)", endpoint, response.status, len(body)
+                        )
+
+                        if not response.ok:
+                            error_code = response_json.get("errorCode", "Unknown error")
+                            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                            if error_code == "VALIDATION_ERROR":
+                                raise Exception("Invalid parameters provided to the API")
+                            elif error_code == "INSUFFICIENT_BALANCE":
+                                raise Exception("Insufficient balance for the requested operation")
+                            elif error_code == "RATE_LIMIT" or response.status == 429:
+                                raise RetryableError("API rate limit exceeded", retry_after, rate_limited=True)
+                            elif response.status >= 500:
+                                raise RetryableError(f"API error: {error_code}", retry_after)
+                            else:
+                                raise Exception(f"API error: {error_code}")
+
+                        return response_json
+                except aiohttp.ClientError as e:
+                    raise RetryableError(f"Network error while accessing {endpoint}: {str(e)}")
+
+            return await self.resilience.acall(self.base_url, lambda: self.rate_limiter.call(send))
 
     @Tool({
         "name": "uniswap_check_approval",
         "description": "Check if the wallet has enough approval for a token and return the transaction to approve the token. The approval must takes place before the swap transaction",
-        "parameters_schema": CheckApprovalParameters
+        "parameters_schema": CheckApprovalParameters,
+        "tags": ["write", "uniswap"]
     })
     async def check_approval(self, wallet_client: EVMWalletClient, parameters: dict):
         """Check token approval and approve if needed."""
@@ -105,7 +154,8 @@ class UniswapService:
     @Tool({
         "name": "uniswap_get_quote",
         "description": "Get the quote for a swap",
-        "parameters_schema": GetQuoteParameters
+        "parameters_schema": GetQuoteParameters,
+        "tags": ["read", "uniswap"]
     })
     async def get_quote(self, wallet_client: EVMWalletClient, parameters: dict):
         """Get a quote for token swap."""
@@ -133,7 +183,8 @@ class UniswapService:
     @Tool({
         "name": "uniswap_swap_tokens",
         "description": "Swap tokens on Uniswap",
-        "parameters_schema": GetQuoteParameters
+        "parameters_schema": GetQuoteParameters,
+        "tags": ["write", "uniswap"]
     })
     async def swap_tokens(self, wallet_client: EVMWalletClient, parameters: dict):
         """Execute a token swap on Uniswap."""
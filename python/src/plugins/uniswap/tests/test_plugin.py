@@ -1,3 +1,7 @@
+import os
+import subprocess
+import sys
+
 from radius.types.chain import Chain
 from radius_plugins.uniswap import UniswapPlugin, UniswapPluginOptions
 
@@ -64,4 +68,20 @@ class TestUniswapPlugin:
         
         # Check Radius chain ID mapping
         assert 1223953 in service.chain_id_map
-        assert service.chain_id_map[1223953] == "RADIUS"
\ No newline at end of file
+        assert service.chain_id_map[1223953] == "RADIUS"
+
+    def test_import_defers_heavy_dependencies(self):
+        """Test that importing the plugin package does not import aiohttp or web3."""
+        code = (
+            "import sys, radius_plugins.uniswap\n"
+            "assert 'aiohttp' not in sys.modules and 'web3' not in sys.modules\n"
+            "radius_plugins.uniswap.UniswapPluginOptions\n"
+            "assert 'aiohttp' not in sys.modules\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        )
+        assert result.returncode == 0, result.stderr
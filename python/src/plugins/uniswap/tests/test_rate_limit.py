@@ -0,0 +1,288 @@
+"""
+Tests for the Uniswap API rate limiter.
+"""
+import asyncio
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from radius.utils.resilience import CircuitOpenError, Resilience, ResiliencePolicy
+from radius_plugins.uniswap.rate_limit import (
+    RateLimitConfig,
+    RateLimiter,
+    RateLimitTimeout,
+    RetryableError,
+    parse_retry_after,
+    shared_rate_limiter,
+)
+from radius_plugins.uniswap.service import UniswapService
+
+
+class FakeClock:
+    """Manually advanced clock whose sleep moves time forward instantly."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def make_limiter(clock, **config):
+    return RateLimiter(RateLimitConfig(**config), clock=clock, sleep=clock.sleep)
+
+
+@pytest.mark.asyncio
+async def test_burst_then_sustained_rate():
+    """Test that the bucket lets a burst through, then spaces requests at the configured rate."""
+    clock = FakeClock()
+    limiter = make_limiter(clock, requests_per_second=2, burst=3)
+
+    waits = [await limiter.acquire() for _ in range(5)]
+
+    assert waits[:3] == [0, 0, 0]
+    assert waits[3:] == pytest.approx([0.5, 0.5])
+    stats = limiter.stats()
+    assert stats["requests"] == 5
+    assert stats["throttled"] == 2
+    assert stats["throttled_seconds"] == pytest.approx(1.0)
+    assert stats["queued"] == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_queue_in_order():
+    """Test that concurrent callers reserve consecutive slots instead of racing."""
+    clock = FakeClock()
+    sleeps = []
+
+    async def sleep(seconds):
+        # Yield without moving the clock so all callers reserve at the same instant
+        sleeps.append(seconds)
+        await asyncio.sleep(0)
+
+    limiter = RateLimiter(RateLimitConfig(requests_per_second=10, burst=1), clock=clock, sleep=sleep)
+
+    waits = await asyncio.gather(*(limiter.acquire() for _ in range(4)))
+
+    assert waits == pytest.approx([0.0, 0.1, 0.2, 0.3])
+
+
+@pytest.mark.asyncio
+async def test_acquire_fails_fast_past_deadline():
+    """Test that a request whose slot lies beyond its timeout is rejected without waiting."""
+    clock = FakeClock()
+    limiter = make_limiter(clock, requests_per_second=1, burst=1)
+    await limiter.acquire()
+
+    with pytest.raises(RateLimitTimeout):
+        await limiter.acquire(timeout=0.5)
+
+    assert clock.sleeps == []
+    assert limiter.stats()["rejected"] == 1
+    assert await limiter.acquire(timeout=1.0) == pytest.approx(1.0)
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_call_pauses_bucket_and_retries():
+    """Test that a rate limit error pauses the shared bucket for Retry-After and then succeeds."""
+    clock = FakeClock()
+    limiter = make_limiter(clock, requests_per_second=100, burst=5)
+    attempts = []
+
+    async def operation():
+        attempts.append(clock.now)
+        if len(attempts) == 1:
+            raise RetryableError("API rate limit exceeded", retry_after=2.0, rate_limited=True)
+        return "ok"
+
+    assert await limiter.call(operation) == "ok"
+    assert attempts[1] - attempts[0] >= 2.0
+    stats = limiter.stats()
+    assert stats["rate_limited"] == 1
+    assert stats["retries"] == 1
+    # Other callers sharing the limiter are held back too
+    assert await limiter.acquire() > 0
+
+
+@pytest.mark.asyncio
+async def test_backoff_is_bounded_and_exhausts():
+    """Test exponential backoff bounds and that the last error is raised once retries run out."""
+    clock = FakeClock()
+    limiter = make_limiter(clock, max_retries=3, base_delay=0.5, max_delay=1.0, max_wait=60)
+
+    async def operation():
+        raise RetryableError("API error: INTERNAL")
+
+    with pytest.raises(RetryableError, match="INTERNAL"):
+        await limiter.call(operation)
+
+    backoffs = [delay for delay in clock.sleeps if delay]
+    assert len(backoffs) <= 3
+    assert all(delay <= 1.0 for delay in backoffs)
+    assert limiter.stats()["retries"] == 3
+    assert limiter.backoff_delay(10, retry_after=5.0) >= 5.0
+
+
+@pytest.mark.asyncio
+async def test_retries_stop_at_deadline():
+    """Test that no retry is scheduled past the call's deadline."""
+    clock = FakeClock()
+    limiter = make_limiter(clock, max_retries=10, max_wait=3.0)
+
+    async def operation():
+        raise RetryableError("API rate limit exceeded", retry_after=5.0, rate_limited=True)
+
+    with pytest.raises(RetryableError):
+        await limiter.call(operation)
+    assert limiter.stats()["retries"] == 0
+
+
+def test_parse_retry_after():
+    """Test parsing Retry-After in seconds and HTTP date form."""
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+def test_shared_limiter_per_api_key():
+    """Test that services using the same API key share one limiter."""
+    assert shared_rate_limiter("key-a") is shared_rate_limiter("key-a")
+    assert shared_rate_limiter("key-a") is not shared_rate_limiter("key-b")
+    assert UniswapService("key-c").rate_limiter is UniswapService("key-c").rate_limiter
+
+
+@pytest.mark.asyncio
+async def test_make_request_retries_rate_limited_responses(aiohttp_server_factory):
+    """Test that the service retries a 429 from the API and returns the eventual answer."""
+    calls = []
+
+    async def quote(request):
+        calls.append(request.headers["x-api-key"])
+        if len(calls) == 1:
+            return web.json_response({"errorCode": "RATE_LIMIT"}, status=429, headers={"Retry-After": "0"})
+        return web.json_response({"quote": {"amount": "1"}})
+
+    base_url = await aiohttp_server_factory(quote)
+    service = UniswapService(
+        "test_api_key", base_url, rate_limiter=RateLimiter(RateLimitConfig(base_delay=0.01))
+    )
+
+    assert await service.make_request("quote", {}) == {"quote": {"amount": "1"}}
+    assert len(calls) == 2
+    assert service.rate_limiter.stats()["rate_limited"] == 1
+
+
+@pytest.mark.asyncio
+async def test_make_request_does_not_retry_client_errors(aiohttp_server_factory):
+    """Test that validation errors fail immediately."""
+    calls = []
+
+    async def quote(request):
+        calls.append(1)
+        return web.json_response({"errorCode": "VALIDATION_ERROR"}, status=400)
+
+    base_url = await aiohttp_server_factory(quote)
+    service = UniswapService("test_api_key", base_url, rate_limiter=RateLimiter())
+
+    with pytest.raises(Exception, match="Invalid parameters"):
+        await service.make_request("quote", {})
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_failing_api_trips_circuit_breaker(aiohttp_server_factory):
+    """Test that repeated server errors open the API's circuit so later calls fail fast."""
+    calls = []
+
+    async def quote(request):
+        calls.append(1)
+        return web.json_response({"errorCode": "INTERNAL_ERROR"}, status=500)
+
+    base_url = await aiohttp_server_factory(quote)
+    service = UniswapService(
+        "test_api_key",
+        base_url,
+        rate_limiter=RateLimiter(RateLimitConfig(max_retries=0)),
+        resilience=Resilience(ResiliencePolicy(max_retries=0, failure_threshold=1)),
+    )
+
+    with pytest.raises(RetryableError):
+        await service.make_request("quote", {})
+    with pytest.raises(CircuitOpenError):
+        await service.make_request("quote", {})
+    assert len(calls) == 1
+
+
+@pytest_asyncio.fixture
+async def aiohttp_server_factory():
+    """Starts a local aiohttp server answering POST /quote and /swap with the given handler."""
+    runners = []
+
+    async def start(handler):
+        app = web.Application()
+        app.router.add_post("/quote", handler)
+        app.router.add_post("/swap", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        runners.append(runner)
+        port = runner.addresses[0][1]
+        return f"http://127.0.0.1:{port}"
+
+    yield start
+    for runner in runners:
+        await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_requests_are_coalesced(aiohttp_server_factory):
+    """Test that identical quote requests in flight together share one HTTP call and rate limit token."""
+    calls = []
+
+    async def quote(request):
+        calls.append(await request.json())
+        await asyncio.sleep(0.01)
+        return web.json_response({"quote": {"amount": "1"}})
+
+    base_url = await aiohttp_server_factory(quote)
+    limiter = RateLimiter()
+    service = UniswapService("test_api_key", base_url, rate_limiter=limiter)
+
+    results = await asyncio.gather(
+        *(service.make_request("quote", {"amount": "1", "tokenIn": "0xa"}) for _ in range(3)),
+        service.make_request("quote", {"amount": "2", "tokenIn": "0xa"}),
+    )
+
+    assert [result["quote"]["amount"] for result in results] == ["1"] * 4
+    assert len(calls) == 2
+    assert limiter.stats()["requests"] == 2
+    assert service.single_flight.stats()["coalesced"] == 2
+
+
+@pytest.mark.asyncio
+async def test_swap_requests_are_not_coalesced(aiohttp_server_factory):
+    """Test that identical concurrent swap requests each get their own transaction from the API."""
+    calls = []
+
+    async def swap(request):
+        calls.append(await request.json())
+        number = len(calls)
+        await asyncio.sleep(0.01)
+        return web.json_response({"swap": {"data": f"0x{number:02x}"}})
+
+    base_url = await aiohttp_server_factory(swap)
+    service = UniswapService("test_api_key", base_url, rate_limiter=RateLimiter())
+
+    results = await asyncio.gather(*(service.make_request("swap", {"quote": {"amount": "1"}}) for _ in range(2)))
+
+    assert len(calls) == 2
+    assert {result["swap"]["data"] for result in results} == {"0x01", "0x02"}
+    assert service.single_flight.stats()["coalesced"] == 0
@@ -1,12 +1,74 @@
-from .classes.tool_base import create_tool, ToolBase
-from .classes.wallet_client_base import WalletClientBase
-from .classes.plugin_base import PluginBase
-from .utils.snake_case import snake_case
-from .utils.get_tools import get_tools
-from .types.chain import Chain, EvmChain
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .classes.tool_base import create_tool, ToolBase
+    from .classes.wallet_client_base import WalletClientBase
+    from .classes.plugin_base import PluginBase
+    from .utils.snake_case import snake_case
+    from .utils.get_tools import get_tools
+    from .utils.select_tools import filter_tools, rank_tools
+    from .utils.tool_manifest import (
+        ToolManifest, get_tool_manifest, get_tools_manifest, dump_tool_manifest, load_tool_manifest
+    )
+    from .utils.resilience import (
+        CircuitBreaker, CircuitOpenError, Resilience, ResiliencePolicy, ResilienceStats, TransientError
+    )
+    from .utils.single_flight import SingleFlight, SingleFlightStats
+    from .utils.tool_scheduler import ToolCall, ToolScheduler, ToolSchedulerStats
+    from .utils.json_codec import JSONCodec, OrjsonCodec, get_json_codec, set_json_codec
+    from .utils.profiling import (
+        AllocationStat, ToolProfile, ToolProfiler, disable_profiling, enable_profiling, get_profiler
+    )
+    from .types.chain import Chain, EvmChain
 
 __version__ = "1.0.0"
 
+# Public names are resolved on first access (PEP 562) so that importing the package
+# does not pull in pydantic and the rest of the tool machinery up front.
+_LAZY_ATTRIBUTES = {
+    # Classes
+    "ToolBase": ".classes.tool_base",
+    "create_tool": ".classes.tool_base",
+    "WalletClientBase": ".classes.wallet_client_base",
+    "PluginBase": ".classes.plugin_base",
+    # Utils
+    "snake_case": ".utils.snake_case",
+    "get_tools": ".utils.get_tools",
+    "filter_tools": ".utils.select_tools",
+    "rank_tools": ".utils.select_tools",
+    "get_tool_manifest": ".utils.tool_manifest",
+    "get_tools_manifest": ".utils.tool_manifest",
+    "dump_tool_manifest": ".utils.tool_manifest",
+    "load_tool_manifest": ".utils.tool_manifest",
+    "ToolManifest": ".utils.tool_manifest",
+    "Resilience": ".utils.resilience",
+    "ResiliencePolicy": ".utils.resilience",
+    "ResilienceStats": ".utils.resilience",
+    "CircuitBreaker": ".utils.resilience",
+    "CircuitOpenError": ".utils.resilience",
+    "TransientError": ".utils.resilience",
+    "SingleFlight": ".utils.single_flight",
+    "SingleFlightStats": ".utils.single_flight",
+    "ToolScheduler": ".utils.tool_scheduler",
+    "ToolCall": ".utils.tool_scheduler",
+    "ToolSchedulerStats": ".utils.tool_scheduler",
+    "JSONCodec": ".utils.json_codec",
+    "OrjsonCodec": ".utils.json_codec",
+    "get_json_codec": ".utils.json_codec",
+    "set_json_codec": ".utils.json_codec",
+    "ToolProfiler": ".utils.profiling",
+    "ToolProfile": ".utils.profiling",
+    "AllocationStat": ".utils.profiling",
+    "enable_profiling": ".utils.profiling",
+    "disable_profiling": ".utils.profiling",
+    "get_profiler": ".utils.profiling",
+    # Types
+    "Chain": ".types.chain",
+    "EvmChain": ".types.chain",
+}
+
+# Spelled out so linters and type checkers see the exports behind the TYPE_CHECKING imports
 __all__ = [
     # Classes
     "ToolBase",
@@ -16,7 +78,48 @@ __all__ = [
     # Utils
     "snake_case",
     "get_tools",
+    "filter_tools",
+    "rank_tools",
+    "get_tool_manifest",
+    "get_tools_manifest",
+    "dump_tool_manifest",
+    "load_tool_manifest",
+    "ToolManifest",
+    "Resilience",
+    "ResiliencePolicy",
+    "ResilienceStats",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "TransientError",
+    "SingleFlight",
+    "SingleFlightStats",
+    "ToolScheduler",
+    "ToolCall",
+    "ToolSchedulerStats",
+    "JSONCodec",
+    "OrjsonCodec",
+    "get_json_codec",
+    "set_json_codec",
+    "ToolProfiler",
+    "ToolProfile",
+    "AllocationStat",
+    "enable_profiling",
+    "disable_profiling",
+    "get_profiler",
     # Types
     "Chain",
     "EvmChain",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
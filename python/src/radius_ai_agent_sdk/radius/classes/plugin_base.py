@@ -1,10 +1,11 @@
 import asyncio
+import contextvars
 import inspect
 import threading
 from abc import ABC, abstractmethod
 from typing import List, Any, TypeVar, Generic
 
-from radius.classes.tool_base import ToolBase, create_tool
+from radius.classes.tool_base import ToolBase, ToolConfig, create_tool
 from radius.classes.wallet_client_base import WalletClientBase
 from radius.types.chain import Chain
 from radius.decorators.tool import StoredToolMetadata, TOOL_METADATA_KEY
@@ -70,13 +71,18 @@ class PluginBase(Generic[TWalletClient], ABC):
                 tool_metadata = getattr(attr, TOOL_METADATA_KEY, None)
 
                 if tool_metadata:
+                    config: ToolConfig = {
+                        "name": tool_metadata.name,
+                        "description": tool_metadata.description,
+                        "parameters": tool_metadata.parameters["schema"],
+                        "tags": tool_metadata.tags,
+                        "wallet_client": wallet_client,
+                    }
+                    if tool_metadata.side_effect is not None:
+                        config["side_effect"] = tool_metadata.side_effect
                     tools.append(
                         create_tool(
-                            {
-                                "name": tool_metadata.name,
-                                "description": tool_metadata.description,
-                                "parameters": tool_metadata.parameters["schema"],
-                            },
+                            config,
                             lambda params, tool=tool_metadata: self._execute_tool(
                                 tool, tool_provider, wallet_client, params
                             ),
@@ -120,7 +126,9 @@ class PluginBase(Generic[TWalletClient], ABC):
                 finally:
                     loop.close()
             
-            thread = threading.Thread(target=run_coro)
+            # Threads start with an empty context; copy the caller's so context variables
+            # set around the tool call (such as the active tenant of a wallet host) apply
+            thread = threading.Thread(target=contextvars.copy_context().run, args=(run_coro,))
             thread.start()
             thread.join()
             
@@ -1,16 +1,83 @@
+import functools
 from abc import ABC, abstractmethod
 from typing import (
     Any,
     Callable,
+    Dict,
     Generic,
+    List,
+    Literal,
     Type,
     TypeVar,
     TypedDict,
 )
 from pydantic import BaseModel
+from typing_extensions import NotRequired
+
+from ..utils import profiling
 
 TResult = TypeVar("TResult")
 
+# JSON Schemas keyed by parameters model, shared by every tool built from the same model
+_JSON_SCHEMA_CACHE: Dict[Type[BaseModel], Dict[str, Any]] = {}
+
+
+def get_json_schema(parameters: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    Returns the JSON Schema of a parameters model, generating it only on first use
+
+    The returned dictionary is shared between callers and must not be mutated.
+
+    Args:
+        parameters: The Pydantic model class defining a tool's parameters
+
+    Returns:
+        The model's JSON Schema
+    """
+    schema = _JSON_SCHEMA_CACHE.get(parameters)
+    if schema is None:
+        schema = _JSON_SCHEMA_CACHE.setdefault(parameters, parameters.model_json_schema())
+    return schema
+
+
+def set_json_schema(parameters: Type[BaseModel], schema: Dict[str, Any]) -> None:
+    """
+    Seeds the JSON Schema cache for a parameters model, e.g. from a previously exported tool manifest
+
+    Args:
+        parameters: The Pydantic model class defining a tool's parameters
+        schema: The JSON Schema to serve for the model
+    """
+    _JSON_SCHEMA_CACHE[parameters] = schema
+
+
+# What running a tool does: "read" only queries state, "write" changes on-chain state (e.g. sends
+# a transaction, consuming a nonce) and "sign" produces a signature without sending anything
+SideEffect = Literal["read", "write", "sign"]
+SIDE_EFFECTS = ("read", "write", "sign")
+
+
+def side_effect_from_tags(tags: List[str]) -> SideEffect:
+    """
+    Infers a tool's side effect from its tags
+
+    Tools tagged neither "read" nor "sign" are treated as writes, so an unknown tool is never run
+    concurrently with another write.
+
+    Args:
+        tags: The tool's tags
+
+    Returns:
+        The side effect class of the tool
+    """
+    if "write" in tags:
+        return "write"
+    if "sign" in tags:
+        return "sign"
+    if "read" in tags:
+        return "read"
+    return "write"
+
 
 class ToolConfig(TypedDict):
     """
@@ -23,11 +90,17 @@ class ToolConfig(TypedDict):
         name: The name of the tool
         description: A description of what the tool does
         parameters: The Pydantic model class defining the tool's parameters
+        tags: Optional labels used to select tools, e.g. "read"/"write" plus a category such as "erc20"
+        side_effect: Optional side effect class ("read", "write" or "sign"); inferred from the tags when omitted
+        wallet_client: Optional wallet client the tool acts on, used to serialize its writes
     """
 
     name: str
     description: str
     parameters: Type[BaseModel]
+    tags: NotRequired[List[str]]
+    side_effect: NotRequired[SideEffect]
+    wallet_client: NotRequired[Any]
 
 
 class ToolBase(Generic[TResult], ABC):
@@ -41,11 +114,23 @@ class ToolBase(Generic[TResult], ABC):
         name: The name of the tool
         description: A description of what the tool does
         parameters: The Pydantic model class defining the tool's parameters
+        tags: Labels used to select tools
+        side_effect: Whether the tool reads, writes or signs, which tells a scheduler what may run concurrently
+        wallet_client: The wallet client the tool acts on, if any
     """
 
     name: str
     description: str
     parameters: Type[BaseModel]
+    tags: List[str]
+    side_effect: SideEffect
+    wallet_client: Any
+
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        execute = cls.__dict__.get("execute")
+        if execute is not None and not getattr(execute, "__isabstractmethod__", False):
+            cls.execute = _profiled(execute)
 
     def __init__(self, config: ToolConfig):
         """
@@ -58,6 +143,21 @@ class ToolBase(Generic[TResult], ABC):
         self.name = config["name"]
         self.description = config["description"]
         self.parameters = config["parameters"]
+        self.tags = list(config.get("tags", []))
+        self.side_effect = config.get("side_effect") or side_effect_from_tags(self.tags)
+        if self.side_effect not in SIDE_EFFECTS:
+            raise ValueError(f"Tool '{self.name}' has an invalid side effect: {self.side_effect}")
+        self.wallet_client = config.get("wallet_client")
+
+    @property
+    def json_schema(self) -> Dict[str, Any]:
+        """
+        The JSON Schema of the tool's parameters
+
+        Generated once per parameters model and cached, so binding the same tool types to many
+        agents or sessions does not regenerate it. The returned dictionary must not be mutated.
+        """
+        return get_json_schema(self.parameters)
 
     @abstractmethod
     def execute(self, parameters: dict[str, Any]) -> TResult:
@@ -73,6 +173,18 @@ class ToolBase(Generic[TResult], ABC):
         pass
 
 
+def _profiled(execute: Callable[..., TResult]) -> Callable[..., TResult]:
+    """Wraps a tool's execute method to report to the installed profiler, if any."""
+
+    @functools.wraps(execute)
+    def wrapper(self: ToolBase, parameters: dict[str, Any]) -> TResult:
+        if profiling._active is None:
+            return execute(self, parameters)
+        return profiling._active.run(self.name, execute, self, parameters)
+
+    return wrapper
+
+
 def create_tool(
     config: ToolConfig, execute_fn: Callable[[dict[str, Any]], TResult]
 ) -> ToolBase[TResult]:
@@ -91,6 +203,6 @@ def create_tool(
         def execute(self, parameters: dict[str, Any]) -> TResult:
             # Validate parameters using the tool's schema before executing
             validated_params = self.parameters.model_validate(parameters)
-            return execute_fn(validated_params.model_dump())
+            return execute_fn(validated_params.model_dump(by_alias=True))
 
     return Tool(config)
@@ -49,7 +49,9 @@ class WalletClientBase(ABC):
                 {
                     "name": "get_address",
                     "description": "Get the address of the wallet",
-                    "parameters": EmptyParams
+                    "parameters": EmptyParams,
+                    "tags": ["read", "wallet"],
+                    "wallet_client": self,
                 },
                 lambda _: self.get_address(),
             ),
@@ -57,7 +59,9 @@ class WalletClientBase(ABC):
                 {
                     "name": "get_chain",
                     "description": "Get the chain of the wallet",
-                    "parameters": EmptyParams
+                    "parameters": EmptyParams,
+                    "tags": ["read", "wallet"],
+                    "wallet_client": self,
                 },
                 lambda _: self.get_chain(),
             ),
@@ -65,7 +69,9 @@ class WalletClientBase(ABC):
                 {
                     "name": "get_balance",
                     "description": "Get the balance of the wallet",
-                    "parameters": BalanceParams
+                    "parameters": BalanceParams,
+                    "tags": ["read", "wallet"],
+                    "wallet_client": self,
                 },
                 lambda parameters: self.balance_of(parameters["address"]),
             ),
@@ -1,9 +1,10 @@
-from dataclasses import dataclass
-from typing import Any, Callable, Type, TypedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, List, Optional, Type, TypedDict
 from typing_extensions import NotRequired
 import inspect
 from pydantic import BaseModel
 
+from radius.classes.tool_base import SIDE_EFFECTS, SideEffect
 from radius.classes.wallet_client_base import WalletClientBase
 from radius.utils.snake_case import snake_case
 
@@ -16,11 +17,15 @@ class ToolDecoratorParams(TypedDict):
         name: Optional custom name for the tool. Defaults to the method name in snake_case
         description: A description of what the tool does
         parameters_schema: A Pydantic model class defining the tool's parameters
+        tags: Optional labels used to select tools, e.g. "read"/"write" plus a category such as "erc20"
+        side_effect: Optional side effect class ("read", "write" or "sign"); inferred from the tags when omitted
     """
 
     name: NotRequired[str]
     description: str
     parameters_schema: Type[BaseModel]
+    tags: NotRequired[List[str]]
+    side_effect: NotRequired[SideEffect]
 
 
 class ParameterMetadata(TypedDict):
@@ -58,6 +63,8 @@ class StoredToolMetadata:
         target: The decorated method
         parameters: Metadata about the tool's parameters
         wallet_client: Metadata about the tool's wallet client parameter
+        tags: Labels used to select tools
+        side_effect: The declared side effect class, or None to infer it from the tags
     """
 
     name: str
@@ -65,6 +72,8 @@ class StoredToolMetadata:
     target: Callable
     parameters: ParameterMetadata
     wallet_client: WalletClientMetadata
+    tags: List[str] = field(default_factory=list)
+    side_effect: Optional[SideEffect] = None
 
 
 TOOL_METADATA_KEY = "__radius_tool__"
@@ -83,6 +92,8 @@ def Tool(tool_params: ToolDecoratorParams) -> Any:
             - description (str): A description of what the tool does
             - name (str, optional): Custom name for the tool. Defaults to the method name in snake_case
             - parameters_schema (Type[BaseModel]): A Pydantic model class to validate parameters at runtime
+            - tags (List[str], optional): Labels used to select tools, e.g. ["read", "erc20"]
+            - side_effect (str, optional): "read", "write" or "sign"; inferred from the tags when omitted
 
     Returns:
         A decorated method that includes parameter validation and tool metadata
@@ -102,6 +113,10 @@ def Tool(tool_params: ToolDecoratorParams) -> Any:
         ValueError: If the method signature is invalid or missing required parameters
     """
 
+    side_effect = tool_params.get("side_effect")
+    if side_effect is not None and side_effect not in SIDE_EFFECTS:
+        raise ValueError(f"Invalid side effect '{side_effect}', expected one of {', '.join(SIDE_EFFECTS)}")
+
     def decorator(func):
         # Get validated parameters from method signature
         parameters_indexes = validate_decorator_parameters(func)
@@ -116,6 +131,8 @@ def Tool(tool_params: ToolDecoratorParams) -> Any:
                 "schema": tool_params["parameters_schema"],
             },
             wallet_client={"index": parameters_indexes.get("wallet_client")},
+            tags=list(tool_params.get("tags", [])),
+            side_effect=side_effect,
         )
 
         # Store metadata directly on the function
@@ -2,12 +2,39 @@ from typing import List, Optional
 from ..classes.plugin_base import PluginBase
 from ..classes.tool_base import ToolBase
 from ..classes.wallet_client_base import WalletClientBase
+from .select_tools import filter_tools, rank_tools
 
 
 def get_tools(
-    wallet: WalletClientBase, plugins: Optional[List[PluginBase]] = None
+    wallet: WalletClientBase,
+    plugins: Optional[List[PluginBase]] = None,
+    *,
+    include: Optional[List[str]] = None,
+    exclude: Optional[List[str]] = None,
+    tags: Optional[List[str]] = None,
+    exclude_tags: Optional[List[str]] = None,
+    query: Optional[str] = None,
+    limit: Optional[int] = None,
 ) -> List[ToolBase]:
-    """Get all tools from the wallet and plugins."""
+    """
+    Get tools from the wallet and plugins.
+
+    All tools are returned by default. Binding fewer tools keeps the LLM prompt small, so the
+    result can be narrowed by name, by tag and by relevance to the task at hand.
+
+    Args:
+        wallet: The wallet client providing the core tools
+        plugins: Plugins whose tools should be included
+        include: Tool names or glob patterns (e.g. "uniswap_*") to keep
+        exclude: Tool names or glob patterns to drop
+        tags: Keep only tools that have at least one of these tags (e.g. ["read"])
+        exclude_tags: Drop tools that have any of these tags (e.g. ["write"])
+        query: The user's task text; when given, tools are ranked by keyword relevance to it
+        limit: Maximum number of tools to return
+
+    Returns:
+        The selected tools
+    """
     tools: List[ToolBase] = []
     plugins = plugins or []
 
@@ -25,4 +52,7 @@ def get_tools(
         plugin_tools = plugin.get_tools(wallet)
         tools.extend(plugin_tools)
 
-    return [*core_tools, *tools]
+    selected = filter_tools([*core_tools, *tools], include, exclude, tags, exclude_tags)
+    if query:
+        return rank_tools(selected, query, limit)
+    return selected[:limit] if limit is not None else selected
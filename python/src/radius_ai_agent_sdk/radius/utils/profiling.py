@@ -0,0 +1,325 @@
+import fnmatch
+import io
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, TypedDict, TypeVar
+
+T = TypeVar("T")
+
+# The profiler tool executions report to; None keeps ToolBase.execute to a single check
+_active: Optional["ToolProfiler"] = None
+
+
+class AllocationStat(TypedDict):
+    """
+    Memory allocated by a source line across the profiled calls of a tool
+
+    Attributes:
+        location: "file:line" of the allocation
+        size_diff: Bytes still allocated when the calls returned
+        count_diff: Memory blocks still allocated when the calls returned
+    """
+
+    location: str
+    size_diff: int
+    count_diff: int
+
+
+class ToolProfile(TypedDict):
+    """
+    Aggregated profile of a tool
+
+    Attributes:
+        calls: Executions profiled
+        skipped: Selected executions run unprofiled because another profiled call was in progress
+        total_time: Wall-clock seconds spent in the profiled executions
+        stats: Aggregated cProfile statistics (``pstats.Stats``), or None when CPU profiling is off
+        allocations: Allocations left by the profiled executions, largest first; empty when memory profiling is off
+    """
+
+    calls: int
+    skipped: int
+    total_time: float
+    stats: Any
+    allocations: List[AllocationStat]
+
+
+class _Aggregate:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.skipped = 0
+        self.total_time = 0.0
+        self.stats: Any = None
+        self.allocations: Dict[str, List[int]] = {}
+
+
+class ToolProfiler:
+    """
+    Profiles tool executions selected by name and sampling rate.
+
+    Selected executions run under ``cProfile`` and, with ``memory=True``, between two
+    ``tracemalloc`` snapshots, and the results are aggregated per tool name. Tools are profiled
+    wherever they run once the profiler is installed with :func:`enable_profiling`; while no
+    profiler is installed, ``ToolBase.execute`` costs one extra check.
+
+    One execution is profiled at a time: selected calls that start on other threads while one
+    is being profiled run unprofiled and are counted as skipped, and tools executed from within
+    a profiled tool are part of its profile. Allocation snapshots cover the whole process, so allocations made by
+    other threads during a profiled call are attributed to it.
+
+    Args:
+        tools: Tool names or ``fnmatch`` patterns to profile; every tool when omitted
+        sample_rate: Fraction of the selected executions to profile, between 0 and 1
+        cpu: Whether to collect cProfile statistics
+        memory: Whether to collect tracemalloc allocation snapshots
+        output_path: File the text report is written to when profiling is disabled
+        rng: Source of uniform random numbers in [0, 1) used for sampling
+
+    Example:
+        ```python
+        profiler = enable_profiling(ToolProfiler(tools=["uniswap_*"], sample_rate=0.1, memory=True))
+        ...
+        print(profiler.format_report())
+        disable_profiling()
+        ```
+    """
+
+    def __init__(
+        self,
+        tools: Optional[Iterable[str]] = None,
+        sample_rate: float = 1.0,
+        cpu: bool = True,
+        memory: bool = False,
+        output_path: Optional[str] = None,
+        rng: Callable[[], float] = random.random,
+    ):
+        if not 0 <= sample_rate <= 1:
+            raise ValueError("sample_rate must be between 0 and 1")
+        self.tools = list(tools) if tools is not None else None
+        self.sample_rate = sample_rate
+        self.cpu = cpu
+        self.memory = memory
+        self.output_path = output_path
+        self._random = rng
+        self._profiles: Dict[str, _Aggregate] = {}
+        self._selected: Dict[str, bool] = {}
+        self._lock = threading.Lock()
+        self._running = threading.Lock()
+        self._profiling = threading.local()
+        self._started_tracemalloc = False
+
+    def selects(self, name: str) -> bool:
+        """Whether executions of a tool are profiled, before sampling."""
+        selected = self._selected.get(name)
+        if selected is None:
+            selected = self.tools is None or any(fnmatch.fnmatchcase(name, pattern) for pattern in self.tools)
+            self._selected[name] = selected
+        return selected
+
+    def run(self, name: str, execute: Callable[..., T], *args: Any) -> T:
+        """
+        Runs one tool execution, profiling it if it is selected and sampled.
+
+        Args:
+            name: The tool's name
+            execute: The execution to run
+            *args: Arguments of ``execute``
+
+        Returns:
+            The result of ``execute``
+        """
+        # Tools executed from within a profiled tool are already covered by its profile
+        if getattr(self._profiling, "active", False):
+            return execute(*args)
+        if not self.selects(name) or self._random() >= self.sample_rate:
+            return execute(*args)
+        if not self._running.acquire(blocking=False):
+            with self._lock:
+                self._aggregate(name).skipped += 1
+            return execute(*args)
+        self._profiling.active = True
+        try:
+            return self._profile(name, execute, args)
+        finally:
+            self._profiling.active = False
+            self._running.release()
+
+    def _profile(self, name: str, execute: Callable[..., T], args: Any) -> T:
+        import cProfile
+        import tracemalloc
+
+        profile = cProfile.Profile() if self.cpu else None
+        before = tracemalloc.take_snapshot() if self.memory and tracemalloc.is_tracing() else None
+        started = time.perf_counter()
+        try:
+            if profile is not None:
+                profile.enable()
+            try:
+                return execute(*args)
+            finally:
+                if profile is not None:
+                    profile.disable()
+        finally:
+            elapsed = time.perf_counter() - started
+            after = tracemalloc.take_snapshot() if before is not None else None
+            self._record(name, elapsed, profile, before, after)
+
+    def _record(self, name: str, elapsed: float, profile: Any, before: Any, after: Any) -> None:
+        import cProfile
+        import pstats
+        import tracemalloc
+
+        differences = []
+        if after is not None:
+            modules = (tracemalloc.__file__, cProfile.__file__, __file__)
+            ignored = [tracemalloc.Filter(False, module) for module in modules]
+            differences = after.filter_traces(ignored).compare_to(before.filter_traces(ignored), "lineno")
+        with self._lock:
+            aggregate = self._aggregate(name)
+            aggregate.calls += 1
+            aggregate.total_time += elapsed
+            if profile is not None:
+                if aggregate.stats is None:
+                    aggregate.stats = pstats.Stats(profile, stream=io.StringIO())
+                else:
+                    aggregate.stats.add(profile)
+            for difference in differences:
+                if difference.size_diff or difference.count_diff:
+                    frame = difference.traceback[0]
+                    totals = aggregate.allocations.setdefault(f"{frame.filename}:{frame.lineno}", [0, 0])
+                    totals[0] += difference.size_diff
+                    totals[1] += difference.count_diff
+
+    def _aggregate(self, name: str) -> _Aggregate:
+        aggregate = self._profiles.get(name)
+        if aggregate is None:
+            aggregate = self._profiles[name] = _Aggregate()
+        return aggregate
+
+    def results(self) -> Dict[str, ToolProfile]:
+        """Returns the aggregated profile of each tool executed while selected."""
+        with self._lock:
+            return {
+                name: {
+                    "calls": aggregate.calls,
+                    "skipped": aggregate.skipped,
+                    "total_time": aggregate.total_time,
+                    "stats": aggregate.stats,
+                    "allocations": sorted(
+                        (
+                            {"location": location, "size_diff": size, "count_diff": count}
+                            for location, (size, count) in aggregate.allocations.items()
+                        ),
+                        key=lambda allocation: abs(allocation["size_diff"]),
+                        reverse=True,
+                    ),
+                }
+                for name, aggregate in self._profiles.items()
+            }
+
+    def reset(self) -> None:
+        """Discards the collected profiles."""
+        with self._lock:
+            self._profiles.clear()
+
+    def format_report(self, limit: int = 20, sort: str = "cumulative") -> str:
+        """
+        Formats the profiles as text, one section per tool.
+
+        Args:
+            limit: Functions and allocation sites listed per tool
+            sort: ``pstats`` sort key of the function listing
+        """
+        sections = []
+        for name, profile in sorted(self.results().items()):
+            lines = [
+                f"=== {name}: {profile['calls']} profiled calls, {profile['skipped']} skipped, "
+                f"{profile['total_time'] * 1000:.2f} ms total"
+            ]
+            if profile["stats"] is not None:
+                stream = io.StringIO()
+                profile["stats"].stream = stream
+                profile["stats"].sort_stats(sort).print_stats(limit)
+                lines.append(stream.getvalue().strip())
+            if profile["allocations"]:
+                lines.append(f"{'size diff':>12}{'blocks':>9}  location")
+                for allocation in profile["allocations"][:limit]:
+                    lines.append(
+                        f"{allocation['size_diff']:>12}{allocation['count_diff']:>9}  {allocation['location']}"
+                    )
+            sections.append("\n".join(lines))
+        return "\n\n".join(sections)
+
+    def dump(self, path: str, limit: int = 20) -> None:
+        """Writes the text report of every tool to a file."""
+        with open(path, "w") as file:
+            file.write(self.format_report(limit) + "\n")
+
+    def dump_stats(self, name: str, path: str) -> None:
+        """
+        Writes the cProfile statistics of a tool in the ``pstats`` format, e.g. for snakeviz.
+
+        Args:
+            name: The tool's name
+            path: The file to write
+        """
+        stats = self.results().get(name, {}).get("stats")
+        if stats is None:
+            raise KeyError(f"No CPU profile collected for tool '{name}'")
+        stats.dump_stats(path)
+
+
+def enable_profiling(profiler: Optional[ToolProfiler] = None, **options: Any) -> ToolProfiler:
+    """
+    Installs a profiler for tool executions, replacing any installed one.
+
+    Args:
+        profiler: The profiler to install; built from ``options`` when omitted
+        **options: Arguments of :class:`ToolProfiler`
+
+    Returns:
+        The installed profiler
+    """
+    global _active
+    if profiler is None:
+        profiler = ToolProfiler(**options)
+    if profiler.memory:
+        import tracemalloc
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            profiler._started_tracemalloc = True
+    previous, _active = _active, profiler
+    if previous is not None and previous is not profiler:
+        _release(previous)
+    return profiler
+
+
+def disable_profiling() -> Optional[ToolProfiler]:
+    """
+    Uninstalls the profiler, writing its report to its ``output_path`` if set.
+
+    Returns:
+        The profiler that was installed, with its collected results, or None
+    """
+    global _active
+    profiler, _active = _active, None
+    if profiler is not None:
+        _release(profiler)
+        if profiler.output_path:
+            profiler.dump(profiler.output_path)
+    return profiler
+
+
+def get_profiler() -> Optional[ToolProfiler]:
+    """Returns the installed profiler, or None while profiling is disabled."""
+    return _active
+
+
+def _release(profiler: ToolProfiler) -> None:
+    if profiler._started_tracemalloc:
+        import tracemalloc
+
+        tracemalloc.stop()
+        profiler._started_tracemalloc = False
@@ -0,0 +1,348 @@
+import asyncio
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Type, TypedDict, TypeVar
+
+T = TypeVar("T")
+
+
+class TransientError(ConnectionError):
+    """Failure of a remote call that may succeed when retried (e.g. HTTP 5xx or 429)."""
+
+
+class CircuitOpenError(ConnectionError):
+    """Raised without calling an endpoint whose circuit breaker is open."""
+
+
+@dataclass
+class ResiliencePolicy:
+    """
+    Timeout, retry and circuit breaker settings for remote calls.
+
+    Attributes:
+        timeout: Deadline in seconds for one call, covering every attempt and backoff; None disables it
+        max_retries: Retries of a failed idempotent call
+        base_delay: First backoff delay in seconds, doubled on every retry (with full jitter)
+        max_delay: Upper bound on a single backoff delay in seconds
+        failure_threshold: Consecutive transient failures (attempts) after which an endpoint's circuit opens
+        reset_timeout: Seconds an open circuit rejects calls before a trial call is let through
+        transient_errors: Exception types treated as transient; other errors are neither retried
+            nor counted against the endpoint
+    """
+
+    timeout: Optional[float] = 30.0
+    max_retries: int = 2
+    base_delay: float = 0.2
+    max_delay: float = 5.0
+    failure_threshold: int = 5
+    reset_timeout: float = 30.0
+    transient_errors: Tuple[Type[BaseException], ...] = (ConnectionError, TimeoutError, OSError)
+
+
+class ResilienceStats(TypedDict):
+    """
+    Counters of a resilience layer
+
+    Attributes:
+        calls: Calls made through the layer
+        failures: Calls that failed after all attempts
+        retries: Attempts repeated after a transient error
+        timeouts: Calls that exceeded their deadline
+        breaker_trips: Times a circuit opened
+        short_circuited: Calls rejected because a circuit was open
+        open_circuits: Endpoints whose circuit is currently open
+    """
+
+    calls: int
+    failures: int
+    retries: int
+    timeouts: int
+    breaker_trips: int
+    short_circuited: int
+    open_circuits: List[str]
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker for one endpoint.
+
+    Closed, it lets every call through. After ``failure_threshold`` consecutive transient
+    failures it opens and rejects calls for ``reset_timeout`` seconds, then half-opens to let a
+    single trial call through: success closes it, failure opens it again.
+
+    Args:
+        name: Endpoint the breaker protects
+        failure_threshold: Consecutive failures that open the circuit
+        reset_timeout: Seconds the circuit stays open
+        clock: Monotonic time source, in seconds
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self.trips = 0
+
+    @property
+    def state(self) -> str:
+        """"closed", "open" or "half-open"."""
+        with self._lock:
+            return self._state()
+
+    def allow(self) -> None:
+        """
+        Admits a call or rejects it.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with a trial call in flight
+        """
+        with self._lock:
+            state = self._state()
+            if state == "closed":
+                return
+            if state == "half-open" and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return
+        raise CircuitOpenError(f"Circuit breaker for {self.name} is open")
+
+    def record_success(self) -> None:
+        """Closes the circuit and resets the failure count."""
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self) -> bool:
+        """
+        Counts a transient failure.
+
+        Returns:
+            Whether this failure opened the circuit
+        """
+        with self._lock:
+            self._failures += 1
+            reopen = self._trial_in_flight
+            self._trial_in_flight = False
+            if reopen or (self._opened_at is None and self._failures >= self.failure_threshold):
+                self._opened_at = self._clock()
+                self.trips += 1
+                return True
+            return False
+
+    def release(self) -> None:
+        """Ends a trial call that was interrupted before the endpoint answered."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def _state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if self._clock() - self._opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+
+
+class Resilience:
+    """
+    Applies a :class:`ResiliencePolicy` to remote calls: a per-call deadline, retries with
+    exponential backoff for idempotent calls, and a circuit breaker per endpoint.
+
+    Only errors matching ``policy.transient_errors`` are retried and count against an endpoint;
+    application errors (an invalid request, a reverted call) pass straight through. Non-idempotent
+    calls (e.g. sending a transaction) are attempted once, but still respect the deadline and the
+    breaker. One instance may be shared by several clients; breakers are keyed by endpoint.
+
+    Example:
+        ```python
+        resilience = Resilience(ResiliencePolicy(timeout=10, max_retries=3))
+        balance = resilience.call("https://rpc.example.com", lambda: fetch_balance(address))
+        print(resilience.stats())
+        ```
+
+    Args:
+        policy: Timeout, retry and breaker settings
+        clock: Monotonic time source, in seconds
+        sleep: Blocking sleep used between synchronous retries
+        async_sleep: Coroutine function used between asynchronous retries
+    """
+
+    def __init__(
+        self,
+        policy: Optional[ResiliencePolicy] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Any] = time.sleep,
+        async_sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+    ):
+        self.policy = policy or ResiliencePolicy()
+        self._clock = clock
+        self._sleep = sleep
+        self._async_sleep = async_sleep
+        self._lock = threading.Lock()
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._counters = {
+            "calls": 0,
+            "failures": 0,
+            "retries": 0,
+            "timeouts": 0,
+            "short_circuited": 0,
+        }
+
+    def breaker(self, endpoint: str) -> CircuitBreaker:
+        """Returns the circuit breaker of an endpoint, creating it on first use."""
+        with self._lock:
+            breaker = self._breakers.get(endpoint)
+            if breaker is None:
+                breaker = self._breakers[endpoint] = CircuitBreaker(
+                    endpoint, self.policy.failure_threshold, self.policy.reset_timeout, self._clock
+                )
+            return breaker
+
+    def stats(self) -> ResilienceStats:
+        """Returns retry, timeout and breaker counters."""
+        with self._lock:
+            breakers = list(self._breakers.values())
+            counters = dict(self._counters)
+        return {
+            "calls": counters["calls"],
+            "failures": counters["failures"],
+            "retries": counters["retries"],
+            "timeouts": counters["timeouts"],
+            "breaker_trips": sum(breaker.trips for breaker in breakers),
+            "short_circuited": counters["short_circuited"],
+            "open_circuits": [breaker.name for breaker in breakers if breaker.state == "open"],
+        }
+
+    def call(self, endpoint: str, operation: Callable[[], T], idempotent: bool = True) -> T:
+        """
+        Runs a blocking call under the policy.
+
+        A blocking call cannot be interrupted, so the deadline bounds retries and backoff; give
+        the underlying transport its own timeout (e.g. ``HTTPProvider(request_kwargs={"timeout": ...})``).
+
+        Args:
+            endpoint: Name of the remote endpoint, used to select its circuit breaker
+            operation: The call to make
+            idempotent: Whether the call may safely be repeated
+
+        Returns:
+            The result of the first successful attempt
+        """
+        deadline = self._deadline()
+        attempt = 0
+        self._count("calls")
+        while True:
+            breaker = self._admit(endpoint)
+            try:
+                result = operation()
+            except Exception as error:
+                delay = self._on_error(breaker, error, attempt, idempotent, deadline)
+                if delay is None:
+                    raise
+                self._sleep(delay)
+                attempt += 1
+                continue
+            except BaseException:
+                breaker.release()
+                raise
+            breaker.record_success()
+            return result
+
+    async def acall(self, endpoint: str, operation: Callable[[], Awaitable[T]], idempotent: bool = True) -> T:
+        """
+        Runs an asynchronous call under the policy; each attempt is cancelled at the deadline.
+
+        Args:
+            endpoint: Name of the remote endpoint, used to select its circuit breaker
+            operation: Coroutine function making the call
+            idempotent: Whether the call may safely be repeated
+
+        Returns:
+            The result of the first successful attempt
+
+        Raises:
+            TimeoutError: If the deadline passes before an attempt succeeds
+        """
+        deadline = self._deadline()
+        attempt = 0
+        self._count("calls")
+        while True:
+            breaker = self._admit(endpoint)
+            remaining = None if deadline is None else max(0.0, deadline - self._clock())
+            try:
+                result = await asyncio.wait_for(operation(), remaining)
+            except asyncio.TimeoutError as error:
+                if deadline is None or self._clock() < deadline:
+                    # A timeout raised by the operation itself, before the deadline
+                    delay = self._on_error(breaker, error, attempt, idempotent, deadline)
+                    if delay is None:
+                        raise
+                    await self._async_sleep(delay)
+                    attempt += 1
+                    continue
+                breaker.record_failure()
+                self._count("timeouts")
+                self._count("failures")
+                raise TimeoutError(f"Call to {endpoint} did not complete within {self.policy.timeout}s") from error
+            except Exception as error:
+                delay = self._on_error(breaker, error, attempt, idempotent, deadline)
+                if delay is None:
+                    raise
+                await self._async_sleep(delay)
+                attempt += 1
+                continue
+            except BaseException:
+                breaker.release()
+                raise
+            breaker.record_success()
+            return result
+
+    def _deadline(self) -> Optional[float]:
+        return None if self.policy.timeout is None else self._clock() + self.policy.timeout
+
+    def _admit(self, endpoint: str) -> CircuitBreaker:
+        breaker = self.breaker(endpoint)
+        try:
+            breaker.allow()
+        except CircuitOpenError:
+            self._count("short_circuited")
+            self._count("failures")
+            raise
+        return breaker
+
+    def _on_error(
+        self, breaker: CircuitBreaker, error: BaseException, attempt: int, idempotent: bool, deadline: Optional[float]
+    ) -> Optional[float]:
+        """Records a failed attempt and returns the delay before retrying, or None to give up."""
+        if not isinstance(error, self.policy.transient_errors) or isinstance(error, CircuitOpenError):
+            # The endpoint answered; the call itself was rejected
+            breaker.record_success()
+            self._count("failures")
+            return None
+        breaker.record_failure()
+        delay = random.uniform(0, min(self.policy.max_delay, self.policy.base_delay * 2 ** attempt))
+        if not idempotent or attempt >= self.policy.max_retries:
+            self._count("failures")
+            return None
+        if deadline is not None and self._clock() + delay >= deadline:
+            self._count("timeouts")
+            self._count("failures")
+            return None
+        self._count("retries")
+        return delay
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            self._counters[counter] += 1
@@ -0,0 +1,147 @@
+import math
+import re
+from collections import Counter
+from fnmatch import fnmatchcase
+from typing import Any, Dict, Iterable, List, Optional
+
+from ..classes.tool_base import ToolBase
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+_STOP_WORDS = frozenset(
+    "a an and are as at be by can do for from get how i in is it me my of on or please the this to "
+    "use using what with you your".split()
+)
+
+# Relative weight of each part of a tool when scoring it against a task
+_FIELD_WEIGHTS = {
+    "name": 3.0,
+    "tags": 2.0,
+    "description": 1.0,
+    "parameters": 0.5,
+}
+
+# BM25 saturation and length normalization parameters
+_K1 = 1.2
+_B = 0.75
+
+
+def _stem(token: str) -> str:
+    """Tiny suffix stripper so that e.g. "balances", "approved" and "addresses" match their base forms."""
+    for suffix in ("ing", "ed"):
+        if len(token) > len(suffix) + 3 and token.endswith(suffix):
+            token = token[: -len(suffix)]
+            break
+    else:
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+    if len(token) > 3 and token.endswith("e"):
+        token = token[:-1]
+    return token
+
+
+def _tokenize(text: str) -> List[str]:
+    # Split camelCase before lowercasing so "tokenAddress" yields "token" and "address"
+    text = re.sub(r"([a-z0-9])([A-Z])", r"\1 \2", text).lower()
+    return [_stem(token) for token in _TOKEN_PATTERN.findall(text) if token not in _STOP_WORDS]
+
+
+def _parameter_text(schema: Dict[str, Any]) -> str:
+    properties = schema.get("properties", {})
+    return " ".join(f"{name} {prop.get('description', '')}" for name, prop in properties.items())
+
+
+def _tool_terms(tool: ToolBase) -> Counter:
+    """Weighted term frequencies of a tool across its name, tags, description and parameters."""
+    fields = {
+        "name": tool.name,
+        "tags": " ".join(tool.tags),
+        "description": tool.description,
+        "parameters": _parameter_text(tool.json_schema),
+    }
+    terms: Counter = Counter()
+    for field, text in fields.items():
+        for token in _tokenize(text):
+            terms[token] += _FIELD_WEIGHTS[field]
+    return terms
+
+
+def _matches(name: str, patterns: Iterable[str]) -> bool:
+    return any(fnmatchcase(name, pattern) for pattern in patterns)
+
+
+def filter_tools(
+    tools: List[ToolBase],
+    include: Optional[List[str]] = None,
+    exclude: Optional[List[str]] = None,
+    tags: Optional[List[str]] = None,
+    exclude_tags: Optional[List[str]] = None,
+) -> List[ToolBase]:
+    """
+    Filters tools by name and tags.
+
+    Args:
+        tools: The tools to filter
+        include: Tool names or glob patterns (e.g. "uniswap_*") to keep; all tools are kept when omitted
+        exclude: Tool names or glob patterns to drop
+        tags: Keep only tools that have at least one of these tags
+        exclude_tags: Drop tools that have any of these tags
+
+    Returns:
+        The matching tools, in their original order
+    """
+    selected = []
+    for tool in tools:
+        if include is not None and not _matches(tool.name, include):
+            continue
+        if exclude and _matches(tool.name, exclude):
+            continue
+        if tags is not None and not set(tags) & set(tool.tags):
+            continue
+        if exclude_tags and set(exclude_tags) & set(tool.tags):
+            continue
+        selected.append(tool)
+    return selected
+
+
+def rank_tools(tools: List[ToolBase], query: str, limit: Optional[int] = None) -> List[ToolBase]:
+    """
+    Ranks tools by their relevance to a task description.
+
+    Scoring is a local BM25 keyword match over each tool's name, tags, description and parameter
+    descriptions, so it needs no embeddings or network calls. Tools that share no terms with the
+    query are dropped; if no tool matches at all, the input is returned unchanged so the agent is
+    never left without tools.
+
+    Args:
+        tools: The candidate tools
+        query: The user's task text
+        limit: Maximum number of tools to return
+
+    Returns:
+        The most relevant tools, best match first
+    """
+    query_terms = set(_tokenize(query))
+    if not tools or not query_terms:
+        return tools[:limit] if limit is not None else list(tools)
+
+    documents = [_tool_terms(tool) for tool in tools]
+    lengths = [sum(document.values()) for document in documents]
+    average_length = sum(lengths) / len(lengths) or 1.0
+
+    scores = []
+    for index, (document, length) in enumerate(zip(documents, lengths)):
+        score = 0.0
+        for term in query_terms:
+            frequency = document.get(term, 0.0)
+            if not frequency:
+                continue
+            containing = sum(1 for other in documents if term in other)
+            idf = math.log(1 + (len(documents) - containing + 0.5) / (containing + 0.5))
+            score += idf * frequency * (_K1 + 1) / (frequency + _K1 * (1 - _B + _B * length / average_length))
+        scores.append((score, index))
+
+    ranked = [tools[index] for score, index in sorted(scores, key=lambda item: (-item[0], item[1])) if score > 0]
+    if not ranked:
+        ranked = list(tools)
+    return ranked[:limit] if limit is not None else ranked
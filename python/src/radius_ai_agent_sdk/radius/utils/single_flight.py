@@ -0,0 +1,142 @@
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, TypedDict, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlightStats(TypedDict):
+    """
+    Counters of a single-flight group
+
+    Attributes:
+        calls: Calls made through the group
+        executions: Calls that ran their operation
+        coalesced: Calls that shared the result of an identical call already in flight
+        in_flight: Operations currently running
+    """
+
+    calls: int
+    executions: int
+    coalesced: int
+    in_flight: int
+
+
+class _Call:
+    """A blocking operation in flight, awaited by the callers that joined it."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Coalesces identical concurrent calls so that only one of them runs.
+
+    The first caller for a key runs the operation; callers arriving with the same key while it
+    is in flight wait for it and receive the same result, or the same exception. Nothing is
+    cached: once the operation completes, the next call for the key runs it again. Only use it
+    for reads, where any caller may be served the result of a call that started slightly
+    before its own.
+
+    Blocking calls (:meth:`do`) coalesce across threads; asynchronous calls (:meth:`ado`)
+    coalesce within an event loop. Coalesced callers share the result object, so it must not
+    be mutated.
+
+    Example:
+        ```python
+        group = SingleFlight()
+        balance = group.do(("balance", address), lambda: w3.eth.get_balance(address))
+        print(group.stats())
+        ```
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._tasks: Dict[Tuple[int, Hashable], "asyncio.Future[Any]"] = {}
+        self._counters = {"calls": 0, "executions": 0, "coalesced": 0}
+
+    def stats(self) -> SingleFlightStats:
+        """Returns call and coalescing counters."""
+        with self._lock:
+            return {
+                "calls": self._counters["calls"],
+                "executions": self._counters["executions"],
+                "coalesced": self._counters["coalesced"],
+                "in_flight": len(self._calls) + len(self._tasks),
+            }
+
+    def do(self, key: Hashable, operation: Callable[[], T]) -> T:
+        """
+        Runs a blocking operation, or joins the identical one in flight.
+
+        Args:
+            key: Identifies identical calls
+            operation: The call to make
+
+        Returns:
+            The result of the operation run for ``key``
+        """
+        with self._lock:
+            self._counters["calls"] += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self._counters["executions"] += 1
+            else:
+                self._counters["coalesced"] += 1
+        assert call is not None
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = operation()
+            return call.result
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    async def ado(self, key: Hashable, operation: Callable[[], Awaitable[T]]) -> T:
+        """
+        Runs an asynchronous operation, or joins the identical one in flight.
+
+        The operation runs in its own task, so cancelling one caller does not cancel it for the
+        others.
+
+        Args:
+            key: Identifies identical calls
+            operation: Coroutine function making the call
+
+        Returns:
+            The result of the operation run for ``key``
+        """
+        loop_key = (id(asyncio.get_running_loop()), key)
+        with self._lock:
+            self._counters["calls"] += 1
+            task = self._tasks.get(loop_key)
+            if task is None:
+                task = self._tasks[loop_key] = asyncio.ensure_future(operation())
+                self._counters["executions"] += 1
+                task.add_done_callback(lambda done: self._forget(loop_key, done))
+            else:
+                self._counters["coalesced"] += 1
+        return await asyncio.shield(task)
+
+    def _forget(self, loop_key: Tuple[int, Hashable], task: "asyncio.Future[Any]") -> None:
+        with self._lock:
+            self._tasks.pop(loop_key, None)
+        if not task.cancelled():
+            # Retrieved here too, in case every caller was cancelled before it completed
+            task.exception()
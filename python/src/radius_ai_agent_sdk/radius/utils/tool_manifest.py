@@ -0,0 +1,107 @@
+import json
+from typing import Any, Dict, List, Optional, TypedDict
+
+from ..classes.plugin_base import PluginBase
+from ..classes.tool_base import ToolBase, set_json_schema
+from ..classes.wallet_client_base import WalletClientBase
+from .get_tools import get_tools
+
+TOOL_MANIFEST_VERSION = 1
+
+
+class ToolManifestEntry(TypedDict):
+    """
+    Serializable description of a single tool
+
+    Attributes:
+        name: The name of the tool
+        description: A description of what the tool does
+        parameters: The JSON Schema of the tool's parameters
+    """
+
+    name: str
+    description: str
+    parameters: Dict[str, Any]
+
+
+class ToolManifest(TypedDict):
+    """
+    Serializable description of a set of tools
+
+    Attributes:
+        version: The manifest format version
+        tools: The tools in the manifest
+    """
+
+    version: int
+    tools: List[ToolManifestEntry]
+
+
+def get_tool_manifest(tools: List[ToolBase]) -> ToolManifest:
+    """
+    Builds a manifest of names, descriptions and JSON Schemas for a list of tools.
+
+    Args:
+        tools: The tools to describe
+
+    Returns:
+        A JSON-serializable tool manifest
+    """
+    return {
+        "version": TOOL_MANIFEST_VERSION,
+        "tools": [
+            {"name": tool.name, "description": tool.description, "parameters": tool.json_schema}
+            for tool in tools
+        ],
+    }
+
+
+def get_tools_manifest(
+    wallet: WalletClientBase, plugins: Optional[List[PluginBase]] = None
+) -> ToolManifest:
+    """Builds a manifest of all tools from the wallet and plugins."""
+    return get_tool_manifest(get_tools(wallet, plugins))
+
+
+def dump_tool_manifest(manifest: ToolManifest) -> str:
+    """
+    Serializes a tool manifest to JSON.
+
+    Args:
+        manifest: The manifest to serialize
+
+    Returns:
+        The manifest as a JSON string
+    """
+    return json.dumps(manifest, separators=(",", ":"))
+
+
+def load_tool_manifest(data: str | bytes, tools: Optional[List[ToolBase]] = None) -> ToolManifest:
+    """
+    Loads a tool manifest serialized with :func:`dump_tool_manifest`.
+
+    When tools are given, the schemas in the manifest are registered for the tools' parameters
+    models, so ``ToolBase.json_schema`` serves them without generating them again.
+
+    Args:
+        data: The serialized manifest
+        tools: Optional tools whose schemas should be seeded from the manifest, matched by name
+
+    Returns:
+        The deserialized manifest
+
+    Raises:
+        ValueError: If the manifest version is not supported
+    """
+    manifest: ToolManifest = json.loads(data)
+    if manifest.get("version") != TOOL_MANIFEST_VERSION:
+        raise ValueError(f"Unsupported tool manifest version: {manifest.get('version')}")
+
+    if tools:
+        schemas = {entry["name"]: entry["parameters"] for entry in manifest["tools"]}
+        for tool in tools:
+            schema = schemas.get(tool.name)
+            if schema is not None:
+                set_json_schema(tool.parameters, schema)
+
+    return manifest
@@ -0,0 +1,243 @@
+import asyncio
+import contextvars
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Deque, Dict, Hashable, List, Optional, Sequence, Tuple, TypedDict
+
+from typing_extensions import NotRequired
+
+from ..classes.tool_base import ToolBase
+
+
+class ToolCall(TypedDict):
+    """
+    A tool invocation to schedule
+
+    Attributes:
+        tool: The tool to run
+        parameters: The parameters to run it with
+        wallet: Optional key of the account the call acts on; defaults to the address of the tool's wallet client
+    """
+
+    tool: ToolBase
+    parameters: Dict[str, Any]
+    wallet: NotRequired[Hashable]
+
+
+class ToolSchedulerStats(TypedDict):
+    """
+    Counters of a tool scheduler
+
+    Attributes:
+        calls: Calls submitted
+        reads: Submitted calls run concurrently (reads and signatures)
+        writes: Submitted calls serialized per wallet
+        completed: Calls that returned a result
+        failed: Calls that raised an error
+        running: Calls currently running
+        queued: Calls waiting for a worker or for an earlier write of their wallet
+        max_queued: Highest number of waiting calls observed
+        write_queues: Wallets with writes pending or running
+    """
+
+    calls: int
+    reads: int
+    writes: int
+    completed: int
+    failed: int
+    running: int
+    queued: int
+    max_queued: int
+    write_queues: int
+
+
+class ToolScheduler:
+    """
+    Runs batches of tool calls, such as the parallel tool calls of one LLM turn, according to
+    their side effects.
+
+    Reads and signatures run concurrently. Writes from the same address run one at a time in
+    submission order, so transactions never race for a nonce, while writes from different
+    addresses proceed in parallel. Calls whose tool has no wallet client share one write queue.
+    A failed write does not stop the writes queued behind it.
+
+    At most ``max_concurrency`` calls run at once; the rest wait in order.
+
+    Example:
+        ```python
+        scheduler = ToolScheduler(max_concurrency=8)
+        tools = {tool.name: tool for tool in get_tools(wallet, plugins)}
+        results = scheduler.run([
+            {"tool": tools["get_token_balance"], "parameters": {...}},
+            {"tool": tools["transfer"], "parameters": {...}},
+            {"tool": tools["approve"], "parameters": {...}},
+        ], return_exceptions=True)
+        ```
+
+    Args:
+        max_concurrency: Maximum number of calls running at the same time
+    """
+
+    def __init__(self, max_concurrency: int = 8):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="radius-tool")
+        self._lock = threading.Lock()
+        self._write_queues: Dict[Hashable, Deque[Tuple[ToolCall, Future, contextvars.Context]]] = {}
+        self._counters = {
+            "calls": 0,
+            "reads": 0,
+            "writes": 0,
+            "completed": 0,
+            "failed": 0,
+            "running": 0,
+            "max_queued": 0,
+        }
+
+    def stats(self) -> ToolSchedulerStats:
+        """Returns call, concurrency and queue depth counters."""
+        with self._lock:
+            counters = dict(self._counters)
+            write_queues = len(self._write_queues)
+        return {
+            "calls": counters["calls"],
+            "reads": counters["reads"],
+            "writes": counters["writes"],
+            "completed": counters["completed"],
+            "failed": counters["failed"],
+            "running": counters["running"],
+            "queued": self._queued(counters),
+            "max_queued": counters["max_queued"],
+            "write_queues": write_queues,
+        }
+
+    def submit(self, call: ToolCall) -> "Future[Any]":
+        """
+        Schedules a tool call.
+
+        Args:
+            call: The tool and parameters to run
+
+        Returns:
+            A future resolving to the tool's result
+        """
+        future: "Future[Any]" = Future()
+        # Calls run in the context they were submitted from, like asyncio tasks
+        context = contextvars.copy_context()
+        tool = call["tool"]
+        if tool.side_effect == "write":
+            key = call["wallet"] if "wallet" in call else _wallet_key(tool)
+            with self._lock:
+                self._count_submitted("writes")
+                queue = self._write_queues.get(key)
+                start = queue is None
+                if start:
+                    queue = self._write_queues[key] = deque()
+                queue.append((call, future, context))
+            if start:
+                self._start_next_write(key)
+        else:
+            with self._lock:
+                self._count_submitted("reads")
+            self._executor.submit(context.run, self._run, call, future)
+        return future
+
+    def run(self, calls: Sequence[ToolCall], return_exceptions: bool = False) -> List[Any]:
+        """
+        Runs a batch of tool calls and waits for all of them.
+
+        Args:
+            calls: The calls to run
+            return_exceptions: Return errors in place of results instead of raising the first one
+
+        Returns:
+            The results, in the order of ``calls``
+        """
+        futures = [self.submit(call) for call in calls]
+        return [_outcome(future, return_exceptions) for future in futures]
+
+    async def arun(self, calls: Sequence[ToolCall], return_exceptions: bool = False) -> List[Any]:
+        """
+        Runs a batch of tool calls without blocking the event loop.
+
+        Args:
+            calls: The calls to run
+            return_exceptions: Return errors in place of results instead of raising the first one
+
+        Returns:
+            The results, in the order of ``calls``
+        """
+        futures = [asyncio.wrap_future(self.submit(call)) for call in calls]
+        return list(await asyncio.gather(*futures, return_exceptions=return_exceptions))
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stops the worker threads, by default after running every scheduled call."""
+        self._executor.shutdown(wait=wait)
+
+    def _start_next_write(self, key: Hashable) -> None:
+        """Hands the oldest write of a wallet to the workers once the previous one completed."""
+        with self._lock:
+            queue = self._write_queues[key]
+            if not queue:
+                del self._write_queues[key]
+                return
+            call, future, context = queue[0]
+        self._executor.submit(context.run, self._run, call, future).add_done_callback(lambda _: self._finish_write(key))
+
+    def _finish_write(self, key: Hashable) -> None:
+        with self._lock:
+            self._write_queues[key].popleft()
+        self._start_next_write(key)
+
+    def _run(self, call: ToolCall, future: "Future[Any]") -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        with self._lock:
+            self._counters["running"] += 1
+        try:
+            result = call["tool"].execute(call["parameters"])
+        except BaseException as error:
+            with self._lock:
+                self._counters["running"] -= 1
+                self._counters["failed"] += 1
+            future.set_exception(error)
+        else:
+            with self._lock:
+                self._counters["running"] -= 1
+                self._counters["completed"] += 1
+            future.set_result(result)
+
+    def _count_submitted(self, kind: str) -> None:
+        """Counts a new call; the caller holds the lock."""
+        self._counters["calls"] += 1
+        self._counters[kind] += 1
+        self._counters["max_queued"] = max(self._counters["max_queued"], self._queued(self._counters))
+
+    @staticmethod
+    def _queued(counters: Dict[str, int]) -> int:
+        return counters["calls"] - counters["completed"] - counters["failed"] - counters["running"]
+
+
+def _wallet_key(tool: ToolBase) -> Optional[Hashable]:
+    """
+    Writes are serialized per sending address, read when the call is submitted, so wallet clients
+    acting for several accounts (such as a tenant host) queue each account separately. Wallet
+    clients without an address queue per object, and tools without one share a queue.
+    """
+    wallet_client = getattr(tool, "wallet_client", None)
+    if wallet_client is None:
+        return None
+    try:
+        return wallet_client.get_address().lower()
+    except Exception:
+        return id(wallet_client)
+
+
+def _outcome(future: "Future[Any]", return_exceptions: bool) -> Any:
+    if return_exceptions:
+        error = future.exception()
+        if error is not None:
+            return error
+    return future.result()
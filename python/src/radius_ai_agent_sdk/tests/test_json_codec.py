@@ -0,0 +1,98 @@
+"""
+Tests for the pluggable JSON codec.
+"""
+import pytest
+
+from radius.utils.json_codec import (
+    JSONCodec,
+    OrjsonCodec,
+    default_json_codec,
+    get_json_codec,
+    set_json_codec,
+)
+
+PAYLOAD = {
+    "quote": {"amountIn": "1000000000000000000", "gasFee": 21000, "route": [[{"fee": 500}]]},
+    "logs": [{"blockNumber": "0x10", "topics": ["0x" + "ab" * 32], "removed": False}],
+    "price": 1.5,
+    "note": None,
+}
+
+
+def codecs():
+    available = [JSONCodec()]
+    try:
+        available.append(OrjsonCodec())
+    except ImportError:
+        pass
+    return available
+
+
+@pytest.fixture(autouse=True)
+def default_codec():
+    """Restores the default codec after every test."""
+    yield
+    set_json_codec(None)
+
+
+@pytest.mark.parametrize("codec", codecs(), ids=lambda codec: codec.name)
+def test_round_trip(codec):
+    """Test that a value encoded to bytes decodes to an equal value."""
+    encoded = codec.dumps(PAYLOAD)
+
+    assert isinstance(encoded, bytes)
+    assert codec.loads(encoded) == PAYLOAD
+
+
+@pytest.mark.parametrize("codec", codecs(), ids=lambda codec: codec.name)
+def test_loads_accepts_bytes_buffers_and_strings(codec):
+    """Test that documents are decoded from bytes, bytearray, memoryview and str alike."""
+    document = b'{"result":"0x1","id":1}'
+
+    for data in (document, bytearray(document), memoryview(document), document.decode()):
+        assert codec.loads(data) == {"result": "0x1", "id": 1}
+
+
+@pytest.mark.parametrize("codec", codecs(), ids=lambda codec: codec.name)
+def test_large_integers_stay_exact(codec):
+    """Test that integers beyond 64 bits are encoded and decoded without loss."""
+    value = {"amount": 2**256 - 1, "values": [-(2**70), 1]}
+
+    assert codec.loads(codec.dumps(value)) == value
+
+
+@pytest.mark.parametrize("codec", codecs(), ids=lambda codec: codec.name)
+def test_invalid_documents_raise_value_error(codec):
+    """Test that invalid JSON raises ValueError whatever the library."""
+    with pytest.raises(ValueError):
+        codec.loads(b"<html>Bad Gateway</html>")
+
+
+def test_unsupported_values_are_encoded_as_strings():
+    """Test that values JSON does not support are encoded with str."""
+    from decimal import Decimal
+
+    for codec in codecs():
+        assert codec.loads(codec.dumps({"amount": Decimal("1.25")})) == {"amount": "1.25"}
+
+
+def test_default_codec_prefers_orjson():
+    """Test that orjson is used when installed and the standard library otherwise."""
+    try:
+        import orjson  # noqa: F401
+    except ImportError:
+        assert type(default_json_codec()) is JSONCodec
+    else:
+        assert isinstance(default_json_codec(), OrjsonCodec)
+
+
+def test_set_json_codec_replaces_the_shared_codec():
+    """Test that an installed codec is returned until the default is restored."""
+    codec = JSONCodec()
+
+    set_json_codec(codec)
+    assert get_json_codec() is codec
+
+    set_json_codec(None)
+    assert get_json_codec() is not codec
+    assert get_json_codec() is get_json_codec()
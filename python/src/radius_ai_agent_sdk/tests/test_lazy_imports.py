@@ -0,0 +1,54 @@
+"""
+Tests for the lazy (PEP 562) attribute loading of the radius package.
+"""
+import os
+import subprocess
+import sys
+
+import pytest
+
+import radius
+
+
+def _run_isolated(code: str) -> subprocess.CompletedProcess:
+    """Runs code in a fresh interpreter that shares this process' import path."""
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+
+
+def test_import_does_not_load_pydantic():
+    """Test that importing radius defers pydantic until a class is accessed."""
+    result = _run_isolated(
+        "import sys, radius\n"
+        "assert 'pydantic' not in sys.modules, 'pydantic imported eagerly'\n"
+        "radius.ToolBase\n"
+        "assert 'pydantic' in sys.modules\n"
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_lazy_attributes_resolve():
+    """Test that every exported name resolves to the object in its defining module."""
+    from radius.classes.tool_base import ToolBase
+    from radius.utils.get_tools import get_tools
+
+    assert sorted(radius.__all__) == sorted(radius._LAZY_ATTRIBUTES)
+    for name in radius.__all__:
+        assert getattr(radius, name) is not None
+    assert radius.ToolBase is ToolBase
+    assert radius.get_tools is get_tools
+
+
+def test_unknown_attribute_raises():
+    """Test that unknown attributes still raise AttributeError."""
+    with pytest.raises(AttributeError):
+        radius.does_not_exist
+
+
+def test_dir_lists_lazy_attributes():
+    """Test that dir() includes names that have not been loaded yet."""
+    assert set(radius.__all__) <= set(dir(radius))
@@ -1,6 +1,9 @@
 """
 Tests for the PluginBase class and related functionality.
 """
+import asyncio
+import contextvars
+
 import pytest
 from unittest.mock import Mock
 
@@ -126,6 +129,28 @@ async def test_execute_async_tool():
     assert async_result["result"].startswith("Async test tool")
 
 
+def test_async_tool_sees_caller_context_inside_running_loop():
+    """Test that an async tool run on a helper thread from a running loop sees the caller's context variables."""
+    tenant = contextvars.ContextVar("tenant", default=None)
+
+    class TenantProvider:
+        @Tool({"description": "Returns the active tenant", "parameters_schema": TestParameters})
+        async def active_tenant(self, params: dict):
+            return tenant.get()
+
+    class TestPlugin(PluginBase):
+        def supports_chain(self, chain):
+            return True
+
+    tool = TestPlugin("tenant_plugin", [TenantProvider()]).get_tools(MockWalletClient())[0]
+
+    async def main():
+        tenant.set("alice")
+        return tool.execute({"param1": "test", "param2": 1})
+
+    assert asyncio.run(main()) == "alice"
+
+
 def test_tool_collection_from_multiple_providers():
     """Test collecting tools from multiple providers."""
     # Create tool provider classes
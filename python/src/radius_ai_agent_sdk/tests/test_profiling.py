@@ -0,0 +1,135 @@
+"""
+Tests for on-demand profiling of tool executions.
+"""
+import threading
+
+import pytest
+from pydantic import BaseModel
+
+from radius.classes.tool_base import ToolBase, create_tool
+from radius.utils import profiling
+from radius.utils.profiling import ToolProfiler, disable_profiling, enable_profiling, get_profiler
+
+
+class CountParameters(BaseModel):
+    """Parameters of the test tools."""
+    count: int
+
+
+def build_list(count):
+    return [str(number) for number in range(count)]
+
+
+def make_tool(name, execute=None):
+    return create_tool(
+        {"name": name, "description": f"{name} tool", "parameters": CountParameters},
+        execute or (lambda parameters: len(build_list(parameters["count"]))),
+    )
+
+
+@pytest.fixture(autouse=True)
+def no_profiler():
+    """Uninstalls any profiler after every test."""
+    yield
+    disable_profiling()
+
+
+def test_disabled_profiling_runs_tools_unchanged():
+    """Test that tools run as before, with no profiler to report to, while profiling is disabled."""
+    tool = make_tool("list_numbers")
+
+    assert get_profiler() is None
+    assert tool.execute({"count": 10}) == 10
+    assert profiling._active is None
+
+
+def test_selected_tools_are_profiled():
+    """Test that only tools matching the selected names are profiled, aggregated per tool."""
+    listed, skipped = make_tool("erc20_list"), make_tool("get_balance")
+    profiler = enable_profiling(tools=["erc20_*"])
+
+    for _ in range(3):
+        assert listed.execute({"count": 1000}) == 1000
+        skipped.execute({"count": 1000})
+
+    results = profiler.results()
+    assert list(results) == ["erc20_list"]
+    assert results["erc20_list"]["calls"] == 3
+    assert results["erc20_list"]["total_time"] > 0
+    functions = {function for _, _, function in results["erc20_list"]["stats"].stats}
+    assert "build_list" in functions
+    assert "erc20_list" in profiler.format_report()
+
+
+def test_sampling_rate_selects_a_fraction_of_calls():
+    """Test that the sampling rate decides which executions are profiled."""
+    draws = iter([0.1, 0.9, 0.2, 0.7])
+    profiler = enable_profiling(ToolProfiler(sample_rate=0.5, rng=lambda: next(draws)))
+    tool = make_tool("list_numbers")
+
+    for _ in range(4):
+        tool.execute({"count": 5})
+
+    assert profiler.results()["list_numbers"]["calls"] == 2
+    with pytest.raises(ValueError):
+        ToolProfiler(sample_rate=1.5)
+
+
+def test_memory_profiling_reports_allocations(tmp_path):
+    """Test that allocations left by a tool are attributed to their source line and dumped on disable."""
+    kept = []
+    tool = make_tool("keep_numbers", lambda parameters: kept.append(build_list(parameters["count"])))
+    report = tmp_path / "profile.txt"
+    profiler = enable_profiling(cpu=False, memory=True, output_path=str(report))
+
+    tool.execute({"count": 10_000})
+    disable_profiling()
+
+    profile = profiler.results()["keep_numbers"]
+    assert profile["stats"] is None
+    top = profile["allocations"][0]
+    assert top["location"].endswith(f"test_profiling.py:{build_list.__code__.co_firstlineno + 1}")
+    assert top["size_diff"] > 100_000
+    assert "keep_numbers" in report.read_text()
+
+
+def test_nested_and_concurrent_calls():
+    """Test that nested tools are part of the outer profile and concurrent calls are skipped, not profiled."""
+    inner = make_tool("inner")
+    started, release = threading.Event(), threading.Event()
+
+    def outer_execute(parameters):
+        started.set()
+        release.wait(5)
+        return inner.execute(parameters)
+
+    outer = make_tool("outer", outer_execute)
+    profiler = enable_profiling()
+    thread = threading.Thread(target=outer.execute, args=({"count": 10},))
+    thread.start()
+    started.wait(5)
+    inner.execute({"count": 10})
+    release.set()
+    thread.join()
+
+    results = profiler.results()
+    assert results["outer"]["calls"] == 1
+    assert results["inner"]["calls"] == 0
+    assert results["inner"]["skipped"] == 1
+
+
+def test_custom_tool_subclasses_are_profiled(tmp_path):
+    """Test that ToolBase subclasses overriding execute are profiled and their stats can be dumped."""
+
+    class Doubler(ToolBase):
+        def execute(self, parameters):
+            return parameters["count"] * 2
+
+    tool = Doubler({"name": "double", "description": "Doubles", "parameters": CountParameters})
+    profiler = enable_profiling()
+
+    assert tool.execute({"count": 21}) == 42
+    profiler.dump_stats("double", str(tmp_path / "double.prof"))
+    assert (tmp_path / "double.prof").stat().st_size > 0
+    with pytest.raises(KeyError):
+        profiler.dump_stats("missing", str(tmp_path / "missing.prof"))
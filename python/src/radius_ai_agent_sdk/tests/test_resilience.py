@@ -0,0 +1,177 @@
+"""
+Tests for the retry, timeout and circuit breaker policy layer.
+"""
+import asyncio
+
+import pytest
+
+from radius.utils.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    Resilience,
+    ResiliencePolicy,
+    TransientError,
+)
+
+
+class FakeClock:
+    """Manually advanced clock whose sleep moves time forward instantly."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def make_resilience(clock, **policy):
+    return Resilience(ResiliencePolicy(**policy), clock=clock, sleep=clock.sleep)
+
+
+def flaky(failures, error=ConnectionError("node hiccup"), result="ok"):
+    """Create an operation failing ``failures`` times before returning ``result``."""
+    calls = []
+
+    def operation():
+        calls.append(1)
+        if len(calls) <= failures:
+            raise error
+        return result
+
+    operation.calls = calls
+    return operation
+
+
+def test_transient_errors_are_retried():
+    """Test that an idempotent call is retried after transient errors."""
+    resilience = make_resilience(FakeClock(), max_retries=2)
+    operation = flaky(2)
+
+    assert resilience.call("node", operation) == "ok"
+    assert len(operation.calls) == 3
+    stats = resilience.stats()
+    assert stats["calls"] == 1
+    assert stats["retries"] == 2
+    assert stats["failures"] == 0
+
+
+def test_retries_are_bounded():
+    """Test that the last transient error is raised once retries are exhausted."""
+    resilience = make_resilience(FakeClock(), max_retries=1)
+    operation = flaky(5)
+
+    with pytest.raises(ConnectionError):
+        resilience.call("node", operation)
+    assert len(operation.calls) == 2
+    assert resilience.stats()["failures"] == 1
+
+
+def test_non_idempotent_calls_are_not_retried():
+    """Test that a call with side effects is attempted once."""
+    resilience = make_resilience(FakeClock())
+    operation = flaky(1)
+
+    with pytest.raises(ConnectionError):
+        resilience.call("node", operation, idempotent=False)
+    assert len(operation.calls) == 1
+
+
+def test_application_errors_pass_through():
+    """Test that non-transient errors are neither retried nor counted against the endpoint."""
+    resilience = make_resilience(FakeClock(), failure_threshold=1)
+    operation = flaky(1, error=ValueError("execution reverted"))
+
+    with pytest.raises(ValueError):
+        resilience.call("node", operation)
+    assert len(operation.calls) == 1
+    assert resilience.breaker("node").state == "closed"
+
+
+def test_deadline_stops_retries():
+    """Test that no retry is scheduled past the call's deadline."""
+    clock = FakeClock()
+    resilience = make_resilience(clock, timeout=1.0, max_retries=10, base_delay=0.5, max_delay=0.5)
+
+    def slow_failure():
+        clock.now += 0.4
+        raise TimeoutError("read timed out")
+
+    with pytest.raises(TimeoutError):
+        resilience.call("node", slow_failure)
+    assert clock.now <= 1.0 + 0.4
+    assert resilience.stats()["timeouts"] == 1
+
+
+def test_circuit_breaker_opens_and_recovers():
+    """Test that a breaker opens after repeated failures, short-circuits calls and half-opens after the timeout."""
+    clock = FakeClock()
+    resilience = make_resilience(clock, max_retries=0, failure_threshold=2, reset_timeout=10)
+
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            resilience.call("node", flaky(1))
+
+    operation = flaky(0)
+    with pytest.raises(CircuitOpenError):
+        resilience.call("node", operation)
+    assert operation.calls == []
+    # Other endpoints are unaffected
+    assert resilience.call("other", flaky(0)) == "ok"
+
+    stats = resilience.stats()
+    assert stats["breaker_trips"] == 1
+    assert stats["short_circuited"] == 1
+    assert stats["open_circuits"] == ["node"]
+
+    clock.now += 10
+    assert resilience.breaker("node").state == "half-open"
+    assert resilience.call("node", operation) == "ok"
+    assert resilience.breaker("node").state == "closed"
+
+
+def test_failed_trial_reopens_circuit():
+    """Test that a failing trial call in the half-open state opens the circuit again."""
+    clock = FakeClock()
+    breaker = CircuitBreaker("node", failure_threshold=1, reset_timeout=5, clock=clock)
+
+    assert breaker.record_failure() is True
+    clock.now += 5
+    breaker.allow()
+    # Only one trial call at a time
+    with pytest.raises(CircuitOpenError):
+        breaker.allow()
+    assert breaker.record_failure() is True
+    assert breaker.state == "open"
+    assert breaker.trips == 2
+
+
+def test_async_call_is_cancelled_at_deadline():
+    """Test that an asynchronous attempt is cancelled when the deadline passes."""
+    resilience = Resilience(ResiliencePolicy(timeout=0.05))
+
+    async def hang():
+        await asyncio.sleep(5)
+
+    with pytest.raises(TimeoutError):
+        asyncio.run(resilience.acall("api", hang))
+    stats = resilience.stats()
+    assert stats["timeouts"] == 1
+    assert stats["failures"] == 1
+
+
+def test_async_transient_errors_are_retried():
+    """Test asynchronous retries of transient errors."""
+    resilience = Resilience(ResiliencePolicy(base_delay=0.001))
+    attempts = []
+
+    async def operation():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise TransientError("HTTP 503")
+        return {"result": "0x1"}
+
+    assert asyncio.run(resilience.acall("api", operation)) == {"result": "0x1"}
+    assert resilience.stats()["retries"] == 1
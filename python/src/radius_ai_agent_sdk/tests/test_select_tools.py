@@ -0,0 +1,107 @@
+"""
+Tests for tool filtering and relevance ranking.
+"""
+from unittest.mock import Mock
+
+from pydantic import BaseModel, Field
+
+from radius.classes.tool_base import create_tool
+from radius.utils.get_tools import get_tools
+from radius.utils.select_tools import filter_tools, rank_tools
+from tests.conftest import MockWalletClient, MockPlugin
+
+
+class TransferParameters(BaseModel):
+    """Parameters for the transfer tool."""
+    to: str = Field(description="The recipient address")
+    amount: str = Field(description="The amount of tokens to send")
+
+
+class QuoteParameters(BaseModel):
+    """Parameters for the quote tool."""
+    token_in: str = Field(description="The token to sell")
+    token_out: str = Field(description="The token to buy")
+
+
+def make_tool(name, description, tags, parameters=TransferParameters):
+    """Create a tool that returns its own name."""
+    return create_tool(
+        {"name": name, "description": description, "parameters": parameters, "tags": tags},
+        lambda _: {"result": name},
+    )
+
+
+def make_tools():
+    """Create a set of tools resembling the core, ERC20 and Uniswap tools."""
+    return [
+        make_tool("get_balance", "Get the balance of the wallet", ["read", "wallet"]),
+        make_tool("get_token_balance", "Get the balance of an ERC20 token", ["read", "erc20"]),
+        make_tool("transfer", "Transfer an amount of an ERC20 token to an address", ["write", "erc20"]),
+        make_tool("approve", "Approve an amount of an ERC20 token to an address", ["write", "erc20"]),
+        make_tool("uniswap_get_quote", "Get the quote for a swap", ["read", "uniswap"], QuoteParameters),
+        make_tool("uniswap_swap_tokens", "Swap tokens on Uniswap", ["write", "uniswap"], QuoteParameters),
+    ]
+
+
+def names(tools):
+    """Return the names of the given tools."""
+    return [tool.name for tool in tools]
+
+
+def test_filter_tools_by_name_patterns():
+    """Test include and exclude filters with exact names and glob patterns."""
+    tools = make_tools()
+
+    assert names(filter_tools(tools, include=["uniswap_*"])) == ["uniswap_get_quote", "uniswap_swap_tokens"]
+    assert names(filter_tools(tools, include=["transfer", "approve"])) == ["transfer", "approve"]
+    assert names(filter_tools(tools, exclude=["*balance"])) == [
+        "transfer", "approve", "uniswap_get_quote", "uniswap_swap_tokens"
+    ]
+    assert filter_tools(tools) == tools
+
+
+def test_filter_tools_by_tags():
+    """Test that tag filters keep tools with any matching tag and drop excluded tags."""
+    tools = make_tools()
+
+    assert names(filter_tools(tools, tags=["read"])) == ["get_balance", "get_token_balance", "uniswap_get_quote"]
+    assert names(filter_tools(tools, tags=["erc20"], exclude_tags=["write"])) == ["get_token_balance"]
+    assert filter_tools(tools, tags=[]) == []
+
+
+def test_rank_tools_orders_by_relevance():
+    """Test that tools matching the task text are ranked first and unrelated tools dropped."""
+    tools = make_tools()
+
+    ranked = rank_tools(tools, "Swap 10 USDC for WETH on Uniswap")
+    assert ranked[0].name == "uniswap_swap_tokens"
+    assert "uniswap_get_quote" in names(ranked)
+    assert "get_balance" not in names(ranked)
+
+    assert rank_tools(tools, "What are my token balances?", limit=2)[0].name in {"get_balance", "get_token_balance"}
+    assert names(rank_tools(tools, "Transfer 5 tokens to 0xabc", limit=1)) == ["transfer"]
+
+
+def test_rank_tools_falls_back_to_all_tools():
+    """Test that a query sharing no terms with any tool returns every tool."""
+    tools = make_tools()
+
+    assert rank_tools(tools, "zzz qqq") == tools
+    assert rank_tools(tools, "", limit=2) == tools[:2]
+    assert rank_tools([], "swap") == []
+
+
+def test_get_tools_with_filters_and_query():
+    """Test that get_tools applies filters and ranking after collecting plugin tools."""
+    tools = make_tools()
+    wallet = MockWalletClient()
+    wallet.get_core_tools = Mock(return_value=tools[:1])
+    plugin = MockPlugin()
+    plugin.get_tools = Mock(return_value=tools[1:])
+
+    assert get_tools(wallet, [plugin]) == tools
+    assert names(get_tools(wallet, [plugin], exclude_tags=["write"])) == [
+        "get_balance", "get_token_balance", "uniswap_get_quote"
+    ]
+    assert names(get_tools(wallet, [plugin], tags=["erc20"], query="approve spending", limit=1)) == ["approve"]
+    assert len(get_tools(wallet, [plugin], limit=3)) == 3
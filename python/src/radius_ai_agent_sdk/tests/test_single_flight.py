@@ -0,0 +1,104 @@
+"""
+Tests for single-flight coalescing of identical concurrent calls.
+"""
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from radius.utils.single_flight import SingleFlight
+
+
+def test_concurrent_identical_calls_share_one_execution():
+    """Test that threads calling with the same key while it is in flight share one result."""
+    group = SingleFlight()
+    release = threading.Event()
+    executions = []
+
+    def operation():
+        executions.append(1)
+        release.wait(5)
+        return {"value": 42}
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [pool.submit(group.do, "balance", operation) for _ in range(8)]
+        # Wait until every caller has joined the flight
+        while group.stats()["calls"] < 8:
+            threading.Event().wait(0.001)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert executions == [1]
+    assert all(result is results[0] for result in results)
+    stats = group.stats()
+    assert stats["executions"] == 1
+    assert stats["coalesced"] == 7
+    assert stats["in_flight"] == 0
+
+
+def test_sequential_calls_are_not_cached():
+    """Test that a completed call is not reused by the next one."""
+    group = SingleFlight()
+    counter = iter(range(10))
+
+    assert group.do("key", lambda: next(counter)) == 0
+    assert group.do("key", lambda: next(counter)) == 1
+    assert group.stats()["coalesced"] == 0
+
+
+def test_errors_are_shared_and_not_remembered():
+    """Test that joined callers receive the leader's error and that a later call runs again."""
+    group = SingleFlight()
+    release = threading.Event()
+
+    def failing():
+        release.wait(5)
+        raise ConnectionError("node down")
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [pool.submit(group.do, "key", failing) for _ in range(2)]
+        while group.stats()["calls"] < 2:
+            threading.Event().wait(0.001)
+        release.set()
+        for future in futures:
+            with pytest.raises(ConnectionError):
+                future.result()
+
+    assert group.do("key", lambda: "recovered") == "recovered"
+
+
+def test_async_calls_are_coalesced():
+    """Test that identical coroutines in flight on one loop share a single execution."""
+    group = SingleFlight()
+    executions = []
+
+    async def fetch():
+        executions.append(1)
+        await asyncio.sleep(0.01)
+        return "quote"
+
+    async def main():
+        return await asyncio.gather(*(group.ado(("quote", 1), fetch) for _ in range(5)), group.ado("other", fetch))
+
+    assert asyncio.run(main()) == ["quote"] * 6
+    assert len(executions) == 2
+    assert group.stats()["coalesced"] == 4
+
+
+def test_cancelled_caller_does_not_cancel_others():
+    """Test that cancelling one waiting caller leaves the shared operation running for the rest."""
+    group = SingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0.02)
+        return "done"
+
+    async def main():
+        first = asyncio.ensure_future(group.ado("key", fetch))
+        second = asyncio.ensure_future(group.ado("key", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(main()) == "done"
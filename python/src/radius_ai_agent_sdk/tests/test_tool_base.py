@@ -2,6 +2,7 @@
 Tests for the ToolBase class and related functionality.
 """
 import pytest
+from unittest.mock import patch
 from typing import Dict, Any
 from pydantic import BaseModel
 
@@ -122,4 +123,23 @@ def test_tool_with_extra_parameters():
     
     # Verify that extra parameters are filtered out
     assert "extra_param" not in captured_params
-    assert captured_params == {"param1": "test", "param2": 123}
\ No newline at end of file
+    assert captured_params == {"param1": "test", "param2": 123}
+
+def test_json_schema_is_cached_per_parameters_model():
+    """Test that tools sharing a parameters model share one generated JSON Schema."""
+    config: ToolConfig = {
+        "name": "schema_tool",
+        "description": "A tool exposing its JSON Schema",
+        "parameters": TestParameters
+    }
+    tool1 = create_tool(config, lambda params: params)
+    tool2 = create_tool({**config, "name": "schema_tool_2"}, lambda params: params)
+
+    with patch.object(TestParameters, "model_json_schema", wraps=TestParameters.model_json_schema) as spy:
+        schema = tool1.json_schema
+        assert tool2.json_schema is schema
+        assert tool1.json_schema is schema
+        assert spy.call_count <= 1
+
+    assert schema["properties"]["param1"]["type"] == "string"
+    assert schema["required"] == ["param1", "param2"]
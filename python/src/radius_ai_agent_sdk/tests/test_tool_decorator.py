@@ -52,6 +52,30 @@ def test_tool_decorator_with_custom_name():
     assert metadata.description == "A tool with custom name"
 
 
+def test_tool_decorator_with_tags():
+    """Test that tags given to the Tool decorator are stored in the metadata."""
+    class TestService:
+        @Tool({
+            "description": "A read tool",
+            "parameters_schema": TestParameters,
+            "tags": ["read", "test"]
+        })
+        def tagged_tool(self, params: dict):
+            return {"result": "ok"}
+
+        @Tool({
+            "description": "An untagged tool",
+            "parameters_schema": TestParameters
+        })
+        def untagged_tool(self, params: dict):
+            return {"result": "ok"}
+
+    service = TestService()
+
+    assert getattr(service.tagged_tool, TOOL_METADATA_KEY).tags == ["read", "test"]
+    assert getattr(service.untagged_tool, TOOL_METADATA_KEY).tags == []
+
+
 def test_validate_decorator_parameters_basic():
     """Test the validate_decorator_parameters function with a valid method."""
     # Create a test method with the right signature
@@ -0,0 +1,80 @@
+"""
+Tests for the tool manifest export and loading utilities.
+"""
+import json
+from unittest.mock import Mock
+
+import pytest
+from pydantic import BaseModel
+
+from radius.classes.tool_base import create_tool, get_json_schema
+from radius.utils.tool_manifest import (
+    dump_tool_manifest,
+    get_tool_manifest,
+    get_tools_manifest,
+    load_tool_manifest,
+)
+from tests.conftest import MockWalletClient, TestParameters
+
+
+class ManifestParameters(BaseModel):
+    """Parameters model used only by the manifest loading test."""
+    amount: int
+
+
+def _tool(name, parameters=TestParameters):
+    return create_tool(
+        {"name": name, "description": f"{name} description", "parameters": parameters},
+        lambda params: params,
+    )
+
+
+def test_get_tool_manifest():
+    """Test that the manifest lists names, descriptions and JSON Schemas."""
+    manifest = get_tool_manifest([_tool("tool_a"), _tool("tool_b")])
+
+    assert manifest["version"] == 1
+    assert [entry["name"] for entry in manifest["tools"]] == ["tool_a", "tool_b"]
+    assert manifest["tools"][0]["description"] == "tool_a description"
+    assert manifest["tools"][0]["parameters"] == TestParameters.model_json_schema()
+
+
+def test_get_tools_manifest_uses_wallet_tools():
+    """Test that the get_tools-level manifest covers the wallet's core tools."""
+    wallet = MockWalletClient()
+    wallet.get_core_tools = Mock(return_value=[_tool("core_tool")])
+
+    manifest = get_tools_manifest(wallet, [])
+
+    assert [entry["name"] for entry in manifest["tools"]] == ["core_tool"]
+
+
+def test_manifest_round_trip():
+    """Test that a dumped manifest loads back unchanged."""
+    manifest = get_tool_manifest([_tool("tool_a")])
+
+    data = dump_tool_manifest(manifest)
+
+    assert json.loads(data) == manifest
+    assert load_tool_manifest(data) == manifest
+
+
+def test_load_tool_manifest_seeds_schema_cache():
+    """Test that loading a manifest with tools serves the stored schemas without regenerating them."""
+    stored_schema = {"type": "object", "properties": {"amount": {"type": "integer"}}, "title": "Stored"}
+    data = json.dumps({
+        "version": 1,
+        "tools": [{"name": "manifest_tool", "description": "d", "parameters": stored_schema}],
+    })
+    tool = _tool("manifest_tool", ManifestParameters)
+
+    load_tool_manifest(data, tools=[tool])
+
+    assert tool.json_schema == stored_schema
+    assert get_json_schema(ManifestParameters) == stored_schema
+
+
+def test_load_tool_manifest_rejects_unknown_version():
+    """Test that manifests from an unsupported format version are rejected."""
+    with pytest.raises(ValueError):
+        load_tool_manifest(json.dumps({"version": 99, "tools": []}))
@@ -0,0 +1,234 @@
+"""
+Tests for side effect metadata on tools and the read/write-aware tool scheduler.
+"""
+import asyncio
+import contextvars
+import threading
+import time
+
+import pytest
+from pydantic import BaseModel
+
+from radius.classes.plugin_base import PluginBase
+from radius.classes.tool_base import create_tool, side_effect_from_tags
+from radius.decorators.tool import Tool
+from radius.utils.tool_scheduler import ToolScheduler
+from tests.conftest import MockWalletClient
+
+
+class DelayParameters(BaseModel):
+    delay: float = 0.0
+    label: str = ""
+
+
+class Recorder:
+    """Records when tool executions start and end."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.events = []
+        self.running = 0
+        self.max_running = 0
+
+    def tool(self, name, side_effect, wallet_client=None, fail=False):
+        def execute(parameters):
+            with self.lock:
+                self.events.append(("start", parameters["label"]))
+                self.running += 1
+                self.max_running = max(self.max_running, self.running)
+            time.sleep(parameters["delay"])
+            with self.lock:
+                self.events.append(("end", parameters["label"]))
+                self.running -= 1
+            if fail:
+                raise RuntimeError(f"{parameters['label']} failed")
+            return parameters["label"]
+
+        config = {"name": name, "description": name, "parameters": DelayParameters, "side_effect": side_effect}
+        if wallet_client is not None:
+            config["wallet_client"] = wallet_client
+        return create_tool(config, execute)
+
+
+def call(tool, label, delay=0.05, **extra):
+    return {"tool": tool, "parameters": {"label": label, "delay": delay}, **extra}
+
+
+def test_side_effect_from_tags():
+    """Test that side effects are inferred from tags, treating unknown tools as writes."""
+    assert side_effect_from_tags(["read", "erc20"]) == "read"
+    assert side_effect_from_tags(["write", "erc20"]) == "write"
+    assert side_effect_from_tags(["sign"]) == "sign"
+    assert side_effect_from_tags(["jsonrpc"]) == "write"
+
+
+def test_tool_decorator_side_effect():
+    """Test that plugin tools carry their declared side effect and wallet client."""
+
+    class Provider:
+        @Tool({"description": "Signs", "parameters_schema": DelayParameters, "tags": ["wallet"], "side_effect": "sign"})
+        def sign_it(self, wallet_client: MockWalletClient, parameters: dict):
+            return "signed"
+
+        @Tool({"description": "Reads", "parameters_schema": DelayParameters, "tags": ["read"]})
+        def read_it(self, parameters: dict):
+            return "read"
+
+    class Plugin(PluginBase):
+        def supports_chain(self, chain):
+            return True
+
+    wallet = MockWalletClient()
+    tools = {tool.name: tool for tool in Plugin("test", [Provider()]).get_tools(wallet)}
+
+    assert tools["sign_it"].side_effect == "sign"
+    assert tools["read_it"].side_effect == "read"
+    assert tools["sign_it"].wallet_client is wallet
+    assert all(tool.side_effect == "read" for tool in wallet.get_core_tools())
+    with pytest.raises(ValueError):
+        Tool({"description": "Bad", "parameters_schema": DelayParameters, "side_effect": "delete"})
+
+
+def test_reads_run_concurrently():
+    """Test that read calls overlap."""
+    recorder = Recorder()
+    read = recorder.tool("read", "read")
+    scheduler = ToolScheduler(max_concurrency=4)
+
+    started = time.monotonic()
+    assert scheduler.run([call(read, str(i), delay=0.2) for i in range(4)]) == ["0", "1", "2", "3"]
+
+    assert recorder.max_running == 4
+    assert time.monotonic() - started < 0.6
+
+
+def test_writes_to_one_wallet_are_serialized_in_order():
+    """Test that writes to the same wallet never overlap and run in submission order."""
+    recorder = Recorder()
+    wallet = MockWalletClient()
+    transfer = recorder.tool("transfer", "write", wallet)
+    approve = recorder.tool("approve", "write", wallet)
+    read = recorder.tool("balance", "read", wallet)
+    scheduler = ToolScheduler(max_concurrency=4)
+
+    results = scheduler.run([call(transfer, "w1"), call(read, "r1"), call(approve, "w2"), call(transfer, "w3")])
+
+    assert results == ["w1", "r1", "w2", "w3"]
+    writes = [event for event in recorder.events if event[1].startswith("w")]
+    assert writes == [("start", "w1"), ("end", "w1"), ("start", "w2"), ("end", "w2"), ("start", "w3"), ("end", "w3")]
+    # The read ran alongside the writes
+    assert recorder.events.index(("start", "r1")) < recorder.events.index(("end", "w1"))
+    stats = scheduler.stats()
+    assert stats["writes"] == 3
+    assert stats["reads"] == 1
+    assert stats["write_queues"] == 0
+    assert stats["max_queued"] >= 2
+
+
+def test_writes_to_different_wallets_run_in_parallel():
+    """Test that separate wallets have separate write queues."""
+    recorder = Recorder()
+    first = recorder.tool("transfer", "write", MockWalletClient("0xa"))
+    second = recorder.tool("transfer", "write", MockWalletClient("0xb"))
+    scheduler = ToolScheduler(max_concurrency=4)
+
+    scheduler.run([call(first, "a", delay=0.1), call(second, "b", delay=0.1)])
+
+    assert recorder.max_running == 2
+
+
+def test_writes_are_queued_per_address_at_submission():
+    """Test that one wallet client sending for several accounts gets a write queue per account."""
+
+    class SwitchingWalletClient(MockWalletClient):
+        def __init__(self):
+            super().__init__()
+            self.active = contextvars.ContextVar("active", default="0xA")
+
+        def get_address(self):
+            return self.active.get()
+
+    recorder = Recorder()
+    wallet = SwitchingWalletClient()
+    send = recorder.tool("send", "write", wallet)
+    scheduler = ToolScheduler(max_concurrency=4)
+
+    first = scheduler.submit(call(send, "a1", delay=0.1))
+    wallet.active.set("0xB")
+    second = scheduler.submit(call(send, "b", delay=0.1))
+    wallet.active.set("0xa")
+    third = scheduler.submit(call(send, "a2", delay=0.1))
+
+    assert [future.result() for future in (first, second, third)] == ["a1", "b", "a2"]
+    assert recorder.max_running == 2
+    assert recorder.events.index(("end", "a1")) < recorder.events.index(("start", "a2"))
+
+
+def test_explicit_wallet_key():
+    """Test that calls naming the same wallet are serialized even without a wallet client."""
+    recorder = Recorder()
+    send = recorder.tool("send", "write")
+    scheduler = ToolScheduler(max_concurrency=4)
+
+    scheduler.run([call(send, "a", wallet="0xa"), call(send, "b", wallet="0xa"), call(send, "c", wallet="0xc")])
+
+    assert recorder.max_running == 2
+    assert recorder.events.index(("end", "a")) < recorder.events.index(("start", "b"))
+
+
+def test_concurrency_is_bounded():
+    """Test that no more than max_concurrency calls run at once."""
+    recorder = Recorder()
+    read = recorder.tool("read", "read")
+    scheduler = ToolScheduler(max_concurrency=2)
+
+    scheduler.run([call(read, str(i), delay=0.02) for i in range(6)])
+
+    assert recorder.max_running == 2
+    stats = scheduler.stats()
+    assert stats["completed"] == 6
+    assert stats["max_queued"] >= 4
+    assert stats["queued"] == 0
+    assert stats["running"] == 0
+
+
+def test_failed_write_does_not_block_the_queue():
+    """Test that a failing write is reported and the next write of the wallet still runs."""
+    recorder = Recorder()
+    wallet = MockWalletClient()
+    failing = recorder.tool("transfer", "write", wallet, fail=True)
+    approve = recorder.tool("approve", "write", wallet)
+    scheduler = ToolScheduler()
+
+    results = scheduler.run([call(failing, "w1"), call(approve, "w2")], return_exceptions=True)
+
+    assert isinstance(results[0], RuntimeError)
+    assert results[1] == "w2"
+    assert scheduler.stats()["failed"] == 1
+    with pytest.raises(RuntimeError):
+        scheduler.run([call(failing, "w3")])
+
+
+def test_arun():
+    """Test running a batch from an event loop."""
+    recorder = Recorder()
+    read = recorder.tool("read", "read")
+    scheduler = ToolScheduler()
+
+    assert asyncio.run(scheduler.arun([call(read, "a"), call(read, "b")])) == ["a", "b"]
+
+
+def test_calls_run_in_the_submitting_context():
+    """Test that reads and queued writes see the context variables set when they were submitted."""
+    tenant = contextvars.ContextVar("tenant", default=None)
+    config = {"description": "tenant", "parameters": DelayParameters}
+    read = create_tool({"name": "read", "side_effect": "read", **config}, lambda parameters: tenant.get())
+    write = create_tool({"name": "write", "side_effect": "write", **config}, lambda parameters: tenant.get())
+    scheduler = ToolScheduler(max_concurrency=2)
+
+    futures = []
+    for name in ["alice", "bob"]:
+        tenant.set(name)
+        futures += [scheduler.submit(call(read, name, delay=0)), scheduler.submit(call(write, name, delay=0))]
+
+    assert [future.result() for future in futures] == ["alice", "alice", "bob", "bob"]
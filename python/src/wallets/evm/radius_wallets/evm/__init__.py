@@ -1,10 +1,11 @@
 from .types import (
-    EVMTransaction, EVMReadRequest, EVMReadResult, EVMTypedData,
+    EVMTransaction, EVMReadRequest, EVMReadResult, EVMTypedData, EVMLog, EVMLogFilter,
     PaymasterOptions, EVMTransactionOptions, TypedDataDomain
 )
 from .evm_wallet_client import EVMWalletClient
 from .evm_smart_wallet_client import EVMSmartWalletClient
 from .send_eth import SendETHPlugin, send_eth
+from .payments import PaymentAggregator, PaymentReceipt, PaymentStats
 
 __version__ = "1.0.0"
 
@@ -13,10 +14,15 @@ __all__ = [
     "EVMReadRequest",
     "EVMReadResult",
     "EVMTypedData",
+    "EVMLog",
+    "EVMLogFilter",
     "EVMWalletClient",
     "EVMSmartWalletClient",
     "SendETHPlugin",
     "send_eth",
+    "PaymentAggregator",
+    "PaymentReceipt",
+    "PaymentStats",
     "PaymasterOptions",
     "EVMTransactionOptions",
     "TypedDataDomain",
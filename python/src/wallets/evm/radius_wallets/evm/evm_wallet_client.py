@@ -1,10 +1,10 @@
 from abc import abstractmethod
-from typing import Dict
+from typing import Dict, List, Sequence
 
 from radius.types.chain import EvmChain
 from radius.classes.wallet_client_base import Signature, WalletClientBase
 
-from .types import EVMTransaction, EVMReadRequest, EVMReadResult, EVMTypedData
+from .types import EVMLog, EVMLogFilter, EVMTransaction, EVMReadRequest, EVMReadResult, EVMTypedData
 
 
 class EVMWalletClient(WalletClientBase):
@@ -32,3 +32,27 @@ class EVMWalletClient(WalletClientBase):
     def sign_typed_data(self, data: EVMTypedData) -> Signature:
         """Sign typed data according to EIP-712."""
         pass
+
+    def sign_messages(self, messages: Sequence[str]) -> List[Signature]:
+        """Sign several messages, returning their signatures in order."""
+        return [self.sign_message(message) for message in messages]
+
+    def sign_typed_data_many(self, payloads: Sequence[EVMTypedData]) -> List[Signature]:
+        """Sign several typed data payloads according to EIP-712, returning their signatures in order."""
+        return [self.sign_typed_data(payload) for payload in payloads]
+
+    def get_block_number(self) -> int:
+        """Get the number of the latest block."""
+        raise NotImplementedError(f"{type(self).__name__} does not support block queries")
+
+    def get_block_timestamp(self, block_number: int) -> int:
+        """Get the timestamp of a block, in seconds since the epoch."""
+        raise NotImplementedError(f"{type(self).__name__} does not support block queries")
+
+    def get_logs(self, filter: EVMLogFilter) -> List[EVMLog]:
+        """Get the event logs matching a filter."""
+        raise NotImplementedError(f"{type(self).__name__} does not support log queries")
+
+    def get_code(self, address: str) -> str:
+        """Get the bytecode deployed at an address as a hex string, ``"0x"`` when there is none."""
+        raise NotImplementedError(f"{type(self).__name__} does not support code queries")
@@ -0,0 +1,407 @@
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple, TypedDict
+
+from .evm_wallet_client import EVMWalletClient
+
+# Payment states: queued, sent as part of a settlement, confirmed, or not paid
+PENDING = "pending"
+SETTLING = "settling"
+SETTLED = "settled"
+FAILED = "failed"
+
+
+class PaymentReceipt(TypedDict):
+    """
+    State of one payment
+
+    Attributes:
+        paymentId: Identifies the payment in the ledger
+        to: The recipient
+        amount: The amount, in wei
+        status: ``pending`` (queued), ``settling`` (sent in a settlement transaction), ``settled``
+            or ``failed``
+        transactionHash: Hash of the settlement transaction, once settled
+        settlementId: Identifies the settlement that paid it, once sent
+        error: Why the payment failed, if it did
+    """
+
+    paymentId: int
+    to: str
+    amount: str
+    status: str
+    transactionHash: Optional[str]
+    settlementId: Optional[int]
+    error: Optional[str]
+
+
+class PaymentStats(TypedDict):
+    """
+    Counters of a payment aggregator
+
+    Attributes:
+        payments: Payments submitted since the aggregator was created
+        pending: Payments waiting to be settled
+        pending_amount: Total of the pending payments, in wei
+        settlements: Settlement transactions confirmed
+        settled_payments: Payments paid by those settlements
+        failed: Payments that failed
+        in_doubt: Settlements found being sent when the ledger was opened, whose outcome was
+            never recorded
+    """
+
+    payments: int
+    pending: int
+    pending_amount: int
+    settlements: int
+    settled_payments: int
+    failed: int
+    in_doubt: int
+
+
+class _Recipient:
+    """Pending payments to one recipient."""
+
+    __slots__ = ("amount", "count", "oldest")
+
+    def __init__(self, oldest: float):
+        self.amount = 0
+        self.count = 0
+        self.oldest = oldest
+
+
+class PaymentAggregator:
+    """
+    Aggregates many small native payments into few settlement transactions.
+
+    Agents paying per API call make thousands of tiny transfers, each costing a transaction and
+    a receipt wait. The aggregator records each payment in a SQLite ledger and returns at once;
+    payments are netted per recipient and settled as one transfer of their total when the
+    oldest has waited ``window`` seconds, or when the recipient's pending total reaches
+    ``max_amount`` or ``max_payments``. Settlements to different recipients are sent
+    concurrently, so a wallet with locally tracked nonces pipelines them instead of waiting for
+    each receipt in turn.
+
+    Every payment gets a receipt that references the settlement transaction once it is
+    confirmed (:meth:`receipt`, or :meth:`pay` to wait for it). Payments of a settlement that
+    reverts or raises fail and are not retried, so they are never paid twice. The ledger
+    survives restarts: pending payments are settled by the next aggregator opened on it for the
+    same sender, while settlements that were being sent when the process stopped are counted as
+    ``in_doubt`` for an operator to check.
+
+    Example:
+        ```python
+        aggregator = PaymentAggregator(wallet, path="~/.radius/payments.db", window=5.0)
+        receipt = aggregator.submit(api_provider, 10**12)
+        ...
+        print(aggregator.receipt(receipt["paymentId"]))  # "settled", with the transaction hash
+        aggregator.close()
+        ```
+
+    Args:
+        wallet_client: The wallet payments are sent from
+        path: SQLite ledger file, created along with its directory if missing; the default
+            ``":memory:"`` keeps the ledger for the process lifetime only
+        window: Seconds a payment waits for others to the same recipient before being settled
+        max_amount: Pending total, in wei, at which a recipient is settled without waiting
+        max_payments: Pending payments at which a recipient is settled without waiting
+        max_concurrency: Settlement transactions sent at the same time
+        clock: Wall-clock time source, in seconds, stored in the ledger
+    """
+
+    def __init__(
+        self,
+        wallet_client: EVMWalletClient,
+        path: str = ":memory:",
+        window: float = 5.0,
+        max_amount: Optional[int] = None,
+        max_payments: int = 1_000,
+        max_concurrency: int = 8,
+        clock: Callable[[], float] = time.time,
+    ):
+        if max_payments < 1:
+            raise ValueError("max_payments must be at least 1")
+        if path != ":memory:":
+            path = os.path.expanduser(path)
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        self.wallet_client = wallet_client
+        self.path = path
+        self.window = window
+        self.max_amount = max_amount
+        self.max_payments = max_payments
+        self._clock = clock
+        self._sender = wallet_client.get_address().lower()
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="radius-settlement")
+        self._settler: Optional[threading.Thread] = None
+        self._closed = False
+        self._in_flight = 0
+        self._counters = {"payments": 0, "settlements": 0, "settled_payments": 0, "failed": 0}
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.executescript(
+            "CREATE TABLE IF NOT EXISTS payments ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, sender TEXT NOT NULL, recipient TEXT NOT NULL, "
+            "amount TEXT NOT NULL, created_at REAL NOT NULL, status TEXT NOT NULL, "
+            "settlement_id INTEGER, error TEXT);"
+            "CREATE INDEX IF NOT EXISTS payments_pending ON payments (sender, status, recipient);"
+            "CREATE TABLE IF NOT EXISTS settlements ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, sender TEXT NOT NULL, recipient TEXT NOT NULL, "
+            "amount TEXT NOT NULL, payments INTEGER NOT NULL, created_at REAL NOT NULL, "
+            "status TEXT NOT NULL, tx_hash TEXT, error TEXT);"
+        )
+        self._connection.commit()
+        (self._in_doubt,) = self._connection.execute(
+            "SELECT COUNT(*) FROM settlements WHERE sender = ? AND status = ?", (self._sender, SETTLING)
+        ).fetchone()
+        self._pending: Dict[str, _Recipient] = {}
+        for recipient, amount, created_at in self._connection.execute(
+            "SELECT recipient, amount, created_at FROM payments WHERE sender = ? AND status = ? ORDER BY id",
+            (self._sender, PENDING),
+        ):
+            self._add_pending(recipient, int(amount), created_at)
+        if self._pending:
+            self._start()
+
+    def submit(self, to: str, amount: int) -> PaymentReceipt:
+        """
+        Records a payment to be settled with others to the same recipient.
+
+        Args:
+            to: The recipient address
+            amount: The amount, in wei
+
+        Returns:
+            The payment's receipt, ``pending`` until its settlement is sent
+
+        Raises:
+            ValueError: If the amount is not positive
+            RuntimeError: If the aggregator is closed
+        """
+        if amount <= 0:
+            raise ValueError("Payment amount must be positive")
+        recipient = self.wallet_client.resolve_address(to)
+        now = self._clock()
+        with self._changed:
+            if self._closed:
+                raise RuntimeError("The payment aggregator is closed")
+            cursor = self._connection.execute(
+                "INSERT INTO payments (sender, recipient, amount, created_at, status) VALUES (?, ?, ?, ?, ?)",
+                (self._sender, recipient, str(amount), now, PENDING),
+            )
+            self._connection.commit()
+            self._counters["payments"] += 1
+            self._add_pending(recipient, amount, now)
+            self._start()
+            self._changed.notify_all()
+            payment_id = int(cursor.lastrowid or 0)
+        return {
+            "paymentId": payment_id,
+            "to": recipient,
+            "amount": str(amount),
+            "status": PENDING,
+            "transactionHash": None,
+            "settlementId": None,
+            "error": None,
+        }
+
+    def pay(self, to: str, amount: int, timeout: Optional[float] = None) -> PaymentReceipt:
+        """
+        Records a payment and waits until it is settled or fails.
+
+        Returns:
+            The payment's receipt
+
+        Raises:
+            TimeoutError: If the payment is not settled within ``timeout`` seconds
+        """
+        payment_id = self.submit(to, amount)["paymentId"]
+        return self.wait(payment_id, timeout)
+
+    def wait(self, payment_id: int, timeout: Optional[float] = None) -> PaymentReceipt:
+        """
+        Waits until a payment is settled or fails.
+
+        Raises:
+            KeyError: If the ledger has no such payment
+            TimeoutError: If the payment is not settled within ``timeout`` seconds
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._changed:
+            while True:
+                receipt = self._receipt(payment_id)
+                if receipt["status"] in (SETTLED, FAILED):
+                    return receipt
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError(f"Payment {payment_id} was not settled within {timeout} seconds")
+                self._changed.wait(remaining)
+
+    def receipt(self, payment_id: int) -> PaymentReceipt:
+        """
+        Returns the current state of a payment.
+
+        Raises:
+            KeyError: If the ledger has no such payment
+        """
+        with self._lock:
+            return self._receipt(payment_id)
+
+    def flush(self) -> None:
+        """Settles every pending payment now and waits for the settlements to complete."""
+        with self._changed:
+            recipients = list(self._pending)
+        self._settle(recipients)
+        with self._changed:
+            while self._in_flight:
+                self._changed.wait()
+
+    def close(self) -> None:
+        """Settles the pending payments and stops the aggregator."""
+        with self._changed:
+            if self._closed:
+                return
+            self._closed = True
+            self._changed.notify_all()
+        if self._settler is not None:
+            self._settler.join()
+        self.flush()
+        self._executor.shutdown()
+        with self._lock:
+            self._connection.close()
+
+    def stats(self) -> PaymentStats:
+        """Returns payment, settlement and pending counters."""
+        with self._lock:
+            return {
+                "payments": self._counters["payments"],
+                "pending": sum(pending.count for pending in self._pending.values()),
+                "pending_amount": sum(pending.amount for pending in self._pending.values()),
+                "settlements": self._counters["settlements"],
+                "settled_payments": self._counters["settled_payments"],
+                "failed": self._counters["failed"],
+                "in_doubt": self._in_doubt,
+            }
+
+    def _add_pending(self, recipient: str, amount: int, created_at: float) -> None:
+        """The caller holds the lock."""
+        pending = self._pending.get(recipient)
+        if pending is None:
+            pending = self._pending[recipient] = _Recipient(created_at)
+        pending.amount += amount
+        pending.count += 1
+
+    def _receipt(self, payment_id: int) -> PaymentReceipt:
+        """The caller holds the lock."""
+        row = self._connection.execute(
+            "SELECT p.recipient, p.amount, p.status, p.settlement_id, s.tx_hash, p.error "
+            "FROM payments p LEFT JOIN settlements s ON s.id = p.settlement_id WHERE p.id = ?",
+            (payment_id,),
+        ).fetchone()
+        if row is None:
+            raise KeyError(f"Unknown payment: {payment_id}")
+        recipient, amount, status, settlement_id, tx_hash, error = row
+        return {
+            "paymentId": payment_id,
+            "to": recipient,
+            "amount": amount,
+            "status": status,
+            "transactionHash": tx_hash if status == SETTLED else None,
+            "settlementId": settlement_id,
+            "error": error,
+        }
+
+    def _start(self) -> None:
+        """Starts the settlement thread if it is not running; the caller holds the lock."""
+        if self._settler is None:
+            self._settler = threading.Thread(target=self._run, name="radius-payment-aggregator", daemon=True)
+            self._settler.start()
+
+    def _run(self) -> None:
+        """Settles recipients as they become due until the aggregator is closed."""
+        while True:
+            with self._changed:
+                if self._closed:
+                    return
+                now = self._clock()
+                due = [recipient for recipient, pending in self._pending.items() if self._is_due(pending, now)]
+                if not due:
+                    oldest = min((pending.oldest for pending in self._pending.values()), default=None)
+                    self._changed.wait(None if oldest is None else max(0.0, oldest + self.window - now))
+                    continue
+            self._settle(due)
+
+    def _is_due(self, pending: _Recipient, now: float) -> bool:
+        return (
+            now - pending.oldest >= self.window
+            or pending.count >= self.max_payments
+            or (self.max_amount is not None and pending.amount >= self.max_amount)
+        )
+
+    def _settle(self, recipients: List[str]) -> None:
+        """Moves the pending payments of recipients into settlements and sends them."""
+        settlements: List[Tuple[int, str, int]] = []
+        with self._changed:
+            now = self._clock()
+            for recipient in recipients:
+                pending = self._pending.pop(recipient, None)
+                if pending is None:
+                    continue
+                cursor = self._connection.execute(
+                    "INSERT INTO settlements (sender, recipient, amount, payments, created_at, status) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (self._sender, recipient, str(pending.amount), pending.count, now, SETTLING),
+                )
+                settlement_id = int(cursor.lastrowid or 0)
+                self._connection.execute(
+                    "UPDATE payments SET status = ?, settlement_id = ? "
+                    "WHERE sender = ? AND recipient = ? AND status = ?",
+                    (SETTLING, settlement_id, self._sender, recipient, PENDING),
+                )
+                settlements.append((settlement_id, recipient, pending.amount))
+            # Recorded before sending, so a crash mid-send cannot lead to paying twice
+            self._connection.commit()
+            self._in_flight += len(settlements)
+        for settlement in settlements:
+            self._executor.submit(self._send, *settlement)
+
+    def _send(self, settlement_id: int, recipient: str, amount: int) -> None:
+        """Sends one settlement transaction and records its outcome."""
+        try:
+            result = self.wallet_client.send_transaction({"to": recipient, "value": amount})
+            error = None
+        except Exception as exception:
+            result, error = None, str(exception)
+
+        with self._changed:
+            if result is not None and result.get("status") == "1":
+                tx_hash = result["hash"] if result["hash"].startswith("0x") else "0x" + result["hash"]
+                self._connection.execute(
+                    "UPDATE settlements SET status = ?, tx_hash = ? WHERE id = ?", (SETTLED, tx_hash, settlement_id)
+                )
+                cursor = self._connection.execute(
+                    "UPDATE payments SET status = ? WHERE settlement_id = ?", (SETTLED, settlement_id)
+                )
+                self._counters["settlements"] += 1
+                self._counters["settled_payments"] += cursor.rowcount
+            else:
+                # A reverted transfer would revert again, and one that raised may have been sent:
+                # either way the payments fail rather than risk paying twice
+                if result is not None:
+                    error = f"Settlement transaction {result.get('hash')} reverted"
+                self._connection.execute(
+                    "UPDATE settlements SET status = ?, error = ? WHERE id = ?", (FAILED, error, settlement_id)
+                )
+                cursor = self._connection.execute(
+                    "UPDATE payments SET status = ?, error = ? WHERE settlement_id = ?",
+                    (FAILED, f"Settlement failed: {error}", settlement_id),
+                )
+                self._counters["failed"] += cursor.rowcount
+            self._connection.commit()
+            self._in_flight -= 1
+            self._changed.notify_all()
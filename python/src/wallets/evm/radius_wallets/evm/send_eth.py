@@ -1,5 +1,5 @@
 from decimal import Decimal
-from typing import Dict, List, cast, TypedDict
+from typing import Any, Dict, List, Optional, cast, TypedDict
 
 from pydantic import BaseModel, Field
 
@@ -8,6 +8,7 @@ from radius.classes.tool_base import ToolBase, create_tool
 from radius.types.chain import Chain
 
 from .evm_smart_wallet_client import EVMWalletClient
+from .payments import PaymentAggregator, PaymentReceipt
 
 class NativeCurrency(TypedDict):
     name: str       # Name of the native token
@@ -31,9 +32,25 @@ class SendETHParameters(BaseModel):
     amount: str = Field(description="The amount of ETH to send")
 
 
+class GetPaymentParameters(BaseModel):
+    payment_id: int = Field(description="The payment ID returned when the payment was sent")
+
+
 class SendETHPlugin(PluginBase[EVMWalletClient]):
-    def __init__(self):
+    """
+    Plugin providing the native token send tool.
+
+    With an ``aggregator``, sends are recorded as payments and settled in batches by the
+    aggregator: the send tool returns a pending payment receipt at once, and a
+    ``get_payment_receipt`` tool reports each payment's settlement transaction.
+
+    Args:
+        aggregator: Payment aggregator settling sends from the wallet the tools are built for
+    """
+
+    def __init__(self, aggregator: Optional[PaymentAggregator] = None):
         super().__init__("sendETH", [])
+        self.aggregator = aggregator
 
     def supports_chain(self, chain: Chain) -> bool:
         # We only support Radius
@@ -41,21 +58,56 @@ class SendETHPlugin(PluginBase[EVMWalletClient]):
 
     def get_tools(self, wallet_client: EVMWalletClient) -> List[ToolBase]:
         chain_token = get_chain_token(wallet_client.get_chain()["id"])
+        aggregator = self.aggregator
+        if aggregator is None:
+            send_tool = create_tool(
+                config={
+                    "name": f"send_{chain_token['symbol']}",
+                    "description": f"Send {chain_token['symbol']} to an address.",
+                    "parameters": SendETHParameters,
+                    "tags": ["write", "native"],
+                    "wallet_client": wallet_client,
+                },
+                execute_fn=lambda params: send_eth_method(
+                    wallet_client, cast(Dict[str, str], params)
+                ),
+            )
+            return [send_tool]
+
+        if aggregator.wallet_client is not wallet_client:
+            raise ValueError("The payment aggregator must be created with the wallet client the tools are built for")
         send_tool = create_tool(
             config={
                 "name": f"send_{chain_token['symbol']}",
-                "description": f"Send {chain_token['symbol']} to an address.",
+                "description": (
+                    f"Send {chain_token['symbol']} to an address. Payments are settled in batches; "
+                    "returns a payment receipt whose status is pending until settled."
+                ),
                 "parameters": SendETHParameters,
+                "tags": ["write", "native"],
+                "wallet_client": wallet_client,
             },
-            execute_fn=lambda params: send_eth_method(
-                wallet_client, cast(Dict[str, str], params)
+            execute_fn=lambda params: aggregate_send_eth_method(
+                aggregator, cast(Dict[str, str], params)
             ),
         )
-        return [send_tool]
+        receipt_tool = create_tool(
+            config={
+                "name": "get_payment_receipt",
+                "description": (
+                    f"Get the status of a {chain_token['symbol']} payment and the transaction that settled it."
+                ),
+                "parameters": GetPaymentParameters,
+                "tags": ["read", "native"],
+                "wallet_client": wallet_client,
+            },
+            execute_fn=lambda params: aggregator.receipt(cast(Dict[str, Any], params)["payment_id"]),
+        )
+        return [send_tool, receipt_tool]
 
 
-def send_eth() -> SendETHPlugin:
-    return SendETHPlugin()
+def send_eth(aggregator: Optional[PaymentAggregator] = None) -> SendETHPlugin:
+    return SendETHPlugin(aggregator)
 
 
 def send_eth_method(wallet_client: EVMWalletClient, parameters: Dict[str, str]) -> str:
@@ -73,6 +125,14 @@ def send_eth_method(wallet_client: EVMWalletClient, parameters: Dict[str, str])
         chain_token = get_chain_token(wallet_client.get_chain()["id"])
         raise Exception(f"Failed to send {chain_token['symbol']}: {str(error)}")
 
+def aggregate_send_eth_method(aggregator: PaymentAggregator, parameters: Dict[str, str]) -> PaymentReceipt:
+    try:
+        amount = int(Decimal(parameters["amount"]) * Decimal("1e18"))
+        return aggregator.submit(parameters["to"], amount)
+    except Exception as error:
+        chain_token = get_chain_token(aggregator.wallet_client.get_chain()["id"])
+        raise Exception(f"Failed to send {chain_token['symbol']}: {str(error)}")
+
 def get_chain_token(chain_id: int) -> Dict[str, str | int]:
     """
     Get information about the Radius chain's native token.
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Optional, TypedDict, Union
 from typing_extensions import NotRequired
 
 from eth_typing import HexStr
@@ -10,6 +10,7 @@ class PaymasterOptions(TypedDict):
 
 class EVMTransactionOptions(TypedDict):
     paymaster: NotRequired[PaymasterOptions]
+    sender: NotRequired[str]  # hex address; pins the sending account of a pooled wallet
 
 
 class EVMTransaction(TypedDict):
@@ -33,6 +34,23 @@ class EVMReadResult(TypedDict):
     value: Any
 
 
+class EVMLogFilter(TypedDict):
+    fromBlock: int
+    toBlock: int
+    address: NotRequired[Union[str, List[str]]]  # hex address(es)
+    topics: NotRequired[List[Optional[Union[str, List[str]]]]]  # hex topics; None matches any
+
+
+class EVMLog(TypedDict):
+    address: str
+    topics: List[str]  # hex
+    data: str  # hex
+    blockNumber: int
+    transactionHash: str
+    logIndex: int
+    timestamp: NotRequired[int]  # block timestamp, when the node includes it
+
+
 class TypedDataDomain(TypedDict):
     name: NotRequired[str]
     version: NotRequired[str]
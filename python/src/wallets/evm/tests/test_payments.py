@@ -0,0 +1,127 @@
+"""
+Tests for the micropayment aggregator.
+"""
+import threading
+
+import pytest
+
+from radius_wallets.evm import PaymentAggregator, send_eth
+
+ALICE = "0x" + "a1" * 20
+BOB = "0x" + "b2" * 20
+
+
+def record_sends(wallet_client, outcome="1"):
+    """Makes a mock wallet record the transactions it sends, optionally reverting or raising."""
+    wallet_client.sent = []
+    lock = threading.Lock()
+
+    def send_transaction(transaction):
+        with lock:
+            wallet_client.sent.append(transaction)
+            number = len(wallet_client.sent)
+        if outcome == "error":
+            raise ConnectionError("receipt timeout")
+        return {"hash": f"{number:064x}", "status": outcome}
+
+    wallet_client.send_transaction = send_transaction
+    return wallet_client
+
+
+@pytest.fixture
+def wallet(mock_evm_wallet_client):
+    """Fixture that provides a wallet recording the transactions sent."""
+    return record_sends(mock_evm_wallet_client)
+
+
+def test_payments_are_netted_per_recipient(wallet):
+    """Test that payments to one recipient settle as one transfer of their total, referenced by each receipt."""
+    aggregator = PaymentAggregator(wallet, window=60)
+    alice = [aggregator.submit(ALICE, 10) for _ in range(5)]
+    bob = aggregator.submit(BOB, 7)
+
+    assert all(receipt["status"] == "pending" for receipt in alice)
+    assert aggregator.stats()["pending_amount"] == 57
+    aggregator.flush()
+
+    assert sorted((tx["to"], tx["value"]) for tx in wallet.sent) == [(ALICE, 50), (BOB, 7)]
+    receipts = [aggregator.receipt(receipt["paymentId"]) for receipt in alice]
+    assert {receipt["status"] for receipt in receipts} == {"settled"}
+    assert len({receipt["transactionHash"] for receipt in receipts}) == 1
+    assert aggregator.receipt(bob["paymentId"])["transactionHash"] != receipts[0]["transactionHash"]
+    stats = aggregator.stats()
+    assert stats["settlements"] == 2
+    assert stats["settled_payments"] == 6
+    assert stats["pending"] == 0
+    aggregator.close()
+
+
+def test_thresholds_trigger_settlement(wallet):
+    """Test that a recipient is settled once its window, amount or count threshold is reached."""
+    aggregator = PaymentAggregator(wallet, window=0.05, max_amount=100, max_payments=3)
+
+    by_amount = aggregator.pay(ALICE, 100, timeout=5)
+    by_count = [aggregator.submit(BOB, 1) for _ in range(3)]
+    by_window = aggregator.pay(ALICE, 1, timeout=5)
+
+    assert by_amount["status"] == "settled"
+    assert aggregator.wait(by_count[0]["paymentId"], timeout=5)["status"] == "settled"
+    assert by_window["status"] == "settled"
+    assert sorted((tx["to"], tx["value"]) for tx in wallet.sent) == [(ALICE, 1), (ALICE, 100), (BOB, 3)]
+    aggregator.close()
+
+
+@pytest.mark.parametrize("outcome", ["0", "error"])
+def test_failed_settlements_fail_their_payments(mock_evm_wallet_client, outcome):
+    """Test that payments of a reverted or raising settlement fail instead of being sent again."""
+    wallet = record_sends(mock_evm_wallet_client, outcome)
+    aggregator = PaymentAggregator(wallet, window=60)
+    payments = [aggregator.submit(ALICE, 5) for _ in range(2)]
+
+    aggregator.flush()
+
+    receipts = [aggregator.receipt(payment["paymentId"]) for payment in payments]
+    assert {receipt["status"] for receipt in receipts} == {"failed"}
+    assert all(receipt["error"] and receipt["transactionHash"] is None for receipt in receipts)
+    assert len(wallet.sent) == 1
+    assert aggregator.stats()["failed"] == 2
+    aggregator.close()
+
+
+def test_ledger_survives_restarts(wallet, tmp_path):
+    """Test that pending payments are settled by the next aggregator opened on the ledger."""
+    path = str(tmp_path / "payments" / "ledger.db")
+    first = PaymentAggregator(wallet, path=path, window=60)
+    payment = first.submit(ALICE, 3)
+    first.submit(ALICE, 4)
+    # Stops without settling, as a crashed process would
+    first._closed = True
+
+    second = PaymentAggregator(wallet, path=path, window=60)
+    assert second.stats()["pending_amount"] == 7
+    second.close()
+
+    assert [(tx["to"], tx["value"]) for tx in wallet.sent] == [(ALICE, 7)]
+    assert second.stats()["in_doubt"] == 0
+    third = PaymentAggregator(wallet, path=path)
+    assert third.receipt(payment["paymentId"])["status"] == "settled"
+    third.close()
+
+
+def test_send_tool_submits_to_the_aggregator(wallet, mock_evm_smart_wallet_client):
+    """Test that the send tool returns a pending receipt and the receipt tool its settlement."""
+    aggregator = PaymentAggregator(wallet, window=60)
+    tools = {tool.name: tool for tool in send_eth(aggregator).get_tools(wallet)}
+
+    receipt = tools["send_ETH"].execute({"to": ALICE, "amount": "0.000001"})
+    assert receipt["status"] == "pending"
+    assert receipt["amount"] == str(10**12)
+    aggregator.flush()
+
+    settled = tools["get_payment_receipt"].execute({"payment_id": receipt["paymentId"]})
+    assert settled["status"] == "settled"
+    assert settled["transactionHash"].startswith("0x")
+    assert tools["get_payment_receipt"].side_effect == "read"
+    with pytest.raises(ValueError):
+        send_eth(aggregator).get_tools(mock_evm_smart_wallet_client)
+    aggregator.close()
@@ -1,5 +1,84 @@
-from .wallet import Web3EVMWalletClient, Web3Options
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .wallet import Web3EVMWalletClient, Web3Options, web3
+    from .cache import RPCCache, RPCCacheStats
+    from .heads import HeadSubscription
+    from .nonce import NonceManager
+    from .multi_endpoint import MultiEndpointProvider, EndpointStats
+    from .pool import Web3WalletPool, PoolStats, web3_pool
+    from .host import Web3WalletHost, WalletHostStats
+    from .batching import BatchingProvider, BatchingStats
+    from .http_provider import CodecHTTPProvider
+    from .gas import GasEstimateCache, GasCacheStats
+    from .typed_data import TypedDataEncoder, TypedDataStats
+    from .signing import SigningPool, SigningPoolStats
 
 __version__ = "1.0.0"
 
-__all__ = ["Web3EVMWalletClient", "Web3Options"]
+# Resolved on first access (PEP 562) so the web3/eth_account stack is only imported when used.
+_LAZY_ATTRIBUTES = {
+    "Web3EVMWalletClient": ".wallet",
+    "Web3Options": ".wallet",
+    "web3": ".wallet",
+    "RPCCache": ".cache",
+    "RPCCacheStats": ".cache",
+    "HeadSubscription": ".heads",
+    "NonceManager": ".nonce",
+    "MultiEndpointProvider": ".multi_endpoint",
+    "EndpointStats": ".multi_endpoint",
+    "Web3WalletPool": ".pool",
+    "PoolStats": ".pool",
+    "web3_pool": ".pool",
+    "Web3WalletHost": ".host",
+    "WalletHostStats": ".host",
+    "BatchingProvider": ".batching",
+    "BatchingStats": ".batching",
+    "CodecHTTPProvider": ".http_provider",
+    "GasEstimateCache": ".gas",
+    "GasCacheStats": ".gas",
+    "TypedDataEncoder": ".typed_data",
+    "TypedDataStats": ".typed_data",
+    "SigningPool": ".signing",
+    "SigningPoolStats": ".signing",
+}
+
+__all__ = [
+    "Web3EVMWalletClient",
+    "Web3Options",
+    "web3",
+    "RPCCache",
+    "RPCCacheStats",
+    "HeadSubscription",
+    "NonceManager",
+    "MultiEndpointProvider",
+    "EndpointStats",
+    "Web3WalletPool",
+    "PoolStats",
+    "web3_pool",
+    "Web3WalletHost",
+    "WalletHostStats",
+    "BatchingProvider",
+    "BatchingStats",
+    "CodecHTTPProvider",
+    "GasEstimateCache",
+    "GasCacheStats",
+    "TypedDataEncoder",
+    "TypedDataStats",
+    "SigningPool",
+    "SigningPoolStats",
+]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
@@ -0,0 +1,193 @@
+import threading
+from concurrent.futures import Future
+from typing import Any, List, Optional, Tuple, TypedDict, Union
+
+from web3.providers.base import BaseProvider, JSONBaseProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+from .http_provider import CodecHTTPProvider
+
+# Sent on their own: batch members may be processed in any order, which would break the nonce
+# order of transactions from one sender
+UNBATCHED_METHODS = frozenset({
+    "eth_sendRawTransaction",
+    "eth_sendTransaction",
+    "eth_subscribe",
+    "eth_unsubscribe",
+})
+
+
+class BatchingStats(TypedDict):
+    """
+    Counters of a batching provider
+
+    Attributes:
+        requests: Requests received
+        round_trips: Requests sent to the wrapped provider, batches counting once
+        batches: Batch requests sent
+        batched_requests: Requests sent as part of a batch
+        max_batch_size: Largest batch sent
+    """
+
+    requests: int
+    round_trips: int
+    batches: int
+    batched_requests: int
+    max_batch_size: int
+
+
+class _Batch:
+    """Requests collected within one window, answered together."""
+
+    def __init__(self) -> None:
+        self.requests: List[Tuple[RPCEndpoint, Any]] = []
+        self.futures: List["Future[RPCResponse]"] = []
+        self.full = threading.Event()
+
+
+class BatchingProvider(JSONBaseProvider):
+    """
+    web3 provider sending requests that arrive close together as one JSON-RPC 2.0 batch.
+
+    The first request of a batch waits up to ``window`` seconds for requests from other threads
+    (concurrent tool calls, the lookups of parallel transactions, ...). The batch is then sent
+    as a single request to the wrapped provider, and each caller receives its own response. A
+    batch is sent as soon as it holds ``max_batch_size`` requests. Transactions
+    (:data:`UNBATCHED_METHODS`) are always sent on their own.
+
+    Batches built explicitly with web3's ``w3.batch_requests()`` are passed through, split into
+    batches of at most ``max_batch_size`` requests.
+
+    If the wrapped provider cannot send batches, requests are sent one by one.
+
+    Example:
+        ```python
+        provider = BatchingProvider("https://rpc.example.com", window=0.002, max_batch_size=50)
+        wallet = web3(Web3(provider), Web3Options(account=account))
+        print(provider.stats())
+        ```
+
+    Args:
+        provider: RPC URL (wrapped in :class:`CodecHTTPProvider`) or a provider supporting ``make_batch_request``
+        window: Seconds the first request of a batch waits for others; 0 disables automatic batching
+        max_batch_size: Maximum number of requests per batch
+        request_timeout: Timeout, in seconds, for requests to a provider given as a URL
+    """
+
+    def __init__(
+        self,
+        provider: Union[str, BaseProvider],
+        window: float = 0.002,
+        max_batch_size: int = 50,
+        request_timeout: float = 10.0,
+    ):
+        super().__init__()
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        if isinstance(provider, str):
+            provider = CodecHTTPProvider(provider, request_kwargs={"timeout": request_timeout})
+        self.provider = provider
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self._lock = threading.Lock()
+        self._pending: Optional[_Batch] = None
+        self._counters = {"requests": 0, "round_trips": 0, "batches": 0, "batched_requests": 0, "max_batch_size": 0}
+
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        if self.window <= 0 or method in UNBATCHED_METHODS:
+            with self._lock:
+                self._counters["requests"] += 1
+            return self._send_one(method, params)
+
+        future: "Future[RPCResponse]" = Future()
+        with self._lock:
+            self._counters["requests"] += 1
+            batch = self._pending
+            leader = batch is None
+            if batch is None:
+                batch = self._pending = _Batch()
+            batch.requests.append((method, params))
+            batch.futures.append(future)
+            full = len(batch.requests) >= self.max_batch_size
+            if full:
+                self._pending = None
+
+        if full:
+            batch.full.set()
+            self._flush(batch)
+        elif leader:
+            batch.full.wait(self.window)
+            with self._lock:
+                owner = self._pending is batch
+                if owner:
+                    self._pending = None
+            if owner:
+                self._flush(batch)
+        return future.result()
+
+    def make_batch_request(self, requests: List[Tuple[RPCEndpoint, Any]]) -> Union[List[RPCResponse], RPCResponse]:
+        with self._lock:
+            self._counters["requests"] += len(requests)
+        responses: List[RPCResponse] = []
+        for start in range(0, len(requests), self.max_batch_size):
+            chunk = self._send_batch(requests[start:start + self.max_batch_size])
+            if not isinstance(chunk, list):
+                # The node rejected the batch as a whole
+                return chunk
+            responses.extend(chunk)
+        return responses
+
+    def is_connected(self, show_traceback: bool = False) -> bool:
+        return self.provider.is_connected(show_traceback)
+
+    def stats(self) -> BatchingStats:
+        """Returns request, round trip and batch size counters."""
+        with self._lock:
+            return {
+                "requests": self._counters["requests"],
+                "round_trips": self._counters["round_trips"],
+                "batches": self._counters["batches"],
+                "batched_requests": self._counters["batched_requests"],
+                "max_batch_size": self._counters["max_batch_size"],
+            }
+
+    def _flush(self, batch: _Batch) -> None:
+        """Sends a collected batch and hands each caller its response."""
+        try:
+            if len(batch.requests) == 1:
+                responses: Union[List[RPCResponse], RPCResponse] = [self._send_one(*batch.requests[0])]
+            else:
+                responses = self._send_batch(batch.requests)
+        except BaseException as error:
+            for future in batch.futures:
+                future.set_exception(error)
+            return
+        if not isinstance(responses, list):
+            responses = [responses] * len(batch.futures)
+        elif len(responses) != len(batch.futures):
+            error = ValueError(f"Batch of {len(batch.futures)} requests got {len(responses)} responses")
+            for future in batch.futures:
+                future.set_exception(error)
+            return
+        for future, response in zip(batch.futures, responses):
+            future.set_result(response)
+
+    def _send_one(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        with self._lock:
+            self._counters["round_trips"] += 1
+        return self.provider.make_request(method, params)
+
+    def _send_batch(self, requests: List[Tuple[RPCEndpoint, Any]]) -> Union[List[RPCResponse], RPCResponse]:
+        make_batch_request = getattr(self.provider, "make_batch_request", None)
+        try:
+            if make_batch_request is None:
+                raise NotImplementedError
+            responses = make_batch_request(requests)
+        except NotImplementedError:
+            return [self._send_one(method, params) for method, params in requests]
+        with self._lock:
+            self._counters["round_trips"] += 1
+            self._counters["batches"] += 1
+            self._counters["batched_requests"] += len(requests)
+            self._counters["max_batch_size"] = max(self._counters["max_batch_size"], len(requests))
+        return responses
@@ -0,0 +1,276 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Optional, Tuple, TypedDict
+
+from web3.middleware.base import Web3Middleware
+
+if TYPE_CHECKING:
+    from web3 import Web3
+    from web3.types import MakeRequestFn, RPCEndpoint, RPCResponse
+
+# Read-only methods that may be served from the cache, mapped to the index of their block
+# parameter (None for methods whose result does not depend on the block)
+CACHEABLE_METHODS = {
+    "eth_call": 1,
+    "eth_getBalance": 1,
+    "eth_getCode": 1,
+    "eth_chainId": None,
+}
+
+# Methods that change chain state as seen by this client
+INVALIDATING_METHODS = frozenset({"eth_sendTransaction", "eth_sendRawTransaction"})
+
+# Block tags whose result moves with the chain head
+_HEAD_TAGS = frozenset({"latest", "safe", "finalized"})
+
+
+class RPCCacheStats(TypedDict):
+    """
+    Counters describing the effectiveness of an RPC cache
+
+    Attributes:
+        hits: Requests served from the cache
+        misses: Cacheable requests that went to the node
+        evictions: Entries dropped to stay within the size bound
+        invalidations: Times head-dependent entries were invalidated (new block or sent transaction)
+        size: Entries currently held
+        hit_rate: hits / (hits + misses), or 0.0 before any cacheable request
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    size: int
+    hit_rate: float
+
+
+@dataclass
+class _Entry:
+    response: Any
+    # Head generation the entry was read at, or None for results that never go stale
+    generation: Optional[int]
+    stored_at: float
+
+
+class RPCCache:
+    """
+    Block-aware LRU cache for idempotent JSON-RPC reads.
+
+    Responses are keyed by method, params and block tag. Results read at a specific block
+    (a block number or hash) and the chain id never go stale. Results read at the chain head
+    ("latest") are dropped as soon as a new block is observed or a transaction is sent through
+    the cache. The head is learned from ``eth_blockNumber`` responses, from :meth:`observe_block`
+    and, when a head-tagged entry is about to be served, by checking ``eth_blockNumber`` at most
+    once per ``block_poll_interval``.
+
+    A single cache may be shared by several wallet clients connected to the same node.
+
+    Args:
+        max_entries: Maximum number of cached responses; least recently used entries are evicted first
+        block_poll_interval: Seconds a head check stays valid before head-tagged entries are
+            re-validated against ``eth_blockNumber``; None trusts :meth:`observe_block` alone
+        max_age: Optional upper bound in seconds on the age of head-tagged entries
+        clock: Monotonic time source, in seconds
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        block_poll_interval: Optional[float] = 1.0,
+        max_age: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.block_poll_interval = block_poll_interval
+        self.max_age = max_age
+        self._clock = clock
+        self._entries: "OrderedDict[Tuple[str, str], _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._block_number: Optional[int] = None
+        self._head_checked_at: Optional[float] = None
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @property
+    def block_number(self) -> Optional[int]:
+        """The most recent block number observed, if any."""
+        return self._block_number
+
+    def observe_block(self, block_number: int) -> None:
+        """
+        Records the current chain head, invalidating head-tagged entries if it moved.
+
+        Args:
+            block_number: The latest block number
+        """
+        with self._lock:
+            self._head_checked_at = self._clock()
+            if block_number == self._block_number:
+                return
+            # Any change invalidates head reads: a new block, a lower number after a reorg, or the
+            # first head seen, since earlier reads were taken at an unknown block
+            self._invalidate_head()
+            self._block_number = block_number
+
+    def invalidate(self) -> None:
+        """Invalidates all head-tagged entries, e.g. after a transaction was sent."""
+        with self._lock:
+            self._invalidate_head()
+
+    def clear(self) -> None:
+        """Drops every entry and resets the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = self._invalidations = 0
+
+    def stats(self) -> RPCCacheStats:
+        """Returns hit, miss and eviction counters for the cache."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+                "size": len(self._entries),
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+            }
+
+    def middleware(self, w3: "Web3") -> "RPCCacheMiddleware":
+        """Builds the web3 middleware serving requests from this cache."""
+        return RPCCacheMiddleware(w3, self)
+
+    def request(self, make_request: "MakeRequestFn", method: "RPCEndpoint", params: Any) -> "RPCResponse":
+        """
+        Serves a JSON-RPC request from the cache, forwarding it to ``make_request`` on a miss.
+
+        Args:
+            make_request: The next request function (middleware or provider)
+            method: The JSON-RPC method
+            params: The JSON-RPC params
+
+        Returns:
+            The JSON-RPC response
+        """
+        if method in INVALIDATING_METHODS:
+            try:
+                return make_request(method, params)
+            finally:
+                self.invalidate()
+
+        if method not in CACHEABLE_METHODS:
+            response = make_request(method, params)
+            self._observe_response(method, params, response)
+            return response
+
+        block = _block_parameter(method, params)
+        if block == "pending":
+            return make_request(method, params)
+        head_dependent = isinstance(block, str) and block in _HEAD_TAGS
+        key = (method, _params_key(params))
+
+        if head_dependent and self._head_check_due():
+            self._check_head(make_request)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._is_fresh(entry):
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry.response
+            if entry is not None:
+                del self._entries[key]
+            self._misses += 1
+            generation = self._generation
+
+        response = make_request(method, params)
+        if "result" not in response:
+            return response
+
+        with self._lock:
+            # Skip storing if the head moved while the request was in flight
+            if head_dependent and generation != self._generation:
+                return response
+            self._entries[key] = _Entry(
+                response=response,
+                generation=generation if head_dependent else None,
+                stored_at=self._clock(),
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        return response
+
+    def _is_fresh(self, entry: _Entry) -> bool:
+        if entry.generation is None:
+            return True
+        if entry.generation != self._generation:
+            return False
+        return self.max_age is None or self._clock() - entry.stored_at <= self.max_age
+
+    def _head_check_due(self) -> bool:
+        if self.block_poll_interval is None:
+            return False
+        checked_at = self._head_checked_at
+        return checked_at is None or self._clock() - checked_at >= self.block_poll_interval
+
+    def _check_head(self, make_request: "MakeRequestFn") -> None:
+        method = "eth_blockNumber"
+        self._observe_response(method, [], make_request(method, []))  # type: ignore
+
+    def _observe_response(self, method: str, params: Any, response: "RPCResponse") -> None:
+        result = response.get("result")
+        if result is None:
+            return
+        if method == "eth_blockNumber":
+            self.observe_block(_to_int(result))
+        elif method == "eth_getBlockByNumber" and params and params[0] == "latest":
+            self.observe_block(_to_int(result["number"]))
+
+    def _invalidate_head(self) -> None:
+        self._generation += 1
+        self._invalidations += 1
+        stale = [key for key, entry in self._entries.items() if entry.generation is not None]
+        for key in stale:
+            del self._entries[key]
+
+
+class RPCCacheMiddleware(Web3Middleware):
+    """web3 middleware that routes requests through an :class:`RPCCache`."""
+
+    def __init__(self, w3: "Web3", cache: RPCCache):
+        super().__init__(w3)
+        self.cache = cache
+
+    def wrap_make_request(self, make_request: "MakeRequestFn") -> "MakeRequestFn":
+        def middleware(method: "RPCEndpoint", params: Any) -> "RPCResponse":
+            return self.cache.request(make_request, method, params)
+
+        return middleware
+
+
+def _block_parameter(method: str, params: Any) -> Any:
+    index = CACHEABLE_METHODS[method]
+    if index is None:
+        return None
+    if params is not None and len(params) > index:
+        return params[index]
+    return "latest"
+
+
+def _to_int(value: Any) -> int:
+    return value if isinstance(value, int) else int(value, 16)
+
+
+def _params_key(params: Any) -> str:
+    return json.dumps(params, sort_keys=True, default=str)
@@ -0,0 +1,174 @@
+import math
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Hashable, Optional, Tuple, TypedDict
+
+from eth_utils.address import to_checksum_address
+
+# Node errors meaning the gas limit of a transaction was too low
+OUT_OF_GAS_ERRORS = ("out of gas", "intrinsic gas too low", "gas required exceeds")
+
+GasKey = Tuple[str, str, Hashable]
+
+
+class GasCacheStats(TypedDict):
+    """
+    Counters of a gas estimate cache
+
+    Attributes:
+        hits: Transactions sent with a cached estimate, skipping ``eth_estimateGas``
+        misses: Transactions whose gas was estimated by the node
+        out_of_gas: Transactions that ran out of gas with a cached estimate and were sent again
+        evictions: Entries dropped to stay within the size bound
+        size: Entries currently held
+        hit_rate: hits / (hits + misses), or 0.0 before any transaction
+    """
+
+    hits: int
+    misses: int
+    out_of_gas: int
+    evictions: int
+    size: int
+    hit_rate: float
+
+
+@dataclass
+class _Entry:
+    gas: int
+    estimated_at: float
+
+
+class GasEstimateCache:
+    """
+    Reuses gas estimates between structurally identical transactions.
+
+    Agents send the same kinds of transaction over and over, such as ERC-20 ``transfer`` and
+    ``approve`` calls on one token or native sends, and the node's estimate for them barely
+    changes. Estimates are keyed by recipient, function selector (the first four bytes of the
+    call data, empty for native sends) and sender class, and a cached transaction is sent with
+    the largest estimate seen for its key times ``multiplier``, without calling
+    ``eth_estimateGas``.
+
+    Entries are estimated again every ``refresh_interval`` seconds. A transaction that runs out
+    of gas with a cached estimate (rejected by the node, or mined as failed having used all its
+    gas) drops the entry and is sent again with a fresh estimate. That failed attempt still
+    costs gas on chain, so the multiplier should cover the spread between calls: an ERC-20
+    transfer to a new holder costs about 50% more than one to an existing holder.
+
+    All senders share one class by default; pass ``sender_class`` to keep separate estimates,
+    for example for smart contract accounts. A single cache may be shared by several wallet
+    clients connected to the same chain.
+
+    Args:
+        multiplier: Safety factor applied to cached estimates
+        refresh_interval: Seconds after which an entry is estimated again
+        max_entries: Maximum number of cached estimates; least recently used entries are evicted first
+        sender_class: Maps a sender address to the class its estimates are shared with
+        clock: Monotonic time source, in seconds
+    """
+
+    def __init__(
+        self,
+        multiplier: float = 1.25,
+        refresh_interval: float = 300.0,
+        max_entries: int = 1024,
+        sender_class: Optional[Callable[[str], Hashable]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if multiplier < 1:
+            raise ValueError("multiplier must be at least 1")
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.multiplier = multiplier
+        self.refresh_interval = refresh_interval
+        self.max_entries = max_entries
+        self.sender_class = sender_class
+        self._clock = clock
+        self._entries: "OrderedDict[GasKey, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._out_of_gas = 0
+        self._evictions = 0
+
+    def key(self, sender: str, to: str, data: str = "") -> GasKey:
+        """
+        Returns the key estimates for a transaction are shared under.
+
+        Args:
+            sender: The sending address
+            to: The recipient address
+            data: The call data, as a hex string
+        """
+        selector = data[:10].lower() if data and data != "0x" else ""
+        sender_class = self.sender_class(sender) if self.sender_class is not None else None
+        return (to_checksum_address(to), selector, sender_class)
+
+    def get(self, key: GasKey) -> Optional[int]:
+        """
+        Returns the gas limit to send a transaction with, or None if it must be estimated.
+
+        Args:
+            key: The key returned by :meth:`key`
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or self._clock() - entry.estimated_at >= self.refresh_interval:
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return math.ceil(entry.gas * self.multiplier)
+
+    def put(self, key: GasKey, gas: int) -> None:
+        """
+        Records a fresh estimate, keeping the largest estimate seen since the last refresh.
+
+        Args:
+            key: The key returned by :meth:`key`
+            gas: The node's estimate
+        """
+        now = self._clock()
+        with self._lock:
+            self._misses += 1
+            entry = self._entries.get(key)
+            if entry is not None and now - entry.estimated_at < self.refresh_interval:
+                entry.gas = max(entry.gas, gas)
+            else:
+                self._entries[key] = _Entry(gas, now)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, key: GasKey) -> None:
+        """Drops the estimate of a key after a transaction ran out of gas with it."""
+        with self._lock:
+            self._out_of_gas += 1
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drops every entry and resets the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._out_of_gas = self._evictions = 0
+
+    def stats(self) -> GasCacheStats:
+        """Returns hit, miss and out-of-gas counters for the cache."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "out_of_gas": self._out_of_gas,
+                "evictions": self._evictions,
+                "size": len(self._entries),
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+            }
+
+
+def is_out_of_gas_error(error: BaseException) -> bool:
+    """Whether a node error means a transaction's gas limit was too low."""
+    message = str(error).lower()
+    return any(pattern in message for pattern in OUT_OF_GAS_ERRORS)
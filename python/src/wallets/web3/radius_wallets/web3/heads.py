@@ -0,0 +1,203 @@
+import json
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    from websockets.sync.client import connect
+except ImportError:  # pragma: no cover - exercised only without the extra installed
+    connect = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+BlockHeader = Dict[str, Any]
+HeadListener = Callable[[BlockHeader], None]
+LogListener = Callable[[Dict[str, Any]], None]
+
+_NEW_HEADS_REQUEST_ID = 1
+_LOGS_REQUEST_ID = 2
+
+
+class HeadSubscription:
+    """
+    Background ``eth_subscribe`` subscription to new block headers over WebSocket.
+
+    A daemon thread keeps the connection open, reconnecting after failures, and publishes
+    every new head to the registered listeners. Wallet clients use it to resolve receipts as
+    soon as the block containing a transaction arrives and to invalidate their RPC cache,
+    instead of polling the node.
+
+    Example:
+        ```python
+        heads = HeadSubscription("wss://rpc.example.com").start()
+        wallet = web3(w3, Web3Options(head_subscription=heads, rpc_cache=RPCCache()))
+        ```
+
+    Args:
+        endpoint: WebSocket JSON-RPC endpoint of the node
+        logs: Optional ``eth_subscribe`` logs filter (``address``/``topics``); matching logs are
+            published to the log listeners
+        reconnect_delay: Seconds to wait before reconnecting after the connection drops
+        open_timeout: Seconds to wait for the connection and subscription in :meth:`start`
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        logs: Optional[Dict[str, Any]] = None,
+        reconnect_delay: float = 1.0,
+        open_timeout: float = 10.0,
+    ):
+        if connect is None:
+            raise ImportError(
+                "HeadSubscription requires the websockets package. "
+                "Install it with: pip install 'radius-ai-agent-sdk-wallet-web3[websocket]'"
+            )
+        self.endpoint = endpoint
+        self.logs = logs
+        self.reconnect_delay = reconnect_delay
+        self.open_timeout = open_timeout
+        self._head_listeners: List[HeadListener] = []
+        self._log_listeners: List[LogListener] = []
+        self._subscriptions: Dict[str, str] = {}
+        self._block_number: Optional[int] = None
+        self._condition = threading.Condition()
+        self._subscribed = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._connection: Any = None
+
+    @property
+    def block_number(self) -> Optional[int]:
+        """The number of the most recent head received, if any."""
+        return self._block_number
+
+    @property
+    def connected(self) -> bool:
+        """Whether the new heads subscription is currently active."""
+        return self._subscribed.is_set()
+
+    def add_listener(self, listener: HeadListener) -> None:
+        """Registers a callable receiving every new block header."""
+        self._head_listeners.append(listener)
+
+    def add_log_listener(self, listener: LogListener) -> None:
+        """Registers a callable receiving every log matching the ``logs`` filter."""
+        self._log_listeners.append(listener)
+
+    def start(self) -> "HeadSubscription":
+        """
+        Starts the subscription thread and waits until new heads are subscribed.
+
+        Returns:
+            The subscription itself, for chaining
+
+        Raises:
+            ConnectionError: If the subscription is not established within ``open_timeout``
+        """
+        if self._thread is None or not self._thread.is_alive():
+            self._stopping.clear()
+            self._thread = threading.Thread(target=self._run, name="radius-head-subscription", daemon=True)
+            self._thread.start()
+        if not self._subscribed.wait(self.open_timeout):
+            self.stop()
+            raise ConnectionError(f"Failed to subscribe to new heads at {self.endpoint}")
+        return self
+
+    def stop(self) -> None:
+        """Closes the connection and stops the subscription thread."""
+        self._stopping.set()
+        connection = self._connection
+        if connection is not None:
+            connection.close()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=self.open_timeout)
+        self._thread = None
+        with self._condition:
+            self._condition.notify_all()
+
+    def wait_for_block(self, after: Optional[int], timeout: Optional[float] = None) -> Optional[int]:
+        """
+        Blocks until a head other than ``after`` is received.
+
+        Args:
+            after: The last block number already handled by the caller, or None for any block.
+                A lower number (after a reorg) also ends the wait.
+            timeout: Maximum number of seconds to wait
+
+        Returns:
+            The latest block number, or None if the wait timed out or the subscription stopped
+        """
+        def arrived() -> bool:
+            latest = self._block_number
+            return (latest is not None and (after is None or latest != after)) or self._stopping.is_set()
+
+        with self._condition:
+            if not self._condition.wait_for(arrived, timeout) or self._stopping.is_set():
+                return None
+            return self._block_number
+
+    def __enter__(self) -> "HeadSubscription":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                with connect(self.endpoint, open_timeout=self.open_timeout) as connection:
+                    self._connection = connection
+                    self._subscribe(connection)
+                    for message in connection:
+                        self._handle(json.loads(message))
+            except Exception as error:
+                if not self._stopping.is_set():
+                    logger.warning("Head subscription to %s failed: %s", self.endpoint, error)
+            finally:
+                self._connection = None
+                self._subscriptions.clear()
+                self._subscribed.clear()
+            self._stopping.wait(self.reconnect_delay)
+
+    def _subscribe(self, connection: Any) -> None:
+        connection.send(json.dumps(
+            {"jsonrpc": "2.0", "id": _NEW_HEADS_REQUEST_ID, "method": "eth_subscribe", "params": ["newHeads"]}
+        ))
+        if self.logs is not None:
+            connection.send(json.dumps(
+                {"jsonrpc": "2.0", "id": _LOGS_REQUEST_ID, "method": "eth_subscribe", "params": ["logs", self.logs]}
+            ))
+
+    def _handle(self, message: Dict[str, Any]) -> None:
+        if message.get("method") == "eth_subscription":
+            params = message["params"]
+            kind = self._subscriptions.get(params["subscription"])
+            if kind == "newHeads":
+                self._publish_head(params["result"])
+            elif kind == "logs":
+                self._publish(self._log_listeners, params["result"])
+            return
+
+        request_id = message.get("id")
+        if "error" in message:
+            raise ConnectionError(f"Subscription request {request_id} failed: {message['error']}")
+        if request_id == _NEW_HEADS_REQUEST_ID:
+            self._subscriptions[message["result"]] = "newHeads"
+            self._subscribed.set()
+        elif request_id == _LOGS_REQUEST_ID:
+            self._subscriptions[message["result"]] = "logs"
+
+    def _publish_head(self, header: BlockHeader) -> None:
+        # Listeners (e.g. caches) see the head before waiters are woken up
+        self._publish(self._head_listeners, header)
+        with self._condition:
+            self._block_number = int(header["number"], 16)
+            self._condition.notify_all()
+
+    def _publish(self, listeners: List[Callable[[Any], None]], payload: Any) -> None:
+        for listener in listeners:
+            try:
+                listener(payload)
+            except Exception:
+                logger.exception("Head subscription listener failed")
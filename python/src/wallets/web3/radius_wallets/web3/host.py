@@ -0,0 +1,348 @@
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypedDict
+
+from eth_account.signers.local import LocalAccount
+from web3 import Web3
+
+from radius.classes.tool_base import ToolBase
+from radius.classes.wallet_client_base import Balance, Signature
+from radius.types.chain import EvmChain
+from radius.utils.get_tools import get_tools
+from radius_wallets.evm import EVMWalletClient
+from radius_wallets.evm.types import (
+    EVMLog,
+    EVMLogFilter,
+    EVMReadRequest,
+    EVMReadResult,
+    EVMTransaction,
+    EVMTypedData,
+)
+
+from .nonce import NonceManager
+from .wallet import Web3EVMWalletClient, Web3Options
+
+_active_wallet: ContextVar[Optional[Web3EVMWalletClient]] = ContextVar("radius_active_tenant", default=None)
+
+
+class WalletHostStats(TypedDict):
+    """
+    Counters of a wallet host
+
+    Attributes:
+        tenants: Tenants currently held
+        max_tenants: Maximum number of tenants held at once
+        created: Tenant wallets created, including re-creations after eviction
+        hits: Lookups served by a tenant wallet already held
+        evicted: Tenants evicted for being least recently used or idle
+    """
+
+    tenants: int
+    max_tenants: int
+    created: int
+    hits: int
+    evicted: int
+
+
+class _Tenant:
+    """A tenant's wallet and the time it was last used."""
+
+    __slots__ = ("wallet", "last_used")
+
+    def __init__(self, wallet: Web3EVMWalletClient, last_used: float):
+        self.wallet = wallet
+        self.last_used = last_used
+
+
+class Web3WalletHost:
+    """
+    Serves many tenants, each with its own key, from one shared client stack.
+
+    A wallet client per user normally means a ``Web3`` instance, middleware and caches per user,
+    and rebuilding every plugin's tools for each of them. The host keeps a single ``Web3``
+    instance (and so one provider and connection pool), one RPC cache, single-flight group and
+    :class:`NonceManager`, and one toolset built from the plugins. Each tenant only adds a
+    ``Web3EVMWalletClient`` holding its account, which shares all of the above.
+
+    Tenants are created on first use, from the account passed to :meth:`tenant` or returned by
+    ``account_loader``, and held in least-recently-used order. When more than ``max_tenants``
+    are held, or a tenant is unused for ``idle_timeout`` seconds, it is evicted and its tracked
+    nonce dropped; the next use re-creates it and reads the nonce from the node again.
+
+    Example:
+        ```python
+        host = Web3WalletHost(
+            Web3(Web3.HTTPProvider(url)),
+            plugins=[send_eth(), erc20(...)],
+            options=Web3Options(rpc_cache=RPCCache()),
+            account_loader=lambda user_id: Account.from_key(keys.fetch(user_id)),
+            max_tenants=5_000,
+        )
+        tools = host.get_tools("user-42")
+        ```
+
+    Args:
+        web3: Web3 instance shared by every tenant
+        plugins: Plugins whose tools are built once and shared by every tenant
+        options: Options shared by every tenant (``account`` is set per tenant)
+        account_loader: Returns the account of a tenant that is not held
+        max_tenants: Maximum number of tenant wallets held at once
+        idle_timeout: Seconds after which an unused tenant is evicted; ``None`` keeps tenants until
+            ``max_tenants`` is exceeded
+    """
+
+    def __init__(
+        self,
+        web3: Web3,
+        plugins: Optional[List[Any]] = None,
+        options: Optional[Web3Options] = None,
+        account_loader: Optional[Callable[[str], LocalAccount]] = None,
+        max_tenants: int = 1_000,
+        idle_timeout: Optional[float] = None,
+    ):
+        if max_tenants < 1:
+            raise ValueError("max_tenants must be at least 1")
+        self._web3 = web3
+        self.plugins = list(plugins or [])
+        self.account_loader = account_loader
+        self.max_tenants = max_tenants
+        self.idle_timeout = idle_timeout
+        # Installs the RPC cache and resilience middleware on the shared Web3 instance once; it
+        # also serves the reads that do not depend on the tenant
+        self._primary = Web3EVMWalletClient(web3, options)
+        self._paymaster = options.paymaster if options else None
+        self._head_subscription = options.head_subscription if options else None
+        self._gas_cache = options.gas_cache if options else None
+        self.nonce_manager = (options.nonce_manager if options else None) or NonceManager(web3)
+        self.wallet = _TenantRouter(self._primary)
+        self._tools: Optional[List[ToolBase]] = None
+        self._tenants: "OrderedDict[str, _Tenant]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {"created": 0, "hits": 0, "evicted": 0}
+
+    def tenant(self, tenant_id: str, account: Optional[LocalAccount] = None) -> Web3EVMWalletClient:
+        """
+        Returns the wallet client of a tenant, creating it if it is not held.
+
+        Args:
+            tenant_id: Identifies the tenant
+            account: The tenant's account; when omitted, a tenant that is not held is loaded
+                with ``account_loader``
+
+        Returns:
+            The tenant's wallet client, sharing the host's Web3 instance, caches and nonces
+
+        Raises:
+            KeyError: If the tenant is not held and no account can be loaded for it
+        """
+        now = time.monotonic()
+        with self._lock:
+            evicted = self._evict_idle(now)
+            entry = self._tenants.get(tenant_id)
+            if entry is not None and (account is None or entry.wallet.get_address() == account.address):
+                self._tenants.move_to_end(tenant_id)
+                entry.last_used = now
+                self._counters["hits"] += 1
+            else:
+                entry = None
+        self._reset_nonces(evicted)
+        if entry is not None:
+            return entry.wallet
+
+        if account is None:
+            if self.account_loader is None:
+                raise KeyError(f"Tenant {tenant_id} is not held and the host has no account loader")
+            account = self.account_loader(tenant_id)
+        # The RPC cache and resilience middleware were installed on the shared Web3 instance by
+        # the primary client, so tenant requests already go through them
+        wallet = Web3EVMWalletClient(
+            self._web3,
+            Web3Options(
+                paymaster=self._paymaster,
+                head_subscription=self._head_subscription,
+                account=account,
+                nonce_manager=self.nonce_manager,
+                single_flight=self._primary.single_flight,
+                gas_cache=self._gas_cache,
+                typed_data_encoder=self._primary.typed_data_encoder,
+            ),
+        )
+
+        with self._lock:
+            self._counters["created"] += 1
+            self._tenants[tenant_id] = _Tenant(wallet, now)
+            self._tenants.move_to_end(tenant_id)
+            evicted = []
+            while len(self._tenants) > self.max_tenants:
+                evicted.append(self._evict(next(iter(self._tenants))))
+        self._reset_nonces(evicted)
+        return wallet
+
+    def get_tools(self, tenant_id: str) -> List[ToolBase]:
+        """
+        Returns the tools of a tenant.
+
+        The core and plugin tools are built once for the host; each call wraps them in views
+        that act as the tenant when executed and whose ``wallet_client`` is the tenant's wallet,
+        so a :class:`~radius.ToolScheduler` serializes writes per tenant.
+
+        Args:
+            tenant_id: Identifies the tenant, which is created if it is not held
+
+        Returns:
+            The tenant's tools
+        """
+        wallet = self.tenant(tenant_id)
+        return [_TenantTool(tool, wallet) for tool in self.shared_tools()]
+
+    def shared_tools(self) -> List[ToolBase]:
+        """The tools built once for every tenant; they only work inside :meth:`use`."""
+        if self._tools is None:
+            self._tools = get_tools(self.wallet, self.plugins)
+        return self._tools
+
+    @contextmanager
+    def use(self, tenant_id: str) -> Iterator[Web3EVMWalletClient]:
+        """
+        Makes a tenant the one the shared tools act as, in the current thread or task.
+
+        The tenant is kept in a context variable, so it also applies to async tools run on a
+        helper thread and to calls submitted to a ``ToolScheduler`` inside the block.
+
+        Example:
+            ```python
+            with host.use("user-42"):
+                tools["send_ETH"].execute({"to": recipient, "amount": "0.1"})
+            ```
+        """
+        with _activate(self.tenant(tenant_id)) as wallet:
+            yield wallet
+
+    def evict(self, tenant_id: str) -> None:
+        """Drops a tenant's wallet and tracked nonce."""
+        with self._lock:
+            evicted = [self._evict(tenant_id)] if tenant_id in self._tenants else []
+        self._reset_nonces(evicted)
+
+    def stats(self) -> WalletHostStats:
+        """Returns tenant counts and cache counters."""
+        with self._lock:
+            return {
+                "tenants": len(self._tenants),
+                "max_tenants": self.max_tenants,
+                "created": self._counters["created"],
+                "hits": self._counters["hits"],
+                "evicted": self._counters["evicted"],
+            }
+
+    def _evict_idle(self, now: float) -> List[str]:
+        """Evicts tenants unused for longer than the idle timeout; the caller holds the lock."""
+        evicted: List[str] = []
+        if self.idle_timeout is None:
+            return evicted
+        while self._tenants:
+            tenant_id, entry = next(iter(self._tenants.items()))
+            if now - entry.last_used <= self.idle_timeout:
+                break
+            evicted.append(self._evict(tenant_id))
+        return evicted
+
+    def _evict(self, tenant_id: str) -> str:
+        """Drops a tenant and returns its address; the caller holds the lock."""
+        entry = self._tenants.pop(tenant_id)
+        self._counters["evicted"] += 1
+        return entry.wallet.get_address()
+
+    def _reset_nonces(self, addresses: List[str]) -> None:
+        """
+        Drops the tracked nonces of evicted tenants, so they are read again from the node if the
+        tenant comes back. Called without the host lock, as a reset waits for a send in progress.
+        """
+        for address in addresses:
+            self.nonce_manager.reset(address)
+
+
+@contextmanager
+def _activate(wallet: Web3EVMWalletClient) -> Iterator[Web3EVMWalletClient]:
+    token = _active_wallet.set(wallet)
+    try:
+        yield wallet
+    finally:
+        _active_wallet.reset(token)
+
+
+class _TenantRouter(EVMWalletClient):
+    """
+    The wallet client the shared tools are built with.
+
+    Account-specific calls go to the active tenant; reads that do not depend on the account
+    are served by the host's primary client.
+    """
+
+    def __init__(self, primary: Web3EVMWalletClient):
+        super().__init__()
+        self._primary = primary
+
+    def _tenant(self) -> Web3EVMWalletClient:
+        wallet = _active_wallet.get()
+        if wallet is None:
+            raise RuntimeError("No tenant is active; use the tools returned by Web3WalletHost.get_tools")
+        return wallet
+
+    def get_address(self) -> str:
+        return self._tenant().get_address()
+
+    def sign_message(self, message: str) -> Signature:
+        return self._tenant().sign_message(message)
+
+    def sign_typed_data(self, data: EVMTypedData) -> Signature:
+        return self._tenant().sign_typed_data(data)
+
+    def send_transaction(self, transaction: EVMTransaction) -> Dict[str, str]:
+        return self._tenant().send_transaction(transaction)
+
+    def get_chain(self) -> EvmChain:
+        return self._primary.get_chain()
+
+    def resolve_address(self, address: str) -> str:
+        return self._primary.resolve_address(address)
+
+    def read(self, request: EVMReadRequest) -> EVMReadResult:
+        return self._primary.read(request)
+
+    def balance_of(self, address: str) -> Balance:
+        return self._primary.balance_of(address)
+
+    def get_block_number(self) -> int:
+        return self._primary.get_block_number()
+
+    def get_block_timestamp(self, block_number: int) -> int:
+        return self._primary.get_block_timestamp(block_number)
+
+    def get_logs(self, filter: EVMLogFilter) -> List[EVMLog]:
+        return self._primary.get_logs(filter)
+
+    def get_code(self, address: str) -> str:
+        return self._primary.get_code(address)
+
+
+class _TenantTool(ToolBase):
+    """A shared tool executed as one tenant."""
+
+    def __init__(self, tool: ToolBase, wallet: Web3EVMWalletClient):
+        super().__init__({
+            "name": tool.name,
+            "description": tool.description,
+            "parameters": tool.parameters,
+            "tags": tool.tags,
+            "side_effect": tool.side_effect,
+            "wallet_client": wallet,
+        })
+        self._tool = tool
+
+    def execute(self, parameters: Dict[str, Any]) -> Any:
+        with _activate(self.wallet_client):
+            return self._tool.execute(parameters)
@@ -0,0 +1,21 @@
+from web3.providers.rpc import HTTPProvider
+from web3.types import RPCResponse
+
+from radius.utils.json_codec import get_json_codec
+
+
+class CodecHTTPProvider(HTTPProvider):
+    """
+    ``HTTPProvider`` decoding responses with the toolkit's JSON codec.
+
+    web3 decodes each response body to a string and then parses it with the standard library;
+    large responses such as ``eth_getLogs`` results spend most of their client-side time there.
+    This provider parses the raw bytes with :func:`~radius.get_json_codec` instead (orjson when
+    installed). Requests are still encoded by web3, which knows its own types.
+
+    :class:`MultiEndpointProvider` and :class:`BatchingProvider` use it for endpoints given as URLs.
+    """
+
+    @staticmethod
+    def decode_rpc_response(raw_response: bytes) -> RPCResponse:
+        return get_json_codec().loads(raw_response)
@@ -0,0 +1,415 @@
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Deque, Dict, List, Optional, Sequence, Set, Tuple, TypedDict, Union
+
+from web3.providers.base import BaseProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+from ._stats import percentile
+from .http_provider import CodecHTTPProvider
+
+# Methods without side effects, load-balanced by latency and possibly hedged. Their answer does
+# not depend on which node serves them, as long as the node has reached the block they ask about.
+READ_METHODS = frozenset({
+    "eth_blockNumber",
+    "eth_call",
+    "eth_chainId",
+    "eth_estimateGas",
+    "eth_feeHistory",
+    "eth_gasPrice",
+    "eth_getBalance",
+    "eth_getBlockByHash",
+    "eth_getBlockByNumber",
+    "eth_getCode",
+    "eth_getLogs",
+    "eth_getStorageAt",
+    "eth_getTransactionByHash",
+    "eth_getTransactionReceipt",
+    "eth_maxPriorityFeePerGas",
+    "net_version",
+    "web3_clientVersion",
+})
+
+# Pinned methods that are safe to retry on another endpoint: re-sending a signed transaction
+# yields the same hash, and nonce queries have no side effects
+_RETRYABLE_PINNED_METHODS = frozenset({"eth_sendRawTransaction", "eth_getTransactionCount"})
+
+# Lookups by transaction hash, first sent to the endpoint that accepted the transaction
+_TRANSACTION_LOOKUPS = frozenset({"eth_getTransactionReceipt", "eth_getTransactionByHash"})
+
+# Position of the block parameter of reads answered at a block, which is "latest" when omitted
+_BLOCK_PARAMETER = {
+    "eth_call": 1,
+    "eth_estimateGas": 1,
+    "eth_feeHistory": 1,
+    "eth_getBalance": 1,
+    "eth_getBlockByNumber": 0,
+    "eth_getCode": 1,
+    "eth_getStorageAt": 2,
+}
+
+# Transactions whose accepting endpoint is remembered
+_MAX_TRACKED_TRANSACTIONS = 4096
+
+
+class EndpointStats(TypedDict):
+    """
+    Request and latency counters of one endpoint
+
+    Attributes:
+        requests: Requests sent to the endpoint, including hedges
+        failures: Requests that raised (connection errors, timeouts, malformed responses)
+        hedges: Hedged duplicate requests sent to the endpoint
+        healthy: Whether the endpoint is currently used
+        head: Latest block number the endpoint reported, if any
+        ewma_ms: Exponentially weighted moving average of successful request latency
+        p50_ms: Median latency over the recent window
+        p95_ms: 95th percentile latency over the recent window
+        p99_ms: 99th percentile latency over the recent window
+    """
+
+    requests: int
+    failures: int
+    hedges: int
+    healthy: bool
+    head: Optional[int]
+    ewma_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+
+
+class _Endpoint:
+    def __init__(self, name: str, provider: BaseProvider, window: int):
+        self.name = name
+        self.provider = provider
+        self.latencies: Deque[float] = deque(maxlen=window)
+        self.ewma: Optional[float] = None
+        self.requests = 0
+        self.failures = 0
+        self.hedges = 0
+        self.consecutive_failures = 0
+        self.unhealthy_until = 0.0
+        self.head: Optional[int] = None
+        self.head_seen = 0.0
+
+
+class MultiEndpointProvider(BaseProvider):
+    """
+    web3 provider spreading requests over several RPC endpoints of the same chain.
+
+    * Reads (:data:`READ_METHODS`) go to the healthy endpoint with the lowest observed latency.
+      If an answer takes longer than the endpoint's ``hedge_percentile`` latency, a duplicate
+      request is sent to the next best endpoint and the first answer wins.
+    * Reads of the latest block (``eth_blockNumber``, and ``latest`` or ``pending`` reads such
+      as ``eth_call``) and transaction lookups skip endpoints whose last reported head is more
+      than ``max_head_lag`` blocks behind the highest one, so an agent does not see the chain
+      go backwards. Receipt and transaction lookups go first to the endpoint that accepted the
+      transaction.
+    * Writes, nonce queries and any other method are pinned to one healthy endpoint (the first
+      configured one while it is healthy), so a sender's transactions and nonces come from a
+      single node.
+    * Endpoints are checked passively: ``max_failures`` consecutive errors take an endpoint out
+      of rotation for ``cooldown`` seconds, and failed requests fail over to the next endpoint
+      where that is safe.
+
+    Example:
+        ```python
+        provider = MultiEndpointProvider(["https://rpc-1.example.com", "https://rpc-2.example.com"])
+        wallet = web3(Web3(provider), Web3Options(account=account))
+        print(provider.stats())
+        ```
+
+    Args:
+        endpoints: RPC URLs (wrapped in :class:`CodecHTTPProvider`) or ready-made providers
+        hedge: Whether to send hedged duplicates of slow reads
+        hedge_percentile: Latency percentile of the chosen endpoint after which a read is hedged
+        min_hedge_delay: Lower bound, in seconds, on the hedge delay
+        min_samples: Samples an endpoint needs before its percentile is used; until then reads
+            are hedged after ``initial_hedge_delay``
+        initial_hedge_delay: Hedge delay, in seconds, for endpoints without enough samples
+        max_failures: Consecutive failures after which an endpoint is taken out of rotation
+        cooldown: Seconds an unhealthy endpoint stays out of rotation before it is tried again
+        window: Number of recent latency samples kept per endpoint
+        ewma_alpha: Weight of the newest sample in the latency moving average
+        request_timeout: Timeout, in seconds, for requests to endpoints given as URLs
+        max_workers: Threads used for hedged requests
+        max_head_lag: Blocks an endpoint may be behind the highest head and still serve reads
+            of the latest block
+        head_max_age: Seconds after which an endpoint's reported head is no longer trusted, so
+            an endpoint left out for lagging is tried again
+    """
+
+    def __init__(
+        self,
+        endpoints: Sequence[Union[str, BaseProvider]],
+        hedge: bool = True,
+        hedge_percentile: float = 95.0,
+        min_hedge_delay: float = 0.005,
+        min_samples: int = 20,
+        initial_hedge_delay: float = 0.25,
+        max_failures: int = 3,
+        cooldown: float = 10.0,
+        window: int = 256,
+        ewma_alpha: float = 0.2,
+        request_timeout: float = 10.0,
+        max_workers: int = 32,
+        max_head_lag: int = 0,
+        head_max_age: float = 30.0,
+    ):
+        super().__init__()
+        if not endpoints:
+            raise ValueError("At least one endpoint is required")
+        self._endpoints: List[_Endpoint] = []
+        for index, endpoint in enumerate(endpoints):
+            if isinstance(endpoint, str):
+                provider: BaseProvider = CodecHTTPProvider(endpoint, request_kwargs={"timeout": request_timeout})
+                name = endpoint
+            else:
+                provider = endpoint
+                name = getattr(endpoint, "endpoint_uri", None) or f"{type(endpoint).__name__}-{index}"
+            self._endpoints.append(_Endpoint(str(name), provider, window))
+        self.hedge = hedge and len(self._endpoints) > 1
+        self.hedge_percentile = hedge_percentile
+        self.min_hedge_delay = min_hedge_delay
+        self.min_samples = min_samples
+        self.initial_hedge_delay = initial_hedge_delay
+        self.max_failures = max_failures
+        self.cooldown = cooldown
+        self.ewma_alpha = ewma_alpha
+        self.max_head_lag = max_head_lag
+        self.head_max_age = head_max_age
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="radius-rpc-hedge")
+        self._pinned: Optional[_Endpoint] = None
+        # Transaction hash -> endpoint that accepted it
+        self._senders: "OrderedDict[str, _Endpoint]" = OrderedDict()
+
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        if method in READ_METHODS:
+            if method in _TRANSACTION_LOOKUPS:
+                response = self._ask_sender(method, params)
+                if response is not None:
+                    return response
+            return self._read(method, params, _follows_head(method, params))
+        return self._pinned_request(method, params)
+
+    def is_connected(self, show_traceback: bool = False) -> bool:
+        return any(endpoint.provider.is_connected(show_traceback) for endpoint in self._endpoints)
+
+    def stats(self) -> Dict[str, EndpointStats]:
+        """Returns request counts, health and latency percentiles per endpoint."""
+        now = time.monotonic()
+        with self._lock:
+            result: Dict[str, EndpointStats] = {}
+            for endpoint in self._endpoints:
+                latencies = list(endpoint.latencies)
+                result[endpoint.name] = {
+                    "requests": endpoint.requests,
+                    "failures": endpoint.failures,
+                    "hedges": endpoint.hedges,
+                    "healthy": endpoint.unhealthy_until <= now,
+                    "head": endpoint.head,
+                    "ewma_ms": (endpoint.ewma or 0.0) * 1000,
+                    "p50_ms": percentile(latencies, 50) * 1000,
+                    "p95_ms": percentile(latencies, 95) * 1000,
+                    "p99_ms": percentile(latencies, 99) * 1000,
+                }
+            return result
+
+    def close(self) -> None:
+        """Stops the hedging threads."""
+        self._executor.shutdown(wait=False)
+
+    def _read(self, method: RPCEndpoint, params: Any, follow_head: bool = False) -> RPCResponse:
+        tried: Set[int] = set()
+        last_error: Optional[Exception] = None
+        while len(tried) < len(self._endpoints):
+            ranked, usable = self._ranked(exclude=tried, follow_head=follow_head)
+            primary = ranked[0]
+            tried.add(id(primary))
+            try:
+                if self.hedge and usable > 1:
+                    response = self._hedged(primary, ranked[1], method, params, tried)
+                else:
+                    response = self._send(primary, method, params)
+                return response
+            except Exception as error:
+                last_error = error
+        raise ConnectionError(f"All RPC endpoints failed for {method}: {last_error}")
+
+    def _hedged(
+        self, primary: _Endpoint, backup: _Endpoint, method: RPCEndpoint, params: Any, tried: Set[int]
+    ) -> RPCResponse:
+        futures: Dict[Future, _Endpoint] = {self._executor.submit(self._send, primary, method, params): primary}
+        done, _ = wait(futures, timeout=self._hedge_delay(primary))
+        if not done:
+            with self._lock:
+                backup.hedges += 1
+            tried.add(id(backup))
+            futures[self._executor.submit(self._send, backup, method, params)] = backup
+
+        pending = set(futures)
+        last_error: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                error = future.exception()
+                if error is None:
+                    return future.result()
+                last_error = error
+        raise last_error  # type: ignore[misc]
+
+    def _pinned_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        tried: Set[int] = set()
+        while True:
+            endpoint = self._pinned_endpoint(exclude=tried)
+            tried.add(id(endpoint))
+            try:
+                response = self._send(endpoint, method, params)
+            except Exception as error:
+                with self._lock:
+                    if self._pinned is endpoint:
+                        self._pinned = None
+                if method not in _RETRYABLE_PINNED_METHODS or len(tried) == len(self._endpoints):
+                    raise ConnectionError(f"RPC endpoint {endpoint.name} failed for {method}: {error}") from error
+            else:
+                if method == "eth_sendRawTransaction" and isinstance(response.get("result"), str):
+                    self._remember_sender(response["result"], endpoint)
+                return response
+
+    def _pinned_endpoint(self, exclude: Set[int]) -> _Endpoint:
+        now = time.monotonic()
+        with self._lock:
+            pinned = self._pinned
+            if pinned is not None and pinned.unhealthy_until <= now and id(pinned) not in exclude:
+                return pinned
+            candidates = [endpoint for endpoint in self._endpoints if id(endpoint) not in exclude]
+            healthy = [endpoint for endpoint in candidates if endpoint.unhealthy_until <= now]
+            # Configuration order, so writes return to the preferred endpoint once it recovers
+            self._pinned = (healthy or candidates)[0]
+            return self._pinned
+
+    def _ranked(self, exclude: Set[int], follow_head: bool = False) -> Tuple[List[_Endpoint], int]:
+        """
+        Orders the endpoints not in ``exclude`` by preference.
+
+        Returns:
+            The endpoints, and how many of the first ones are healthy (and, with ``follow_head``,
+            not lagging), which are the ones reads may be hedged across
+        """
+        now = time.monotonic()
+        with self._lock:
+            candidates = [endpoint for endpoint in self._endpoints if id(endpoint) not in exclude]
+            healthy = [endpoint for endpoint in candidates if endpoint.unhealthy_until <= now]
+            unhealthy = [endpoint for endpoint in candidates if endpoint.unhealthy_until > now]
+            # Unmeasured endpoints rank first so every endpoint gets latency samples
+            healthy.sort(key=lambda endpoint: endpoint.ewma if endpoint.ewma is not None else -1.0)
+            unhealthy.sort(key=lambda endpoint: endpoint.unhealthy_until)
+            lagging: List[_Endpoint] = []
+            if follow_head:
+                heads = [endpoint.head for endpoint in self._endpoints if self._head_is_recent(endpoint, now)]
+                if heads:
+                    # Endpoints without a recent head are kept, which is how lagging ones are retried
+                    highest = max(heads)
+                    lagging = [
+                        endpoint for endpoint in healthy
+                        if self._head_is_recent(endpoint, now) and endpoint.head < highest - self.max_head_lag
+                    ]
+                    healthy = [endpoint for endpoint in healthy if endpoint not in lagging]
+            return healthy + lagging + unhealthy, len(healthy)
+
+    def _head_is_recent(self, endpoint: _Endpoint, now: float) -> bool:
+        """The caller holds the lock."""
+        return endpoint.head is not None and now - endpoint.head_seen <= self.head_max_age
+
+    def _ask_sender(self, method: RPCEndpoint, params: Any) -> Optional[RPCResponse]:
+        """Looks a transaction up on the endpoint that accepted it, if known and healthy."""
+        tx_hash = params[0].lower() if params and isinstance(params[0], str) else None
+        with self._lock:
+            endpoint = self._senders.get(tx_hash) if tx_hash else None
+        if endpoint is None or endpoint.unhealthy_until > time.monotonic():
+            return None
+        try:
+            response = self._send(endpoint, method, params)
+        except Exception:
+            return None
+        if response.get("result") is not None and method == "eth_getTransactionReceipt":
+            # Mined; any endpoint at the head has the receipt from now on
+            with self._lock:
+                self._senders.pop(tx_hash, None)
+        return response
+
+    def _remember_sender(self, tx_hash: str, endpoint: _Endpoint) -> None:
+        with self._lock:
+            self._senders[tx_hash.lower()] = endpoint
+            self._senders.move_to_end(tx_hash.lower())
+            while len(self._senders) > _MAX_TRACKED_TRANSACTIONS:
+                self._senders.popitem(last=False)
+
+    def _hedge_delay(self, endpoint: _Endpoint) -> float:
+        with self._lock:
+            latencies = list(endpoint.latencies)
+        if len(latencies) < self.min_samples:
+            return self.initial_hedge_delay
+        return max(self.min_hedge_delay, percentile(latencies, self.hedge_percentile))
+
+    def _send(self, endpoint: _Endpoint, method: RPCEndpoint, params: Any) -> RPCResponse:
+        with self._lock:
+            endpoint.requests += 1
+        started = time.perf_counter()
+        try:
+            response = endpoint.provider.make_request(method, params)
+            if not isinstance(response, dict) or ("result" not in response and "error" not in response):
+                raise ValueError(f"Malformed response: {response!r}")
+        except Exception:
+            with self._lock:
+                endpoint.failures += 1
+                endpoint.consecutive_failures += 1
+                if endpoint.consecutive_failures >= self.max_failures:
+                    endpoint.unhealthy_until = time.monotonic() + self.cooldown
+            raise
+
+        elapsed = time.perf_counter() - started
+        head = _reported_head(method, params, response)
+        with self._lock:
+            if head is not None:
+                endpoint.head = head
+                endpoint.head_seen = time.monotonic()
+            endpoint.latencies.append(elapsed)
+            endpoint.ewma = elapsed if endpoint.ewma is None else (
+                self.ewma_alpha * elapsed + (1 - self.ewma_alpha) * endpoint.ewma
+            )
+            endpoint.consecutive_failures = 0
+            endpoint.unhealthy_until = 0.0
+        return response
+
+
+def _follows_head(method: str, params: Any) -> bool:
+    """Whether a read is answered at the latest block, so a lagging node would answer it wrongly."""
+    if method == "eth_blockNumber" or method in _TRANSACTION_LOOKUPS:
+        return True
+    if method == "eth_getLogs":
+        log_filter = params[0] if params else {}
+        return isinstance(log_filter, dict) and "blockHash" not in log_filter and (
+            log_filter.get("toBlock") in (None, "latest", "pending")
+        )
+    index = _BLOCK_PARAMETER.get(method)
+    if index is None:
+        return False
+    block = params[index] if params is not None and len(params) > index else "latest"
+    return block in ("latest", "pending")
+
+
+def _reported_head(method: str, params: Any, response: RPCResponse) -> Optional[int]:
+    """The block number of the node's head, when the response tells it."""
+    result = response.get("result")
+    if method == "eth_getBlockByNumber" and params and params[0] == "latest" and isinstance(result, dict):
+        result = result.get("number")
+    elif method != "eth_blockNumber":
+        return None
+    if isinstance(result, str):
+        return int(result, 16)
+    return result if isinstance(result, int) else None
@@ -0,0 +1,86 @@
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+from eth_utils.address import to_checksum_address
+from web3 import Web3
+
+
+class NonceManager:
+    """
+    Thread-safe, locally tracked transaction nonces.
+
+    The first nonce for an address is read from the node (including pending transactions);
+    later nonces are handed out locally, so concurrent sends from one account do not race on
+    ``eth_getTransactionCount``. If sending fails, the address is re-synchronized with the node
+    on its next allocation.
+
+    Args:
+        web3: Web3 instance used to read the starting nonce of each address
+    """
+
+    def __init__(self, web3: Web3):
+        self._web3 = web3
+        self._next: Dict[str, int] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, address: str) -> int:
+        """
+        Allocates the next nonce for an address.
+
+        Args:
+            address: The sending address
+
+        Returns:
+            The nonce to use for the next transaction
+        """
+        address = to_checksum_address(address)
+        with self._address_lock(address):
+            return self._take(address)
+
+    def reset(self, address: Optional[str] = None) -> None:
+        """Forgets the tracked nonce of an address (or all addresses) so it is read from the node again."""
+        if address is None:
+            with self._lock:
+                self._next.clear()
+            return
+        address = to_checksum_address(address)
+        with self._address_lock(address):
+            self._next.pop(address, None)
+
+    @contextmanager
+    def allocate(self, address: str) -> Iterator[int]:
+        """
+        Allocates a nonce for the duration of a send.
+
+        The address stays locked until the block exits, so transactions from one account reach
+        the node in nonce order. If the block raises, the address is re-synchronized with the
+        node on its next allocation.
+
+        Example:
+            ```python
+            with nonces.allocate(account.address) as nonce:
+                tx["nonce"] = nonce
+                w3.eth.send_raw_transaction(account.sign_transaction(tx).raw_transaction)
+            ```
+        """
+        address = to_checksum_address(address)
+        with self._address_lock(address):
+            nonce = self._take(address)
+            try:
+                yield nonce
+            except BaseException:
+                self._next.pop(address, None)
+                raise
+
+    def _take(self, address: str) -> int:
+        nonce = self._next.get(address)
+        if nonce is None:
+            nonce = self._web3.eth.get_transaction_count(address, "pending")
+        self._next[address] = nonce + 1
+        return nonce
+
+    def _address_lock(self, address: str) -> threading.Lock:
+        with self._lock:
+            return self._locks.setdefault(address, threading.Lock())
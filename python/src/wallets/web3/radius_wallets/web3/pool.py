@@ -0,0 +1,251 @@
+import itertools
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Sequence, TypedDict
+
+from eth_account.signers.local import LocalAccount
+from eth_utils.address import to_checksum_address
+from web3 import Web3
+
+from radius.classes.wallet_client_base import Balance, Signature
+from radius.types.chain import EvmChain
+from radius.utils.single_flight import SingleFlight
+from radius_wallets.evm import EVMWalletClient
+from radius_wallets.evm.types import (
+    EVMLog,
+    EVMLogFilter,
+    EVMReadRequest,
+    EVMReadResult,
+    EVMTransaction,
+    EVMTypedData,
+)
+
+from .nonce import NonceManager
+from .typed_data import TypedDataEncoder
+from .wallet import Web3EVMWalletClient, Web3Options
+
+
+class AccountStats(TypedDict):
+    """
+    Per-account counters of a wallet pool
+
+    Attributes:
+        address: The account address
+        pending: Transactions sent and not yet confirmed
+        sent: Transactions confirmed
+        failed: Transactions that raised an error
+    """
+
+    address: str
+    pending: int
+    sent: int
+    failed: int
+
+
+class PoolStats(TypedDict):
+    """
+    Throughput counters of a wallet pool
+
+    Attributes:
+        accounts: Per-account counters
+        pending: Transactions in flight across the pool
+        sent: Transactions confirmed across the pool
+        failed: Transactions that raised an error across the pool
+        throughput: Confirmed transactions per second over the last ``throughput_window`` seconds
+    """
+
+    accounts: List[AccountStats]
+    pending: int
+    sent: int
+    failed: int
+    throughput: float
+
+
+class Web3WalletPool(EVMWalletClient):
+    """
+    Wallet client that spreads transactions over several local accounts.
+
+    A single account serializes every send on one nonce sequence. The pool holds a
+    ``Web3EVMWalletClient`` per account, sharing one ``Web3`` instance and
+    :class:`NonceManager`, and routes each ``send_transaction`` to the account with the fewest
+    transactions in flight, so throughput scales with the number of accounts when the pool is
+    used from several threads. Callers that need a specific sender pin it with
+    ``options["sender"]`` on the transaction, or use :meth:`wallet` directly.
+
+    Reads, signing and ``get_address`` use the primary (first) account.
+
+    Args:
+        web3: Web3 instance connected to the node
+        accounts: Local accounts to send from
+        options: Options applied to every account's wallet client (``account`` and
+            ``nonce_manager`` are set per account by the pool)
+        throughput_window: Seconds of history used for the throughput metric
+    """
+
+    def __init__(
+        self,
+        web3: Web3,
+        accounts: Sequence[LocalAccount],
+        options: Optional[Web3Options] = None,
+        throughput_window: float = 60.0,
+    ):
+        super().__init__()
+        if not accounts:
+            raise ValueError("A wallet pool needs at least one account")
+        self._web3 = web3
+        self._nonce_manager = NonceManager(web3)
+        self._wallets: Dict[str, Web3EVMWalletClient] = {}
+        # One coalescing group and encoder for all accounts, so identical reads from any of them share an RPC
+        single_flight = (options.single_flight if options else None) or SingleFlight()
+        typed_data_encoder = (options.typed_data_encoder if options else None) or TypedDataEncoder()
+        # The signing pool serves the account it signs with
+        signing_pool = options.signing_pool if options else None
+        for account in accounts:
+            self._wallets[to_checksum_address(account.address)] = Web3EVMWalletClient(
+                web3,
+                Web3Options(
+                    paymaster=options.paymaster if options else None,
+                    rpc_cache=options.rpc_cache if options else None,
+                    head_subscription=options.head_subscription if options else None,
+                    account=account,
+                    nonce_manager=self._nonce_manager,
+                    resilience=options.resilience if options else None,
+                    single_flight=single_flight,
+                    gas_cache=options.gas_cache if options else None,
+                    typed_data_encoder=typed_data_encoder,
+                    signing_pool=signing_pool if signing_pool and signing_pool.address == account.address else None,
+                ),
+            )
+        self._primary = next(iter(self._wallets.values()))
+        self._lock = threading.Lock()
+        self._rotation = itertools.cycle(list(self._wallets))
+        self._pending = {address: 0 for address in self._wallets}
+        self._sent = {address: 0 for address in self._wallets}
+        self._failed = {address: 0 for address in self._wallets}
+        self.throughput_window = throughput_window
+        self._completed: Deque[float] = deque()
+
+    @property
+    def addresses(self) -> List[str]:
+        """The addresses of the pooled accounts."""
+        return list(self._wallets)
+
+    def wallet(self, address: str) -> Web3EVMWalletClient:
+        """
+        Returns the wallet client of one pooled account.
+
+        Raises:
+            ValueError: If the address is not part of the pool
+        """
+        try:
+            return self._wallets[to_checksum_address(address)]
+        except KeyError:
+            raise ValueError(f"Account {address} is not part of the pool")
+
+    def get_address(self) -> str:
+        return self._primary.get_address()
+
+    def get_chain(self) -> EvmChain:
+        return self._primary.get_chain()
+
+    def resolve_address(self, address: str) -> str:
+        return self._primary.resolve_address(address)
+
+    def sign_message(self, message: str) -> Signature:
+        return self._primary.sign_message(message)
+
+    def sign_typed_data(self, data: EVMTypedData) -> Signature:
+        return self._primary.sign_typed_data(data)
+
+    def sign_messages(self, messages: Sequence[str]) -> List[Signature]:
+        return self._primary.sign_messages(messages)
+
+    def sign_typed_data_many(self, payloads: Sequence[EVMTypedData]) -> List[Signature]:
+        return self._primary.sign_typed_data_many(payloads)
+
+    def read(self, request: EVMReadRequest) -> EVMReadResult:
+        return self._primary.read(request)
+
+    def balance_of(self, address: str) -> Balance:
+        return self._primary.balance_of(address)
+
+    def get_block_number(self) -> int:
+        return self._primary.get_block_number()
+
+    def get_block_timestamp(self, block_number: int) -> int:
+        return self._primary.get_block_timestamp(block_number)
+
+    def get_logs(self, filter: EVMLogFilter) -> List[EVMLog]:
+        return self._primary.get_logs(filter)
+
+    def get_code(self, address: str) -> str:
+        return self._primary.get_code(address)
+
+    def send_transaction(self, transaction: EVMTransaction) -> Dict[str, str]:
+        """Send a transaction from the least busy account, or from ``options["sender"]`` if given."""
+        address = self._acquire(transaction.get("options", {}).get("sender"))
+        try:
+            result = self._wallets[address].send_transaction(transaction)
+        except Exception:
+            self._release(address, failed=True)
+            raise
+        self._release(address, failed=False)
+        return result
+
+    def stats(self) -> PoolStats:
+        """Returns per-account and pool-wide transaction counters and throughput."""
+        with self._lock:
+            self._trim(time.monotonic())
+            accounts: List[AccountStats] = [
+                {
+                    "address": address,
+                    "pending": self._pending[address],
+                    "sent": self._sent[address],
+                    "failed": self._failed[address],
+                }
+                for address in self._wallets
+            ]
+            return {
+                "accounts": accounts,
+                "pending": sum(self._pending.values()),
+                "sent": sum(self._sent.values()),
+                "failed": sum(self._failed.values()),
+                "throughput": len(self._completed) / self.throughput_window,
+            }
+
+    def _acquire(self, sender: Optional[str]) -> str:
+        with self._lock:
+            if sender is not None:
+                address = self.wallet(sender).get_address()
+            else:
+                # Least pending transactions; rotating the start point spreads ties evenly
+                start = next(self._rotation)
+                order = list(self._wallets)
+                offset = order.index(start)
+                candidates = order[offset:] + order[:offset]
+                address = min(candidates, key=lambda candidate: self._pending[candidate])
+            self._pending[address] += 1
+            return address
+
+    def _release(self, address: str, failed: bool) -> None:
+        with self._lock:
+            self._pending[address] -= 1
+            if failed:
+                self._failed[address] += 1
+            else:
+                self._sent[address] += 1
+                now = time.monotonic()
+                self._completed.append(now)
+                self._trim(now)
+
+    def _trim(self, now: float) -> None:
+        while self._completed and now - self._completed[0] > self.throughput_window:
+            self._completed.popleft()
+
+
+def web3_pool(
+    client: Web3, accounts: Sequence[LocalAccount], options: Optional[Web3Options] = None
+) -> Web3WalletPool:
+    """Create a new Web3WalletPool instance."""
+    return Web3WalletPool(client, accounts, options)
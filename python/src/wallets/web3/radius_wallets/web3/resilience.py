@@ -0,0 +1,39 @@
+from typing import TYPE_CHECKING, Any
+
+from radius.utils.resilience import Resilience
+from web3.middleware.base import Web3Middleware
+
+from .multi_endpoint import READ_METHODS
+
+if TYPE_CHECKING:
+    from web3 import Web3
+    from web3.types import MakeRequestFn, RPCEndpoint, RPCResponse
+
+# JSON-RPC methods that may be retried: reads, plus the nonce query
+IDEMPOTENT_METHODS = READ_METHODS | {"eth_getTransactionCount"}
+
+
+class ResilienceMiddleware(Web3Middleware):
+    """
+    web3 middleware applying a :class:`~radius.utils.resilience.Resilience` policy to every request.
+
+    Reads are retried on transport errors within the policy's deadline; transactions are sent
+    once. All requests go through the circuit breaker of the provider's endpoint, so an
+    unreachable node fails fast instead of stalling every tool call. JSON-RPC error responses
+    (e.g. a reverted call) are answers from a healthy node and are passed through unchanged.
+    """
+
+    def __init__(self, w3: "Web3", resilience: Resilience):
+        super().__init__(w3)
+        self.resilience = resilience
+
+    def wrap_make_request(self, make_request: "MakeRequestFn") -> "MakeRequestFn":
+        provider = self._w3.provider
+        endpoint = str(getattr(provider, "endpoint_uri", None) or type(provider).__name__)
+
+        def middleware(method: "RPCEndpoint", params: Any) -> "RPCResponse":
+            return self.resilience.call(
+                endpoint, lambda: make_request(method, params), idempotent=method in IDEMPOTENT_METHODS
+            )
+
+        return middleware
@@ -0,0 +1,202 @@
+import math
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, List, Optional, Sequence, TypedDict
+
+from eth_account import Account
+from eth_account.messages import encode_defunct
+from eth_account.signers.local import LocalAccount
+from eth_utils import to_hex
+
+from radius.classes.wallet_client_base import Signature
+from radius_wallets.evm.types import EVMTypedData
+
+from .typed_data import TypedDataEncoder
+
+# State of a worker process, loaded once by its initializer
+_worker_account: Optional[LocalAccount] = None
+_worker_encoder: Optional[TypedDataEncoder] = None
+
+
+class SigningPoolStats(TypedDict):
+    """
+    Counters of a signing pool
+
+    Attributes:
+        processes: Worker processes the pool runs
+        started: Whether the worker processes have been started
+        batches: Batches signed
+        signatures: Payloads signed, in workers or in process
+        chunks: Chunks submitted to the workers
+    """
+
+    processes: int
+    started: bool
+    batches: int
+    signatures: int
+    chunks: int
+
+
+def _init_worker(key: bytes) -> None:
+    global _worker_account, _worker_encoder
+    _worker_account = Account.from_key(key)
+    _worker_encoder = TypedDataEncoder()
+
+
+def _sign_messages(messages: Sequence[str]) -> List[str]:
+    assert _worker_account is not None
+    return [to_hex(_worker_account.sign_message(encode_defunct(text=message)).signature) for message in messages]
+
+
+def _sign_typed_data(payloads: Sequence[EVMTypedData]) -> List[str]:
+    assert _worker_account is not None and _worker_encoder is not None
+    return [to_hex(_worker_account.sign_message(_worker_encoder.encode(payload)).signature) for payload in payloads]
+
+
+class SigningPool:
+    """
+    Signs batches of messages and typed data with one local account across worker processes.
+
+    ECDSA signing and keccak hashing are CPU bound and hold the GIL, so signing on threads does
+    not scale. The pool starts ``processes`` workers on first use, each loading the account's
+    key once through its initializer; tasks only carry the payloads. A batch is split into
+    chunks of at most ``chunk_size`` payloads, sized to give every worker several chunks, and
+    the signatures are returned in the order of the payloads. Batches smaller than
+    ``min_batch``, and every batch of a single-process pool, are signed in the calling process.
+
+    Workers are started with the ``spawn`` method by default, which is safe in processes
+    running other threads but takes about a second per worker to import the signing stack;
+    call :meth:`start` to pay that before the first batch.
+
+    Args:
+        account: The account to sign with
+        processes: Worker processes to run; defaults to the number of CPUs
+        chunk_size: Maximum payloads sent to a worker in one task
+        min_batch: Smallest batch sent to the workers
+        mp_context: The multiprocessing context, or the name of its start method
+
+    Example:
+        ```python
+        with SigningPool(account, processes=8) as signer:
+            wallet = web3(w3, Web3Options(account=account, signing_pool=signer))
+            signatures = wallet.sign_messages(attestations)
+        ```
+    """
+
+    def __init__(
+        self,
+        account: LocalAccount,
+        processes: Optional[int] = None,
+        chunk_size: int = 256,
+        min_batch: int = 16,
+        mp_context: Any = "spawn",
+    ):
+        if processes is not None and processes < 1:
+            raise ValueError("processes must be at least 1")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self.account = account
+        self.address = account.address
+        self.processes = processes or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.min_batch = min_batch
+        self._context = multiprocessing.get_context(mp_context) if isinstance(mp_context, str) else mp_context
+        self._encoder = TypedDataEncoder()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._counters = {"batches": 0, "signatures": 0, "chunks": 0}
+
+    def start(self) -> None:
+        """Starts the worker processes, if they are not running yet."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.processes,
+                    mp_context=self._context,
+                    initializer=_init_worker,
+                    initargs=(bytes(self.account.key),),
+                )
+                # Processes are only spawned as tasks arrive; get all of them loading the key now
+                for future in [self._executor.submit(_sign_messages, []) for _ in range(self.processes)]:
+                    future.result()
+
+    def close(self) -> None:
+        """Stops the worker processes. The pool starts them again if it is used afterwards."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
+
+    def __enter__(self) -> "SigningPool":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def sign_messages(self, messages: Sequence[str]) -> List[Signature]:
+        """
+        Signs messages as EIP-191 personal messages, like ``sign_message``.
+
+        Args:
+            messages: The messages to sign
+
+        Returns:
+            The signatures, in the order of the messages
+        """
+        return self._sign(
+            list(messages),
+            _sign_messages,
+            lambda message: self.account.sign_message(encode_defunct(text=message)).signature,
+        )
+
+    def sign_typed_data_many(self, payloads: Sequence[EVMTypedData]) -> List[Signature]:
+        """
+        Signs EIP-712 typed data payloads, like ``sign_typed_data``.
+
+        Each worker caches domain separators and type hashes, so batches of payloads of one
+        shape only hash their messages.
+
+        Args:
+            payloads: The typed data payloads to sign
+
+        Returns:
+            The signatures, in the order of the payloads
+        """
+        return self._sign(
+            list(payloads),
+            _sign_typed_data,
+            lambda payload: self.account.sign_message(self._encoder.encode(payload)).signature,
+        )
+
+    def _sign(
+        self, items: List[Any], sign_chunk: Callable[[Sequence[Any]], List[str]], sign_one: Callable[[Any], bytes]
+    ) -> List[Signature]:
+        if len(items) < self.min_batch or self.processes == 1:
+            signatures = [to_hex(sign_one(item)) for item in items]
+            chunks = 0
+        else:
+            self.start()
+            assert self._executor is not None
+            # Several chunks per worker keep them all busy until the end of the batch
+            size = min(self.chunk_size, max(1, math.ceil(len(items) / (self.processes * 4))))
+            parts = [items[start:start + size] for start in range(0, len(items), size)]
+            signatures = [signature for part in self._executor.map(sign_chunk, parts) for signature in part]
+            chunks = len(parts)
+        with self._lock:
+            self._counters["batches"] += 1
+            self._counters["signatures"] += len(items)
+            self._counters["chunks"] += chunks
+        return [{"signature": signature} for signature in signatures]
+
+    def stats(self) -> SigningPoolStats:
+        """Returns batch and signature counters."""
+        with self._lock:
+            return {
+                "processes": self.processes,
+                "started": self._executor is not None,
+                "batches": self._counters["batches"],
+                "signatures": self._counters["signatures"],
+                "chunks": self._counters["chunks"],
+            }
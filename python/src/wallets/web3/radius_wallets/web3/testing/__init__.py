@@ -0,0 +1,18 @@
+"""
+Test and benchmark helpers for the Web3 wallet.
+
+Requires the ``tester`` extra: ``pip install 'radius-ai-agent-sdk-wallet-web3[tester]'``.
+"""
+
+from .head_server import HeadServer
+from .local_chain import LocalChain, LockedEthereumTesterProvider
+from .metrics import LatencyRecorder, LatencySummary, percentile
+
+__all__ = [
+    "HeadServer",
+    "LocalChain",
+    "LockedEthereumTesterProvider",
+    "LatencyRecorder",
+    "LatencySummary",
+    "percentile",
+]
@@ -0,0 +1,399 @@
+"""
+Compiled contracts deployed by :class:`LocalChain`.
+
+Generated from the Vyper sources in ``sources/`` with ``vyper -f abi,bytecode``
+(vyper 0.4.3). Regenerate this module whenever a source file changes.
+"""
+
+TOKEN_ABI = [
+    {
+        "name": "Transfer",
+        "inputs": [
+            {
+                "name": "sender",
+                "type": "address",
+                "indexed": True
+            },
+            {
+                "name": "receiver",
+                "type": "address",
+                "indexed": True
+            },
+            {
+                "name": "value",
+                "type": "uint256",
+                "indexed": False
+            }
+        ],
+        "anonymous": False,
+        "type": "event"
+    },
+    {
+        "name": "Approval",
+        "inputs": [
+            {
+                "name": "owner",
+                "type": "address",
+                "indexed": True
+            },
+            {
+                "name": "spender",
+                "type": "address",
+                "indexed": True
+            },
+            {
+                "name": "value",
+                "type": "uint256",
+                "indexed": False
+            }
+        ],
+        "anonymous": False,
+        "type": "event"
+    },
+    {
+        "stateMutability": "nonpayable",
+        "type": "function",
+        "name": "mint",
+        "inputs": [
+            {
+                "name": "_to",
+                "type": "address"
+            },
+            {
+                "name": "_value",
+                "type": "uint256"
+            }
+        ],
+        "outputs": []
+    },
+    {
+        "stateMutability": "nonpayable",
+        "type": "function",
+        "name": "transfer",
+        "inputs": [
+            {
+                "name": "_to",
+                "type": "address"
+            },
+            {
+                "name": "_value",
+                "type": "uint256"
+            }
+        ],
+        "outputs": [
+            {
+                "name": "",
+                "type": "bool"
+            }
+        ]
+    },
+    {
+        "stateMutability": "nonpayable",
+        "type": "function",
+        "name": "transferFrom",
+        "inputs": [
+            {
+                "name": "_from",
+                "type": "address"
+            },
+            {
+                "name": "_to",
+                "type": "address"
+            },
+            {
+                "name": "_value",
+                "type": "uint256"
+            }
+        ],
+        "outputs": [
+            {
+                "name": "",
+                "type": "bool"
+            }
+        ]
+    },
+    {
+        "stateMutability": "nonpayable",
+        "type": "function",
+        "name": "approve",
+        "inputs": [
+            {
+                "name": "_spender",
+                "type": "address"
+            },
+            {
+                "name": "_value",
+                "type": "uint256"
+            }
+        ],
+        "outputs": [
+            {
+                "name": "",
+                "type": "bool"
+            }
+        ]
+    },
+    {
+        "stateMutability": "view",
+        "type": "function",
+        "name": "name",
+        "inputs": [],
+        "outputs": [
+            {
+                "name": "",
+                "type": "string"
+            }
+        ]
+    },
+    {
+        "stateMutability": "view",
+        "type": "function",
+        "name": "symbol",
+        "inputs": [],
+        "outputs": [
+            {
+                "name": "",
+                "type": "string"
+            }
+        ]
+    },
+    {
+        "stateMutability": "view",
+        "type": "function",
+        "name": "decimals",
+        "inputs": [],
+        "outputs": [
+            {
+                "name": "",
+                "type": "uint8"
+            }
+        ]
+    },
+    {
+        "stateMutability": "view",
+        "type": "function",
+        "name": "totalSupply",
+        "inputs": [],
+        "outputs": [
+            {
+                "name": "",
+                "type": "uint256"
+            }
+        ]
+    },
+    {
+        "stateMutability": "view",
+        "type": "function",
+        "name": "balanceOf",
+        "inputs": [
+            {
+                "name": "arg0",
+                "type": "address"
+            }
+        ],
+        "outputs": [
+            {
+                "name": "",
+                "type": "uint256"
+            }
+        ]
+    },
+    {
+        "stateMutability": "view",
+        "type": "function",
+        "name": "allowance",
+        "inputs": [
+            {
+                "name": "arg0",
+                "type": "address"
+            },
+            {
+                "name": "arg1",
+                "type": "address"
+            }
+        ],
+        "outputs": [
+            {
+                "name": "",
+                "type": "uint256"
+            }
+        ]
+    },
+    {
+        "stateMutability": "view",
+        "type": "function",
+        "name": "minter",
+        "inputs": [],
+        "outputs": [
+            {
+                "name": "",
+                "type": "address"
+            }
+        ]
+    },
+    {
+        "stateMutability": "nonpayable",
+        "type": "constructor",
+        "inputs": [
+            {
+                "name": "_name",
+                "type": "string"
+            },
+            {
+                "name": "_symbol",
+                "type": "string"
+            },
+            {
+                "name": "_decimals",
+                "type": "uint8"
+            },
+            {
+                "name": "_supply",
+                "type": "uint256"
+            }
+        ],
+        "outputs": []
+    }
+]
+
+TOKEN_BYTECODE = (
+    "0x3461011f57602061063e5f395f5160208161063e015f395f516020811161011f575060408161063e0160a0395060206106"
+    "5e5f395f5160208161063e015f395f516010811161011f575060308161063e0160e03950602061067e5f395f518060081c61"
+    "011f576101205260a0515f5560c05160015560e0516002556101005160035561012051600455336008553360405260206106"
+    "9e6060396100a06100b2565b6104e5610123610000396104e5610000f35b60055460605180820182811061011f5790509050"
+    "60055560066040516020525f5260405f20805460605180820182811061011f57905090508155506040515f7fddf252ad1be2"
+    "c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef60605160805260206080a3565b5f80fd5f3560e01c600260"
+    "09820660011b6104d301601e395f51565b6340c10f1981186100d0576044361034176104cf576004358060a01c6104cf5760"
+    "a0526008543318156100ba5760208061012052601f60c0527f45524332303a2063616c6c6572206973206e6f742074686520"
+    "6d696e7465720060e05260c08161012001603f82825e8051806020830101601f825f03163682375050601f19601f82516020"
+    "01011690509050810190506308c379a0610100528060040161011cfd5b60a0516040526024356060526100ce610462565b00"
+    "5b6395d89b41811861045e57346104cf5760208060405280604001600254815260035460208201528051806020830101601f"
+    "825f03163682375050601f19601f825160200101169050810190506040f35b63a9059cbb811861045e576044361034176104"
+    "cf576004358060a01c6104cf576040526006336020525f5260405f2080546024358082038281116104cf5790509050815550"
+    "60066040516020525f5260405f2080546024358082018281106104cf5790509050815550604051337fddf252ad1be2c89b69"
+    "c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef60243560605260206060a3600160605260206060f35b6323b872dd"
+    "81186102ab576064361034176104cf576004358060a01c6104cf576040526024358060a01c6104cf57606052600760405160"
+    "20525f5260405f2080336020525f5260405f20905080546044358082038281116104cf579050905081555060066040516020"
+    "525f5260405f2080546044358082038281116104cf579050905081555060066060516020525f5260405f2080546044358082"
+    "018281106104cf57905090508155506060516040517fddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4d"
+    "f523b3ef60443560805260206080a3600160805260206080f35b63095ea7b3811861045e576044361034176104cf57600435"
+    "8060a01c6104cf576040526024356007336020525f5260405f20806040516020525f5260405f20905055604051337f8c5be1"
+    "e5ebec7d5bd14f71427d1e84f3dd0314c0f7b2291e5b200ac8c7c3b92560243560605260206060a3600160605260206060f3"
+    "5b6306fdde03811861045e57346104cf57602080604052806040015f54815260015460208201528051806020830101601f82"
+    "5f03163682375050601f19601f825160200101169050810190506040f35b63313ce567811861045e57346104cf5760045460"
+    "405260206040f35b6318160ddd81186103af57346104cf5760055460405260206040f35b6370a08231811861045e57602436"
+    "1034176104cf576004358060a01c6104cf5760405260066040516020525f5260405f205460605260206060f35b63dd62ed3e"
+    "811861045e576044361034176104cf576004358060a01c6104cf576040526024358060a01c6104cf57606052600760405160"
+    "20525f5260405f20806060516020525f5260405f2090505460805260206080f35b6307546172811861045e57346104cf5760"
+    "085460405260206040f35b5f5ffd5b6005546060518082018281106104cf579050905060055560066040516020525f526040"
+    "5f2080546060518082018281106104cf57905090508155506040515f7fddf252ad1be2c89b69c2b068fc378daa952ba7f163"
+    "c4a11628f55a4df523b3ef60605160805260206080a3565b5f80fd03ea039301c403770328045e001801200442855820d6f7"
+    "84d78314756257f52adfcecd215e6acd06fc253a8ba3f0527032ac7723501904e5811200a1657679706572830004030036"
+)
+
+MULTICALL3_ABI = [
+    {
+        "stateMutability": "nonpayable",
+        "type": "function",
+        "name": "aggregate3",
+        "inputs": [
+            {
+                "name": "calls",
+                "type": "tuple[]",
+                "components": [
+                    {
+                        "name": "target",
+                        "type": "address"
+                    },
+                    {
+                        "name": "allowFailure",
+                        "type": "bool"
+                    },
+                    {
+                        "name": "callData",
+                        "type": "bytes"
+                    }
+                ]
+            }
+        ],
+        "outputs": [
+            {
+                "name": "",
+                "type": "tuple[]",
+                "components": [
+                    {
+                        "name": "success",
+                        "type": "bool"
+                    },
+                    {
+                        "name": "returnData",
+                        "type": "bytes"
+                    }
+                ]
+            }
+        ]
+    },
+    {
+        "stateMutability": "view",
+        "type": "function",
+        "name": "getEthBalance",
+        "inputs": [
+            {
+                "name": "addr",
+                "type": "address"
+            }
+        ],
+        "outputs": [
+            {
+                "name": "",
+                "type": "uint256"
+            }
+        ]
+    },
+    {
+        "stateMutability": "view",
+        "type": "function",
+        "name": "getBlockNumber",
+        "inputs": [],
+        "outputs": [
+            {
+                "name": "",
+                "type": "uint256"
+            }
+        ]
+    },
+    {
+        "stateMutability": "view",
+        "type": "function",
+        "name": "getCurrentBlockTimestamp",
+        "inputs": [],
+        "outputs": [
+            {
+                "name": "",
+                "type": "uint256"
+            }
+        ]
+    }
+]
+
+MULTICALL3_BYTECODE = (
+    "0x61035861001161000039610358610000f35f3560e01c60026003820660011b61035201601e395f51565b6382ad56cb8118"
+    "6102e65760243610341761034e57600435600401604081351161034e5780355f816040811161034e5780156100b557905b80"
+    "60051b6020850101356020850101610180820260600181358060a01c61034e57815260208201358060011c61034e57602082"
+    "0152604082013582018035610104811161034e5750602081350160408301818382375050505050600101818118610050575b"
+    "50508060405250505f616060525f6040516040811161034e57801561023457905b6101808102606001805161b08052602081"
+    "015161b0a052604081016020815101808261b0c05e50505060403661b2003761b080515a61b0c061010061b3608251602084"
+    "015f8787f190509050905061b460523d61010081183d61010010021861b3405261b3406020815101808261b4805e505061b4"
+    "605161b20052602061b48051018061b48061b2205e5061b200516101725761b0a051610175565b60015b6101f15760208061"
+    "b3a052601761b340527f4d756c746963616c6c333a2063616c6c206661696c656400000000000000000061b3605261b34081"
+    "61b3a001603782825e8051806020830101601f825f03163682375050601f19601f8251602001011690509050810190506308"
+    "c379a061b380528060040161b39cfd5b61606051603f811161034e5761014081026160800161b200518152602061b2205101"
+    "602082018161b220825e5050506001810161606052506001018181186100d6575b505060208061b080528061b080015f6160"
+    "60518083528060051b5f826040811161034e5780156102d157905b828160051b602088010152610140810261608001836020"
+    "8801016040825182528060208301526020830181830160208251018083835e508051806020830101601f825f031636823750"
+    "50601f19601f8251602001011690509050810190509050905083019250600101818118610260575b50508201602001915050"
+    "90508101905061b080f35b6342cbb15c811861034a573461034e574360405260206040f35b634d2301cc811861034a576024"
+    "3610341761034e576004358060a01c61034e576040526040513160605260206060f35b630f28c97d811861034a573461034e"
+    "574260405260206040f35b5f5ffd5b5f80fd033000180300855820a6fa5806c7cc454c37d967bc27f5ab51573ca4b7bd1493"
+    "71dd5a7d7b12e45cf6190358810600a1657679706572830004030036"
+)
@@ -0,0 +1,186 @@
+import itertools
+import json
+import threading
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from web3 import Web3
+
+try:
+    from websockets.exceptions import ConnectionClosed
+    from websockets.sync.server import serve
+except ImportError:  # pragma: no cover - exercised only without the extra installed
+    serve = None  # type: ignore
+
+if TYPE_CHECKING:
+    from .local_chain import LocalChain
+
+# Log fields that JSON-RPC encodes as hex quantities
+_LOG_QUANTITIES = ("blockNumber", "logIndex", "transactionIndex")
+
+
+class HeadServer:
+    """
+    Minimal WebSocket JSON-RPC server publishing a LocalChain's blocks via ``eth_subscribe``.
+
+    Serves ``newHeads`` and ``logs`` subscriptions (and ``eth_unsubscribe``) so that a
+    ``HeadSubscription`` can be exercised end to end against the in-process chain. Other
+    JSON-RPC methods are not served; use the chain's regular provider for them.
+
+    Example:
+        ```python
+        chain = LocalChain()
+        with chain.head_server() as server, HeadSubscription(server.url) as heads:
+            wallet = chain.wallet(0, Web3Options(head_subscription=heads))
+        ```
+    """
+
+    def __init__(self, chain: "LocalChain", host: str = "127.0.0.1", port: int = 0):
+        if serve is None:
+            raise ImportError(
+                "HeadServer requires the websockets package. "
+                "Install it with: pip install 'radius-ai-agent-sdk-wallet-web3[websocket]'"
+            )
+        self.chain = chain
+        self.host = host
+        self.port = port
+        self._server: Any = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        # Subscription ID -> (connection, kind, logs filter)
+        self._subscriptions: Dict[str, Tuple[Any, str, Optional[Dict[str, Any]]]] = {}
+
+    @property
+    def url(self) -> str:
+        """The ``ws://`` URL of the running server."""
+        return f"ws://{self.host}:{self.port}"
+
+    def start(self) -> "HeadServer":
+        """Starts serving in a background thread."""
+        self._server = serve(self._handle, self.host, self.port)
+        self.port = self._server.socket.getsockname()[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="radius-head-server", daemon=True)
+        self._thread.start()
+        # Record the current head so only blocks mined from now on are announced
+        self.chain.provider.publish_heads()
+        self.chain.provider.head_listeners.append(self.publish)
+        return self
+
+    def stop(self) -> None:
+        """Stops the server and closes all connections."""
+        if self.publish in self.chain.provider.head_listeners:
+            self.chain.provider.head_listeners.remove(self.publish)
+        if self._server is not None:
+            self._server.shutdown()
+            self._server = None
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def disconnect_all(self) -> None:
+        """Closes every client connection, e.g. to exercise reconnection."""
+        with self._lock:
+            connections = {connection for connection, _, _ in self._subscriptions.values()}
+        for connection in connections:
+            connection.close()
+
+    def publish(self, block: Dict[str, Any]) -> None:
+        """
+        Sends a mined block to the ``newHeads`` subscribers and its matching logs to the ``logs`` subscribers.
+
+        Args:
+            block: The block as returned by eth-tester
+        """
+        header = {
+            "number": hex(block["number"]),
+            "hash": block["hash"],
+            "parentHash": block["parent_hash"],
+            "timestamp": hex(block["timestamp"]),
+        }
+        with self._lock:
+            subscriptions = list(self._subscriptions.items())
+
+        logs: Optional[List[Dict[str, Any]]] = None
+        for subscription_id, (connection, kind, logs_filter) in subscriptions:
+            if kind == "newHeads":
+                self._notify(connection, subscription_id, header)
+                continue
+            if logs is None:
+                logs = self._block_logs(block["number"])
+            for log in logs:
+                if _log_matches(log, logs_filter or {}):
+                    self._notify(connection, subscription_id, log)
+
+    def __enter__(self) -> "HeadServer":
+        return self if self._server is not None else self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def _handle(self, connection: Any) -> None:
+        try:
+            for message in connection:
+                request = json.loads(message)
+                connection.send(json.dumps(self._respond(connection, request)))
+        except ConnectionClosed:
+            pass
+        finally:
+            with self._lock:
+                for subscription_id in [key for key, value in self._subscriptions.items() if value[0] is connection]:
+                    del self._subscriptions[subscription_id]
+
+    def _respond(self, connection: Any, request: Dict[str, Any]) -> Dict[str, Any]:
+        method = request.get("method")
+        params = request.get("params") or []
+        response: Dict[str, Any] = {"jsonrpc": "2.0", "id": request.get("id")}
+        if method == "eth_subscribe" and params and params[0] in ("newHeads", "logs"):
+            subscription_id = hex(next(self._ids))
+            logs_filter = params[1] if len(params) > 1 else None
+            with self._lock:
+                self._subscriptions[subscription_id] = (connection, params[0], logs_filter)
+            response["result"] = subscription_id
+        elif method == "eth_unsubscribe" and params:
+            with self._lock:
+                response["result"] = self._subscriptions.pop(params[0], None) is not None
+        else:
+            response["error"] = {"code": -32601, "message": f"Method not supported: {method}"}
+        return response
+
+    def _notify(self, connection: Any, subscription_id: str, result: Dict[str, Any]) -> None:
+        message = {
+            "jsonrpc": "2.0",
+            "method": "eth_subscription",
+            "params": {"subscription": subscription_id, "result": result},
+        }
+        try:
+            connection.send(json.dumps(message))
+        except ConnectionClosed:
+            pass
+
+    def _block_logs(self, number: int) -> List[Dict[str, Any]]:
+        logs = []
+        for log in self.chain.web3.eth.get_logs({"fromBlock": number, "toBlock": number}):
+            encoded = json.loads(Web3.to_json(log))  # type: ignore[arg-type]
+            for field in _LOG_QUANTITIES:
+                encoded[field] = hex(encoded[field])
+            encoded.pop("type", None)
+            logs.append(encoded)
+        return logs
+
+
+def _log_matches(log: Dict[str, Any], logs_filter: Dict[str, Any]) -> bool:
+    addresses = logs_filter.get("address")
+    if addresses is not None:
+        if isinstance(addresses, str):
+            addresses = [addresses]
+        if log["address"].lower() not in {address.lower() for address in addresses}:
+            return False
+    for position, expected in enumerate(logs_filter.get("topics") or []):
+        if expected is None:
+            continue
+        if position >= len(log["topics"]):
+            return False
+        options = expected if isinstance(expected, list) else [expected]
+        if log["topics"][position].lower() not in {option.lower() for option in options}:
+            return False
+    return True
@@ -0,0 +1,232 @@
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+from eth_account import Account
+from eth_account.signers.local import LocalAccount
+from web3 import Web3
+from web3.providers.eth_tester import EthereumTesterProvider
+from web3.providers.eth_tester.defaults import API_ENDPOINTS, static_return
+
+from radius_wallets.evm.send_eth import RADIUS_CHAIN_ID
+
+from ..wallet import Web3EVMWalletClient, Web3Options
+from .contracts import MULTICALL3_ABI, MULTICALL3_BYTECODE, TOKEN_ABI, TOKEN_BYTECODE
+
+if TYPE_CHECKING:
+    from .head_server import HeadServer
+
+try:
+    from eth_tester import EthereumTester, PyEVMBackend
+except ImportError:  # pragma: no cover - exercised only without the extra installed
+    EthereumTester = None  # type: ignore
+    PyEVMBackend = None  # type: ignore
+
+
+# Requests after which eth-tester may have mined new blocks
+_MINING_METHODS = frozenset({"eth_sendTransaction", "eth_sendRawTransaction", "evm_mine"})
+
+
+class LockedEthereumTesterProvider(EthereumTesterProvider):
+    """
+    EthereumTesterProvider that serializes requests so it can be shared across threads.
+
+    Also tracks the chain head and calls ``head_listeners`` with the raw eth-tester block of
+    every newly mined block, which lets tests publish ``newHeads`` notifications.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._lock = threading.Lock()
+        self.request_count = 0
+        self.head_listeners: List[Callable[[Dict[str, Any]], None]] = []
+        self._published_block: Optional[int] = None
+
+    def make_request(self, method, params):
+        with self._lock:
+            self.request_count += 1
+            response = super().make_request(method, params)
+        if self.head_listeners and method in _MINING_METHODS:
+            self.publish_heads()
+        return response
+
+    def publish_heads(self) -> None:
+        """Calls the head listeners for every block mined since the last call."""
+        with self._lock:
+            latest = self.ethereum_tester.get_block_by_number("latest")
+            published = self._published_block
+            if published is None or latest["number"] <= published:
+                # First call, or the chain was reverted: only the current head is announced
+                blocks = [] if latest["number"] == published else [latest]
+            else:
+                blocks = [
+                    self.ethereum_tester.get_block_by_number(number)
+                    for number in range(published + 1, latest["number"] + 1)
+                ]
+            self._published_block = latest["number"]
+        for block in blocks:
+            for listener in self.head_listeners:
+                listener(block)
+
+
+class LocalChain:
+    """
+    In-process EVM stand-in for the Radius network.
+
+    Runs py-evm through eth-tester behind a regular ``Web3`` provider, reports the Radius
+    chain ID, funds a set of local accounts and deploys an ERC-20 token and a
+    Multicall3-compatible aggregator. Every transaction is mined into its own block as
+    soon as it is sent, which mirrors Radius' near-instant settlement.
+
+    Example:
+        ```python
+        chain = LocalChain()
+        wallet = chain.wallet()
+        tools = get_tools(wallet, [send_eth(), erc20(ERC20PluginOptions(tokens=[chain.token]))])
+        ```
+    """
+
+    def __init__(
+        self,
+        chain_id: int = RADIUS_CHAIN_ID,
+        num_accounts: int = 10,
+        token_name: str = "Radius Test Token",
+        token_symbol: str = "RTT",
+        token_decimals: int = 18,
+        token_supply: int = 10**9 * 10**18,
+    ):
+        """
+        Creates a fresh chain with funded accounts and deployed contracts.
+
+        Args:
+            chain_id: The chain ID reported by the node and used for signing
+            num_accounts: The number of funded accounts to create
+            token_name: The name of the deployed ERC-20 token
+            token_symbol: The symbol of the deployed ERC-20 token
+            token_decimals: The decimals of the deployed ERC-20 token
+            token_supply: The initial token supply in base units, minted to the first account
+
+        Raises:
+            ImportError: If eth-tester and py-evm are not installed
+        """
+        if PyEVMBackend is None:
+            raise ImportError(
+                "LocalChain requires eth-tester and py-evm. "
+                "Install them with: pip install 'radius-ai-agent-sdk-wallet-web3[tester]'"
+            )
+
+        self.chain_id = chain_id
+        self.backend = PyEVMBackend(
+            genesis_state=PyEVMBackend.generate_genesis_state(num_accounts=num_accounts)
+        )
+        # py-evm hardcodes the chain ID on the chain class; override it on the instance so
+        # transactions signed for Radius validate.
+        self.backend.chain.chain_id = chain_id
+        self.tester = EthereumTester(backend=self.backend)
+
+        api_endpoints = {namespace: dict(endpoints) for namespace, endpoints in API_ENDPOINTS.items()}
+        api_endpoints["eth"]["chainId"] = static_return(chain_id)
+        self.provider = LockedEthereumTesterProvider(self.tester, api_endpoints=api_endpoints)
+        self.web3 = Web3(self.provider)
+
+        self.accounts: List[LocalAccount] = [
+            Account.from_key(key.to_bytes()) for key in self.backend.account_keys
+        ]
+
+        deployer = self.accounts[0].address
+        self.token_address = self._deploy(
+            TOKEN_ABI, TOKEN_BYTECODE, deployer, token_name, token_symbol, token_decimals, token_supply
+        )
+        self.multicall_address = self._deploy(MULTICALL3_ABI, MULTICALL3_BYTECODE, deployer)
+        self.token_decimals = token_decimals
+        self.token_symbol = token_symbol
+        self.token_name = token_name
+
+    @property
+    def token(self) -> Dict[str, Any]:
+        """The deployed ERC-20 token in the format expected by ``ERC20PluginOptions``."""
+        return {
+            "decimals": self.token_decimals,
+            "symbol": self.token_symbol,
+            "name": self.token_name,
+            "chains": {self.chain_id: {"contractAddress": self.token_address}},
+        }
+
+    @property
+    def request_count(self) -> int:
+        """The number of JSON-RPC requests served by the node so far."""
+        return self.provider.request_count
+
+    def connect(self, account_index: Optional[int] = None) -> Web3:
+        """
+        Creates a new ``Web3`` instance connected to this chain.
+
+        Args:
+            account_index: Index of the account to set as the default (and local signing) account
+
+        Returns:
+            A Web3 instance sharing this chain's provider
+        """
+        w3 = Web3(self.provider)
+        if account_index is not None:
+            account = self.accounts[account_index]
+            w3.eth.default_account = account.address
+            w3.eth.default_local_account = account  # type: ignore
+        return w3
+
+    def wallet(self, account_index: int = 0, options: Optional[Web3Options] = None) -> Web3EVMWalletClient:
+        """
+        Creates a wallet client for one of the funded accounts.
+
+        Args:
+            account_index: Index of the funded account to use
+            options: Optional wallet options
+
+        Returns:
+            A Web3EVMWalletClient connected to this chain
+        """
+        return Web3EVMWalletClient(self.connect(account_index), options)
+
+    def token_contract(self):
+        """Returns a web3 contract object for the deployed ERC-20 token."""
+        return self.web3.eth.contract(address=self.token_address, abi=TOKEN_ABI)
+
+    def mint(self, to: str, amount: int) -> None:
+        """Mints test tokens to an address."""
+        tx_hash = self.token_contract().functions.mint(to, amount).transact({"from": self.accounts[0].address})
+        self.web3.eth.wait_for_transaction_receipt(tx_hash)
+
+    def mine(self, blocks: int = 1) -> None:
+        """Mines empty blocks, or blocks with pending transactions when auto-mining is disabled."""
+        # Through the provider, so mining is serialized with requests and announced to head listeners
+        self.provider.make_request("evm_mine", [blocks])
+
+    def head_server(self, host: str = "127.0.0.1", port: int = 0) -> "HeadServer":
+        """
+        Starts a WebSocket server publishing this chain's new heads via ``eth_subscribe``.
+
+        Args:
+            host: Interface to listen on
+            port: Port to listen on; 0 picks a free port
+
+        Returns:
+            The running server; connect a ``HeadSubscription`` to its ``url``
+        """
+        from .head_server import HeadServer
+
+        return HeadServer(self, host, port).start()
+
+    def snapshot(self) -> int:
+        """Takes a snapshot of the chain state and returns its ID."""
+        return self.tester.take_snapshot()
+
+    def revert(self, snapshot_id: int) -> None:
+        """Reverts the chain state to a snapshot taken with :meth:`snapshot`."""
+        self.tester.revert_to_snapshot(snapshot_id)
+        if self.provider.head_listeners:
+            self.provider.publish_heads()
+
+    def _deploy(self, abi: List[Dict[str, Any]], bytecode: str, deployer: str, *args: Any) -> str:
+        contract = self.web3.eth.contract(abi=abi, bytecode=bytecode)
+        tx_hash = contract.constructor(*args).transact({"from": deployer})
+        receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash)
+        return receipt["contractAddress"]
@@ -0,0 +1,98 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, TypedDict
+
+from .._stats import percentile
+
+
+class LatencySummary(TypedDict):
+    """
+    Latency and throughput summary for one operation
+
+    Attributes:
+        count: Number of recorded samples
+        mean_ms: Mean latency in milliseconds
+        p50_ms: Median latency in milliseconds
+        p95_ms: 95th percentile latency in milliseconds
+        p99_ms: 99th percentile latency in milliseconds
+        max_ms: Maximum latency in milliseconds
+        throughput: Samples per second over the recorder's wall-clock window
+    """
+
+    count: int
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+    throughput: float
+
+
+class LatencyRecorder:
+    """
+    Thread-safe recorder of per-operation latencies.
+
+    Example:
+        ```python
+        recorder = LatencyRecorder()
+        with recorder.measure("send_ETH"):
+            tool.execute({"to": recipient, "amount": "0.01"})
+        print(recorder.format_report())
+        ```
+    """
+
+    def __init__(self):
+        self._samples: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+        self._started_at = time.perf_counter()
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        """Records the duration of the wrapped block under ``name``."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def record(self, name: str, seconds: float) -> None:
+        """Records a single latency sample in seconds."""
+        with self._lock:
+            self._samples.setdefault(name, []).append(seconds)
+
+    def reset(self) -> None:
+        """Drops all samples and restarts the throughput window."""
+        with self._lock:
+            self._samples.clear()
+            self._started_at = time.perf_counter()
+
+    def report(self) -> Dict[str, LatencySummary]:
+        """Summarizes the recorded samples per operation."""
+        elapsed = max(time.perf_counter() - self._started_at, 1e-9)
+        with self._lock:
+            samples = {name: list(values) for name, values in self._samples.items()}
+
+        report: Dict[str, LatencySummary] = {}
+        for name, values in samples.items():
+            report[name] = {
+                "count": len(values),
+                "mean_ms": sum(values) / len(values) * 1000,
+                "p50_ms": percentile(values, 50) * 1000,
+                "p95_ms": percentile(values, 95) * 1000,
+                "p99_ms": percentile(values, 99) * 1000,
+                "max_ms": max(values) * 1000,
+                "throughput": len(values) / elapsed,
+            }
+        return report
+
+    def format_report(self) -> str:
+        """Formats :meth:`report` as a fixed-width table."""
+        header = f"{'operation':<28}{'count':>8}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'ops/s':>10}"
+        lines = [header, "-" * len(header)]
+        for name, summary in sorted(self.report().items()):
+            lines.append(
+                f"{name:<28}{summary['count']:>8}{summary['mean_ms']:>10.2f}{summary['p50_ms']:>10.2f}"
+                f"{summary['p95_ms']:>10.2f}{summary['p99_ms']:>10.2f}{summary['throughput']:>10.1f}"
+            )
+        return "\n".join(lines)
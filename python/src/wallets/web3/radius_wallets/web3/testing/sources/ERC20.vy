@@ -0,0 +1,69 @@
+# pragma version ~=0.4.0
+"""
+@title Minimal ERC-20 token for the local chain fixture
+@notice The deployer receives the initial supply and may mint more.
+"""
+
+event Transfer:
+    sender: indexed(address)
+    receiver: indexed(address)
+    value: uint256
+
+event Approval:
+    owner: indexed(address)
+    spender: indexed(address)
+    value: uint256
+
+name: public(String[32])
+symbol: public(String[16])
+decimals: public(uint8)
+totalSupply: public(uint256)
+balanceOf: public(HashMap[address, uint256])
+allowance: public(HashMap[address, HashMap[address, uint256]])
+minter: public(address)
+
+
+@deploy
+def __init__(_name: String[32], _symbol: String[16], _decimals: uint8, _supply: uint256):
+    self.name = _name
+    self.symbol = _symbol
+    self.decimals = _decimals
+    self.minter = msg.sender
+    self._mint(msg.sender, _supply)
+
+
+@internal
+def _mint(_to: address, _value: uint256):
+    self.totalSupply += _value
+    self.balanceOf[_to] += _value
+    log Transfer(sender=empty(address), receiver=_to, value=_value)
+
+
+@external
+def mint(_to: address, _value: uint256):
+    assert msg.sender == self.minter, "ERC20: caller is not the minter"
+    self._mint(_to, _value)
+
+
+@external
+def transfer(_to: address, _value: uint256) -> bool:
+    self.balanceOf[msg.sender] -= _value
+    self.balanceOf[_to] += _value
+    log Transfer(sender=msg.sender, receiver=_to, value=_value)
+    return True
+
+
+@external
+def transferFrom(_from: address, _to: address, _value: uint256) -> bool:
+    self.allowance[_from][msg.sender] -= _value
+    self.balanceOf[_from] -= _value
+    self.balanceOf[_to] += _value
+    log Transfer(sender=_from, receiver=_to, value=_value)
+    return True
+
+
+@external
+def approve(_spender: address, _value: uint256) -> bool:
+    self.allowance[msg.sender][_spender] = _value
+    log Approval(owner=msg.sender, spender=_spender, value=_value)
+    return True
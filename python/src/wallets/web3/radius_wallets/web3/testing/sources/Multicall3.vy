@@ -0,0 +1,56 @@
+# pragma version ~=0.4.0
+"""
+@title Multicall3-compatible aggregator for the local chain fixture
+@notice Implements the `aggregate3`, `getEthBalance` and block helpers of
+        Multicall3 with the same ABI, bounded to small payloads.
+"""
+
+MAX_CALLS: constant(uint256) = 64
+MAX_CALLDATA: constant(uint256) = 260
+MAX_RETURNDATA: constant(uint256) = 256
+
+
+struct Call3:
+    target: address
+    allowFailure: bool
+    callData: Bytes[MAX_CALLDATA]
+
+
+struct Result:
+    success: bool
+    returnData: Bytes[MAX_RETURNDATA]
+
+
+@external
+def aggregate3(calls: DynArray[Call3, MAX_CALLS]) -> DynArray[Result, MAX_CALLS]:
+    results: DynArray[Result, MAX_CALLS] = []
+    for call: Call3 in calls:
+        success: bool = False
+        response: Bytes[MAX_RETURNDATA] = b""
+        success, response = raw_call(
+            call.target,
+            call.callData,
+            max_outsize=MAX_RETURNDATA,
+            revert_on_failure=False,
+        )
+        assert success or call.allowFailure, "Multicall3: call failed"
+        results.append(Result(success=success, returnData=response))
+    return results
+
+
+@view
+@external
+def getEthBalance(addr: address) -> uint256:
+    return addr.balance
+
+
+@view
+@external
+def getBlockNumber() -> uint256:
+    return block.number
+
+
+@view
+@external
+def getCurrentBlockTimestamp() -> uint256:
+    return block.timestamp
@@ -0,0 +1,198 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple, TypedDict
+
+from eth_abi.registry import registry
+# Private eth_account helpers, so the eth-account version is capped in pyproject.toml
+from eth_account._utils.encode_typed_data.encoding_and_hashing import (
+    encode_field,
+    get_primary_type,
+    hash_domain,
+    hash_type,
+)
+from eth_account._utils.encode_typed_data.helpers import is_array_type, parse_parent_array_type
+from eth_account.messages import SignableMessage
+from eth_utils import ValidationError, keccak
+from hexbytes import HexBytes
+
+from radius_wallets.evm.types import EVMTypedData
+
+# Hash of an empty array member, as encoded by eth_account
+_EMPTY_ARRAY_HASH = keccak(b"")
+_NULL_STRUCT_HASH = b"\x00" * 32
+
+Fields = Tuple[Tuple[str, str], ...]
+
+
+class TypedDataStats(TypedDict):
+    """
+    Counters of a typed data encoder
+
+    Attributes:
+        hits: Payloads encoded with a cached domain separator and type hashes
+        misses: Payloads whose domain and types were hashed from scratch
+        evictions: Entries dropped to stay within the size bound
+        size: (domain, types) entries currently held
+        hit_rate: hits / (hits + misses), or 0.0 before any payload
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    hit_rate: float
+
+
+class _Schema:
+    """The hashed form of a set of EIP-712 types and the domain they are signed under."""
+
+    __slots__ = ("domain_separator", "primary_type", "types", "fields", "type_hashes")
+
+    def __init__(self, domain: Dict[str, Any], types: Dict[str, Any]):
+        self.types = {name: fields for name, fields in types.items() if name != "EIP712Domain"}
+        if "EIP712Domain" in types:
+            domain_fields = {field["name"] for field in types["EIP712Domain"]}
+            if set(domain) != domain_fields:
+                raise ValidationError(
+                    f"The fields provided in `domain` ({sorted(domain)}) do not match the fields "
+                    f"provided in `types.EIP712Domain` ({sorted(domain_fields)})"
+                )
+        self.domain_separator = hash_domain(domain)
+        self.primary_type = get_primary_type(self.types)
+        self.fields: Dict[str, Fields] = {
+            name: tuple((field["name"], field["type"]) for field in fields) for name, fields in self.types.items()
+        }
+        self.type_hashes = {name: hash_type(name, self.types) for name in self.types}
+
+
+class TypedDataEncoder:
+    """
+    Encodes EIP-712 typed data for signing, caching what repeats between payloads.
+
+    ``eth_account.messages.encode_typed_data`` hashes the domain and re-derives every type's
+    dependencies and type hash on each call, although agents sign structurally identical
+    payloads over and over, such as Uniswap Permit2 permits that differ only in amount, nonce
+    and deadline. This encoder keeps the domain separator, primary type and type hashes per
+    (domain, types) pair, so only the message struct is encoded and hashed per call. Encoding
+    is identical to ``encode_typed_data``, including its value coercions, and the payload is
+    never modified; a string ``chainId`` in the domain is read as an integer.
+
+    Thread safe; a single encoder may be shared by several wallet clients.
+
+    Args:
+        max_entries: Maximum number of cached (domain, types) pairs; least recently used entries are evicted first
+
+    Example:
+        ```python
+        encoder = TypedDataEncoder()
+        signed = account.sign_message(encoder.encode(permit))
+        ```
+    """
+
+    def __init__(self, max_entries: int = 256):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self._schemas: "OrderedDict[Hashable, _Schema]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def encode(self, data: EVMTypedData) -> SignableMessage:
+        """
+        Encodes typed data into a message ready to be signed.
+
+        Args:
+            data: The full typed data payload, with ``domain``, ``types``, ``message`` and
+                optionally ``primaryType``
+
+        Returns:
+            The EIP-712 signable message
+
+        Raises:
+            ValidationError: If the domain does not match ``types.EIP712Domain``, or
+                ``primaryType`` is not the primary type of ``types``
+        """
+        schema = self._schema(data)
+        primary_type = data.get("primaryType")
+        if primary_type is not None and primary_type != schema.primary_type:
+            raise ValidationError(
+                f"The provided `primaryType` ({primary_type}) does not match the derived "
+                f"`primaryType` ({schema.primary_type})"
+            )
+        message_hash = self._hash_struct(schema, schema.primary_type, data["message"])
+        return SignableMessage(HexBytes(b"\x01"), schema.domain_separator, message_hash)
+
+    def _schema(self, data: EVMTypedData) -> _Schema:
+        domain: Dict[str, Any] = dict(data["domain"])
+        if "chainId" in domain:
+            domain["chainId"] = int(domain["chainId"])
+        try:
+            key: Optional[Hashable] = (
+                tuple(sorted(domain.items())),
+                tuple(
+                    (name, tuple((field["name"], field["type"]) for field in fields))
+                    for name, fields in data["types"].items()
+                ),
+            )
+            hash(key)
+        except TypeError:
+            key = None
+
+        if key is not None:
+            with self._lock:
+                schema = self._schemas.get(key)
+                if schema is not None:
+                    self._schemas.move_to_end(key)
+                    self._hits += 1
+                    return schema
+
+        schema = _Schema(domain, data["types"])
+        with self._lock:
+            self._misses += 1
+            if key is not None:
+                self._schemas[key] = schema
+                while len(self._schemas) > self.max_entries:
+                    self._schemas.popitem(last=False)
+                    self._evictions += 1
+        return schema
+
+    def _hash_struct(self, schema: _Schema, type_: str, value: Dict[str, Any]) -> bytes:
+        # Every member encodes to one static 32-byte word, so the struct's ABI encoding is their
+        # concatenation
+        words = [schema.type_hashes[type_]]
+        for name, field_type in schema.fields[type_]:
+            words.append(self._encode_field(schema, name, field_type, value.get(name)))
+        return bytes(keccak(b"".join(words)))
+
+    def _encode_field(self, schema: _Schema, name: str, type_: str, value: Any) -> bytes:
+        # Structs and arrays are hashed here, with the cached type hashes; other values are
+        # encoded by eth_account, which also raises its errors for invalid structs and arrays
+        if type_ in schema.fields:
+            return _NULL_STRUCT_HASH if value is None else self._hash_struct(schema, type_, value)
+        if isinstance(value, list) and is_array_type(type_):
+            if not value:
+                return _EMPTY_ARRAY_HASH
+            item_type = parse_parent_array_type(type_)
+            return keccak(b"".join(self._encode_field(schema, name, item_type, item) for item in value))
+        encoded_type, encoded_value = encode_field(schema.types, name, type_, value)
+        return registry.get_encoder(encoded_type)(encoded_value)
+
+    def clear(self) -> None:
+        """Drops every entry and resets the statistics."""
+        with self._lock:
+            self._schemas.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def stats(self) -> TypedDataStats:
+        """Returns hit and miss counters for the cached domains and types."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "size": len(self._schemas),
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+            }
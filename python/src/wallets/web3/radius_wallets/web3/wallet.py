@@ -1,28 +1,68 @@
-from typing import Dict, Optional
+import time
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, cast
 from eth_typing import ChecksumAddress, HexStr
+from hexbytes import HexBytes
 from radius.classes.wallet_client_base import Balance, Signature
+from radius.utils.resilience import Resilience
+from radius.utils.single_flight import SingleFlight
 from web3 import Web3
-from web3.types import Wei, TxParams
+from web3.exceptions import BlockNotFound, TimeExhausted, TransactionNotFound
+from web3.types import FilterParams, Wei, TxParams, TxReceipt
 from eth_utils.address import to_checksum_address
-from eth_account.messages import encode_defunct, encode_typed_data
+from eth_account.messages import encode_defunct
+from eth_account.signers.local import LocalAccount
 
 from radius.types.chain import EvmChain
 from radius_wallets.evm import EVMWalletClient
 from radius_wallets.evm.types import (
+    EVMLog,
+    EVMLogFilter,
     EVMTransaction,
     EVMReadRequest,
     EVMReadResult,
     EVMTypedData,
     PaymasterOptions,
 )
+from .cache import RPCCache
+from .gas import GasEstimateCache, is_out_of_gas_error
+from .nonce import NonceManager
+from .resilience import ResilienceMiddleware
+from .typed_data import TypedDataEncoder
+
+if TYPE_CHECKING:
+    from .heads import BlockHeader, HeadSubscription
+    from .signing import SigningPool
+
+RPC_CACHE_MIDDLEWARE_NAME = "radius_rpc_cache"
+RESILIENCE_MIDDLEWARE_NAME = "radius_resilience"
+RECEIPT_TIMEOUT = 120.0
 
 
 class Web3Options:
     def __init__(
         self,
         paymaster: Optional[PaymasterOptions] = None,
+        rpc_cache: Optional[RPCCache] = None,
+        head_subscription: Optional["HeadSubscription"] = None,
+        account: Optional[LocalAccount] = None,
+        nonce_manager: Optional[NonceManager] = None,
+        resilience: Optional[Resilience] = None,
+        single_flight: Optional[SingleFlight] = None,
+        gas_cache: Optional[GasEstimateCache] = None,
+        typed_data_encoder: Optional[TypedDataEncoder] = None,
+        signing_pool: Optional["SigningPool"] = None,
     ):
         self.paymaster = paymaster
+        self.rpc_cache = rpc_cache
+        self.head_subscription = head_subscription
+        self.account = account
+        self.nonce_manager = nonce_manager
+        self.resilience = resilience
+        self.single_flight = single_flight
+        self.gas_cache = gas_cache
+        self.typed_data_encoder = typed_data_encoder
+        self.signing_pool = signing_pool
 
 
 class Web3EVMWalletClient(EVMWalletClient):
@@ -35,8 +75,58 @@ class Web3EVMWalletClient(EVMWalletClient):
         self._default_paymaster_input = (
             options.paymaster["input"] if options and options.paymaster else None
         )
+        self.rpc_cache = options.rpc_cache if options else None
+        if self.rpc_cache is not None:
+            self._install_rpc_cache(self.rpc_cache)
+        self.resilience = options.resilience if options else None
+        if self.resilience is not None:
+            self._install_resilience(self.resilience)
+        self.head_subscription = options.head_subscription if options else None
+        # Identical reads in flight at the same time share one RPC; pass a group to share it between wallets
+        self.single_flight = (options.single_flight if options else None) or SingleFlight()
+        # Repeated transactions of one kind reuse gas estimates instead of calling eth_estimateGas
+        self.gas_cache = options.gas_cache if options else None
+        # Domain separators and type hashes of signed typed data, reused between payloads
+        self.typed_data_encoder = (options.typed_data_encoder if options else None) or TypedDataEncoder()
+        # With a local account, transactions are signed here and sent raw instead of relying on
+        # the node (or web3's default account) to sign them
+        self._account = options.account if options else None
+        self._nonce_manager: Optional[NonceManager] = None
+        if self._account is not None:
+            self._nonce_manager = (options.nonce_manager if options else None) or NonceManager(web3)
+        if self.head_subscription is not None and self.rpc_cache is not None:
+            self.head_subscription.add_listener(self._observe_head)
+        # Batches of signatures are spread over the pool's worker processes
+        self.signing_pool = options.signing_pool if options else None
+        if self.signing_pool is not None and self.signing_pool.address != self.get_address():
+            raise ValueError("The signing pool must sign with the wallet's account")
+
+    def _install_rpc_cache(self, cache: RPCCache) -> None:
+        """Routes the Web3 instance's requests through the cache, closest to the provider."""
+        onion = self._web3.middleware_onion
+        if RPC_CACHE_MIDDLEWARE_NAME in onion:
+            onion.replace(RPC_CACHE_MIDDLEWARE_NAME, cache.middleware)
+        else:
+            onion.inject(cache.middleware, name=RPC_CACHE_MIDDLEWARE_NAME, layer=0)
+
+    def _install_resilience(self, resilience: Resilience) -> None:
+        """Applies timeouts, retries and circuit breaking to requests that reach the provider."""
+        middleware = partial(ResilienceMiddleware, resilience=resilience)
+        onion = self._web3.middleware_onion
+        if RESILIENCE_MIDDLEWARE_NAME in onion:
+            onion.replace(RESILIENCE_MIDDLEWARE_NAME, middleware)
+        else:
+            # Innermost, below the RPC cache, so cache hits skip it
+            onion.inject(middleware, name=RESILIENCE_MIDDLEWARE_NAME, layer=0)
+
+    def _observe_head(self, header: "BlockHeader") -> None:
+        """Publishes a new head from the subscription to the RPC cache."""
+        if self.rpc_cache is not None:
+            self.rpc_cache.observe_block(int(header["number"], 16))
 
     def get_address(self) -> str:
+        if self._account is not None:
+            return self._account.address
         if not self._web3.eth.default_account:
             return ""
         return self._web3.eth.default_account
@@ -62,32 +152,41 @@ class Web3EVMWalletClient(EVMWalletClient):
 
     def sign_message(self, message: str) -> Signature:
         """Sign a message with the current account."""
-        if not self._web3.eth.default_account:
+        if not self.get_address():
             raise ValueError("No account connected")
 
 
         signable_message = encode_defunct(text=message)
-        signed_message = self._web3.eth.default_local_account.sign_message(signable_message)  # type: ignore
+        signed_message = self._signer().sign_message(signable_message)
 
         return {"signature": self._web3.to_hex(signed_message.signature)}
 
     def sign_typed_data(self, data: EVMTypedData) -> Signature:
         """Sign typed data according to EIP-712."""
-        if not self._web3.eth.default_account:
+        if not self.get_address():
             raise ValueError("No account connected")
 
-        # Convert chain_id to int if it's present
-        if "chainId" in data["domain"]:
-            data["domain"]["chainId"] = int(data["domain"]["chainId"])
-        
-        structured_data = encode_typed_data(full_message=data)  # type: ignore
-        signed_message = self._web3.eth.default_local_account.sign_message(structured_data)  # type: ignore
+        structured_data = self.typed_data_encoder.encode(data)
+        signed_message = self._signer().sign_message(structured_data)
 
         return {"signature": self._web3.to_hex(signed_message.signature)}
 
+    def sign_messages(self, messages: Sequence[str]) -> List[Signature]:
+        """Sign several messages, in the signing pool's worker processes if the wallet has one."""
+        if self.signing_pool is None:
+            return super().sign_messages(messages)
+        return self.signing_pool.sign_messages(messages)
+
+    def sign_typed_data_many(self, payloads: Sequence[EVMTypedData]) -> List[Signature]:
+        """Sign several typed data payloads, in the signing pool's worker processes if the wallet has one."""
+        if self.signing_pool is None:
+            return super().sign_typed_data_many(payloads)
+        return self.signing_pool.sign_typed_data_many(payloads)
+
     def send_transaction(self, transaction: EVMTransaction) -> Dict[str, str]:
         """Send a transaction on Radius."""
-        if not self._web3.eth.default_account:
+        sender = self.get_address()
+        if not sender:
             raise ValueError("No account connected")
 
         to_address = self.resolve_address(transaction["to"])
@@ -100,7 +199,7 @@ class Web3EVMWalletClient(EVMWalletClient):
         # Simple ETH transfer
         if not transaction.get("abi"):
             tx_params: TxParams = {
-                "from": self._web3.eth.default_account,
+                "from": sender,
                 "to": to_checksum_address(to_address),
                 "chainId": self._web3.eth.chain_id,
                 "value": Wei(transaction.get("value", 0)),
@@ -110,8 +209,7 @@ class Web3EVMWalletClient(EVMWalletClient):
             if paymaster_address and paymaster_input:
                 raise NotImplementedError("Paymaster not supported")
 
-            tx_hash = self._web3.eth.send_transaction(tx_params)
-            return self._wait_for_receipt(HexStr(tx_hash.hex()))
+            return self._send_and_wait(tx_params, to_address, str(tx_params["data"]))
 
         # Contract call
         function_name = transaction.get("functionName")
@@ -129,7 +227,7 @@ class Web3EVMWalletClient(EVMWalletClient):
         # First simulate the contract call to catch any potential errors
         try:
             contract_function(*args).call({
-                "from": self._web3.eth.default_account,
+                "from": sender,
                 "value": Wei(transaction.get("value", 0)),
             })
         except Exception as e:
@@ -137,7 +235,7 @@ class Web3EVMWalletClient(EVMWalletClient):
 
         # Build transaction parameters
         tx_params: TxParams = {
-            "from": self._web3.eth.default_account,
+            "from": sender,
             "chainId": self._web3.eth.chain_id,
             "value": Wei(transaction.get("value", 0)),
         }
@@ -145,19 +243,30 @@ class Web3EVMWalletClient(EVMWalletClient):
         if paymaster_address and paymaster_input:
             raise NotImplementedError("Paymaster not supported")
 
-        # Build and send the transaction
-        tx = contract_function(*args).build_transaction(tx_params)
-        
-        # Get the nonce
-        tx["nonce"] = self._web3.eth.get_transaction_count(self._web3.eth.default_account)
-        
-        # Send the transaction
-        tx_hash = self._web3.eth.send_transaction(tx)
+        def build(params: TxParams) -> TxParams:
+            tx = contract_function(*args).build_transaction(params)
+            # Get the nonce (allocated locally when signing with a local account)
+            if self._account is None:
+                tx["nonce"] = self._web3.eth.get_transaction_count(sender)
+            return tx
 
-        return self._wait_for_receipt(HexStr(tx_hash.hex()))
+        # Build and send the transaction; the function selector only keys the gas cache
+        selector = contract_function(*args).selector if self.gas_cache is not None else ""
+        return self._send_and_wait(tx_params, contract.address, selector, build)
 
     def read(self, request: EVMReadRequest) -> EVMReadResult:
         """Read data from a smart contract."""
+        key = (
+            "read",
+            request["address"].lower(),
+            request["functionName"],
+            repr(request.get("args", [])),
+            # The ABI is alive while the call is in flight, so its id cannot be reused
+            id(request["abi"]),
+        )
+        return self.single_flight.do(key, lambda: self._read(request))
+
+    def _read(self, request: EVMReadRequest) -> EVMReadResult:
         contract = self._web3.eth.contract(
             address=self.resolve_address(request["address"]), abi=request["abi"]
         )
@@ -171,7 +280,9 @@ class Web3EVMWalletClient(EVMWalletClient):
     def balance_of(self, address: str) -> Balance:
         """Get the balance of an address."""
         resolved_address = self.resolve_address(address)
-        balance_wei = self._web3.eth.get_balance(resolved_address)
+        balance_wei = self.single_flight.do(
+            ("balance", resolved_address), lambda: self._web3.eth.get_balance(resolved_address)
+        )
 
         decimals = 18  # ETH decimals
         symbol = "ETH"
@@ -187,9 +298,113 @@ class Web3EVMWalletClient(EVMWalletClient):
             "in_base_units": str(balance_wei),
         }
 
+    def get_block_number(self) -> int:
+        """Get the number of the latest block."""
+        return self._web3.eth.block_number
+
+    def get_block_timestamp(self, block_number: int) -> int:
+        """Get the timestamp of a block, in seconds since the epoch."""
+        return int(self._web3.eth.get_block(block_number)["timestamp"])
+
+    def get_logs(self, filter: EVMLogFilter) -> List[EVMLog]:
+        """Get the event logs matching a filter."""
+        params: Dict[str, Any] = {"fromBlock": filter["fromBlock"], "toBlock": filter["toBlock"]}
+        if "address" in filter:
+            address = filter["address"]
+            params["address"] = (
+                to_checksum_address(address) if isinstance(address, str)
+                else [to_checksum_address(item) for item in address]
+            )
+        if "topics" in filter:
+            params["topics"] = filter["topics"]
+
+        logs: List[EVMLog] = []
+        for log in self._web3.eth.get_logs(cast(FilterParams, params)):
+            entry: EVMLog = {
+                "address": log["address"],
+                "topics": [HexBytes(topic).to_0x_hex() for topic in log["topics"]],
+                "data": HexBytes(log["data"]).to_0x_hex(),
+                "blockNumber": log["blockNumber"],
+                "transactionHash": HexBytes(log["transactionHash"]).to_0x_hex(),
+                "logIndex": log["logIndex"],
+            }
+            # Included by nodes implementing the current eth_getLogs spec
+            timestamp = cast(Dict[str, Any], log).get("blockTimestamp")
+            if timestamp is not None:
+                entry["timestamp"] = int(timestamp, 16) if isinstance(timestamp, str) else int(timestamp)
+            logs.append(entry)
+        return logs
+
+    def get_code(self, address: str) -> str:
+        """Get the bytecode deployed at an address as a hex string, ``"0x"`` when there is none."""
+        return HexBytes(self._web3.eth.get_code(to_checksum_address(address))).to_0x_hex()
+
+    def _signer(self) -> LocalAccount:
+        """The account used to sign messages."""
+        return self._account or self._web3.eth.default_local_account  # type: ignore
+
+    def _send(self, tx: TxParams) -> HexBytes:
+        """Send a transaction, signing it locally when the wallet has a local account."""
+        if self._account is None or self._nonce_manager is None:
+            return self._web3.eth.send_transaction(tx)
+
+        tx = cast(TxParams, dict(tx))
+        if "gas" not in tx:
+            tx["gas"] = self._web3.eth.estimate_gas(tx)
+        if "gasPrice" not in tx and "maxFeePerGas" not in tx:
+            tx["gasPrice"] = self._web3.eth.gas_price
+        with self._nonce_manager.allocate(self._account.address) as nonce:
+            tx["nonce"] = nonce
+            signed = self._account.sign_transaction(tx)  # type: ignore[arg-type]
+            return self._web3.eth.send_raw_transaction(signed.raw_transaction)
+
+    def _send_and_wait(
+        self,
+        tx_params: TxParams,
+        to: str,
+        data: str,
+        build: Callable[[TxParams], TxParams] = lambda params: cast(TxParams, dict(params)),
+    ) -> Dict[str, str]:
+        """
+        Build, send and confirm a transaction, taking its gas limit from the gas cache if enabled.
+
+        A transaction that runs out of gas with a cached limit is sent again with a fresh estimate.
+        """
+        if self.gas_cache is None or "gas" in tx_params:
+            return self._wait_for_receipt(HexStr(self._send(build(tx_params)).hex()))
+
+        key = self.gas_cache.key(str(tx_params["from"]), to, data)
+        gas = self.gas_cache.get(key)
+        if gas is not None:
+            try:
+                receipt = self._get_receipt(HexStr(self._send(build({**tx_params, "gas": gas})).hex()))
+            except Exception as error:
+                if not is_out_of_gas_error(error):
+                    raise
+            else:
+                # A failed transaction that used its whole gas limit ran out of gas
+                if receipt["status"] == 1 or receipt["gasUsed"] < gas:
+                    return self._format_receipt(receipt)
+            self.gas_cache.invalidate(key)
+
+        tx = build(tx_params)
+        if "gas" not in tx:
+            tx["gas"] = self._web3.eth.estimate_gas(tx)
+        self.gas_cache.put(key, int(tx["gas"]))
+        return self._wait_for_receipt(HexStr(self._send(tx).hex()))
+
     def _wait_for_receipt(self, tx_hash: HexStr) -> Dict[str, str]:
         """Wait for a transaction receipt and return standardized result."""
-        receipt = self._web3.eth.wait_for_transaction_receipt(tx_hash)
+        return self._format_receipt(self._get_receipt(tx_hash))
+
+    def _get_receipt(self, tx_hash: HexStr) -> TxReceipt:
+        """Wait for a transaction receipt, on new heads when subscribed."""
+        if self.head_subscription is not None and self.head_subscription.connected:
+            return self._wait_for_receipt_on_heads(tx_hash)
+        return self._web3.eth.wait_for_transaction_receipt(tx_hash)
+
+    def _format_receipt(self, receipt: TxReceipt) -> Dict[str, str]:
+        """Return the standardized result for a receipt."""
         # Remove '0x' prefix from hex string to match test expectations
         tx_hash_str = receipt["transactionHash"].hex().replace('0x', '')
         return {
@@ -197,6 +412,47 @@ class Web3EVMWalletClient(EVMWalletClient):
             "status": "1" if receipt["status"] == 1 else "0",
         }
 
+    def _wait_for_receipt_on_heads(self, tx_hash: HexStr, timeout: float = RECEIPT_TIMEOUT) -> TxReceipt:
+        """
+        Wait for a receipt by inspecting each new block announced by the head subscription.
+
+        Confirmation latency is bounded by the block time rather than a poll interval. Falls back
+        to polling if the subscription drops while waiting.
+        """
+        heads = cast("HeadSubscription", self.head_subscription)
+        deadline = time.monotonic() + timeout
+        # Read the head before the first receipt check so no block can be missed in between
+        seen = heads.block_number
+        try:
+            return self._web3.eth.get_transaction_receipt(tx_hash)
+        except TransactionNotFound:
+            pass
+
+        target = HexBytes(tx_hash)
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeExhausted(f"Transaction {tx_hash} is not in the chain after {timeout} seconds")
+            if not heads.connected:
+                return self._web3.eth.wait_for_transaction_receipt(tx_hash, timeout=remaining)
+
+            head = heads.wait_for_block(seen, timeout=min(remaining, heads.reconnect_delay + 1.0))
+            if head is None:
+                continue
+
+            first = head if seen is None or head < seen else seen + 1
+            for number in range(first, head + 1):
+                try:
+                    block = self._web3.eth.get_block(number)
+                except BlockNotFound:
+                    # The node serving HTTP requests has not caught up with the subscription yet
+                    head = number - 1
+                    time.sleep(0.01)
+                    break
+                if target in block["transactions"]:
+                    return self._web3.eth.get_transaction_receipt(tx_hash)
+            seen = head
+
 
 def web3(client: Web3, options: Optional[Web3Options] = None) -> Web3EVMWalletClient:
     """Create a new Web3EVMWalletClient instance."""
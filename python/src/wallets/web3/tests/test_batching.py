@@ -0,0 +1,208 @@
+"""
+Tests for the JSON-RPC batching provider, run against LocalChain served over HTTP.
+"""
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip("eth_tester")
+
+from web3 import Web3
+from web3.providers.base import JSONBaseProvider
+from web3._utils.encoding import Web3JsonEncoder
+
+from radius.utils.json_codec import JSONCodec, set_json_codec
+from radius_wallets.web3 import BatchingProvider, CodecHTTPProvider
+from radius_wallets.web3.testing import LocalChain
+
+
+class JSONRPCServer:
+    """HTTP JSON-RPC server answering single and batch requests from a LocalChain, recording POST sizes."""
+
+    def __init__(self, chain):
+        self.posts = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                requests = body if isinstance(body, list) else [body]
+                server.posts.append(len(requests) if isinstance(body, list) else 0)
+                responses = [
+                    {**chain.provider.make_request(request["method"], request["params"]), "id": request["id"]}
+                    for request in requests
+                ]
+                result = responses if isinstance(body, list) else responses[0]
+                payload = json.dumps(result, cls=Web3JsonEncoder).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self._httpd.server_address[1]}"
+        threading.Thread(target=self._httpd.serve_forever, daemon=True).start()
+
+    def stop(self):
+        self._httpd.shutdown()
+
+
+@pytest.fixture(scope="module")
+def local_chain():
+    """Fixture that provides a LocalChain shared by the module."""
+    return LocalChain(num_accounts=3)
+
+
+@pytest.fixture
+def rpc_server(local_chain):
+    """Fixture that serves the LocalChain over HTTP."""
+    server = JSONRPCServer(local_chain)
+    yield server
+    server.stop()
+
+
+def test_concurrent_requests_share_one_round_trip(rpc_server, local_chain):
+    """Test that requests made within the window are sent as one batch and demultiplexed."""
+    provider = BatchingProvider(rpc_server.url, window=0.2, max_batch_size=50)
+    w3 = Web3(provider)
+    addresses = [account.address for account in local_chain.accounts]
+    release = threading.Barrier(len(addresses))
+
+    def balance(address):
+        release.wait()
+        return w3.eth.get_balance(address)
+
+    with ThreadPoolExecutor(max_workers=len(addresses)) as executor:
+        balances = list(executor.map(balance, addresses))
+
+    assert balances == [local_chain.web3.eth.get_balance(address) for address in addresses]
+    assert rpc_server.posts == [3]
+    stats = provider.stats()
+    assert stats["requests"] == 3
+    assert stats["round_trips"] == 1
+    assert stats["max_batch_size"] == 3
+
+
+def test_full_batch_is_sent_without_waiting(rpc_server, local_chain):
+    """Test that a batch reaching max_batch_size is flushed immediately and the rest starts a new one."""
+    provider = BatchingProvider(rpc_server.url, window=5.0, max_batch_size=2)
+    w3 = Web3(provider)
+    addresses = [account.address for account in local_chain.accounts[:2]]
+    release = threading.Barrier(2)
+
+    def balance(address):
+        release.wait()
+        return w3.eth.get_balance(address)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert len(list(executor.map(balance, addresses))) == 2
+
+    assert rpc_server.posts == [2]
+
+
+def test_lone_request_is_sent_unbatched(rpc_server, local_chain):
+    """Test that a request with no company is sent as a plain request after the window."""
+    provider = BatchingProvider(rpc_server.url, window=0.001)
+
+    assert Web3(provider).eth.chain_id == local_chain.chain_id
+    assert rpc_server.posts == [0]
+    assert provider.stats()["batches"] == 0
+
+
+def test_explicit_batches_are_split(rpc_server, local_chain):
+    """Test that web3's batch_requests() is passed through in chunks of max_batch_size."""
+    provider = BatchingProvider(rpc_server.url, max_batch_size=2)
+    w3 = Web3(provider)
+
+    with w3.batch_requests() as batch:
+        for account in local_chain.accounts:
+            batch.add(w3.eth.get_balance(account.address))
+        results = batch.execute()
+
+    assert results == [local_chain.web3.eth.get_balance(account.address) for account in local_chain.accounts]
+    assert rpc_server.posts == [2, 1]
+
+
+def test_transactions_are_never_batched():
+    """Test that transactions are sent on their own even while reads are being batched."""
+
+    class RecordingProvider(JSONBaseProvider):
+        def __init__(self):
+            super().__init__()
+            self.calls = []
+
+        def make_request(self, method, params):
+            self.calls.append(method)
+            return {"jsonrpc": "2.0", "id": 1, "result": "0x1"}
+
+        def make_batch_request(self, requests):
+            self.calls.append([method for method, _ in requests])
+            return [{"jsonrpc": "2.0", "id": index, "result": "0x1"} for index in range(len(requests))]
+
+    recording = RecordingProvider()
+    provider = BatchingProvider(recording, window=0.2)
+    release = threading.Barrier(3)
+
+    def request(method):
+        release.wait()
+        return provider.make_request(method, [])
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        list(executor.map(request, ["eth_getBalance", "eth_sendRawTransaction", "eth_gasPrice"]))
+
+    assert recording.calls[0] == "eth_sendRawTransaction"
+    assert sorted(recording.calls[1]) == ["eth_gasPrice", "eth_getBalance"]
+
+
+def test_batch_falls_back_without_batch_support(local_chain):
+    """Test that requests are sent one by one to providers that cannot batch."""
+    provider = BatchingProvider(local_chain.provider, window=0.2)
+    w3 = Web3(provider)
+    addresses = [account.address for account in local_chain.accounts]
+    release = threading.Barrier(len(addresses))
+
+    def balance(address):
+        release.wait()
+        return w3.eth.get_balance(address)
+
+    with ThreadPoolExecutor(max_workers=len(addresses)) as executor:
+        balances = list(executor.map(balance, addresses))
+
+    assert balances == [local_chain.web3.eth.get_balance(address) for address in addresses]
+    assert provider.stats()["round_trips"] == 3
+
+
+def test_url_providers_decode_with_the_json_codec(rpc_server, local_chain):
+    """Test that providers built from a URL decode single and batch responses with the shared codec."""
+
+    class CountingCodec(JSONCodec):
+        def __init__(self):
+            self.decoded = 0
+
+        def loads(self, data):
+            self.decoded += 1
+            return super().loads(data)
+
+    codec = CountingCodec()
+    set_json_codec(codec)
+    try:
+        provider = BatchingProvider(rpc_server.url, max_batch_size=2)
+        w3 = Web3(provider)
+        assert isinstance(provider.provider, CodecHTTPProvider)
+
+        assert w3.eth.chain_id == local_chain.chain_id
+        with w3.batch_requests() as batch:
+            for account in local_chain.accounts[:2]:
+                batch.add(w3.eth.get_balance(account.address))
+            assert batch.execute() == [local_chain.web3.eth.get_balance(a.address) for a in local_chain.accounts[:2]]
+    finally:
+        set_json_codec(None)
+
+    assert codec.decoded == 2
@@ -0,0 +1,165 @@
+"""
+Tests for the gas estimate cache, run against LocalChain.
+"""
+import pytest
+
+pytest.importorskip("eth_tester")
+
+from radius_wallets.web3 import GasEstimateCache, Web3Options
+from radius_wallets.web3.testing import LocalChain
+
+TRANSFER_SELECTOR = "0xa9059cbb"
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture(scope="module")
+def local_chain():
+    """Fixture that provides a LocalChain shared by the module."""
+    return LocalChain(num_accounts=3)
+
+
+@pytest.fixture(autouse=True)
+def isolated_chain(local_chain):
+    """Reverts the shared chain to a clean state after every test."""
+    snapshot_id = local_chain.snapshot()
+    yield
+    local_chain.revert(snapshot_id)
+
+
+@pytest.fixture
+def estimates(local_chain, monkeypatch):
+    """Fixture that records the eth_estimateGas requests reaching the node."""
+    calls = []
+    tester = local_chain.provider.ethereum_tester
+    estimate_gas = tester.estimate_gas
+
+    def recording(*args, **kwargs):
+        calls.append(args)
+        return estimate_gas(*args, **kwargs)
+
+    monkeypatch.setattr(tester, "estimate_gas", recording)
+    return calls
+
+
+def transfer(local_chain, recipient, amount):
+    return {
+        "to": local_chain.token_address,
+        "abi": local_chain.token_contract().abi,
+        "functionName": "transfer",
+        "args": [recipient, amount],
+    }
+
+
+@pytest.mark.parametrize("signing", ["local", "node"])
+def test_repeated_transactions_skip_estimation(local_chain, estimates, signing):
+    """Test that only the first transaction of a kind is estimated, with local and node signing."""
+    cache = GasEstimateCache()
+    options = Web3Options(gas_cache=cache, account=local_chain.accounts[0] if signing == "local" else None)
+    wallet = local_chain.wallet(0, options)
+    recipient = local_chain.accounts[1].address
+
+    for _ in range(3):
+        assert wallet.send_transaction({"to": recipient, "value": 1})["status"] == "1"
+        assert wallet.send_transaction(transfer(local_chain, recipient, 10))["status"] == "1"
+
+    assert len(estimates) == 2
+    assert local_chain.token_contract().functions.balanceOf(recipient).call() == 30
+    stats = cache.stats()
+    assert stats["hits"] == 4
+    assert stats["misses"] == 2
+    assert stats["size"] == 2
+
+
+def test_wallet_without_cache_estimates_every_send(local_chain, estimates):
+    """Test that sends estimate gas as before unless the cache is enabled."""
+    wallet = local_chain.wallet(0, Web3Options(account=local_chain.accounts[0]))
+
+    for _ in range(2):
+        wallet.send_transaction({"to": local_chain.accounts[1].address, "value": 1})
+
+    assert len(estimates) == 2
+
+
+def test_out_of_gas_falls_back_to_a_fresh_estimate(local_chain, estimates):
+    """Test that a transaction mined as failed for lack of gas is sent again with a fresh estimate."""
+    cache = GasEstimateCache(multiplier=1.0)
+    wallet = local_chain.wallet(0, Web3Options(gas_cache=cache, account=local_chain.accounts[0]))
+    recipient = local_chain.accounts[1].address
+    key = cache.key(wallet.get_address(), local_chain.token_address, TRANSFER_SELECTOR)
+    # Enough to start executing the transfer, not to finish it
+    cache.put(key, 25_000)
+
+    result = wallet.send_transaction(transfer(local_chain, recipient, 10))
+
+    assert result["status"] == "1"
+    assert local_chain.token_contract().functions.balanceOf(recipient).call() == 10
+    assert len(estimates) == 1
+    assert cache.stats()["out_of_gas"] == 1
+    assert cache.get(key) > 25_000
+
+
+def test_rejected_transaction_falls_back_to_a_fresh_estimate(local_chain, estimates, monkeypatch):
+    """Test that a transaction the node rejects for too little gas is sent again with a fresh estimate."""
+    cache = GasEstimateCache()
+    wallet = local_chain.wallet(0, Web3Options(gas_cache=cache, account=local_chain.accounts[0]))
+    recipient = local_chain.accounts[1].address
+    wallet.send_transaction({"to": recipient, "value": 1})
+    tester = local_chain.provider.ethereum_tester
+    send_raw_transaction = tester.send_raw_transaction
+    rejected = []
+
+    def reject_once(raw_transaction):
+        if not rejected:
+            rejected.append(raw_transaction)
+            raise ValueError("intrinsic gas too low")
+        return send_raw_transaction(raw_transaction)
+
+    monkeypatch.setattr(tester, "send_raw_transaction", reject_once)
+    before = local_chain.web3.eth.get_balance(recipient)
+
+    assert wallet.send_transaction({"to": recipient, "value": 1})["status"] == "1"
+    assert local_chain.web3.eth.get_balance(recipient) == before + 1
+    assert len(estimates) == 2
+    assert cache.stats()["out_of_gas"] == 1
+
+
+def test_entries_refresh_and_keep_the_largest_estimate():
+    """Test that entries expire after the refresh interval and keep their largest estimate until then."""
+    clock = FakeClock()
+    cache = GasEstimateCache(multiplier=1.5, refresh_interval=60, clock=clock)
+    key = cache.key("0x" + "11" * 20, "0x" + "22" * 20, TRANSFER_SELECTOR + "00" * 64)
+
+    cache.put(key, 40_000)
+    cache.put(key, 30_000)
+    assert cache.get(key) == 60_000
+
+    clock.now = 60
+    assert cache.get(key) is None
+    cache.put(key, 30_000)
+    assert cache.get(key) == 45_000
+
+
+def test_keys_separate_recipients_selectors_and_sender_classes():
+    """Test that estimates are shared per recipient, selector and sender class."""
+    cache = GasEstimateCache(sender_class=lambda sender: sender.lower().startswith("0xaa"), max_entries=2)
+    token = "0x" + "22" * 20
+    plain, other_plain, special = "0x" + "11" * 20, "0x" + "33" * 20, "0x" + "aa" * 20
+
+    assert cache.key(plain, token, TRANSFER_SELECTOR) == cache.key(other_plain, token, TRANSFER_SELECTOR)
+    assert cache.key(special, token, TRANSFER_SELECTOR) != cache.key(plain, token, TRANSFER_SELECTOR)
+    assert cache.key(plain, token, "0x095ea7b3") != cache.key(plain, token, TRANSFER_SELECTOR)
+    assert cache.key(plain, token, "0x")[1] == ""
+
+    for selector in ("0x00000001", "0x00000002", "0x00000003"):
+        cache.put(cache.key(plain, token, selector), 21_000)
+    assert cache.stats()["size"] == 2
+    assert cache.stats()["evictions"] == 1
@@ -0,0 +1,120 @@
+"""
+Tests for the WebSocket newHeads subscription and head-driven receipts, run against LocalChain.
+"""
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("eth_tester")
+pytest.importorskip("websockets")
+
+from radius_wallets.web3 import HeadSubscription, RPCCache, Web3Options
+from radius_wallets.web3.testing import LocalChain
+
+TRANSFER_TOPIC = "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+
+
+@pytest.fixture
+def local_chain():
+    """Fixture that provides a fresh LocalChain."""
+    return LocalChain(num_accounts=2)
+
+
+@pytest.fixture
+def head_server(local_chain):
+    """Fixture that provides a running newHeads server for the chain."""
+    with local_chain.head_server() as server:
+        yield server
+
+
+@pytest.fixture
+def heads(head_server):
+    """Fixture that provides a started subscription to the head server."""
+    with HeadSubscription(head_server.url, reconnect_delay=0.05) as subscription:
+        yield subscription
+
+
+def test_subscription_receives_new_heads(local_chain, heads):
+    """Test that mined blocks are published to listeners in order."""
+    received = []
+    heads.add_listener(lambda header: received.append(int(header["number"], 16)))
+    start = local_chain.web3.eth.block_number
+
+    local_chain.mine(3)
+
+    latest = start
+    while latest != start + 3:
+        latest = heads.wait_for_block(latest, timeout=5)
+    assert received == [start + 1, start + 2, start + 3]
+    assert heads.block_number == start + 3
+
+
+def test_subscription_receives_logs(local_chain, head_server):
+    """Test that logs matching the filter are published to log listeners."""
+    received = []
+    logs_filter = {"address": local_chain.token_address, "topics": [TRANSFER_TOPIC]}
+    with HeadSubscription(head_server.url, logs=logs_filter) as heads:
+        heads.add_log_listener(received.append)
+        number = local_chain.web3.eth.block_number
+        local_chain.token_contract().functions.transfer(local_chain.accounts[1].address, 5).transact(
+            {"from": local_chain.accounts[0].address}
+        )
+        heads.wait_for_block(number, timeout=5)
+
+    assert len(received) == 1
+    assert received[0]["address"].lower() == local_chain.token_address.lower()
+    assert received[0]["topics"][0] == TRANSFER_TOPIC
+
+
+def test_receipt_resolved_from_new_block(local_chain, heads):
+    """Test that a pending transaction's receipt is resolved when its block is announced."""
+    wallet = local_chain.wallet(0, Web3Options(head_subscription=heads))
+    local_chain.tester.disable_auto_mine_transactions()
+    miner = threading.Timer(0.2, local_chain.mine)
+    miner.start()
+
+    started = time.monotonic()
+    result = wallet.send_transaction({"to": local_chain.accounts[1].address, "value": 1})
+    elapsed = time.monotonic() - started
+    miner.join()
+
+    assert result["status"] == "1"
+    assert 0.2 <= elapsed < 2
+
+
+def test_heads_invalidate_rpc_cache(local_chain, heads):
+    """Test that heads published by the subscription invalidate the wallet's RPC cache."""
+    cache = RPCCache(block_poll_interval=None)
+    wallet = local_chain.wallet(0, Web3Options(rpc_cache=cache, head_subscription=heads))
+    recipient = local_chain.accounts[1].address
+    before = wallet.balance_of(recipient)["in_base_units"]
+
+    # Sent by another client, so only the new head tells the cache the balance changed
+    number = local_chain.web3.eth.block_number
+    local_chain.web3.eth.send_transaction({"from": local_chain.accounts[0].address, "to": recipient, "value": 7})
+    heads.wait_for_block(number, timeout=5)
+
+    assert int(wallet.balance_of(recipient)["in_base_units"]) == int(before) + 7
+    assert cache.block_number == number + 1
+
+
+def test_subscription_reconnects(local_chain, head_server, heads):
+    """Test that the subscription reconnects and keeps publishing after the connection drops."""
+    head_server.disconnect_all()
+    number = local_chain.web3.eth.block_number
+
+    # Blocks mined before the client has resubscribed are missed, so keep mining until one arrives
+    deadline = time.monotonic() + 5
+    while heads.block_number is None and time.monotonic() < deadline:
+        local_chain.mine()
+        heads.wait_for_block(None, timeout=0.1)
+
+    assert heads.connected
+    assert heads.block_number is not None and heads.block_number > number
+
+
+def test_start_fails_without_server():
+    """Test that start raises when no server is listening."""
+    with pytest.raises(ConnectionError):
+        HeadSubscription("ws://127.0.0.1:9", open_timeout=0.5, reconnect_delay=0.05).start()
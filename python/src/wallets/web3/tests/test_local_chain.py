@@ -0,0 +1,200 @@
+"""
+End-to-end tests running the wallet, SendETHPlugin and ERC20 plugin against the in-process LocalChain.
+"""
+import pytest
+
+pytest.importorskip("eth_tester")
+
+from eth_account import Account
+from eth_account.messages import encode_defunct
+
+from radius import get_tools
+from radius_plugins.erc20 import ERC20PluginOptions, erc20
+from radius_wallets.evm import send_eth
+from radius_wallets.evm.send_eth import RADIUS_CHAIN_ID
+from radius_wallets.web3.testing import LatencyRecorder, LocalChain
+from radius_wallets.web3.testing.contracts import MULTICALL3_ABI, TOKEN_ABI
+
+
+@pytest.fixture(scope="module")
+def local_chain():
+    """Fixture that provides a LocalChain shared by the module."""
+    return LocalChain()
+
+
+@pytest.fixture(autouse=True)
+def isolated_chain(local_chain):
+    """Reverts the shared chain to a clean state after every test."""
+    snapshot_id = local_chain.snapshot()
+    yield
+    local_chain.revert(snapshot_id)
+
+
+@pytest.fixture
+def tools(local_chain):
+    """Fixture that provides the SendETH and ERC20 tools for the first account, keyed by name."""
+    wallet = local_chain.wallet(0)
+    plugins = [send_eth(), erc20(ERC20PluginOptions(tokens=[local_chain.token]))]
+    return {tool.name: tool for tool in get_tools(wallet, plugins)}
+
+
+def test_wallet_reports_radius_chain(local_chain):
+    """Test that the local chain identifies itself as Radius."""
+    wallet = local_chain.wallet(0)
+
+    assert wallet.get_chain() == {"type": "evm", "id": RADIUS_CHAIN_ID}
+    assert wallet.get_address() == local_chain.accounts[0].address
+
+
+def test_send_eth_tool(local_chain, tools):
+    """Test sending ETH through the SendETHPlugin tool."""
+    recipient = local_chain.accounts[1].address
+    before = local_chain.web3.eth.get_balance(recipient)
+
+    tx_hash = tools["send_ETH"].execute({"to": recipient, "amount": "1.5"})
+
+    assert len(tx_hash) == 64
+    assert local_chain.web3.eth.get_balance(recipient) - before == 1500000000000000000
+
+
+def test_balance_of(local_chain):
+    """Test reading a native balance through the wallet client."""
+    wallet = local_chain.wallet(0)
+    balance = wallet.balance_of(local_chain.accounts[3].address)
+
+    assert balance["symbol"] == "ETH"
+    assert int(balance["in_base_units"]) == local_chain.web3.eth.get_balance(local_chain.accounts[3].address)
+
+
+def test_erc20_transfer_and_balance(local_chain, tools):
+    """Test transferring tokens and reading balances through the ERC20 plugin tools."""
+    recipient = local_chain.accounts[1].address
+
+    tools["transfer"].execute({"tokenAddress": local_chain.token_address, "to": recipient, "amount": "1000"})
+
+    balance = tools["get_token_balance"].execute({"wallet": recipient, "tokenAddress": local_chain.token_address})
+    assert balance == 1000
+
+
+def test_erc20_approve_and_transfer_from(local_chain, tools):
+    """Test approving a spender that then moves tokens with transferFrom."""
+    owner = local_chain.accounts[0].address
+    spender_wallet = local_chain.wallet(1)
+    recipient = local_chain.accounts[2].address
+
+    tools["approve"].execute(
+        {"tokenAddress": local_chain.token_address, "spender": spender_wallet.get_address(), "amount": "500"}
+    )
+    allowance = tools["get_token_allowance"].execute(
+        {"tokenAddress": local_chain.token_address, "owner": owner, "spender": spender_wallet.get_address()}
+    )
+    assert allowance == 500
+
+    spender_tools = {
+        tool.name: tool
+        for tool in get_tools(spender_wallet, [erc20(ERC20PluginOptions(tokens=[local_chain.token]))])
+    }
+    spender_tools["transfer_from"].execute(
+        {"tokenAddress": local_chain.token_address, "from": owner, "to": recipient, "amount": "200"}
+    )
+
+    assert tools["get_token_balance"].execute({"wallet": recipient, "tokenAddress": local_chain.token_address}) == 200
+
+
+def test_erc20_token_info_and_total_supply(local_chain, tools):
+    """Test that the deployed token is registered with the ERC20 plugin."""
+    info = tools["get_token_info_by_symbol"].execute({"symbol": local_chain.token_symbol})
+    total_supply = tools["get_token_total_supply"].execute({"tokenAddress": local_chain.token_address})
+
+    assert info["contractAddress"] == local_chain.token_address
+    assert total_supply == 10**9 * 10**18
+
+
+def test_multicall_aggregate3(local_chain):
+    """Test aggregating token reads through the deployed Multicall3 contract."""
+    wallet = local_chain.wallet(0)
+    token = local_chain.token_contract()
+    owner = local_chain.accounts[0].address
+    calls = [
+        (local_chain.token_address, False, token.encode_abi("balanceOf", [owner])),
+        (local_chain.token_address, False, token.encode_abi("decimals", [])),
+    ]
+
+    result = wallet.read(
+        {
+            "address": local_chain.multicall_address,
+            "abi": MULTICALL3_ABI,
+            "functionName": "aggregate3",
+            "args": [calls],
+        }
+    )
+
+    (balance_ok, balance_data), (decimals_ok, decimals_data) = result["value"]
+    assert balance_ok and decimals_ok
+    assert int.from_bytes(balance_data, "big") == 10**9 * 10**18
+    assert int.from_bytes(decimals_data, "big") == 18
+
+
+def test_sign_message_recovers_signer(local_chain):
+    """Test that signatures from the local account recover to the wallet address."""
+    wallet = local_chain.wallet(0)
+    signature = wallet.sign_message("hello radius")
+
+    recovered = Account.recover_message(encode_defunct(text="hello radius"), signature=signature["signature"])
+    assert recovered == wallet.get_address()
+
+
+def test_mint(local_chain):
+    """Test minting test tokens to an arbitrary account."""
+    recipient = local_chain.accounts[4].address
+    local_chain.mint(recipient, 42)
+
+    contract = local_chain.web3.eth.contract(address=local_chain.token_address, abi=TOKEN_ABI)
+    assert contract.functions.balanceOf(recipient).call() == 42
+
+
+def test_get_logs(local_chain):
+    """Test reading Transfer logs and block timestamps through the wallet client."""
+    wallet = local_chain.wallet(0)
+    recipient = local_chain.accounts[4].address
+    start = wallet.get_block_number() + 1
+    local_chain.mint(recipient, 42)
+
+    transfer_topic = "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+    logs = wallet.get_logs({
+        "fromBlock": start,
+        "toBlock": wallet.get_block_number(),
+        "address": local_chain.token_address,
+        "topics": [transfer_topic],
+    })
+
+    assert len(logs) == 1
+    assert logs[0]["address"] == local_chain.token_address
+    assert logs[0]["topics"][0] == transfer_topic
+    assert logs[0]["topics"][2][-40:] == recipient[2:].lower()
+    assert int(logs[0]["data"], 16) == 42
+    assert wallet.get_block_timestamp(logs[0]["blockNumber"]) > 0
+
+
+def test_get_code(local_chain):
+    """Test that contracts have code and accounts do not."""
+    wallet = local_chain.wallet(0)
+
+    assert len(wallet.get_code(local_chain.multicall_address)) > 2
+    assert wallet.get_code(local_chain.accounts[1].address) == "0x"
+
+
+def test_latency_recorder_report(local_chain, tools):
+    """Test that latencies of end-to-end tool calls are recorded and summarized."""
+    recorder = LatencyRecorder()
+    recipient = local_chain.accounts[1].address
+
+    for _ in range(3):
+        with recorder.measure("send_ETH"):
+            tools["send_ETH"].execute({"to": recipient, "amount": "0.01"})
+
+    report = recorder.report()
+    assert report["send_ETH"]["count"] == 3
+    assert report["send_ETH"]["p50_ms"] <= report["send_ETH"]["p99_ms"]
+    assert report["send_ETH"]["throughput"] > 0
+    assert "send_ETH" in recorder.format_report()
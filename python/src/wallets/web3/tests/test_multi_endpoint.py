@@ -0,0 +1,244 @@
+"""
+Tests for the multi-endpoint provider with latency-based load balancing and hedged reads.
+"""
+import threading
+import time
+
+import pytest
+from web3 import Web3
+from web3.providers.base import BaseProvider
+
+from radius_wallets.web3 import MultiEndpointProvider
+
+
+class FakeProvider(BaseProvider):
+    """Provider answering every request after a configurable delay, or failing."""
+
+    def __init__(self, name, delay=0.0, fail=False):
+        super().__init__()
+        self.endpoint_uri = name
+        self.delay = delay
+        self.fail = fail
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def make_request(self, method, params):
+        with self._lock:
+            self.calls.append(method)
+        time.sleep(self.delay)
+        if self.fail:
+            raise ConnectionError(f"{self.endpoint_uri} is down")
+        return {"jsonrpc": "2.0", "id": 1, "result": "0x1"}
+
+    def is_connected(self, show_traceback=False):
+        return not self.fail
+
+
+class ChainNode(FakeProvider):
+    """Provider reporting a head block, accepting transactions and returning receipts of mined ones."""
+
+    def __init__(self, name, head, delay=0.0):
+        super().__init__(name, delay)
+        self.head = head
+        self.mined = set()
+
+    def make_request(self, method, params):
+        super().make_request(method, params)
+        if method == "eth_blockNumber":
+            return {"jsonrpc": "2.0", "id": 1, "result": hex(self.head)}
+        if method == "eth_sendRawTransaction":
+            return {"jsonrpc": "2.0", "id": 1, "result": "0x" + "ab" * 32}
+        if method == "eth_getTransactionReceipt":
+            receipt = {"transactionHash": params[0], "status": "0x1"} if params[0] in self.mined else None
+            return {"jsonrpc": "2.0", "id": 1, "result": receipt}
+        return {"jsonrpc": "2.0", "id": 1, "result": hex(self.head)}
+
+
+def test_reads_prefer_fastest_endpoint():
+    """Test that reads are routed to the endpoint with the lowest observed latency."""
+    fast = FakeProvider("fast", delay=0.001)
+    slow = FakeProvider("slow", delay=0.02)
+    provider = MultiEndpointProvider([slow, fast], hedge=False)
+
+    for _ in range(20):
+        provider.make_request("eth_call", [{}, "latest"])
+
+    # Both endpoints are sampled once, then the fast one takes the traffic
+    assert len(slow.calls) == 1
+    assert len(fast.calls) == 19
+    stats = provider.stats()
+    assert stats["fast"]["ewma_ms"] < stats["slow"]["ewma_ms"]
+    assert stats["fast"]["p50_ms"] > 0
+
+
+def test_slow_read_is_hedged():
+    """Test that a read exceeding the hedge delay is duplicated and the faster answer wins."""
+    stalled = FakeProvider("stalled", delay=0.5)
+    healthy = FakeProvider("healthy", delay=0.001)
+    provider = MultiEndpointProvider([stalled, healthy], initial_hedge_delay=0.02)
+
+    started = time.perf_counter()
+    response = provider.make_request("eth_getBalance", ["0x0", "latest"])
+    elapsed = time.perf_counter() - started
+
+    assert response["result"] == "0x1"
+    assert elapsed < 0.3
+    assert provider.stats()["healthy"]["hedges"] == 1
+    provider.close()
+
+
+def test_hedge_delay_follows_latency_percentile():
+    """Test that the hedge delay comes from the endpoint's latency percentile once it has samples."""
+    endpoint = FakeProvider("a", delay=0.0)
+    provider = MultiEndpointProvider(
+        [endpoint, FakeProvider("b")], min_samples=5, min_hedge_delay=0.001, initial_hedge_delay=1.0
+    )
+
+    assert provider._hedge_delay(provider._endpoints[0]) == 1.0
+    provider._endpoints[0].latencies.extend([0.01, 0.01, 0.01, 0.01, 0.05])
+    assert provider._hedge_delay(provider._endpoints[0]) == 0.05
+
+
+def test_writes_are_pinned_to_one_endpoint():
+    """Test that writes and nonce queries always go to the first healthy endpoint."""
+    first = FakeProvider("first", delay=0.01)
+    second = FakeProvider("second", delay=0.0)
+    provider = MultiEndpointProvider([first, second], hedge=False)
+
+    for _ in range(3):
+        provider.make_request("eth_getTransactionCount", ["0x0", "pending"])
+        provider.make_request("eth_sendRawTransaction", ["0x00"])
+
+    assert first.calls == ["eth_getTransactionCount", "eth_sendRawTransaction"] * 3
+    assert second.calls == []
+
+
+def test_failover_and_passive_health_checks():
+    """Test that failing endpoints are skipped and taken out of rotation after repeated errors."""
+    broken = FakeProvider("broken", fail=True)
+    working = FakeProvider("working")
+    provider = MultiEndpointProvider([broken, working], hedge=False, max_failures=2, cooldown=60)
+
+    for _ in range(5):
+        assert provider.make_request("eth_sendRawTransaction", ["0x00"])["result"] == "0x1"
+        assert provider.make_request("eth_call", [{}, "latest"])["result"] == "0x1"
+
+    stats = provider.stats()
+    assert stats["broken"]["healthy"] is False
+    assert stats["broken"]["failures"] == 2
+    assert stats["working"]["healthy"] is True
+
+
+def test_non_idempotent_writes_do_not_fail_over():
+    """Test that node-signed transactions are not re-sent to another endpoint."""
+    broken = FakeProvider("broken", fail=True)
+    working = FakeProvider("working")
+    provider = MultiEndpointProvider([broken, working], hedge=False)
+
+    with pytest.raises(ConnectionError):
+        provider.make_request("eth_sendTransaction", [{}])
+    assert working.calls == []
+
+
+def test_all_endpoints_failing():
+    """Test that a read fails once every endpoint has failed."""
+    provider = MultiEndpointProvider([FakeProvider("a", fail=True), FakeProvider("b", fail=True)])
+
+    with pytest.raises(ConnectionError):
+        provider.make_request("eth_chainId", [])
+    provider.close()
+
+
+def test_latest_reads_skip_lagging_endpoints():
+    """Test that reads of the latest block avoid an endpoint behind the highest head, while historical reads do not."""
+    lagging = ChainNode("lagging", head=90, delay=0.0)
+    synced = ChainNode("synced", head=100, delay=0.005)
+    provider = MultiEndpointProvider([lagging, synced], hedge=False)
+
+    # Both endpoints are sampled first, which reports their heads
+    assert [provider.make_request("eth_blockNumber", [])["result"] for _ in range(2)] == ["0x5a", "0x64"]
+    lagging.calls.clear()
+    synced.calls.clear()
+
+    for _ in range(3):
+        assert provider.make_request("eth_blockNumber", [])["result"] == "0x64"
+        provider.make_request("eth_call", [{}, "latest"])
+        provider.make_request("eth_getLogs", [{"fromBlock": "0x1"}])
+        provider.make_request("eth_getBalance", ["0x0", "0x10"])
+
+    assert lagging.calls == ["eth_getBalance"] * 3
+    assert synced.calls == ["eth_blockNumber", "eth_call", "eth_getLogs"] * 3
+    stats = provider.stats()
+    assert stats["lagging"]["head"] == 90
+    assert stats["synced"]["head"] == 100
+
+
+def test_lagging_endpoint_is_retried_once_its_head_is_stale():
+    """Test that an endpoint left out for lagging is tried again after head_max_age and used once caught up."""
+    lagging = ChainNode("lagging", head=90, delay=0.0)
+    synced = ChainNode("synced", head=100, delay=0.005)
+    provider = MultiEndpointProvider([lagging, synced], hedge=False, max_head_lag=2, head_max_age=0.05)
+    provider.make_request("eth_blockNumber", [])
+    provider.make_request("eth_blockNumber", [])
+
+    lagging.head = 99
+    time.sleep(0.06)
+    assert provider.make_request("eth_blockNumber", [])["result"] == "0x63"
+    # Within max_head_lag of the highest head, the faster endpoint serves latest reads again
+    provider.make_request("eth_call", [{}, "latest"])
+
+    assert lagging.calls[-2:] == ["eth_blockNumber", "eth_call"]
+
+
+def test_receipts_are_read_from_the_accepting_endpoint():
+    """Test that a transaction lookup goes to the endpoint that accepted the transaction until it is mined."""
+    accepting = ChainNode("accepting", head=100, delay=0.005)
+    other = ChainNode("other", head=100, delay=0.0)
+    provider = MultiEndpointProvider([accepting, other], hedge=False)
+
+    tx_hash = provider.make_request("eth_sendRawTransaction", ["0x00"])["result"]
+    assert provider.make_request("eth_getTransactionReceipt", [tx_hash])["result"] is None
+    accepting.mined.add(tx_hash)
+    assert provider.make_request("eth_getTransactionReceipt", [tx_hash])["result"]["status"] == "0x1"
+
+    assert accepting.calls == ["eth_sendRawTransaction", "eth_getTransactionReceipt", "eth_getTransactionReceipt"]
+    assert other.calls == []
+    # Mined, so later lookups are load-balanced like other reads
+    assert provider._senders == {}
+
+
+def test_requires_endpoints():
+    """Test that at least one endpoint is required."""
+    with pytest.raises(ValueError):
+        MultiEndpointProvider([])
+
+
+def test_wallet_over_multiple_endpoints():
+    """Test that a wallet works end to end over several providers of the same chain."""
+    pytest.importorskip("eth_tester")
+    from radius_wallets.web3 import Web3EVMWalletClient, Web3Options
+    from radius_wallets.web3.testing import LocalChain
+
+    class TesterEndpoint(BaseProvider):
+        """Endpoint forwarding raw JSON-RPC to the chain through eth-tester's request formatting."""
+
+        def __init__(self, chain):
+            super().__init__()
+            self._w3 = Web3(chain.provider, middleware=[])
+
+        def make_request(self, method, params):
+            return self._w3.provider.request_func(self._w3, self._w3.middleware_onion)(method, params)
+
+        def is_connected(self, show_traceback=False):
+            return True
+
+    chain = LocalChain(num_accounts=2)
+    provider = MultiEndpointProvider([TesterEndpoint(chain), TesterEndpoint(chain)])
+    wallet = Web3EVMWalletClient(Web3(provider), Web3Options(account=chain.accounts[0]))
+    recipient = chain.accounts[1].address
+    before = chain.web3.eth.get_balance(recipient)
+
+    assert wallet.send_transaction({"to": recipient, "value": 3})["status"] == "1"
+    assert int(wallet.balance_of(recipient)["in_base_units"]) == before + 3
+    assert sum(stats["requests"] for stats in provider.stats().values()) > 0
+    provider.close()
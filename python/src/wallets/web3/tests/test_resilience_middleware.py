@@ -0,0 +1,88 @@
+"""
+Tests for applying the resilience policy to Web3 wallet requests.
+"""
+import pytest
+from web3 import Web3
+from web3.providers.base import BaseProvider
+
+from radius.utils.resilience import CircuitOpenError, Resilience, ResiliencePolicy
+from radius_wallets.web3 import RPCCache, Web3EVMWalletClient, Web3Options
+
+ADDRESS = "0x7E5F4552091A69125d5DfCb7b8C2659029395Bdf"
+
+
+class FlakyProvider(BaseProvider):
+    """Provider failing the first ``failures`` requests with a connection error."""
+
+    endpoint_uri = "http://flaky-node"
+
+    def __init__(self, failures):
+        super().__init__()
+        self.failures = failures
+        self.calls = []
+
+    def make_request(self, method, params):
+        self.calls.append(method)
+        if len(self.calls) <= self.failures:
+            raise ConnectionError("connection reset by peer")
+        if method == "eth_sendRawTransaction":
+            return {"jsonrpc": "2.0", "id": 1, "result": "0x" + "ab" * 32}
+        return {"jsonrpc": "2.0", "id": 1, "result": "0x5"}
+
+    def is_connected(self, show_traceback=False):
+        return True
+
+
+def make_wallet(provider, resilience, **options):
+    return Web3EVMWalletClient(Web3(provider), Web3Options(resilience=resilience, **options))
+
+
+def test_reads_are_retried():
+    """Test that a transient node error on a read is retried instead of failing the tool call."""
+    provider = FlakyProvider(failures=1)
+    resilience = Resilience(ResiliencePolicy(base_delay=0.001))
+    wallet = make_wallet(provider, resilience)
+
+    assert wallet.balance_of(ADDRESS)["in_base_units"] == "5"
+    assert provider.calls == ["eth_getBalance", "eth_getBalance"]
+    assert resilience.stats()["retries"] == 1
+
+
+def test_transactions_are_not_retried():
+    """Test that sending a transaction is attempted only once."""
+    provider = FlakyProvider(failures=1)
+    resilience = Resilience(ResiliencePolicy(base_delay=0.001))
+    w3 = make_wallet(provider, resilience)._web3
+
+    with pytest.raises(ConnectionError):
+        w3.eth.send_raw_transaction("0x00")
+    assert provider.calls == ["eth_sendRawTransaction"]
+
+
+def test_breaker_fails_fast_for_unreachable_node():
+    """Test that an unreachable node trips the breaker so later calls fail without a request."""
+    provider = FlakyProvider(failures=100)
+    resilience = Resilience(ResiliencePolicy(max_retries=0, failure_threshold=2))
+    wallet = make_wallet(provider, resilience)
+
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            wallet.balance_of(ADDRESS)
+    with pytest.raises(CircuitOpenError):
+        wallet.balance_of(ADDRESS)
+
+    assert len(provider.calls) == 2
+    assert resilience.stats()["open_circuits"] == ["http://flaky-node"]
+
+
+def test_cache_hits_bypass_resilience():
+    """Test that the resilience middleware sits below the RPC cache."""
+    provider = FlakyProvider(failures=0)
+    resilience = Resilience()
+    wallet = make_wallet(provider, resilience, rpc_cache=RPCCache(block_poll_interval=None))
+
+    wallet.balance_of(ADDRESS)
+    wallet.balance_of(ADDRESS)
+
+    assert provider.calls == ["eth_getBalance"]
+    assert resilience.stats()["calls"] == 1
@@ -0,0 +1,206 @@
+"""
+Tests for the block-aware RPC response cache.
+"""
+import pytest
+
+from radius_wallets.web3 import RPCCache, Web3Options
+
+
+class FakeNode:
+    """Callable standing in for the next request function, counting requests per method."""
+
+    def __init__(self, block_number=1):
+        self.block_number = block_number
+        self.calls = []
+
+    def __call__(self, method, params):
+        self.calls.append(method)
+        if method == "eth_blockNumber":
+            return {"jsonrpc": "2.0", "id": 1, "result": hex(self.block_number)}
+        if method == "eth_call" and params[0].get("data") == "0xbad":
+            return {"jsonrpc": "2.0", "id": 1, "error": {"code": 3, "message": "execution reverted"}}
+        return {"jsonrpc": "2.0", "id": 1, "result": f"{method}@{self.block_number}"}
+
+    def count(self, method):
+        return self.calls.count(method)
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+CALL = [{"to": "0x0000000000000000000000000000000000000001", "data": "0x70a08231"}, "latest"]
+
+
+def test_repeated_reads_hit_cache():
+    """Test that identical reads at the same head are served from the cache."""
+    cache = RPCCache(block_poll_interval=None)
+    node = FakeNode()
+
+    first = cache.request(node, "eth_call", CALL)
+    second = cache.request(node, "eth_call", CALL)
+
+    assert first == second
+    assert node.count("eth_call") == 1
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+
+
+def test_new_block_invalidates_head_reads():
+    """Test that observing a new block drops "latest" entries but keeps block-pinned ones."""
+    cache = RPCCache(block_poll_interval=None)
+    node = FakeNode()
+    pinned = ["0x0000000000000000000000000000000000000001", "0x1"]
+
+    cache.observe_block(1)
+    cache.request(node, "eth_call", CALL)
+    cache.request(node, "eth_getBalance", pinned)
+    cache.request(node, "eth_chainId", [])
+
+    node.block_number = 2
+    cache.observe_block(2)
+    assert cache.request(node, "eth_call", CALL)["result"] == "eth_call@2"
+    cache.request(node, "eth_getBalance", pinned)
+    cache.request(node, "eth_chainId", [])
+
+    assert node.count("eth_call") == 2
+    assert node.count("eth_getBalance") == 1
+    assert node.count("eth_chainId") == 1
+    assert cache.stats()["invalidations"] == 2
+
+
+def test_block_number_responses_are_observed():
+    """Test that eth_blockNumber responses passing through the cache update the head."""
+    cache = RPCCache(block_poll_interval=None)
+    node = FakeNode(block_number=5)
+
+    cache.request(node, "eth_blockNumber", [])
+    assert cache.block_number == 5
+
+
+def test_head_is_polled_after_interval():
+    """Test that head reads are re-validated against eth_blockNumber once per poll interval."""
+    clock = FakeClock()
+    cache = RPCCache(block_poll_interval=1.0, clock=clock)
+    node = FakeNode()
+
+    cache.request(node, "eth_call", CALL)
+    cache.request(node, "eth_call", CALL)
+    assert node.count("eth_blockNumber") == 1
+    assert node.count("eth_call") == 1
+
+    clock.now = 1.5
+    cache.request(node, "eth_call", CALL)
+    assert node.count("eth_blockNumber") == 2
+    assert node.count("eth_call") == 1
+
+    clock.now = 3.0
+    node.block_number = 2
+    cache.request(node, "eth_call", CALL)
+    assert node.count("eth_call") == 2
+
+
+def test_max_age_bounds_head_reads():
+    """Test that head reads older than max_age are refetched even without a new block."""
+    clock = FakeClock()
+    cache = RPCCache(block_poll_interval=None, max_age=2.0, clock=clock)
+    node = FakeNode()
+
+    cache.request(node, "eth_call", CALL)
+    clock.now = 3.0
+    cache.request(node, "eth_call", CALL)
+
+    assert node.count("eth_call") == 2
+
+
+def test_sending_transaction_invalidates():
+    """Test that sending a transaction through the cache invalidates head reads."""
+    cache = RPCCache(block_poll_interval=None)
+    node = FakeNode()
+
+    cache.request(node, "eth_call", CALL)
+    cache.request(node, "eth_sendRawTransaction", ["0x00"])
+    cache.request(node, "eth_call", CALL)
+
+    assert node.count("eth_call") == 2
+
+
+def test_errors_and_pending_reads_are_not_cached():
+    """Test that error responses and "pending" reads always go to the node."""
+    cache = RPCCache(block_poll_interval=None)
+    node = FakeNode()
+    failing = [{"to": "0x0000000000000000000000000000000000000001", "data": "0xbad"}, "latest"]
+
+    for _ in range(2):
+        assert "error" in cache.request(node, "eth_call", failing)
+        cache.request(node, "eth_getBalance", ["0x0000000000000000000000000000000000000001", "pending"])
+
+    assert node.count("eth_call") == 2
+    assert node.count("eth_getBalance") == 2
+    assert cache.stats()["size"] == 0
+
+
+def test_lru_eviction():
+    """Test that the least recently used entry is evicted when the cache is full."""
+    cache = RPCCache(max_entries=2, block_poll_interval=None)
+    node = FakeNode()
+
+    cache.request(node, "eth_getBalance", ["0xa", "latest"])
+    cache.request(node, "eth_getBalance", ["0xb", "latest"])
+    cache.request(node, "eth_getBalance", ["0xa", "latest"])
+    cache.request(node, "eth_getBalance", ["0xc", "latest"])
+    cache.request(node, "eth_getBalance", ["0xa", "latest"])
+    cache.request(node, "eth_getBalance", ["0xb", "latest"])
+
+    assert node.count("eth_getBalance") == 4
+    assert cache.stats()["evictions"] == 2
+
+
+def test_invalid_size():
+    """Test that a cache must hold at least one entry."""
+    with pytest.raises(ValueError):
+        RPCCache(max_entries=0)
+
+
+def test_wallet_reads_through_cache():
+    """Test that a wallet configured with a cache serves repeated reads without the node."""
+    pytest.importorskip("eth_tester")
+    from radius_wallets.web3.testing import LocalChain
+
+    chain = LocalChain(num_accounts=2)
+    cache = RPCCache(block_poll_interval=None)
+    wallet = chain.wallet(0, Web3Options(rpc_cache=cache))
+    other = chain.accounts[1].address
+    balance_request = {
+        "address": chain.token_address,
+        "abi": chain.token_contract().abi,
+        "functionName": "balanceOf",
+        "args": [wallet.get_address()],
+    }
+
+    balance = wallet.read(balance_request)["value"]
+    wallet.get_chain()
+    before = chain.request_count
+    for _ in range(3):
+        assert wallet.read(balance_request)["value"] == balance
+        wallet.balance_of(wallet.get_address())
+        wallet.get_chain()
+    # Only the first balance_of reaches the node; the other reads are cache hits
+    assert chain.request_count - before == 1
+
+    wallet.send_transaction({
+        "to": chain.token_address,
+        "abi": chain.token_contract().abi,
+        "functionName": "transfer",
+        "args": [other, 10],
+    })
+    assert wallet.read(balance_request)["value"] == balance - 10
+    assert cache.stats()["hits"] > 0
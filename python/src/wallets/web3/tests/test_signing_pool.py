@@ -0,0 +1,90 @@
+"""
+Tests for bulk signing across worker processes.
+"""
+import pytest
+from eth_account import Account
+from eth_account.messages import encode_defunct
+from web3 import Web3
+
+from radius_wallets.web3 import SigningPool, Web3EVMWalletClient, Web3Options, Web3WalletPool
+
+ACCOUNT = Account.from_key("0x" + "4c" * 32)
+
+
+def attestation(nonce):
+    return {
+        "types": {
+            "EIP712Domain": [{"name": "name", "type": "string"}, {"name": "chainId", "type": "uint256"}],
+            "Attestation": [{"name": "subject", "type": "address"}, {"name": "nonce", "type": "uint256"}],
+        },
+        "primaryType": "Attestation",
+        "domain": {"name": "Attestations", "chainId": 1},
+        "message": {"subject": "0x" + "ab" * 20, "nonce": nonce},
+    }
+
+
+@pytest.fixture(scope="module")
+def signing_pool():
+    """Fixture that provides a two-process signing pool, started once for the module."""
+    pool = SigningPool(ACCOUNT, processes=2, chunk_size=8, min_batch=4)
+    yield pool
+    pool.close()
+
+
+@pytest.fixture
+def wallet(signing_pool):
+    """Fixture that provides a wallet signing batches in the pool."""
+    return Web3EVMWalletClient(Web3(), Web3Options(account=ACCOUNT, signing_pool=signing_pool))
+
+
+def test_messages_are_signed_in_order_by_the_workers(wallet, signing_pool):
+    """Test that a batch is split into chunks and returns the same signatures as signing one by one."""
+    messages = [f"attestation {index}" for index in range(50)]
+    before = signing_pool.stats()
+
+    signatures = wallet.sign_messages(messages)
+
+    assert signatures == [wallet.sign_message(message) for message in messages]
+    recovered = Account.recover_message(encode_defunct(text=messages[7]), signature=signatures[7]["signature"])
+    assert recovered == ACCOUNT.address
+    stats = signing_pool.stats()
+    assert stats["started"]
+    assert stats["signatures"] - before["signatures"] == 50
+    assert stats["chunks"] - before["chunks"] == 8
+
+
+def test_typed_data_is_signed_in_order_by_the_workers(wallet):
+    """Test that typed data batches return the signatures of sign_typed_data, in order."""
+    payloads = [attestation(nonce) for nonce in range(20)]
+
+    assert wallet.sign_typed_data_many(payloads) == [wallet.sign_typed_data(payload) for payload in payloads]
+
+
+def test_small_batches_are_signed_in_process():
+    """Test that batches below min_batch are signed without starting the workers."""
+    pool = SigningPool(ACCOUNT, processes=2, min_batch=4)
+
+    signatures = pool.sign_messages(["a", "b", "c"])
+
+    assert signatures[1]["signature"] == Web3.to_hex(ACCOUNT.sign_message(encode_defunct(text="b")).signature)
+    assert pool.stats() == {"processes": 2, "started": False, "batches": 1, "signatures": 3, "chunks": 0}
+
+
+def test_wallets_without_a_pool_sign_sequentially():
+    """Test that wallets sign batches on the calling thread unless given a pool for their account."""
+    wallet = Web3EVMWalletClient(Web3(), Web3Options(account=ACCOUNT))
+
+    assert wallet.sign_messages(["a", "b"]) == [wallet.sign_message("a"), wallet.sign_message("b")]
+    with pytest.raises(ValueError):
+        Web3EVMWalletClient(Web3(), Web3Options(account=Account.create(), signing_pool=SigningPool(ACCOUNT)))
+
+
+def test_wallet_pool_signs_batches_with_its_primary_account(signing_pool):
+    """Test that a wallet pool passes the signing pool to the account it signs with."""
+    pool = Web3WalletPool(Web3(), [ACCOUNT, Account.create()], Web3Options(signing_pool=signing_pool))
+    before = signing_pool.stats()["signatures"]
+
+    signatures = pool.sign_messages([str(index) for index in range(8)])
+
+    assert signatures[3] == pool.sign_message("3")
+    assert signing_pool.stats()["signatures"] - before == 8
@@ -0,0 +1,138 @@
+"""
+Tests for the cached EIP-712 typed data encoder.
+"""
+import copy
+
+import pytest
+from eth_account import Account
+from eth_account.messages import encode_typed_data
+from eth_utils import ValidationError
+from web3 import Web3
+
+from radius_wallets.web3 import TypedDataEncoder, Web3EVMWalletClient, Web3Options
+
+PERMIT2 = "0x000000000022D473030F116dDEE9F6B43aC78BA3"
+
+
+def permit_single(amount, nonce, chain_id=1):
+    return {
+        "types": {
+            "EIP712Domain": [
+                {"name": "name", "type": "string"},
+                {"name": "chainId", "type": "uint256"},
+                {"name": "verifyingContract", "type": "address"},
+            ],
+            "PermitSingle": [
+                {"name": "details", "type": "PermitDetails"},
+                {"name": "spender", "type": "address"},
+                {"name": "sigDeadline", "type": "uint256"},
+            ],
+            "PermitDetails": [
+                {"name": "token", "type": "address"},
+                {"name": "amount", "type": "uint160"},
+                {"name": "expiration", "type": "uint48"},
+                {"name": "nonce", "type": "uint48"},
+            ],
+        },
+        "primaryType": "PermitSingle",
+        "domain": {"name": "Permit2", "chainId": chain_id, "verifyingContract": PERMIT2},
+        "message": {
+            "details": {"token": "0x" + "11" * 20, "amount": str(amount), "expiration": 1_900_000_000, "nonce": nonce},
+            "spender": "0x" + "22" * 20,
+            "sigDeadline": "1900000000",
+        },
+    }
+
+
+def mail():
+    return {
+        "types": {
+            "Person": [{"name": "name", "type": "string"}, {"name": "wallets", "type": "address[]"}],
+            "Mail": [
+                {"name": "from", "type": "Person"},
+                {"name": "to", "type": "Person[]"},
+                {"name": "contents", "type": "string"},
+                {"name": "attachment", "type": "bytes"},
+                {"name": "tags", "type": "bytes8[]"},
+                {"name": "urgent", "type": "bool"},
+            ],
+        },
+        "domain": {"name": "Ether Mail", "version": "1", "chainId": 1, "salt": b"decafbeef"},
+        "message": {
+            "from": {"name": "Cow", "wallets": ["0xCD2a3d9F938E13CD947Ec05AbC7FE734Df8DD826"]},
+            "to": [
+                {"name": "Bob", "wallets": []},
+                {"name": "Alice", "wallets": ["0x" + "bb" * 20, "0x" + "cc" * 20]},
+            ],
+            "contents": "Hello, Bob!",
+            "attachment": "0xdeadbeef",
+            "tags": ["0x0102", "0x03"],
+            "urgent": "false",
+        },
+    }
+
+
+@pytest.mark.parametrize("payload", [permit_single(10**6, 0), permit_single(1, 7, chain_id=8453), mail()])
+def test_encoding_matches_eth_account(payload):
+    """Test that payloads encode exactly as eth_account does, on first use and from the cache."""
+    encoder = TypedDataEncoder()
+    expected = encode_typed_data(full_message=copy.deepcopy(payload))
+
+    assert encoder.encode(payload) == expected
+    assert encoder.encode(payload) == expected
+    assert encoder.stats()["hits"] == 1
+
+
+def test_payload_is_not_mutated():
+    """Test that a string chain ID is read as an integer without modifying the payload."""
+    payload = permit_single(5, 1, chain_id="1")
+    original = copy.deepcopy(payload)
+
+    assert TypedDataEncoder().encode(payload) == TypedDataEncoder().encode(permit_single(5, 1, chain_id=1))
+    assert payload == original
+
+
+def test_entries_are_kept_per_domain_and_types():
+    """Test that permits differing only in their message share one entry, and other domains get their own."""
+    encoder = TypedDataEncoder(max_entries=2)
+
+    for nonce in range(5):
+        encoder.encode(permit_single(10**6 + nonce, nonce))
+    encoder.encode(permit_single(1, 0, chain_id=10))
+    encoder.encode(mail())
+
+    stats = encoder.stats()
+    assert stats["hits"] == 4
+    assert stats["misses"] == 3
+    assert stats["size"] == 2
+    assert stats["evictions"] == 1
+
+
+def test_invalid_payloads_are_rejected():
+    """Test that a wrong primary type or a domain not matching its declared fields is rejected."""
+    encoder = TypedDataEncoder()
+    wrong_primary_type = permit_single(1, 0)
+    wrong_primary_type["primaryType"] = "PermitDetails"
+    extra_domain_field = permit_single(1, 0)
+    extra_domain_field["domain"]["version"] = "1"
+
+    with pytest.raises(ValidationError):
+        encoder.encode(wrong_primary_type)
+    with pytest.raises(ValidationError):
+        encoder.encode(extra_domain_field)
+
+
+def test_wallet_signs_with_a_shared_encoder():
+    """Test that wallet signatures recover to the account and reuse the encoder passed in the options."""
+    account = Account.create()
+    encoder = TypedDataEncoder()
+    wallet = Web3EVMWalletClient(Web3(), Web3Options(account=account, typed_data_encoder=encoder))
+
+    for nonce in range(3):
+        payload = permit_single(10**6, nonce)
+        signature = wallet.sign_typed_data(payload)["signature"]
+        signable = encode_typed_data(full_message=payload)
+        assert Account.recover_message(signable, signature=signature) == account.address
+
+    assert wallet.typed_data_encoder is encoder
+    assert encoder.stats()["hits"] == 2
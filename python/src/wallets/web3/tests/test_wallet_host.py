@@ -0,0 +1,161 @@
+"""
+Tests for the multi-tenant wallet host, run against LocalChain.
+"""
+import threading
+import time
+import tracemalloc
+
+import pytest
+
+pytest.importorskip("eth_tester")
+
+from eth_account import Account
+from web3 import Web3
+
+from radius_wallets.evm import send_eth
+from radius_wallets.web3 import RPCCache, Web3Options, Web3WalletHost
+from radius_wallets.web3.testing import LocalChain
+
+
+@pytest.fixture(scope="module")
+def local_chain():
+    """Fixture that provides a LocalChain shared by the module."""
+    return LocalChain(num_accounts=5)
+
+
+@pytest.fixture(autouse=True)
+def isolated_chain(local_chain):
+    """Reverts the shared chain to a clean state after every test."""
+    snapshot_id = local_chain.snapshot()
+    yield
+    local_chain.revert(snapshot_id)
+
+
+@pytest.fixture
+def host(local_chain):
+    """Fixture that provides a host loading tenants "0" to "4" from the funded accounts."""
+    return Web3WalletHost(
+        Web3(local_chain.provider),
+        plugins=[send_eth()],
+        options=Web3Options(rpc_cache=RPCCache()),
+        account_loader=lambda tenant_id: local_chain.accounts[int(tenant_id)],
+        max_tenants=2,
+    )
+
+
+def test_tenants_share_one_toolset(host, local_chain):
+    """Test that each tenant's tools act as that tenant while the tools are built once."""
+    first = {tool.name: tool for tool in host.get_tools("1")}
+    second = {tool.name: tool for tool in host.get_tools("2")}
+
+    assert first["get_address"].execute({}) == local_chain.accounts[1].address
+    assert second["get_address"].execute({}) == local_chain.accounts[2].address
+    assert first["send_ETH"].side_effect == "write"
+    assert first["send_ETH"].wallet_client is host.tenant("1")
+    assert second["send_ETH"].wallet_client is not first["send_ETH"].wallet_client
+    assert host.shared_tools() is host.shared_tools()
+    assert host.tenant("1")._web3 is host.tenant("2")._web3
+
+
+def test_tenant_sends_from_its_own_account(host, local_chain):
+    """Test that a tenant's writes are signed with its key and use the shared nonce manager."""
+    tools = {tool.name: tool for tool in host.get_tools("3")}
+    sender = local_chain.accounts[3].address
+    recipient = local_chain.accounts[4].address
+    nonce = local_chain.web3.eth.get_transaction_count(sender)
+    before = local_chain.web3.eth.get_balance(recipient)
+
+    tools["send_ETH"].execute({"to": recipient, "amount": "0.5"})
+    tools["send_ETH"].execute({"to": recipient, "amount": "0.5"})
+
+    assert local_chain.web3.eth.get_balance(recipient) == before + Web3.to_wei(1, "ether")
+    assert local_chain.web3.eth.get_transaction_count(sender) == nonce + 2
+
+
+def test_least_recently_used_tenant_is_evicted(host, local_chain):
+    """Test that tenants beyond max_tenants are evicted and re-created on their next use."""
+    recipient = local_chain.accounts[4].address
+    {tool.name: tool for tool in host.get_tools("1")}["send_ETH"].execute({"to": recipient, "amount": "0.1"})
+    host.tenant("2")
+    host.tenant("3")
+
+    stats = host.stats()
+    assert stats["tenants"] == 2
+    assert stats["evicted"] == 1
+
+    # Re-created from the loader; its nonce is read from the node again
+    tools = {tool.name: tool for tool in host.get_tools("1")}
+    tools["send_ETH"].execute({"to": recipient, "amount": "0.1"})
+    assert local_chain.web3.eth.get_transaction_count(local_chain.accounts[1].address) == 2
+    assert host.stats()["created"] == 4
+
+
+def test_eviction_does_not_block_other_tenants(host, local_chain):
+    """Test that evicting a tenant with a send in progress does not hold up other tenants."""
+    host.tenant("1")
+    host.tenant("2")
+    sending, release = threading.Event(), threading.Event()
+
+    def send():
+        # Holds tenant 1's nonce, as a send in flight does
+        with host.nonce_manager.allocate(local_chain.accounts[1].address):
+            sending.set()
+            release.wait(5)
+
+    sender = threading.Thread(target=send)
+    sender.start()
+    sending.wait(5)
+    evictor = threading.Thread(target=host.evict, args=("1",))
+    evictor.start()
+    try:
+        time.sleep(0.05)
+        started = time.monotonic()
+        assert host.tenant("2").get_address() == local_chain.accounts[2].address
+        assert time.monotonic() - started < 1
+        assert evictor.is_alive()
+    finally:
+        release.set()
+        sender.join()
+        evictor.join()
+    assert host.stats()["tenants"] == 1
+
+
+def test_idle_tenants_are_evicted(local_chain):
+    """Test that tenants unused for longer than the idle timeout are dropped."""
+    host = Web3WalletHost(Web3(local_chain.provider), idle_timeout=0.05)
+    host.tenant("a", local_chain.accounts[1])
+    time.sleep(0.1)
+    host.tenant("b", local_chain.accounts[2])
+
+    assert host.stats()["tenants"] == 1
+    with pytest.raises(KeyError):
+        host.tenant("a")
+
+
+def test_shared_tools_need_an_active_tenant(host, local_chain):
+    """Test that the shared tools only act inside use()."""
+    get_address = {tool.name: tool for tool in host.shared_tools()}["get_address"]
+
+    with pytest.raises(RuntimeError):
+        get_address.execute({})
+    with host.use("2"):
+        assert get_address.execute({}) == local_chain.accounts[2].address
+    # Reads that do not depend on the tenant work without one
+    assert host.wallet.get_chain()["id"] == local_chain.chain_id
+
+
+def test_per_tenant_memory_is_small(local_chain):
+    """Test that a tenant costs kilobytes on top of its account."""
+    accounts = [Account.create() for _ in range(200)]
+    host = Web3WalletHost(Web3(local_chain.provider), plugins=[send_eth()], max_tenants=500)
+    host.tenant("warmup", accounts[0])
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for index, account in enumerate(accounts):
+        host.tenant(str(index), account)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    assert allocated / len(accounts) < 8 * 1024
@@ -0,0 +1,150 @@
+"""
+Tests for local-account signing, nonce management and the multi-account wallet pool, run against LocalChain.
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+pytest.importorskip("eth_tester")
+
+from web3 import Web3
+
+from radius.utils.resilience import Resilience, ResiliencePolicy
+from radius_wallets.evm import EVMWalletClient
+from radius_wallets.web3 import NonceManager, Web3EVMWalletClient, Web3Options, Web3WalletPool, web3_pool
+from radius_wallets.web3.testing import LocalChain
+
+
+@pytest.fixture(scope="module")
+def local_chain():
+    """Fixture that provides a LocalChain shared by the module."""
+    return LocalChain(num_accounts=5)
+
+
+@pytest.fixture(autouse=True)
+def isolated_chain(local_chain):
+    """Reverts the shared chain to a clean state after every test."""
+    snapshot_id = local_chain.snapshot()
+    yield
+    local_chain.revert(snapshot_id)
+
+
+@pytest.fixture
+def pool(local_chain):
+    """Fixture that provides a pool over the first three accounts, with no web3 default account."""
+    return web3_pool(Web3(local_chain.provider), local_chain.accounts[:3])
+
+
+def test_local_account_signs_and_sends_raw(local_chain):
+    """Test that a wallet with a local account signs transactions itself."""
+    account = local_chain.accounts[3]
+    recipient = local_chain.accounts[4].address
+    wallet = Web3EVMWalletClient(Web3(local_chain.provider), Web3Options(account=account))
+    before = local_chain.web3.eth.get_balance(recipient)
+
+    assert wallet.get_address() == account.address
+    assert wallet.send_transaction({"to": recipient, "value": 5})["status"] == "1"
+    result = wallet.send_transaction({
+        "to": local_chain.token_address,
+        "abi": local_chain.token_contract().abi,
+        "functionName": "approve",
+        "args": [recipient, 10],
+    })
+
+    assert result["status"] == "1"
+    assert local_chain.web3.eth.get_balance(recipient) == before + 5
+    assert local_chain.web3.eth.get_transaction_count(account.address) == 2
+    assert wallet.sign_message("hello")["signature"].startswith("0x")
+
+
+def test_nonce_manager_allocates_sequentially(local_chain):
+    """Test that nonces are allocated locally and re-synchronized after a failure."""
+    nonces = NonceManager(local_chain.web3)
+    address = local_chain.accounts[3].address
+    start = local_chain.web3.eth.get_transaction_count(address)
+
+    assert [nonces.reserve(address) for _ in range(3)] == [start, start + 1, start + 2]
+
+    with pytest.raises(RuntimeError):
+        with nonces.allocate(address):
+            raise RuntimeError("send failed")
+    assert nonces.reserve(address) == start
+
+
+def test_pool_is_an_evm_wallet(pool, local_chain):
+    """Test that the pool behaves as a wallet of its primary account."""
+    assert isinstance(pool, EVMWalletClient)
+    assert pool.get_address() == local_chain.accounts[0].address
+    assert pool.addresses == [account.address for account in local_chain.accounts[:3]]
+    assert pool.get_chain()["id"] == local_chain.chain_id
+
+
+def test_pool_spreads_concurrent_sends(pool, local_chain):
+    """Test that concurrent sends are spread over all accounts without nonce conflicts."""
+    recipient = local_chain.accounts[4].address
+    before = local_chain.web3.eth.get_balance(recipient)
+    counts = {address: local_chain.web3.eth.get_transaction_count(address) for address in pool.addresses}
+
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        results = list(executor.map(lambda _: pool.send_transaction({"to": recipient, "value": 1}), range(12)))
+
+    assert all(result["status"] == "1" for result in results)
+    assert local_chain.web3.eth.get_balance(recipient) == before + 12
+    stats = pool.stats()
+    assert stats["sent"] == 12
+    assert stats["pending"] == 0
+    assert stats["failed"] == 0
+    assert stats["throughput"] > 0
+    for account in stats["accounts"]:
+        assert account["sent"] > 0
+        sent_on_chain = local_chain.web3.eth.get_transaction_count(account["address"]) - counts[account["address"]]
+        assert sent_on_chain == account["sent"]
+
+
+def test_pool_sticky_sender(pool, local_chain):
+    """Test that options.sender pins the sending account."""
+    sender = local_chain.accounts[2].address
+
+    for _ in range(3):
+        pool.send_transaction({"to": local_chain.accounts[4].address, "value": 1, "options": {"sender": sender}})
+
+    assert [account["sent"] for account in pool.stats()["accounts"]] == [0, 0, 3]
+    assert pool.wallet(sender).get_address() == sender
+    with pytest.raises(ValueError):
+        pool.wallet(local_chain.accounts[4].address)
+
+
+def test_pool_counts_failures(pool, local_chain):
+    """Test that failed sends are counted and release the account."""
+    with pytest.raises(ValueError):
+        pool.send_transaction({
+            "to": local_chain.token_address,
+            "abi": local_chain.token_contract().abi,
+            "functionName": "transfer",
+            "args": [local_chain.accounts[4].address, 10**40],
+        })
+
+    stats = pool.stats()
+    assert stats["failed"] == 1
+    assert stats["pending"] == 0
+
+
+def test_pool_requires_accounts(local_chain):
+    """Test that a pool cannot be created without accounts."""
+    with pytest.raises(ValueError):
+        Web3WalletPool(local_chain.web3, [])
+
+
+def test_pool_forwards_resilience_and_single_flight(local_chain):
+    """Test that every pooled wallet shares the pool's resilience policy and coalescing group."""
+    resilience = Resilience(ResiliencePolicy(base_delay=0.001))
+    w3 = Web3(local_chain.provider)
+    pool = Web3WalletPool(w3, local_chain.accounts[:3], Web3Options(resilience=resilience))
+
+    wallets = list(pool._wallets.values())
+    assert all(wallet.resilience is resilience for wallet in wallets)
+    assert len({id(wallet.single_flight) for wallet in wallets}) == 1
+    assert "radius_resilience" in w3.middleware_onion
+
+    pool.balance_of(local_chain.accounts[4].address)
+    assert resilience.stats()["calls"] > 0
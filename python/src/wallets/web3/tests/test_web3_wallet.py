@@ -1,6 +1,10 @@
 """
 Tests for the Web3EVMWalletClient implementation.
 """
+import os
+import subprocess
+import sys
+
 import pytest
 from unittest.mock import MagicMock, patch
 from web3 import Web3
@@ -341,6 +345,38 @@ def test_balance_of(mock_web3_wallet, mock_web3):
     # Skip verifying get_balance since it's a lambda function
 
 
+def test_concurrent_identical_reads_are_coalesced(mock_web3):
+    """Test that identical balance and contract reads in flight together share one RPC."""
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+    from radius_wallets.web3 import Web3Options
+    from radius.utils.single_flight import SingleFlight
+
+    release = threading.Event()
+    rpc_calls = []
+
+    def get_balance(address):
+        rpc_calls.append(address)
+        release.wait(5)
+        return 10**18
+
+    mock_web3.eth.get_balance = get_balance
+    group = SingleFlight()
+    wallet = Web3EVMWalletClient(mock_web3, Web3Options(single_flight=group))
+    address = "0x1234567890123456789012345678901234567890"
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(wallet.balance_of, address) for _ in range(4)]
+        while group.stats()["calls"] < 4:
+            threading.Event().wait(0.001)
+        release.set()
+        balances = [future.result() for future in futures]
+
+    assert rpc_calls == [address]
+    assert [balance["in_base_units"] for balance in balances] == [str(10**18)] * 4
+    assert group.stats()["coalesced"] == 3
+
+
 def test_web3_factory_function(mock_web3, mock_web3_options):
     """Test the web3 factory function."""
     # Import the factory function
@@ -353,4 +389,30 @@ def test_web3_factory_function(mock_web3, mock_web3_options):
     assert isinstance(wallet, Web3EVMWalletClient)
     assert wallet._web3 == mock_web3
     assert wallet._default_paymaster_address == mock_web3_options.paymaster["address"]
-    assert wallet._default_paymaster_input == mock_web3_options.paymaster["input"]
\ No newline at end of file
+    assert wallet._default_paymaster_input == mock_web3_options.paymaster["input"]
+
+
+def test_import_defers_web3():
+    """Test that importing the package does not import web3 until the client is accessed."""
+    code = (
+        "import sys, radius_wallets.web3\n"
+        "assert 'web3' not in sys.modules and 'eth_account' not in sys.modules\n"
+        "radius_wallets.web3.Web3EVMWalletClient\n"
+        "assert 'web3' in sys.modules\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_exports_match_lazy_attributes():
+    """Test that __all__ lists exactly the lazily resolved names, and that each of them resolves."""
+    import radius_wallets.web3 as package
+
+    assert sorted(package.__all__) == sorted(package._LAZY_ATTRIBUTES)
+    for name in package.__all__:
+        assert getattr(package, name) is not None